@@ -433,11 +433,6 @@ graph [
     target 6
     weight -0.1
   ]
-  edge [
-    source 0
-    target 7
-    weight 0
-  ]
   edge [
     source 0
     target 8
@@ -458,31 +453,11 @@ graph [
     target 11
     weight -0.1
   ]
-  edge [
-    source 0
-    target 12
-    weight 0
-  ]
   edge [
     source 0
     target 13
     weight 0.1
   ]
-  edge [
-    source 0
-    target 14
-    weight 0
-  ]
-  edge [
-    source 0
-    target 15
-    weight 0
-  ]
-  edge [
-    source 0
-    target 16
-    weight 0
-  ]
   edge [
     source 0
     target 17
@@ -493,11 +468,6 @@ graph [
     target 18
     weight 0.1
   ]
-  edge [
-    source 0
-    target 19
-    weight 0
-  ]
   edge [
     source 0
     target 20
@@ -525,25132 +495,1437 @@ graph [
   ]
   edge [
     source 0
-    target 25
-    weight 0
+    target 26
+    weight 0.1
   ]
   edge [
     source 0
-    target 26
+    target 29
     weight 0.1
   ]
   edge [
     source 0
-    target 27
-    weight 0
+    target 36
+    weight -0.1
   ]
   edge [
     source 0
-    target 28
-    weight 0
+    target 95
+    weight 0.1
   ]
   edge [
     source 0
-    target 29
+    target 99
     weight 0.1
   ]
   edge [
-    source 0
-    target 30
-    weight 0
+    source 1
+    target 2
+    weight -0.1
   ]
   edge [
-    source 0
-    target 31
-    weight 0
+    source 1
+    target 3
+    weight -0.1
   ]
   edge [
-    source 0
-    target 32
-    weight 0
+    source 1
+    target 4
+    weight -0.1
   ]
   edge [
-    source 0
-    target 33
-    weight 0
+    source 1
+    target 5
+    weight -0.1
   ]
   edge [
-    source 0
-    target 34
-    weight 0
+    source 1
+    target 6
+    weight -0.1
   ]
   edge [
-    source 0
-    target 35
-    weight 0
+    source 1
+    target 7
+    weight -0.1
   ]
   edge [
-    source 0
-    target 36
+    source 1
+    target 8
     weight -0.1
   ]
   edge [
-    source 0
-    target 37
-    weight 0
+    source 1
+    target 9
+    weight -0.2
   ]
   edge [
-    source 0
-    target 38
-    weight 0
+    source 1
+    target 10
+    weight -0.1
   ]
   edge [
-    source 0
-    target 39
-    weight 0
+    source 1
+    target 15
+    weight 0.1
   ]
   edge [
-    source 0
-    target 40
-    weight 0
+    source 1
+    target 16
+    weight 0.1
   ]
   edge [
-    source 0
-    target 41
-    weight 0
+    source 1
+    target 19
+    weight 0.1
   ]
   edge [
-    source 0
-    target 42
-    weight 0
+    source 1
+    target 20
+    weight 0.1
   ]
   edge [
-    source 0
-    target 43
-    weight 0
+    source 1
+    target 21
+    weight 0.1
   ]
   edge [
-    source 0
-    target 44
-    weight 0
+    source 1
+    target 23
+    weight 0.1
   ]
   edge [
-    source 0
-    target 45
-    weight 0
+    source 1
+    target 33
+    weight -0.1
   ]
   edge [
-    source 0
-    target 46
-    weight 0
+    source 1
+    target 36
+    weight -0.1
   ]
   edge [
-    source 0
-    target 47
-    weight 0
+    source 1
+    target 83
+    weight -0.1
   ]
   edge [
-    source 0
-    target 48
-    weight 0
+    source 1
+    target 88
+    weight -0.1
   ]
   edge [
-    source 0
-    target 49
-    weight 0
+    source 1
+    target 99
+    weight 0.1
   ]
   edge [
-    source 0
-    target 50
-    weight 0
+    source 2
+    target 3
+    weight -0.1
   ]
   edge [
-    source 0
-    target 51
-    weight 0
+    source 2
+    target 4
+    weight -0.1
   ]
   edge [
-    source 0
-    target 52
-    weight 0
+    source 2
+    target 9
+    weight -0.2
   ]
   edge [
-    source 0
-    target 53
-    weight 0
+    source 2
+    target 12
+    weight 0.1
   ]
   edge [
-    source 0
-    target 54
-    weight 0
+    source 2
+    target 15
+    weight 0.1
   ]
   edge [
-    source 0
-    target 55
-    weight 0
+    source 2
+    target 21
+    weight 0.1
   ]
   edge [
-    source 0
-    target 56
-    weight 0
+    source 2
+    target 22
+    weight 0.1
   ]
   edge [
-    source 0
-    target 57
-    weight 0
+    source 2
+    target 23
+    weight 0.1
   ]
   edge [
-    source 0
-    target 58
-    weight 0
+    source 2
+    target 24
+    weight 0.1
   ]
   edge [
-    source 0
-    target 59
-    weight 0
+    source 2
+    target 29
+    weight 0.1
   ]
   edge [
-    source 0
-    target 60
-    weight 0
+    source 2
+    target 83
+    weight -0.1
   ]
   edge [
-    source 0
-    target 61
-    weight 0
+    source 2
+    target 91
+    weight -0.1
   ]
   edge [
-    source 0
-    target 62
-    weight 0
+    source 2
+    target 93
+    weight -0.1
   ]
   edge [
-    source 0
-    target 63
-    weight 0
+    source 2
+    target 99
+    weight 0.1
   ]
   edge [
-    source 0
-    target 64
-    weight 0
+    source 3
+    target 4
+    weight -0.1
   ]
   edge [
-    source 0
-    target 65
-    weight 0
+    source 3
+    target 5
+    weight -0.1
   ]
   edge [
-    source 0
-    target 66
-    weight 0
+    source 3
+    target 6
+    weight -0.1
   ]
   edge [
-    source 0
-    target 67
-    weight 0
+    source 3
+    target 7
+    weight -0.1
   ]
   edge [
-    source 0
-    target 68
-    weight 0
+    source 3
+    target 9
+    weight -0.1
   ]
   edge [
-    source 0
-    target 69
-    weight 0
+    source 3
+    target 14
+    weight 0.1
   ]
   edge [
-    source 0
-    target 70
-    weight 0
+    source 3
+    target 15
+    weight 0.1
   ]
   edge [
-    source 0
-    target 71
-    weight 0
+    source 3
+    target 16
+    weight 0.1
   ]
   edge [
-    source 0
-    target 72
-    weight 0
+    source 3
+    target 18
+    weight 0.1
   ]
   edge [
-    source 0
-    target 73
-    weight 0
+    source 3
+    target 22
+    weight 0.1
   ]
   edge [
-    source 0
-    target 74
-    weight 0
+    source 3
+    target 24
+    weight 0.2
   ]
   edge [
-    source 0
-    target 75
-    weight 0
+    source 3
+    target 28
+    weight -0.1
   ]
   edge [
-    source 0
-    target 76
-    weight 0
+    source 3
+    target 36
+    weight -0.1
   ]
   edge [
-    source 0
-    target 77
-    weight 0
+    source 3
+    target 85
+    weight -0.1
   ]
   edge [
-    source 0
-    target 78
-    weight 0
+    source 3
+    target 99
+    weight 0.1
   ]
   edge [
-    source 0
-    target 79
-    weight 0
+    source 4
+    target 5
+    weight -0.1
   ]
   edge [
-    source 0
-    target 80
-    weight 0
+    source 4
+    target 6
+    weight -0.1
   ]
   edge [
-    source 0
-    target 81
-    weight 0
+    source 4
+    target 7
+    weight -0.1
   ]
   edge [
-    source 0
-    target 82
-    weight 0
+    source 4
+    target 9
+    weight -0.1
   ]
   edge [
-    source 0
-    target 83
-    weight 0
+    source 4
+    target 12
+    weight 0.1
   ]
   edge [
-    source 0
-    target 84
-    weight 0
+    source 4
+    target 14
+    weight 0.1
   ]
   edge [
-    source 0
-    target 85
-    weight 0
+    source 4
+    target 15
+    weight 0.1
   ]
   edge [
-    source 0
-    target 86
-    weight 0
+    source 4
+    target 16
+    weight 0.1
   ]
   edge [
-    source 0
-    target 87
-    weight 0
+    source 4
+    target 20
+    weight 0.1
   ]
   edge [
-    source 0
-    target 88
-    weight 0
+    source 4
+    target 22
+    weight -0.1
   ]
   edge [
-    source 0
-    target 89
-    weight 0
+    source 4
+    target 24
+    weight 0.1
   ]
   edge [
-    source 0
-    target 90
-    weight 0
+    source 4
+    target 26
+    weight -0.1
   ]
   edge [
-    source 0
-    target 91
-    weight 0
+    source 4
+    target 28
+    weight -0.1
   ]
   edge [
-    source 0
-    target 92
-    weight 0
+    source 4
+    target 88
+    weight -0.1
   ]
   edge [
-    source 0
-    target 93
-    weight 0
+    source 4
+    target 99
+    weight 0.1
   ]
   edge [
-    source 0
-    target 94
-    weight 0
+    source 5
+    target 6
+    weight -0.1
   ]
   edge [
-    source 0
-    target 95
-    weight 0.1
+    source 5
+    target 8
+    weight -0.1
   ]
   edge [
-    source 0
-    target 96
-    weight 0
+    source 5
+    target 12
+    weight 0.1
   ]
   edge [
-    source 0
-    target 97
-    weight 0
+    source 5
+    target 14
+    weight 0.1
   ]
   edge [
-    source 0
-    target 98
-    weight 0
+    source 5
+    target 15
+    weight 0.1
   ]
   edge [
-    source 0
-    target 99
+    source 5
+    target 17
     weight 0.1
   ]
   edge [
-    source 0
-    target 100
-    weight 0
+    source 5
+    target 27
+    weight -0.1
   ]
   edge [
-    source 1
-    target 2
+    source 5
+    target 28
     weight -0.1
   ]
   edge [
-    source 1
-    target 3
+    source 5
+    target 36
     weight -0.1
   ]
   edge [
-    source 1
-    target 4
+    source 5
+    target 53
     weight -0.1
   ]
   edge [
-    source 1
-    target 5
+    source 5
+    target 77
     weight -0.1
   ]
   edge [
-    source 1
-    target 6
+    source 5
+    target 79
     weight -0.1
   ]
   edge [
-    source 1
-    target 7
+    source 5
+    target 84
     weight -0.1
   ]
   edge [
-    source 1
-    target 8
+    source 5
+    target 85
     weight -0.1
   ]
   edge [
-    source 1
-    target 9
-    weight -0.2
+    source 5
+    target 91
+    weight -0.1
   ]
   edge [
-    source 1
-    target 10
+    source 5
+    target 97
     weight -0.1
   ]
   edge [
-    source 1
-    target 11
-    weight 0
+    source 6
+    target 7
+    weight -0.1
   ]
   edge [
-    source 1
-    target 12
-    weight 0
+    source 6
+    target 8
+    weight -0.1
   ]
   edge [
-    source 1
-    target 13
-    weight 0
+    source 6
+    target 9
+    weight -0.1
   ]
   edge [
-    source 1
-    target 14
-    weight 0
+    source 6
+    target 10
+    weight -0.1
   ]
   edge [
-    source 1
-    target 15
-    weight 0.1
+    source 6
+    target 11
+    weight -0.1
   ]
   edge [
-    source 1
+    source 6
     target 16
     weight 0.1
   ]
   edge [
-    source 1
+    source 6
     target 17
-    weight 0
-  ]
-  edge [
-    source 1
-    target 18
-    weight 0
-  ]
-  edge [
-    source 1
-    target 19
     weight 0.1
   ]
   edge [
-    source 1
+    source 6
     target 20
     weight 0.1
   ]
   edge [
-    source 1
-    target 21
-    weight 0.1
-  ]
-  edge [
-    source 1
+    source 6
     target 22
-    weight 0
-  ]
-  edge [
-    source 1
-    target 23
-    weight 0.1
+    weight 0.2
   ]
   edge [
-    source 1
+    source 6
     target 24
-    weight 0
+    weight -0.1
   ]
   edge [
-    source 1
-    target 25
-    weight 0
+    source 6
+    target 28
+    weight -0.1
   ]
   edge [
-    source 1
-    target 26
-    weight 0.0
+    source 6
+    target 88
+    weight -0.1
   ]
   edge [
-    source 1
-    target 27
-    weight 0
+    source 7
+    target 12
+    weight 0.1
   ]
   edge [
-    source 1
-    target 28
-    weight 0
+    source 7
+    target 13
+    weight 0.1
   ]
   edge [
-    source 1
-    target 29
-    weight 0
+    source 7
+    target 19
+    weight -0.1
   ]
   edge [
-    source 1
-    target 30
-    weight 0
+    source 7
+    target 24
+    weight 0.1
   ]
   edge [
-    source 1
-    target 31
-    weight 0
+    source 7
+    target 93
+    weight -0.1
   ]
   edge [
-    source 1
-    target 32
-    weight 0
+    source 7
+    target 95
+    weight 0.1
   ]
   edge [
-    source 1
-    target 33
+    source 8
+    target 9
     weight -0.1
   ]
   edge [
-    source 1
-    target 34
-    weight 0
-  ]
-  edge [
-    source 1
-    target 35
-    weight 0
+    source 8
+    target 10
+    weight -0.1
   ]
   edge [
-    source 1
-    target 36
+    source 8
+    target 11
     weight -0.1
   ]
   edge [
-    source 1
-    target 37
-    weight 0
+    source 8
+    target 13
+    weight 0.1
   ]
   edge [
-    source 1
-    target 38
-    weight 0
+    source 8
+    target 14
+    weight 0.1
   ]
   edge [
-    source 1
-    target 39
-    weight 0
+    source 8
+    target 16
+    weight 0.1
   ]
   edge [
-    source 1
-    target 40
-    weight 0
+    source 8
+    target 91
+    weight -0.1
   ]
   edge [
-    source 1
-    target 41
-    weight 0
+    source 8
+    target 98
+    weight 0.1
   ]
   edge [
-    source 1
-    target 42
-    weight 0
+    source 9
+    target 11
+    weight -0.1
   ]
   edge [
-    source 1
-    target 43
-    weight 0
+    source 9
+    target 13
+    weight 0.1
   ]
   edge [
-    source 1
-    target 44
-    weight 0
+    source 9
+    target 17
+    weight -0.1
   ]
   edge [
-    source 1
-    target 45
-    weight 0
+    source 9
+    target 18
+    weight 0.1
   ]
   edge [
-    source 1
-    target 46
-    weight 0
+    source 9
+    target 19
+    weight 0.1
   ]
   edge [
-    source 1
-    target 47
-    weight 0
+    source 9
+    target 22
+    weight -0.1
   ]
   edge [
-    source 1
-    target 48
-    weight 0
+    source 9
+    target 29
+    weight 0.1
   ]
   edge [
-    source 1
-    target 49
-    weight 0
+    source 10
+    target 11
+    weight -0.1
   ]
   edge [
-    source 1
-    target 50
-    weight 0
+    source 10
+    target 13
+    weight 0.1
   ]
   edge [
-    source 1
-    target 51
-    weight 0
+    source 10
+    target 18
+    weight 0.1
   ]
   edge [
-    source 1
-    target 52
-    weight 0
+    source 10
+    target 20
+    weight 0.1
   ]
   edge [
-    source 1
-    target 53
-    weight 0
+    source 10
+    target 24
+    weight 0.1
   ]
   edge [
-    source 1
-    target 54
-    weight 0
+    source 10
+    target 31
+    weight 0.1
   ]
   edge [
-    source 1
-    target 55
-    weight 0
+    source 10
+    target 33
+    weight -0.1
   ]
   edge [
-    source 1
-    target 56
-    weight 0
+    source 10
+    target 35
+    weight -0.1
   ]
   edge [
-    source 1
-    target 57
-    weight 0
+    source 10
+    target 93
+    weight -0.1
   ]
   edge [
-    source 1
-    target 58
-    weight 0
+    source 11
+    target 12
+    weight 0.1
   ]
   edge [
-    source 1
-    target 59
-    weight 0
+    source 11
+    target 18
+    weight 0.1
   ]
   edge [
-    source 1
-    target 60
-    weight 0
+    source 11
+    target 20
+    weight 0.1
   ]
   edge [
-    source 1
-    target 61
-    weight 0
+    source 11
+    target 21
+    weight 0.1
   ]
   edge [
-    source 1
-    target 62
-    weight 0
+    source 11
+    target 30
+    weight 0.1
   ]
   edge [
-    source 1
-    target 63
-    weight 0
+    source 11
+    target 79
+    weight -0.1
   ]
   edge [
-    source 1
-    target 64
-    weight 0
+    source 11
+    target 95
+    weight 0.1
   ]
   edge [
-    source 1
-    target 65
-    weight 0
+    source 12
+    target 19
+    weight 0.1
   ]
   edge [
-    source 1
-    target 66
-    weight 0
+    source 12
+    target 24
+    weight -0.1
   ]
   edge [
-    source 1
-    target 67
-    weight 0
+    source 12
+    target 32
+    weight -0.1
   ]
   edge [
-    source 1
-    target 68
-    weight 0
+    source 13
+    target 14
+    weight 0.1
   ]
   edge [
-    source 1
-    target 69
-    weight 0
+    source 13
+    target 15
+    weight -0.1
   ]
   edge [
-    source 1
-    target 70
-    weight 0
+    source 13
+    target 24
+    weight 0.1
   ]
   edge [
-    source 1
-    target 71
-    weight 0
+    source 13
+    target 34
+    weight -0.1
   ]
   edge [
-    source 1
-    target 72
-    weight 0
+    source 13
+    target 84
+    weight -0.1
   ]
   edge [
-    source 1
-    target 73
-    weight 0
+    source 14
+    target 25
+    weight 0.1
   ]
   edge [
-    source 1
-    target 74
-    weight 0
+    source 14
+    target 31
+    weight 0.1
   ]
   edge [
-    source 1
-    target 75
-    weight 0
+    source 14
+    target 100
+    weight -0.1
   ]
   edge [
-    source 1
-    target 76
-    weight 0
+    source 15
+    target 17
+    weight -0.1
   ]
   edge [
-    source 1
-    target 77
-    weight 0
+    source 15
+    target 19
+    weight -0.1
   ]
   edge [
-    source 1
-    target 78
-    weight 0
+    source 15
+    target 20
+    weight 0.1
   ]
   edge [
-    source 1
-    target 79
-    weight 0
+    source 15
+    target 27
+    weight -0.1
   ]
   edge [
-    source 1
-    target 80
-    weight 0
+    source 15
+    target 30
+    weight 0.1
   ]
   edge [
-    source 1
-    target 81
-    weight 0
+    source 15
+    target 31
+    weight 0.1
   ]
   edge [
-    source 1
-    target 82
-    weight 0
+    source 15
+    target 35
+    weight -0.1
   ]
   edge [
-    source 1
-    target 83
+    source 15
+    target 48
     weight -0.1
   ]
   edge [
-    source 1
-    target 84
-    weight 0
+    source 15
+    target 83
+    weight -0.1
   ]
   edge [
-    source 1
-    target 85
-    weight 0
+    source 15
+    target 95
+    weight 0.1
   ]
   edge [
-    source 1
-    target 86
-    weight 0
+    source 15
+    target 96
+    weight -0.1
   ]
   edge [
-    source 1
-    target 87
-    weight 0
+    source 16
+    target 17
+    weight 0.1
   ]
   edge [
-    source 1
-    target 88
-    weight -0.1
+    source 16
+    target 23
+    weight 0.1
   ]
   edge [
-    source 1
-    target 89
-    weight 0
+    source 16
+    target 24
+    weight 0.1
   ]
   edge [
-    source 1
-    target 90
-    weight 0
+    source 16
+    target 28
+    weight -0.1
   ]
   edge [
-    source 1
-    target 91
-    weight 0
+    source 16
+    target 31
+    weight 0.1
   ]
   edge [
-    source 1
-    target 92
-    weight 0
+    source 16
+    target 32
+    weight -0.1
   ]
   edge [
-    source 1
-    target 93
-    weight 0
+    source 16
+    target 33
+    weight -0.1
   ]
   edge [
-    source 1
-    target 94
-    weight 0
+    source 16
+    target 79
+    weight -0.1
   ]
   edge [
-    source 1
+    source 16
     target 95
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 1
-    target 96
-    weight 0
+    source 16
+    target 100
+    weight -0.1
   ]
   edge [
-    source 1
-    target 97
-    weight 0
+    source 17
+    target 19
+    weight 0.1
   ]
   edge [
-    source 1
-    target 98
-    weight 0
+    source 17
+    target 30
+    weight 0.1
   ]
   edge [
-    source 1
-    target 99
+    source 17
+    target 31
     weight 0.1
   ]
   edge [
-    source 1
-    target 100
-    weight 0
+    source 17
+    target 32
+    weight -0.1
   ]
   edge [
-    source 2
-    target 3
+    source 17
+    target 33
     weight -0.1
   ]
   edge [
-    source 2
-    target 4
+    source 17
+    target 55
     weight -0.1
   ]
   edge [
-    source 2
-    target 5
-    weight 0
+    source 17
+    target 85
+    weight -0.1
   ]
   edge [
-    source 2
-    target 6
-    weight 0
+    source 17
+    target 87
+    weight -0.1
   ]
   edge [
-    source 2
-    target 7
-    weight 0
+    source 17
+    target 99
+    weight -0.1
   ]
   edge [
-    source 2
-    target 8
-    weight 0
+    source 17
+    target 100
+    weight -0.1
   ]
   edge [
-    source 2
-    target 9
-    weight -0.2
+    source 18
+    target 19
+    weight 0.1
   ]
   edge [
-    source 2
-    target 10
-    weight 0
+    source 18
+    target 20
+    weight 0.2
   ]
   edge [
-    source 2
-    target 11
-    weight 0
+    source 18
+    target 24
+    weight 0.1
   ]
   edge [
-    source 2
-    target 12
+    source 18
+    target 25
     weight 0.1
   ]
   edge [
-    source 2
-    target 13
-    weight 0
+    source 18
+    target 30
+    weight 0.1
   ]
   edge [
-    source 2
-    target 14
-    weight 0
+    source 18
+    target 84
+    weight -0.1
   ]
   edge [
-    source 2
-    target 15
-    weight 0.1
+    source 19
+    target 23
+    weight -0.1
   ]
   edge [
-    source 2
-    target 16
-    weight 0
+    source 19
+    target 31
+    weight -0.1
   ]
   edge [
-    source 2
-    target 17
-    weight 0
+    source 19
+    target 37
+    weight -0.1
   ]
   edge [
-    source 2
-    target 18
-    weight 0
+    source 19
+    target 87
+    weight -0.1
   ]
   edge [
-    source 2
-    target 19
-    weight 0
+    source 19
+    target 98
+    weight 0.1
   ]
   edge [
-    source 2
-    target 20
-    weight 0
+    source 20
+    target 25
+    weight 0.1
   ]
   edge [
-    source 2
-    target 21
+    source 20
+    target 29
     weight 0.1
   ]
   edge [
-    source 2
-    target 22
-    weight 0.1
+    source 20
+    target 32
+    weight -0.1
   ]
   edge [
-    source 2
-    target 23
-    weight 0.1
+    source 20
+    target 37
+    weight -0.1
   ]
   edge [
-    source 2
-    target 24
+    source 20
+    target 84
     weight 0.1
   ]
   edge [
-    source 2
-    target 25
-    weight 0
+    source 20
+    target 98
+    weight 0.1
   ]
   edge [
-    source 2
+    source 21
     target 26
-    weight 0
-  ]
-  edge [
-    source 2
-    target 27
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 2
-    target 28
-    weight 0
+    source 21
+    target 34
+    weight -0.1
   ]
   edge [
-    source 2
-    target 29
-    weight 0.1
+    source 21
+    target 79
+    weight -0.1
   ]
   edge [
-    source 2
-    target 30
-    weight 0
+    source 21
+    target 91
+    weight -0.1
   ]
   edge [
-    source 2
-    target 31
-    weight 0
+    source 22
+    target 27
+    weight -0.1
   ]
   edge [
-    source 2
-    target 32
-    weight 0
+    source 22
+    target 28
+    weight -0.1
   ]
   edge [
-    source 2
+    source 22
     target 33
-    weight 0
+    weight -0.1
   ]
   edge [
-    source 2
-    target 34
-    weight 0
+    source 22
+    target 100
+    weight -0.1
   ]
   edge [
-    source 2
-    target 35
-    weight 0
+    source 23
+    target 24
+    weight 0.1
   ]
   edge [
-    source 2
-    target 36
-    weight 0
+    source 23
+    target 25
+    weight 0.1
   ]
   edge [
-    source 2
-    target 37
-    weight 0
+    source 23
+    target 29
+    weight 0.1
   ]
   edge [
-    source 2
-    target 38
-    weight 0
+    source 23
+    target 33
+    weight -0.1
   ]
   edge [
-    source 2
-    target 39
-    weight 0
+    source 23
+    target 37
+    weight -0.1
   ]
   edge [
-    source 2
-    target 40
-    weight 0
+    source 23
+    target 91
+    weight -0.1
   ]
   edge [
-    source 2
-    target 41
-    weight 0
+    source 24
+    target 25
+    weight 0.1
   ]
   edge [
-    source 2
-    target 42
-    weight 0
+    source 24
+    target 27
+    weight -0.1
   ]
   edge [
-    source 2
-    target 43
-    weight 0
+    source 24
+    target 37
+    weight -0.1
   ]
   edge [
-    source 2
-    target 44
-    weight 0
+    source 24
+    target 50
+    weight -0.1
   ]
   edge [
-    source 2
-    target 45
-    weight 0
+    source 24
+    target 55
+    weight 0.1
   ]
   edge [
-    source 2
-    target 46
-    weight 0
+    source 24
+    target 68
+    weight 0.1
   ]
   edge [
-    source 2
-    target 47
-    weight 0
+    source 24
+    target 81
+    weight -0.1
   ]
   edge [
-    source 2
-    target 48
-    weight 0
+    source 24
+    target 82
+    weight -0.1
   ]
   edge [
-    source 2
-    target 49
-    weight 0
+    source 24
+    target 88
+    weight -0.1
   ]
   edge [
-    source 2
-    target 50
-    weight 0
+    source 25
+    target 26
+    weight 0.1
   ]
   edge [
-    source 2
-    target 51
-    weight 0
+    source 25
+    target 27
+    weight -0.1
   ]
   edge [
-    source 2
-    target 52
-    weight 0
+    source 26
+    target 27
+    weight -0.1
   ]
   edge [
-    source 2
-    target 53
-    weight 0
+    source 26
+    target 29
+    weight -0.1
   ]
   edge [
-    source 2
-    target 54
-    weight 0
-  ]
-  edge [
-    source 2
-    target 55
-    weight 0
-  ]
-  edge [
-    source 2
-    target 56
-    weight 0
-  ]
-  edge [
-    source 2
-    target 57
-    weight 0
-  ]
-  edge [
-    source 2
-    target 58
-    weight 0
-  ]
-  edge [
-    source 2
-    target 59
-    weight 0
-  ]
-  edge [
-    source 2
-    target 60
-    weight 0
-  ]
-  edge [
-    source 2
-    target 61
-    weight 0
-  ]
-  edge [
-    source 2
-    target 62
-    weight 0
-  ]
-  edge [
-    source 2
-    target 63
-    weight 0
-  ]
-  edge [
-    source 2
-    target 64
-    weight 0
-  ]
-  edge [
-    source 2
-    target 65
-    weight 0
-  ]
-  edge [
-    source 2
-    target 66
-    weight 0
-  ]
-  edge [
-    source 2
-    target 67
-    weight 0
-  ]
-  edge [
-    source 2
-    target 68
-    weight 0
-  ]
-  edge [
-    source 2
-    target 69
-    weight 0
-  ]
-  edge [
-    source 2
-    target 70
-    weight 0
-  ]
-  edge [
-    source 2
-    target 71
-    weight 0
-  ]
-  edge [
-    source 2
-    target 72
-    weight 0
-  ]
-  edge [
-    source 2
-    target 73
-    weight 0
-  ]
-  edge [
-    source 2
-    target 74
-    weight 0
-  ]
-  edge [
-    source 2
-    target 75
-    weight 0
-  ]
-  edge [
-    source 2
-    target 76
-    weight 0
-  ]
-  edge [
-    source 2
-    target 77
-    weight 0
-  ]
-  edge [
-    source 2
-    target 78
-    weight 0
-  ]
-  edge [
-    source 2
-    target 79
-    weight 0
-  ]
-  edge [
-    source 2
-    target 80
-    weight 0
-  ]
-  edge [
-    source 2
-    target 81
-    weight 0
-  ]
-  edge [
-    source 2
-    target 82
-    weight 0
-  ]
-  edge [
-    source 2
-    target 83
-    weight -0.1
-  ]
-  edge [
-    source 2
-    target 84
-    weight 0
-  ]
-  edge [
-    source 2
-    target 85
-    weight 0
-  ]
-  edge [
-    source 2
-    target 86
-    weight 0
-  ]
-  edge [
-    source 2
-    target 87
-    weight 0
-  ]
-  edge [
-    source 2
-    target 88
-    weight 0
-  ]
-  edge [
-    source 2
-    target 89
-    weight 0
-  ]
-  edge [
-    source 2
-    target 90
-    weight 0
-  ]
-  edge [
-    source 2
-    target 91
+    source 26
+    target 30
     weight -0.1
   ]
   edge [
-    source 2
-    target 92
-    weight 0
-  ]
-  edge [
-    source 2
-    target 93
+    source 26
+    target 31
     weight -0.1
   ]
   edge [
-    source 2
-    target 94
-    weight 0
-  ]
-  edge [
-    source 2
-    target 95
-    weight 0
-  ]
-  edge [
-    source 2
+    source 26
     target 96
-    weight 0
-  ]
-  edge [
-    source 2
-    target 97
-    weight 0
-  ]
-  edge [
-    source 2
-    target 98
-    weight 0
-  ]
-  edge [
-    source 2
-    target 99
     weight 0.1
   ]
   edge [
-    source 2
-    target 100
-    weight 0
-  ]
-  edge [
-    source 3
-    target 4
-    weight -0.1
-  ]
-  edge [
-    source 3
-    target 5
-    weight -0.1
-  ]
-  edge [
-    source 3
-    target 6
-    weight -0.1
-  ]
-  edge [
-    source 3
-    target 7
+    source 27
+    target 32
     weight -0.1
   ]
   edge [
-    source 3
-    target 8
-    weight 0
-  ]
-  edge [
-    source 3
-    target 9
+    source 27
+    target 83
     weight -0.1
   ]
   edge [
-    source 3
-    target 10
-    weight 0
-  ]
-  edge [
-    source 3
-    target 11
-    weight 0
-  ]
-  edge [
-    source 3
-    target 12
-    weight 0
-  ]
-  edge [
-    source 3
-    target 13
-    weight 0
-  ]
-  edge [
-    source 3
-    target 14
-    weight 0.1
-  ]
-  edge [
-    source 3
-    target 15
-    weight 0.1
-  ]
-  edge [
-    source 3
-    target 16
-    weight 0.1
-  ]
-  edge [
-    source 3
-    target 17
-    weight 0
-  ]
-  edge [
-    source 3
-    target 18
-    weight 0.1
-  ]
-  edge [
-    source 3
-    target 19
-    weight 0
-  ]
-  edge [
-    source 3
-    target 20
-    weight 0
-  ]
-  edge [
-    source 3
-    target 21
-    weight 0
-  ]
-  edge [
-    source 3
-    target 22
+    source 27
+    target 98
     weight 0.1
   ]
   edge [
-    source 3
-    target 23
-    weight 0
-  ]
-  edge [
-    source 3
-    target 24
-    weight 0.2
-  ]
-  edge [
-    source 3
-    target 25
-    weight 0
-  ]
-  edge [
-    source 3
-    target 26
-    weight 0
-  ]
-  edge [
-    source 3
-    target 27
-    weight 0
-  ]
-  edge [
-    source 3
-    target 28
-    weight -0.1
-  ]
-  edge [
-    source 3
-    target 29
-    weight 0
-  ]
-  edge [
-    source 3
-    target 30
-    weight 0
-  ]
-  edge [
-    source 3
-    target 31
-    weight 0
-  ]
-  edge [
-    source 3
-    target 32
-    weight 0
-  ]
-  edge [
-    source 3
-    target 33
-    weight 0
-  ]
-  edge [
-    source 3
-    target 34
-    weight 0
-  ]
-  edge [
-    source 3
-    target 35
-    weight 0
-  ]
-  edge [
-    source 3
-    target 36
-    weight -0.1
-  ]
-  edge [
-    source 3
-    target 37
-    weight 0
-  ]
-  edge [
-    source 3
-    target 38
-    weight 0
-  ]
-  edge [
-    source 3
-    target 39
-    weight 0
-  ]
-  edge [
-    source 3
-    target 40
-    weight 0
-  ]
-  edge [
-    source 3
-    target 41
-    weight 0
-  ]
-  edge [
-    source 3
-    target 42
-    weight 0
-  ]
-  edge [
-    source 3
-    target 43
-    weight 0
-  ]
-  edge [
-    source 3
-    target 44
-    weight 0
-  ]
-  edge [
-    source 3
-    target 45
-    weight 0
-  ]
-  edge [
-    source 3
-    target 46
-    weight 0
-  ]
-  edge [
-    source 3
-    target 47
-    weight 0
-  ]
-  edge [
-    source 3
-    target 48
-    weight 0
-  ]
-  edge [
-    source 3
-    target 49
-    weight 0
-  ]
-  edge [
-    source 3
-    target 50
-    weight 0
-  ]
-  edge [
-    source 3
-    target 51
-    weight 0
-  ]
-  edge [
-    source 3
-    target 52
-    weight 0
-  ]
-  edge [
-    source 3
-    target 53
-    weight 0
-  ]
-  edge [
-    source 3
-    target 54
-    weight 0
-  ]
-  edge [
-    source 3
-    target 55
-    weight 0
-  ]
-  edge [
-    source 3
-    target 56
-    weight 0
-  ]
-  edge [
-    source 3
-    target 57
-    weight 0
-  ]
-  edge [
-    source 3
-    target 58
-    weight 0
-  ]
-  edge [
-    source 3
-    target 59
-    weight 0
-  ]
-  edge [
-    source 3
-    target 60
-    weight 0
-  ]
-  edge [
-    source 3
-    target 61
-    weight 0
-  ]
-  edge [
-    source 3
-    target 62
-    weight 0
-  ]
-  edge [
-    source 3
-    target 63
-    weight 0
-  ]
-  edge [
-    source 3
-    target 64
-    weight 0
-  ]
-  edge [
-    source 3
-    target 65
-    weight 0
-  ]
-  edge [
-    source 3
-    target 66
-    weight 0
-  ]
-  edge [
-    source 3
-    target 67
-    weight 0
-  ]
-  edge [
-    source 3
-    target 68
-    weight 0
-  ]
-  edge [
-    source 3
-    target 69
-    weight 0
-  ]
-  edge [
-    source 3
-    target 70
-    weight 0
-  ]
-  edge [
-    source 3
-    target 71
-    weight 0
-  ]
-  edge [
-    source 3
-    target 72
-    weight 0
-  ]
-  edge [
-    source 3
-    target 73
-    weight 0
-  ]
-  edge [
-    source 3
-    target 74
-    weight 0
-  ]
-  edge [
-    source 3
-    target 75
-    weight 0
-  ]
-  edge [
-    source 3
-    target 76
-    weight 0
-  ]
-  edge [
-    source 3
-    target 77
-    weight 0
-  ]
-  edge [
-    source 3
-    target 78
-    weight 0
-  ]
-  edge [
-    source 3
-    target 79
-    weight 0
-  ]
-  edge [
-    source 3
-    target 80
-    weight 0
-  ]
-  edge [
-    source 3
-    target 81
-    weight 0
-  ]
-  edge [
-    source 3
-    target 82
-    weight 0
-  ]
-  edge [
-    source 3
-    target 83
-    weight 0
-  ]
-  edge [
-    source 3
-    target 84
-    weight 0
-  ]
-  edge [
-    source 3
-    target 85
-    weight -0.1
-  ]
-  edge [
-    source 3
-    target 86
-    weight 0
-  ]
-  edge [
-    source 3
-    target 87
-    weight 0
-  ]
-  edge [
-    source 3
-    target 88
-    weight 0
-  ]
-  edge [
-    source 3
-    target 89
-    weight 0
-  ]
-  edge [
-    source 3
-    target 90
-    weight 0
-  ]
-  edge [
-    source 3
-    target 91
-    weight 0
-  ]
-  edge [
-    source 3
-    target 92
-    weight 0
-  ]
-  edge [
-    source 3
-    target 93
-    weight 0
-  ]
-  edge [
-    source 3
-    target 94
-    weight 0
-  ]
-  edge [
-    source 3
-    target 95
-    weight 0
-  ]
-  edge [
-    source 3
-    target 96
-    weight 0
-  ]
-  edge [
-    source 3
-    target 97
-    weight 0
-  ]
-  edge [
-    source 3
-    target 98
-    weight 0
-  ]
-  edge [
-    source 3
-    target 99
-    weight 0.1
-  ]
-  edge [
-    source 3
-    target 100
-    weight 0
-  ]
-  edge [
-    source 4
-    target 5
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 6
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 7
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 8
-    weight 0
-  ]
-  edge [
-    source 4
-    target 9
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 10
-    weight 0
-  ]
-  edge [
-    source 4
-    target 11
-    weight 0
-  ]
-  edge [
-    source 4
-    target 12
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 13
-    weight 0
-  ]
-  edge [
-    source 4
-    target 14
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 15
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 16
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 17
-    weight 0
-  ]
-  edge [
-    source 4
-    target 18
-    weight 0
-  ]
-  edge [
-    source 4
-    target 19
-    weight 0
-  ]
-  edge [
-    source 4
-    target 20
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 21
-    weight 0
-  ]
-  edge [
-    source 4
-    target 22
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 23
-    weight 0
-  ]
-  edge [
-    source 4
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 25
-    weight 0
-  ]
-  edge [
-    source 4
-    target 26
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 27
-    weight 0
-  ]
-  edge [
-    source 4
-    target 28
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 29
-    weight 0
-  ]
-  edge [
-    source 4
-    target 30
-    weight 0
-  ]
-  edge [
-    source 4
-    target 31
-    weight 0
-  ]
-  edge [
-    source 4
-    target 32
-    weight 0
-  ]
-  edge [
-    source 4
-    target 33
-    weight 0
-  ]
-  edge [
-    source 4
-    target 34
-    weight 0
-  ]
-  edge [
-    source 4
-    target 35
-    weight 0
-  ]
-  edge [
-    source 4
-    target 36
-    weight 0
-  ]
-  edge [
-    source 4
-    target 37
-    weight 0
-  ]
-  edge [
-    source 4
-    target 38
-    weight 0
-  ]
-  edge [
-    source 4
-    target 39
-    weight 0
-  ]
-  edge [
-    source 4
-    target 40
-    weight 0
-  ]
-  edge [
-    source 4
-    target 41
-    weight 0
-  ]
-  edge [
-    source 4
-    target 42
-    weight 0
-  ]
-  edge [
-    source 4
-    target 43
-    weight 0
-  ]
-  edge [
-    source 4
-    target 44
-    weight 0
-  ]
-  edge [
-    source 4
-    target 45
-    weight 0
-  ]
-  edge [
-    source 4
-    target 46
-    weight 0
-  ]
-  edge [
-    source 4
-    target 47
-    weight 0
-  ]
-  edge [
-    source 4
-    target 48
-    weight 0
-  ]
-  edge [
-    source 4
-    target 49
-    weight 0
-  ]
-  edge [
-    source 4
-    target 50
-    weight 0
-  ]
-  edge [
-    source 4
-    target 51
-    weight 0
-  ]
-  edge [
-    source 4
-    target 52
-    weight 0
-  ]
-  edge [
-    source 4
-    target 53
-    weight 0
-  ]
-  edge [
-    source 4
-    target 54
-    weight 0
-  ]
-  edge [
-    source 4
-    target 55
-    weight 0
-  ]
-  edge [
-    source 4
-    target 56
-    weight 0
-  ]
-  edge [
-    source 4
-    target 57
-    weight 0
-  ]
-  edge [
-    source 4
-    target 58
-    weight 0
-  ]
-  edge [
-    source 4
-    target 59
-    weight 0
-  ]
-  edge [
-    source 4
-    target 60
-    weight 0
-  ]
-  edge [
-    source 4
-    target 61
-    weight 0
-  ]
-  edge [
-    source 4
-    target 62
-    weight 0
-  ]
-  edge [
-    source 4
-    target 63
-    weight 0
-  ]
-  edge [
-    source 4
-    target 64
-    weight 0
-  ]
-  edge [
-    source 4
-    target 65
-    weight 0
-  ]
-  edge [
-    source 4
-    target 66
-    weight 0
-  ]
-  edge [
-    source 4
-    target 67
-    weight 0
-  ]
-  edge [
-    source 4
-    target 68
-    weight 0
-  ]
-  edge [
-    source 4
-    target 69
-    weight 0
-  ]
-  edge [
-    source 4
-    target 70
-    weight 0
-  ]
-  edge [
-    source 4
-    target 71
-    weight 0
-  ]
-  edge [
-    source 4
-    target 72
-    weight 0
-  ]
-  edge [
-    source 4
-    target 73
-    weight 0
-  ]
-  edge [
-    source 4
-    target 74
-    weight 0
-  ]
-  edge [
-    source 4
-    target 75
-    weight 0
-  ]
-  edge [
-    source 4
-    target 76
-    weight 0
-  ]
-  edge [
-    source 4
-    target 77
-    weight 0
-  ]
-  edge [
-    source 4
-    target 78
-    weight 0
-  ]
-  edge [
-    source 4
-    target 79
-    weight 0
-  ]
-  edge [
-    source 4
-    target 80
-    weight 0
-  ]
-  edge [
-    source 4
-    target 81
-    weight 0
-  ]
-  edge [
-    source 4
-    target 82
-    weight 0
-  ]
-  edge [
-    source 4
-    target 83
-    weight 0
-  ]
-  edge [
-    source 4
-    target 84
-    weight 0
-  ]
-  edge [
-    source 4
-    target 85
-    weight 0
-  ]
-  edge [
-    source 4
-    target 86
-    weight 0
-  ]
-  edge [
-    source 4
-    target 87
-    weight 0
-  ]
-  edge [
-    source 4
-    target 88
-    weight -0.1
-  ]
-  edge [
-    source 4
-    target 89
-    weight 0
-  ]
-  edge [
-    source 4
-    target 90
-    weight 0
-  ]
-  edge [
-    source 4
-    target 91
-    weight 0
-  ]
-  edge [
-    source 4
-    target 92
-    weight 0
-  ]
-  edge [
-    source 4
-    target 93
-    weight 0
-  ]
-  edge [
-    source 4
-    target 94
-    weight 0
-  ]
-  edge [
-    source 4
-    target 95
-    weight 0
-  ]
-  edge [
-    source 4
-    target 96
-    weight 0
-  ]
-  edge [
-    source 4
-    target 97
-    weight 0
-  ]
-  edge [
-    source 4
-    target 98
-    weight 0
-  ]
-  edge [
-    source 4
-    target 99
-    weight 0.1
-  ]
-  edge [
-    source 4
-    target 100
-    weight 0
-  ]
-  edge [
-    source 5
-    target 6
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 7
-    weight 0
-  ]
-  edge [
-    source 5
-    target 8
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 9
-    weight 0
-  ]
-  edge [
-    source 5
-    target 10
-    weight 0
-  ]
-  edge [
-    source 5
-    target 11
-    weight 0
-  ]
-  edge [
-    source 5
-    target 12
-    weight 0.1
-  ]
-  edge [
-    source 5
-    target 13
-    weight 0
-  ]
-  edge [
-    source 5
-    target 14
-    weight 0.1
-  ]
-  edge [
-    source 5
-    target 15
-    weight 0.1
-  ]
-  edge [
-    source 5
-    target 16
-    weight 0
-  ]
-  edge [
-    source 5
-    target 17
-    weight 0.1
-  ]
-  edge [
-    source 5
-    target 18
-    weight 0
-  ]
-  edge [
-    source 5
-    target 19
-    weight 0
-  ]
-  edge [
-    source 5
-    target 20
-    weight 0
-  ]
-  edge [
-    source 5
-    target 21
-    weight 0
-  ]
-  edge [
-    source 5
-    target 22
-    weight 0
-  ]
-  edge [
-    source 5
-    target 23
-    weight 0
-  ]
-  edge [
-    source 5
-    target 24
-    weight 0
-  ]
-  edge [
-    source 5
-    target 25
-    weight 0
-  ]
-  edge [
-    source 5
-    target 26
-    weight 0
-  ]
-  edge [
-    source 5
-    target 27
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 28
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 29
-    weight 0
-  ]
-  edge [
-    source 5
-    target 30
-    weight 0
-  ]
-  edge [
-    source 5
-    target 31
-    weight 0
-  ]
-  edge [
-    source 5
-    target 32
-    weight 0
-  ]
-  edge [
-    source 5
-    target 33
-    weight 0
-  ]
-  edge [
-    source 5
-    target 34
-    weight 0
-  ]
-  edge [
-    source 5
-    target 35
-    weight 0
-  ]
-  edge [
-    source 5
-    target 36
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 37
-    weight 0
-  ]
-  edge [
-    source 5
-    target 38
-    weight 0
-  ]
-  edge [
-    source 5
-    target 39
-    weight 0
-  ]
-  edge [
-    source 5
-    target 40
-    weight 0
-  ]
-  edge [
-    source 5
-    target 41
-    weight 0
-  ]
-  edge [
-    source 5
-    target 42
-    weight 0
-  ]
-  edge [
-    source 5
-    target 43
-    weight 0
-  ]
-  edge [
-    source 5
-    target 44
-    weight 0
-  ]
-  edge [
-    source 5
-    target 45
-    weight 0
-  ]
-  edge [
-    source 5
-    target 46
-    weight 0
-  ]
-  edge [
-    source 5
-    target 47
-    weight 0
-  ]
-  edge [
-    source 5
-    target 48
-    weight 0
-  ]
-  edge [
-    source 5
-    target 49
-    weight 0
-  ]
-  edge [
-    source 5
-    target 50
-    weight 0
-  ]
-  edge [
-    source 5
-    target 51
-    weight 0
-  ]
-  edge [
-    source 5
-    target 52
-    weight 0
-  ]
-  edge [
-    source 5
-    target 53
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 54
-    weight 0
-  ]
-  edge [
-    source 5
-    target 55
-    weight 0
-  ]
-  edge [
-    source 5
-    target 56
-    weight 0
-  ]
-  edge [
-    source 5
-    target 57
-    weight 0
-  ]
-  edge [
-    source 5
-    target 58
-    weight 0
-  ]
-  edge [
-    source 5
-    target 59
-    weight 0
-  ]
-  edge [
-    source 5
-    target 60
-    weight 0
-  ]
-  edge [
-    source 5
-    target 61
-    weight 0
-  ]
-  edge [
-    source 5
-    target 62
-    weight 0
-  ]
-  edge [
-    source 5
-    target 63
-    weight 0
-  ]
-  edge [
-    source 5
-    target 64
-    weight 0
-  ]
-  edge [
-    source 5
-    target 65
-    weight 0
-  ]
-  edge [
-    source 5
-    target 66
-    weight 0
-  ]
-  edge [
-    source 5
-    target 67
-    weight 0
-  ]
-  edge [
-    source 5
-    target 68
-    weight 0
-  ]
-  edge [
-    source 5
-    target 69
-    weight 0
-  ]
-  edge [
-    source 5
-    target 70
-    weight 0
-  ]
-  edge [
-    source 5
-    target 71
-    weight 0
-  ]
-  edge [
-    source 5
-    target 72
-    weight 0
-  ]
-  edge [
-    source 5
-    target 73
-    weight 0
-  ]
-  edge [
-    source 5
-    target 74
-    weight 0
-  ]
-  edge [
-    source 5
-    target 75
-    weight 0
-  ]
-  edge [
-    source 5
-    target 76
-    weight 0
-  ]
-  edge [
-    source 5
-    target 77
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 78
-    weight 0
-  ]
-  edge [
-    source 5
-    target 79
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 80
-    weight 0
-  ]
-  edge [
-    source 5
-    target 81
-    weight 0
-  ]
-  edge [
-    source 5
-    target 82
-    weight 0
-  ]
-  edge [
-    source 5
-    target 83
-    weight 0
-  ]
-  edge [
-    source 5
-    target 84
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 85
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 86
-    weight 0
-  ]
-  edge [
-    source 5
-    target 87
-    weight 0
-  ]
-  edge [
-    source 5
-    target 88
-    weight 0
-  ]
-  edge [
-    source 5
-    target 89
-    weight 0
-  ]
-  edge [
-    source 5
-    target 90
-    weight 0
-  ]
-  edge [
-    source 5
-    target 91
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 92
-    weight 0
-  ]
-  edge [
-    source 5
-    target 93
-    weight 0
-  ]
-  edge [
-    source 5
-    target 94
-    weight 0
-  ]
-  edge [
-    source 5
-    target 95
-    weight 0
-  ]
-  edge [
-    source 5
-    target 96
-    weight 0
-  ]
-  edge [
-    source 5
-    target 97
-    weight -0.1
-  ]
-  edge [
-    source 5
-    target 98
-    weight 0
-  ]
-  edge [
-    source 5
-    target 99
-    weight 0
-  ]
-  edge [
-    source 5
-    target 100
-    weight 0
-  ]
-  edge [
-    source 6
-    target 7
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 8
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 9
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 10
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 11
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 12
-    weight 0
-  ]
-  edge [
-    source 6
-    target 13
-    weight 0
-  ]
-  edge [
-    source 6
-    target 14
-    weight 0
-  ]
-  edge [
-    source 6
-    target 15
-    weight 0
-  ]
-  edge [
-    source 6
-    target 16
-    weight 0.1
-  ]
-  edge [
-    source 6
-    target 17
-    weight 0.1
-  ]
-  edge [
-    source 6
-    target 18
-    weight 0
-  ]
-  edge [
-    source 6
-    target 19
-    weight 0
-  ]
-  edge [
-    source 6
-    target 20
-    weight 0.1
-  ]
-  edge [
-    source 6
-    target 21
-    weight 0
-  ]
-  edge [
-    source 6
-    target 22
-    weight 0.2
-  ]
-  edge [
-    source 6
-    target 23
-    weight 0
-  ]
-  edge [
-    source 6
-    target 24
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 25
-    weight 0
-  ]
-  edge [
-    source 6
-    target 26
-    weight 0
-  ]
-  edge [
-    source 6
-    target 27
-    weight 0
-  ]
-  edge [
-    source 6
-    target 28
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 29
-    weight 0
-  ]
-  edge [
-    source 6
-    target 30
-    weight 0
-  ]
-  edge [
-    source 6
-    target 31
-    weight 0
-  ]
-  edge [
-    source 6
-    target 32
-    weight 0
-  ]
-  edge [
-    source 6
-    target 33
-    weight 0
-  ]
-  edge [
-    source 6
-    target 34
-    weight 0
-  ]
-  edge [
-    source 6
-    target 35
-    weight 0
-  ]
-  edge [
-    source 6
-    target 36
-    weight 0
-  ]
-  edge [
-    source 6
-    target 37
-    weight 0
-  ]
-  edge [
-    source 6
-    target 38
-    weight 0
-  ]
-  edge [
-    source 6
-    target 39
-    weight 0
-  ]
-  edge [
-    source 6
-    target 40
-    weight 0
-  ]
-  edge [
-    source 6
-    target 41
-    weight 0
-  ]
-  edge [
-    source 6
-    target 42
-    weight 0
-  ]
-  edge [
-    source 6
-    target 43
-    weight 0
-  ]
-  edge [
-    source 6
-    target 44
-    weight 0
-  ]
-  edge [
-    source 6
-    target 45
-    weight 0
-  ]
-  edge [
-    source 6
-    target 46
-    weight 0
-  ]
-  edge [
-    source 6
-    target 47
-    weight 0
-  ]
-  edge [
-    source 6
-    target 48
-    weight 0
-  ]
-  edge [
-    source 6
-    target 49
-    weight 0
-  ]
-  edge [
-    source 6
-    target 50
-    weight 0
-  ]
-  edge [
-    source 6
-    target 51
-    weight 0
-  ]
-  edge [
-    source 6
-    target 52
-    weight 0
-  ]
-  edge [
-    source 6
-    target 53
-    weight 0
-  ]
-  edge [
-    source 6
-    target 54
-    weight 0
-  ]
-  edge [
-    source 6
-    target 55
-    weight 0
-  ]
-  edge [
-    source 6
-    target 56
-    weight 0
-  ]
-  edge [
-    source 6
-    target 57
-    weight 0
-  ]
-  edge [
-    source 6
-    target 58
-    weight 0
-  ]
-  edge [
-    source 6
-    target 59
-    weight 0
-  ]
-  edge [
-    source 6
-    target 60
-    weight 0
-  ]
-  edge [
-    source 6
-    target 61
-    weight 0
-  ]
-  edge [
-    source 6
-    target 62
-    weight 0
-  ]
-  edge [
-    source 6
-    target 63
-    weight 0
-  ]
-  edge [
-    source 6
-    target 64
-    weight 0
-  ]
-  edge [
-    source 6
-    target 65
-    weight 0
-  ]
-  edge [
-    source 6
-    target 66
-    weight 0
-  ]
-  edge [
-    source 6
-    target 67
-    weight 0
-  ]
-  edge [
-    source 6
-    target 68
-    weight 0
-  ]
-  edge [
-    source 6
-    target 69
-    weight 0
-  ]
-  edge [
-    source 6
-    target 70
-    weight 0
-  ]
-  edge [
-    source 6
-    target 71
-    weight 0
-  ]
-  edge [
-    source 6
-    target 72
-    weight 0
-  ]
-  edge [
-    source 6
-    target 73
-    weight 0
-  ]
-  edge [
-    source 6
-    target 74
-    weight 0
-  ]
-  edge [
-    source 6
-    target 75
-    weight 0
-  ]
-  edge [
-    source 6
-    target 76
-    weight 0
-  ]
-  edge [
-    source 6
-    target 77
-    weight 0
-  ]
-  edge [
-    source 6
-    target 78
-    weight 0
-  ]
-  edge [
-    source 6
-    target 79
-    weight 0
-  ]
-  edge [
-    source 6
-    target 80
-    weight 0
-  ]
-  edge [
-    source 6
-    target 81
-    weight 0
-  ]
-  edge [
-    source 6
-    target 82
-    weight 0
-  ]
-  edge [
-    source 6
-    target 83
-    weight 0
-  ]
-  edge [
-    source 6
-    target 84
-    weight 0
-  ]
-  edge [
-    source 6
-    target 85
-    weight 0
-  ]
-  edge [
-    source 6
-    target 86
-    weight 0
-  ]
-  edge [
-    source 6
-    target 87
-    weight 0
-  ]
-  edge [
-    source 6
-    target 88
-    weight -0.1
-  ]
-  edge [
-    source 6
-    target 89
-    weight 0
-  ]
-  edge [
-    source 6
-    target 90
-    weight 0
-  ]
-  edge [
-    source 6
-    target 91
-    weight 0
-  ]
-  edge [
-    source 6
-    target 92
-    weight 0
-  ]
-  edge [
-    source 6
-    target 93
-    weight 0
-  ]
-  edge [
-    source 6
-    target 94
-    weight 0
-  ]
-  edge [
-    source 6
-    target 95
-    weight 0
-  ]
-  edge [
-    source 6
-    target 96
-    weight 0
-  ]
-  edge [
-    source 6
-    target 97
-    weight 0
-  ]
-  edge [
-    source 6
-    target 98
-    weight 0
-  ]
-  edge [
-    source 6
-    target 99
-    weight 0
-  ]
-  edge [
-    source 6
-    target 100
-    weight 0
-  ]
-  edge [
-    source 7
-    target 8
-    weight 0
-  ]
-  edge [
-    source 7
-    target 9
-    weight 0
-  ]
-  edge [
-    source 7
-    target 10
-    weight 0
-  ]
-  edge [
-    source 7
-    target 11
-    weight 0
-  ]
-  edge [
-    source 7
-    target 12
-    weight 0.1
-  ]
-  edge [
-    source 7
-    target 13
-    weight 0.1
-  ]
-  edge [
-    source 7
-    target 14
-    weight 0
-  ]
-  edge [
-    source 7
-    target 15
-    weight 0
-  ]
-  edge [
-    source 7
-    target 16
-    weight 0
-  ]
-  edge [
-    source 7
-    target 17
-    weight 0
-  ]
-  edge [
-    source 7
-    target 18
-    weight 0
-  ]
-  edge [
-    source 7
-    target 19
-    weight -0.1
-  ]
-  edge [
-    source 7
-    target 20
-    weight 0
-  ]
-  edge [
-    source 7
-    target 21
-    weight 0
-  ]
-  edge [
-    source 7
-    target 22
-    weight 0
-  ]
-  edge [
-    source 7
-    target 23
-    weight 0
-  ]
-  edge [
-    source 7
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 7
-    target 25
-    weight 0
-  ]
-  edge [
-    source 7
-    target 26
-    weight 0
-  ]
-  edge [
-    source 7
-    target 27
-    weight 0
-  ]
-  edge [
-    source 7
-    target 28
-    weight 0
-  ]
-  edge [
-    source 7
-    target 29
-    weight 0
-  ]
-  edge [
-    source 7
-    target 30
-    weight 0
-  ]
-  edge [
-    source 7
-    target 31
-    weight 0
-  ]
-  edge [
-    source 7
-    target 32
-    weight 0
-  ]
-  edge [
-    source 7
-    target 33
-    weight 0
-  ]
-  edge [
-    source 7
-    target 34
-    weight 0
-  ]
-  edge [
-    source 7
-    target 35
-    weight 0
-  ]
-  edge [
-    source 7
-    target 36
-    weight 0
-  ]
-  edge [
-    source 7
-    target 37
-    weight 0
-  ]
-  edge [
-    source 7
-    target 38
-    weight 0
-  ]
-  edge [
-    source 7
-    target 39
-    weight 0
-  ]
-  edge [
-    source 7
-    target 40
-    weight 0
-  ]
-  edge [
-    source 7
-    target 41
-    weight 0
-  ]
-  edge [
-    source 7
-    target 42
-    weight 0
-  ]
-  edge [
-    source 7
-    target 43
-    weight 0
-  ]
-  edge [
-    source 7
-    target 44
-    weight 0
-  ]
-  edge [
-    source 7
-    target 45
-    weight 0
-  ]
-  edge [
-    source 7
-    target 46
-    weight 0
-  ]
-  edge [
-    source 7
-    target 47
-    weight 0
-  ]
-  edge [
-    source 7
-    target 48
-    weight 0
-  ]
-  edge [
-    source 7
-    target 49
-    weight 0
-  ]
-  edge [
-    source 7
-    target 50
-    weight 0
-  ]
-  edge [
-    source 7
-    target 51
-    weight 0
-  ]
-  edge [
-    source 7
-    target 52
-    weight 0
-  ]
-  edge [
-    source 7
-    target 53
-    weight 0
-  ]
-  edge [
-    source 7
-    target 54
-    weight 0
-  ]
-  edge [
-    source 7
-    target 55
-    weight 0
-  ]
-  edge [
-    source 7
-    target 56
-    weight 0
-  ]
-  edge [
-    source 7
-    target 57
-    weight 0
-  ]
-  edge [
-    source 7
-    target 58
-    weight 0
-  ]
-  edge [
-    source 7
-    target 59
-    weight 0
-  ]
-  edge [
-    source 7
-    target 60
-    weight 0
-  ]
-  edge [
-    source 7
-    target 61
-    weight 0
-  ]
-  edge [
-    source 7
-    target 62
-    weight 0
-  ]
-  edge [
-    source 7
-    target 63
-    weight 0
-  ]
-  edge [
-    source 7
-    target 64
-    weight 0
-  ]
-  edge [
-    source 7
-    target 65
-    weight 0
-  ]
-  edge [
-    source 7
-    target 66
-    weight 0
-  ]
-  edge [
-    source 7
-    target 67
-    weight 0
-  ]
-  edge [
-    source 7
-    target 68
-    weight 0
-  ]
-  edge [
-    source 7
-    target 69
-    weight 0
-  ]
-  edge [
-    source 7
-    target 70
-    weight 0
-  ]
-  edge [
-    source 7
-    target 71
-    weight 0
-  ]
-  edge [
-    source 7
-    target 72
-    weight 0
-  ]
-  edge [
-    source 7
-    target 73
-    weight 0
-  ]
-  edge [
-    source 7
-    target 74
-    weight 0
-  ]
-  edge [
-    source 7
-    target 75
-    weight 0
-  ]
-  edge [
-    source 7
-    target 76
-    weight 0
-  ]
-  edge [
-    source 7
-    target 77
-    weight 0
-  ]
-  edge [
-    source 7
-    target 78
-    weight 0
-  ]
-  edge [
-    source 7
-    target 79
-    weight 0
-  ]
-  edge [
-    source 7
-    target 80
-    weight 0
-  ]
-  edge [
-    source 7
-    target 81
-    weight 0
-  ]
-  edge [
-    source 7
-    target 82
-    weight 0
-  ]
-  edge [
-    source 7
-    target 83
-    weight 0
-  ]
-  edge [
-    source 7
-    target 84
-    weight 0
-  ]
-  edge [
-    source 7
-    target 85
-    weight 0
-  ]
-  edge [
-    source 7
-    target 86
-    weight 0
-  ]
-  edge [
-    source 7
-    target 87
-    weight 0
-  ]
-  edge [
-    source 7
-    target 88
-    weight 0
-  ]
-  edge [
-    source 7
-    target 89
-    weight 0
-  ]
-  edge [
-    source 7
-    target 90
-    weight 0
-  ]
-  edge [
-    source 7
-    target 91
-    weight 0
-  ]
-  edge [
-    source 7
-    target 92
-    weight 0
-  ]
-  edge [
-    source 7
-    target 93
-    weight -0.1
-  ]
-  edge [
-    source 7
-    target 94
-    weight 0
-  ]
-  edge [
-    source 7
-    target 95
-    weight 0.1
-  ]
-  edge [
-    source 7
-    target 96
-    weight 0
-  ]
-  edge [
-    source 7
-    target 97
-    weight 0
-  ]
-  edge [
-    source 7
-    target 98
-    weight 0
-  ]
-  edge [
-    source 7
-    target 99
-    weight 0
-  ]
-  edge [
-    source 7
-    target 100
-    weight 0
-  ]
-  edge [
-    source 8
-    target 9
-    weight -0.1
-  ]
-  edge [
-    source 8
-    target 10
-    weight -0.1
-  ]
-  edge [
-    source 8
-    target 11
-    weight -0.1
-  ]
-  edge [
-    source 8
-    target 12
-    weight 0
-  ]
-  edge [
-    source 8
-    target 13
-    weight 0.1
-  ]
-  edge [
-    source 8
-    target 14
-    weight 0.1
-  ]
-  edge [
-    source 8
-    target 15
-    weight 0
-  ]
-  edge [
-    source 8
-    target 16
-    weight 0.1
-  ]
-  edge [
-    source 8
-    target 17
-    weight 0
-  ]
-  edge [
-    source 8
-    target 18
-    weight 0
-  ]
-  edge [
-    source 8
-    target 19
-    weight 0
-  ]
-  edge [
-    source 8
-    target 20
-    weight 0
-  ]
-  edge [
-    source 8
-    target 21
-    weight 0
-  ]
-  edge [
-    source 8
-    target 22
-    weight 0
-  ]
-  edge [
-    source 8
-    target 23
-    weight 0
-  ]
-  edge [
-    source 8
-    target 24
-    weight 0
-  ]
-  edge [
-    source 8
-    target 25
-    weight 0
-  ]
-  edge [
-    source 8
-    target 26
-    weight 0
-  ]
-  edge [
-    source 8
-    target 27
-    weight 0
-  ]
-  edge [
-    source 8
-    target 28
-    weight 0
-  ]
-  edge [
-    source 8
-    target 29
-    weight 0
-  ]
-  edge [
-    source 8
-    target 30
-    weight 0
-  ]
-  edge [
-    source 8
-    target 31
-    weight 0
-  ]
-  edge [
-    source 8
-    target 32
-    weight 0
-  ]
-  edge [
-    source 8
-    target 33
-    weight 0
-  ]
-  edge [
-    source 8
-    target 34
-    weight 0
-  ]
-  edge [
-    source 8
-    target 35
-    weight 0
-  ]
-  edge [
-    source 8
-    target 36
-    weight 0
-  ]
-  edge [
-    source 8
-    target 37
-    weight 0
-  ]
-  edge [
-    source 8
-    target 38
-    weight 0
-  ]
-  edge [
-    source 8
-    target 39
-    weight 0
-  ]
-  edge [
-    source 8
-    target 40
-    weight 0
-  ]
-  edge [
-    source 8
-    target 41
-    weight 0
-  ]
-  edge [
-    source 8
-    target 42
-    weight 0
-  ]
-  edge [
-    source 8
-    target 43
-    weight 0
-  ]
-  edge [
-    source 8
-    target 44
-    weight 0
-  ]
-  edge [
-    source 8
-    target 45
-    weight 0
-  ]
-  edge [
-    source 8
-    target 46
-    weight 0
-  ]
-  edge [
-    source 8
-    target 47
-    weight 0
-  ]
-  edge [
-    source 8
-    target 48
-    weight 0
-  ]
-  edge [
-    source 8
-    target 49
-    weight 0
-  ]
-  edge [
-    source 8
-    target 50
-    weight 0
-  ]
-  edge [
-    source 8
-    target 51
-    weight 0
-  ]
-  edge [
-    source 8
-    target 52
-    weight 0
-  ]
-  edge [
-    source 8
-    target 53
-    weight 0
-  ]
-  edge [
-    source 8
-    target 54
-    weight 0
-  ]
-  edge [
-    source 8
-    target 55
-    weight 0
-  ]
-  edge [
-    source 8
-    target 56
-    weight 0
-  ]
-  edge [
-    source 8
-    target 57
-    weight 0
-  ]
-  edge [
-    source 8
-    target 58
-    weight 0
-  ]
-  edge [
-    source 8
-    target 59
-    weight 0
-  ]
-  edge [
-    source 8
-    target 60
-    weight 0
-  ]
-  edge [
-    source 8
-    target 61
-    weight 0
-  ]
-  edge [
-    source 8
-    target 62
-    weight 0
-  ]
-  edge [
-    source 8
-    target 63
-    weight 0
-  ]
-  edge [
-    source 8
-    target 64
-    weight 0
-  ]
-  edge [
-    source 8
-    target 65
-    weight 0
-  ]
-  edge [
-    source 8
-    target 66
-    weight 0
-  ]
-  edge [
-    source 8
-    target 67
-    weight 0
-  ]
-  edge [
-    source 8
-    target 68
-    weight 0
-  ]
-  edge [
-    source 8
-    target 69
-    weight 0
-  ]
-  edge [
-    source 8
-    target 70
-    weight 0
-  ]
-  edge [
-    source 8
-    target 71
-    weight 0
-  ]
-  edge [
-    source 8
-    target 72
-    weight 0
-  ]
-  edge [
-    source 8
-    target 73
-    weight 0
-  ]
-  edge [
-    source 8
-    target 74
-    weight 0
-  ]
-  edge [
-    source 8
-    target 75
-    weight 0
-  ]
-  edge [
-    source 8
-    target 76
-    weight 0
-  ]
-  edge [
-    source 8
-    target 77
-    weight 0
-  ]
-  edge [
-    source 8
-    target 78
-    weight 0
-  ]
-  edge [
-    source 8
-    target 79
-    weight 0
-  ]
-  edge [
-    source 8
-    target 80
-    weight 0
-  ]
-  edge [
-    source 8
-    target 81
-    weight 0
-  ]
-  edge [
-    source 8
-    target 82
-    weight 0
-  ]
-  edge [
-    source 8
-    target 83
-    weight 0
-  ]
-  edge [
-    source 8
-    target 84
-    weight 0
-  ]
-  edge [
-    source 8
-    target 85
-    weight 0
-  ]
-  edge [
-    source 8
-    target 86
-    weight 0
-  ]
-  edge [
-    source 8
-    target 87
-    weight 0
-  ]
-  edge [
-    source 8
-    target 88
-    weight 0
-  ]
-  edge [
-    source 8
-    target 89
-    weight 0
-  ]
-  edge [
-    source 8
-    target 90
-    weight 0
-  ]
-  edge [
-    source 8
-    target 91
-    weight -0.1
-  ]
-  edge [
-    source 8
-    target 92
-    weight 0
-  ]
-  edge [
-    source 8
-    target 93
-    weight 0
-  ]
-  edge [
-    source 8
-    target 94
-    weight 0
-  ]
-  edge [
-    source 8
-    target 95
-    weight 0
-  ]
-  edge [
-    source 8
-    target 96
-    weight 0
-  ]
-  edge [
-    source 8
-    target 97
-    weight 0
-  ]
-  edge [
-    source 8
-    target 98
-    weight 0.1
-  ]
-  edge [
-    source 8
-    target 99
-    weight 0
-  ]
-  edge [
-    source 8
-    target 100
-    weight 0
-  ]
-  edge [
-    source 9
-    target 10
-    weight 0
-  ]
-  edge [
-    source 9
-    target 11
-    weight -0.1
-  ]
-  edge [
-    source 9
-    target 12
-    weight 0
-  ]
-  edge [
-    source 9
-    target 13
-    weight 0.1
-  ]
-  edge [
-    source 9
-    target 14
-    weight 0
-  ]
-  edge [
-    source 9
-    target 15
-    weight 0
-  ]
-  edge [
-    source 9
-    target 16
-    weight 0
-  ]
-  edge [
-    source 9
-    target 17
-    weight -0.1
-  ]
-  edge [
-    source 9
-    target 18
-    weight 0.1
-  ]
-  edge [
-    source 9
-    target 19
-    weight 0.1
-  ]
-  edge [
-    source 9
-    target 20
-    weight 0
-  ]
-  edge [
-    source 9
-    target 21
-    weight 0
-  ]
-  edge [
-    source 9
-    target 22
-    weight -0.1
-  ]
-  edge [
-    source 9
-    target 23
-    weight 0
-  ]
-  edge [
-    source 9
-    target 24
-    weight 0
-  ]
-  edge [
-    source 9
-    target 25
-    weight 0
-  ]
-  edge [
-    source 9
-    target 26
-    weight 0
-  ]
-  edge [
-    source 9
-    target 27
-    weight 0
-  ]
-  edge [
-    source 9
-    target 28
-    weight 0
-  ]
-  edge [
-    source 9
-    target 29
-    weight 0.1
-  ]
-  edge [
-    source 9
-    target 30
-    weight 0
-  ]
-  edge [
-    source 9
-    target 31
-    weight 0
-  ]
-  edge [
-    source 9
-    target 32
-    weight 0
-  ]
-  edge [
-    source 9
-    target 33
-    weight 0
-  ]
-  edge [
-    source 9
-    target 34
-    weight 0
-  ]
-  edge [
-    source 9
-    target 35
-    weight 0
-  ]
-  edge [
-    source 9
-    target 36
-    weight 0
-  ]
-  edge [
-    source 9
-    target 37
-    weight 0
-  ]
-  edge [
-    source 9
-    target 38
-    weight 0
-  ]
-  edge [
-    source 9
-    target 39
-    weight 0
-  ]
-  edge [
-    source 9
-    target 40
-    weight 0
-  ]
-  edge [
-    source 9
-    target 41
-    weight 0
-  ]
-  edge [
-    source 9
-    target 42
-    weight 0
-  ]
-  edge [
-    source 9
-    target 43
-    weight 0
-  ]
-  edge [
-    source 9
-    target 44
-    weight 0
-  ]
-  edge [
-    source 9
-    target 45
-    weight 0
-  ]
-  edge [
-    source 9
-    target 46
-    weight 0
-  ]
-  edge [
-    source 9
-    target 47
-    weight 0
-  ]
-  edge [
-    source 9
-    target 48
-    weight 0
-  ]
-  edge [
-    source 9
-    target 49
-    weight 0
-  ]
-  edge [
-    source 9
-    target 50
-    weight 0
-  ]
-  edge [
-    source 9
-    target 51
-    weight 0
-  ]
-  edge [
-    source 9
-    target 52
-    weight 0
-  ]
-  edge [
-    source 9
-    target 53
-    weight 0
-  ]
-  edge [
-    source 9
-    target 54
-    weight 0
-  ]
-  edge [
-    source 9
-    target 55
-    weight 0
-  ]
-  edge [
-    source 9
-    target 56
-    weight 0
-  ]
-  edge [
-    source 9
-    target 57
-    weight 0
-  ]
-  edge [
-    source 9
-    target 58
-    weight 0
-  ]
-  edge [
-    source 9
-    target 59
-    weight 0
-  ]
-  edge [
-    source 9
-    target 60
-    weight 0
-  ]
-  edge [
-    source 9
-    target 61
-    weight 0
-  ]
-  edge [
-    source 9
-    target 62
-    weight 0
-  ]
-  edge [
-    source 9
-    target 63
-    weight 0
-  ]
-  edge [
-    source 9
-    target 64
-    weight 0
-  ]
-  edge [
-    source 9
-    target 65
-    weight 0
-  ]
-  edge [
-    source 9
-    target 66
-    weight 0
-  ]
-  edge [
-    source 9
-    target 67
-    weight 0
-  ]
-  edge [
-    source 9
-    target 68
-    weight 0
-  ]
-  edge [
-    source 9
-    target 69
-    weight 0
-  ]
-  edge [
-    source 9
-    target 70
-    weight 0
-  ]
-  edge [
-    source 9
-    target 71
-    weight 0
-  ]
-  edge [
-    source 9
-    target 72
-    weight 0
-  ]
-  edge [
-    source 9
-    target 73
-    weight 0
-  ]
-  edge [
-    source 9
-    target 74
-    weight 0
-  ]
-  edge [
-    source 9
-    target 75
-    weight 0
-  ]
-  edge [
-    source 9
-    target 76
-    weight 0
-  ]
-  edge [
-    source 9
-    target 77
-    weight 0
-  ]
-  edge [
-    source 9
-    target 78
-    weight 0
-  ]
-  edge [
-    source 9
-    target 79
-    weight 0
-  ]
-  edge [
-    source 9
-    target 80
-    weight 0
-  ]
-  edge [
-    source 9
-    target 81
-    weight 0
-  ]
-  edge [
-    source 9
-    target 82
-    weight 0
-  ]
-  edge [
-    source 9
-    target 83
-    weight 0
-  ]
-  edge [
-    source 9
-    target 84
-    weight 0
-  ]
-  edge [
-    source 9
-    target 85
-    weight 0
-  ]
-  edge [
-    source 9
-    target 86
-    weight 0
-  ]
-  edge [
-    source 9
-    target 87
-    weight 0
-  ]
-  edge [
-    source 9
-    target 88
-    weight 0
-  ]
-  edge [
-    source 9
-    target 89
-    weight 0
-  ]
-  edge [
-    source 9
-    target 90
-    weight 0
-  ]
-  edge [
-    source 9
-    target 91
-    weight 0
-  ]
-  edge [
-    source 9
-    target 92
-    weight 0
-  ]
-  edge [
-    source 9
-    target 93
-    weight 0
-  ]
-  edge [
-    source 9
-    target 94
-    weight 0
-  ]
-  edge [
-    source 9
-    target 95
-    weight 0
-  ]
-  edge [
-    source 9
-    target 96
-    weight 0
-  ]
-  edge [
-    source 9
-    target 97
-    weight 0
-  ]
-  edge [
-    source 9
-    target 98
-    weight 0
-  ]
-  edge [
-    source 9
-    target 99
-    weight 0
-  ]
-  edge [
-    source 9
-    target 100
-    weight 0
-  ]
-  edge [
-    source 10
-    target 11
-    weight -0.1
-  ]
-  edge [
-    source 10
-    target 12
-    weight 0
-  ]
-  edge [
-    source 10
-    target 13
-    weight 0.1
-  ]
-  edge [
-    source 10
-    target 14
-    weight 0
-  ]
-  edge [
-    source 10
-    target 15
-    weight 0
-  ]
-  edge [
-    source 10
-    target 16
-    weight 0
-  ]
-  edge [
-    source 10
-    target 17
-    weight 0
-  ]
-  edge [
-    source 10
-    target 18
-    weight 0.1
-  ]
-  edge [
-    source 10
-    target 19
-    weight 0
-  ]
-  edge [
-    source 10
-    target 20
-    weight 0.1
-  ]
-  edge [
-    source 10
-    target 21
-    weight 0
-  ]
-  edge [
-    source 10
-    target 22
-    weight 0
-  ]
-  edge [
-    source 10
-    target 23
-    weight 0
-  ]
-  edge [
-    source 10
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 10
-    target 25
-    weight 0
-  ]
-  edge [
-    source 10
-    target 26
-    weight 0
-  ]
-  edge [
-    source 10
-    target 27
-    weight 0
-  ]
-  edge [
-    source 10
-    target 28
-    weight 0
-  ]
-  edge [
-    source 10
-    target 29
-    weight 0
-  ]
-  edge [
-    source 10
-    target 30
-    weight 0
-  ]
-  edge [
-    source 10
-    target 31
-    weight 0.1
-  ]
-  edge [
-    source 10
-    target 32
-    weight 0
-  ]
-  edge [
-    source 10
-    target 33
-    weight -0.1
-  ]
-  edge [
-    source 10
-    target 34
-    weight 0
-  ]
-  edge [
-    source 10
-    target 35
-    weight -0.1
-  ]
-  edge [
-    source 10
-    target 36
-    weight 0
-  ]
-  edge [
-    source 10
-    target 37
-    weight 0
-  ]
-  edge [
-    source 10
-    target 38
-    weight 0
-  ]
-  edge [
-    source 10
-    target 39
-    weight 0
-  ]
-  edge [
-    source 10
-    target 40
-    weight 0
-  ]
-  edge [
-    source 10
-    target 41
-    weight 0
-  ]
-  edge [
-    source 10
-    target 42
-    weight 0
-  ]
-  edge [
-    source 10
-    target 43
-    weight 0
-  ]
-  edge [
-    source 10
-    target 44
-    weight 0
-  ]
-  edge [
-    source 10
-    target 45
-    weight 0
-  ]
-  edge [
-    source 10
-    target 46
-    weight 0
-  ]
-  edge [
-    source 10
-    target 47
-    weight 0
-  ]
-  edge [
-    source 10
-    target 48
-    weight 0
-  ]
-  edge [
-    source 10
-    target 49
-    weight 0
-  ]
-  edge [
-    source 10
-    target 50
-    weight 0
-  ]
-  edge [
-    source 10
-    target 51
-    weight 0
-  ]
-  edge [
-    source 10
-    target 52
-    weight 0
-  ]
-  edge [
-    source 10
-    target 53
-    weight 0
-  ]
-  edge [
-    source 10
-    target 54
-    weight 0
-  ]
-  edge [
-    source 10
-    target 55
-    weight 0
-  ]
-  edge [
-    source 10
-    target 56
-    weight 0
-  ]
-  edge [
-    source 10
-    target 57
-    weight 0
-  ]
-  edge [
-    source 10
-    target 58
-    weight 0
-  ]
-  edge [
-    source 10
-    target 59
-    weight 0
-  ]
-  edge [
-    source 10
-    target 60
-    weight 0
-  ]
-  edge [
-    source 10
-    target 61
-    weight 0
-  ]
-  edge [
-    source 10
-    target 62
-    weight 0
-  ]
-  edge [
-    source 10
-    target 63
-    weight 0
-  ]
-  edge [
-    source 10
-    target 64
-    weight 0
-  ]
-  edge [
-    source 10
-    target 65
-    weight 0
-  ]
-  edge [
-    source 10
-    target 66
-    weight 0
-  ]
-  edge [
-    source 10
-    target 67
-    weight 0
-  ]
-  edge [
-    source 10
-    target 68
-    weight 0
-  ]
-  edge [
-    source 10
-    target 69
-    weight 0
-  ]
-  edge [
-    source 10
-    target 70
-    weight 0
-  ]
-  edge [
-    source 10
-    target 71
-    weight 0
-  ]
-  edge [
-    source 10
-    target 72
-    weight 0
-  ]
-  edge [
-    source 10
-    target 73
-    weight 0
-  ]
-  edge [
-    source 10
-    target 74
-    weight 0
-  ]
-  edge [
-    source 10
-    target 75
-    weight 0
-  ]
-  edge [
-    source 10
-    target 76
-    weight 0
-  ]
-  edge [
-    source 10
-    target 77
-    weight 0
-  ]
-  edge [
-    source 10
-    target 78
-    weight 0
-  ]
-  edge [
-    source 10
-    target 79
-    weight 0
-  ]
-  edge [
-    source 10
-    target 80
-    weight 0
-  ]
-  edge [
-    source 10
-    target 81
-    weight 0
-  ]
-  edge [
-    source 10
-    target 82
-    weight 0
-  ]
-  edge [
-    source 10
-    target 83
-    weight 0
-  ]
-  edge [
-    source 10
-    target 84
-    weight 0
-  ]
-  edge [
-    source 10
-    target 85
-    weight 0
-  ]
-  edge [
-    source 10
-    target 86
-    weight 0
-  ]
-  edge [
-    source 10
-    target 87
-    weight 0
-  ]
-  edge [
-    source 10
-    target 88
-    weight 0
-  ]
-  edge [
-    source 10
-    target 89
-    weight 0
-  ]
-  edge [
-    source 10
-    target 90
-    weight 0
-  ]
-  edge [
-    source 10
-    target 91
-    weight 0
-  ]
-  edge [
-    source 10
-    target 92
-    weight 0
-  ]
-  edge [
-    source 10
-    target 93
-    weight -0.1
-  ]
-  edge [
-    source 10
-    target 94
-    weight 0
-  ]
-  edge [
-    source 10
-    target 95
-    weight 0
-  ]
-  edge [
-    source 10
-    target 96
-    weight 0
-  ]
-  edge [
-    source 10
-    target 97
-    weight 0
-  ]
-  edge [
-    source 10
-    target 98
-    weight 0
-  ]
-  edge [
-    source 10
-    target 99
-    weight 0
-  ]
-  edge [
-    source 10
-    target 100
-    weight 0
-  ]
-  edge [
-    source 11
-    target 12
-    weight 0.1
-  ]
-  edge [
-    source 11
-    target 13
-    weight 0
-  ]
-  edge [
-    source 11
-    target 14
-    weight 0
-  ]
-  edge [
-    source 11
-    target 15
-    weight 0
-  ]
-  edge [
-    source 11
-    target 16
-    weight 0
-  ]
-  edge [
-    source 11
-    target 17
-    weight 0
-  ]
-  edge [
-    source 11
-    target 18
-    weight 0.1
-  ]
-  edge [
-    source 11
-    target 19
-    weight 0
-  ]
-  edge [
-    source 11
-    target 20
-    weight 0.1
-  ]
-  edge [
-    source 11
-    target 21
-    weight 0.1
-  ]
-  edge [
-    source 11
-    target 22
-    weight 0
-  ]
-  edge [
-    source 11
-    target 23
-    weight 0
-  ]
-  edge [
-    source 11
-    target 24
-    weight 0
-  ]
-  edge [
-    source 11
-    target 25
-    weight 0
-  ]
-  edge [
-    source 11
-    target 26
-    weight 0
-  ]
-  edge [
-    source 11
-    target 27
-    weight 0
-  ]
-  edge [
-    source 11
-    target 28
-    weight 0
-  ]
-  edge [
-    source 11
-    target 29
-    weight 0
-  ]
-  edge [
-    source 11
-    target 30
-    weight 0.1
-  ]
-  edge [
-    source 11
-    target 31
-    weight 0
-  ]
-  edge [
-    source 11
-    target 32
-    weight 0
-  ]
-  edge [
-    source 11
-    target 33
-    weight 0
-  ]
-  edge [
-    source 11
-    target 34
-    weight 0
-  ]
-  edge [
-    source 11
-    target 35
-    weight 0
-  ]
-  edge [
-    source 11
-    target 36
-    weight 0
-  ]
-  edge [
-    source 11
-    target 37
-    weight 0
-  ]
-  edge [
-    source 11
-    target 38
-    weight 0
-  ]
-  edge [
-    source 11
-    target 39
-    weight 0
-  ]
-  edge [
-    source 11
-    target 40
-    weight 0
-  ]
-  edge [
-    source 11
-    target 41
-    weight 0
-  ]
-  edge [
-    source 11
-    target 42
-    weight 0
-  ]
-  edge [
-    source 11
-    target 43
-    weight 0
-  ]
-  edge [
-    source 11
-    target 44
-    weight 0
-  ]
-  edge [
-    source 11
-    target 45
-    weight 0
-  ]
-  edge [
-    source 11
-    target 46
-    weight 0
-  ]
-  edge [
-    source 11
-    target 47
-    weight 0
-  ]
-  edge [
-    source 11
-    target 48
-    weight 0
-  ]
-  edge [
-    source 11
-    target 49
-    weight 0
-  ]
-  edge [
-    source 11
-    target 50
-    weight 0
-  ]
-  edge [
-    source 11
-    target 51
-    weight 0
-  ]
-  edge [
-    source 11
-    target 52
-    weight 0
-  ]
-  edge [
-    source 11
-    target 53
-    weight 0
-  ]
-  edge [
-    source 11
-    target 54
-    weight 0
-  ]
-  edge [
-    source 11
-    target 55
-    weight 0
-  ]
-  edge [
-    source 11
-    target 56
-    weight 0
-  ]
-  edge [
-    source 11
-    target 57
-    weight 0
-  ]
-  edge [
-    source 11
-    target 58
-    weight 0
-  ]
-  edge [
-    source 11
-    target 59
-    weight 0
-  ]
-  edge [
-    source 11
-    target 60
-    weight 0
-  ]
-  edge [
-    source 11
-    target 61
-    weight 0
-  ]
-  edge [
-    source 11
-    target 62
-    weight 0
-  ]
-  edge [
-    source 11
-    target 63
-    weight 0
-  ]
-  edge [
-    source 11
-    target 64
-    weight 0
-  ]
-  edge [
-    source 11
-    target 65
-    weight 0
-  ]
-  edge [
-    source 11
-    target 66
-    weight 0
-  ]
-  edge [
-    source 11
-    target 67
-    weight 0
-  ]
-  edge [
-    source 11
-    target 68
-    weight 0
-  ]
-  edge [
-    source 11
-    target 69
-    weight 0
-  ]
-  edge [
-    source 11
-    target 70
-    weight 0
-  ]
-  edge [
-    source 11
-    target 71
-    weight 0
-  ]
-  edge [
-    source 11
-    target 72
-    weight 0
-  ]
-  edge [
-    source 11
-    target 73
-    weight 0
-  ]
-  edge [
-    source 11
-    target 74
-    weight 0
-  ]
-  edge [
-    source 11
-    target 75
-    weight 0
-  ]
-  edge [
-    source 11
-    target 76
-    weight 0
-  ]
-  edge [
-    source 11
-    target 77
-    weight 0
-  ]
-  edge [
-    source 11
-    target 78
-    weight 0
-  ]
-  edge [
-    source 11
-    target 79
-    weight -0.1
-  ]
-  edge [
-    source 11
-    target 80
-    weight 0
-  ]
-  edge [
-    source 11
-    target 81
-    weight 0
-  ]
-  edge [
-    source 11
-    target 82
-    weight 0
-  ]
-  edge [
-    source 11
-    target 83
-    weight 0
-  ]
-  edge [
-    source 11
-    target 84
-    weight 0
-  ]
-  edge [
-    source 11
-    target 85
-    weight 0
-  ]
-  edge [
-    source 11
-    target 86
-    weight 0
-  ]
-  edge [
-    source 11
-    target 87
-    weight 0
-  ]
-  edge [
-    source 11
-    target 88
-    weight 0
-  ]
-  edge [
-    source 11
-    target 89
-    weight 0
-  ]
-  edge [
-    source 11
-    target 90
-    weight 0
-  ]
-  edge [
-    source 11
-    target 91
-    weight 0
-  ]
-  edge [
-    source 11
-    target 92
-    weight 0
-  ]
-  edge [
-    source 11
-    target 93
-    weight 0
-  ]
-  edge [
-    source 11
-    target 94
-    weight 0
-  ]
-  edge [
-    source 11
-    target 95
-    weight 0.1
-  ]
-  edge [
-    source 11
-    target 96
-    weight 0
-  ]
-  edge [
-    source 11
-    target 97
-    weight 0
-  ]
-  edge [
-    source 11
-    target 98
-    weight 0
-  ]
-  edge [
-    source 11
-    target 99
-    weight 0
-  ]
-  edge [
-    source 11
-    target 100
-    weight 0
-  ]
-  edge [
-    source 12
-    target 13
-    weight 0
-  ]
-  edge [
-    source 12
-    target 14
-    weight 0
-  ]
-  edge [
-    source 12
-    target 15
-    weight 0
-  ]
-  edge [
-    source 12
-    target 16
-    weight 0
-  ]
-  edge [
-    source 12
-    target 17
-    weight 0
-  ]
-  edge [
-    source 12
-    target 18
-    weight 0
-  ]
-  edge [
-    source 12
-    target 19
-    weight 0.1
-  ]
-  edge [
-    source 12
-    target 20
-    weight 0
-  ]
-  edge [
-    source 12
-    target 21
-    weight 0
-  ]
-  edge [
-    source 12
-    target 22
-    weight 0
-  ]
-  edge [
-    source 12
-    target 23
-    weight 0
-  ]
-  edge [
-    source 12
-    target 24
-    weight -0.1
-  ]
-  edge [
-    source 12
-    target 25
-    weight 0
-  ]
-  edge [
-    source 12
-    target 26
-    weight 0
-  ]
-  edge [
-    source 12
-    target 27
-    weight 0
-  ]
-  edge [
-    source 12
-    target 28
-    weight 0
-  ]
-  edge [
-    source 12
-    target 29
-    weight 0
-  ]
-  edge [
-    source 12
-    target 30
-    weight 0
-  ]
-  edge [
-    source 12
-    target 31
-    weight 0
-  ]
-  edge [
-    source 12
-    target 32
-    weight -0.1
-  ]
-  edge [
-    source 12
-    target 33
-    weight 0
-  ]
-  edge [
-    source 12
-    target 34
-    weight 0
-  ]
-  edge [
-    source 12
-    target 35
-    weight 0
-  ]
-  edge [
-    source 12
-    target 36
-    weight 0
-  ]
-  edge [
-    source 12
-    target 37
-    weight 0
-  ]
-  edge [
-    source 12
-    target 38
-    weight 0
-  ]
-  edge [
-    source 12
-    target 39
-    weight 0
-  ]
-  edge [
-    source 12
-    target 40
-    weight 0
-  ]
-  edge [
-    source 12
-    target 41
-    weight 0
-  ]
-  edge [
-    source 12
-    target 42
-    weight 0
-  ]
-  edge [
-    source 12
-    target 43
-    weight 0
-  ]
-  edge [
-    source 12
-    target 44
-    weight 0
-  ]
-  edge [
-    source 12
-    target 45
-    weight 0
-  ]
-  edge [
-    source 12
-    target 46
-    weight 0
-  ]
-  edge [
-    source 12
-    target 47
-    weight 0
-  ]
-  edge [
-    source 12
-    target 48
-    weight 0
-  ]
-  edge [
-    source 12
-    target 49
-    weight 0
-  ]
-  edge [
-    source 12
-    target 50
-    weight 0
-  ]
-  edge [
-    source 12
-    target 51
-    weight 0
-  ]
-  edge [
-    source 12
-    target 52
-    weight 0
-  ]
-  edge [
-    source 12
-    target 53
-    weight 0
-  ]
-  edge [
-    source 12
-    target 54
-    weight 0
-  ]
-  edge [
-    source 12
-    target 55
-    weight 0
-  ]
-  edge [
-    source 12
-    target 56
-    weight 0
-  ]
-  edge [
-    source 12
-    target 57
-    weight 0
-  ]
-  edge [
-    source 12
-    target 58
-    weight 0
-  ]
-  edge [
-    source 12
-    target 59
-    weight 0
-  ]
-  edge [
-    source 12
-    target 60
-    weight 0
-  ]
-  edge [
-    source 12
-    target 61
-    weight 0
-  ]
-  edge [
-    source 12
-    target 62
-    weight 0
-  ]
-  edge [
-    source 12
-    target 63
-    weight 0
-  ]
-  edge [
-    source 12
-    target 64
-    weight 0
-  ]
-  edge [
-    source 12
-    target 65
-    weight 0
-  ]
-  edge [
-    source 12
-    target 66
-    weight 0
-  ]
-  edge [
-    source 12
-    target 67
-    weight 0
-  ]
-  edge [
-    source 12
-    target 68
-    weight 0
-  ]
-  edge [
-    source 12
-    target 69
-    weight 0
-  ]
-  edge [
-    source 12
-    target 70
-    weight 0
-  ]
-  edge [
-    source 12
-    target 71
-    weight 0
-  ]
-  edge [
-    source 12
-    target 72
-    weight 0
-  ]
-  edge [
-    source 12
-    target 73
-    weight 0
-  ]
-  edge [
-    source 12
-    target 74
-    weight 0
-  ]
-  edge [
-    source 12
-    target 75
-    weight 0
-  ]
-  edge [
-    source 12
-    target 76
-    weight 0
-  ]
-  edge [
-    source 12
-    target 77
-    weight 0
-  ]
-  edge [
-    source 12
-    target 78
-    weight 0
-  ]
-  edge [
-    source 12
-    target 79
-    weight 0
-  ]
-  edge [
-    source 12
-    target 80
-    weight 0
-  ]
-  edge [
-    source 12
-    target 81
-    weight 0
-  ]
-  edge [
-    source 12
-    target 82
-    weight 0
-  ]
-  edge [
-    source 12
-    target 83
-    weight 0
-  ]
-  edge [
-    source 12
-    target 84
-    weight 0
-  ]
-  edge [
-    source 12
-    target 85
-    weight 0
-  ]
-  edge [
-    source 12
-    target 86
-    weight 0
-  ]
-  edge [
-    source 12
-    target 87
-    weight 0
-  ]
-  edge [
-    source 12
-    target 88
-    weight 0
-  ]
-  edge [
-    source 12
-    target 89
-    weight 0
-  ]
-  edge [
-    source 12
-    target 90
-    weight 0
-  ]
-  edge [
-    source 12
-    target 91
-    weight 0
-  ]
-  edge [
-    source 12
-    target 92
-    weight 0
-  ]
-  edge [
-    source 12
-    target 93
-    weight 0
-  ]
-  edge [
-    source 12
-    target 94
-    weight 0
-  ]
-  edge [
-    source 12
-    target 95
-    weight 0
-  ]
-  edge [
-    source 12
-    target 96
-    weight 0
-  ]
-  edge [
-    source 12
-    target 97
-    weight 0
-  ]
-  edge [
-    source 12
-    target 98
-    weight 0
-  ]
-  edge [
-    source 12
-    target 99
-    weight 0
-  ]
-  edge [
-    source 12
-    target 100
-    weight 0
-  ]
-  edge [
-    source 13
-    target 14
-    weight 0.1
-  ]
-  edge [
-    source 13
-    target 15
-    weight -0.1
-  ]
-  edge [
-    source 13
-    target 16
-    weight 0
-  ]
-  edge [
-    source 13
-    target 17
-    weight 0
-  ]
-  edge [
-    source 13
-    target 18
-    weight 0
-  ]
-  edge [
-    source 13
-    target 19
-    weight 0
-  ]
-  edge [
-    source 13
-    target 20
-    weight 0
-  ]
-  edge [
-    source 13
-    target 21
-    weight 0
-  ]
-  edge [
-    source 13
-    target 22
-    weight 0
-  ]
-  edge [
-    source 13
-    target 23
-    weight 0
-  ]
-  edge [
-    source 13
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 13
-    target 25
-    weight 0
-  ]
-  edge [
-    source 13
-    target 26
-    weight 0
-  ]
-  edge [
-    source 13
-    target 27
-    weight 0
-  ]
-  edge [
-    source 13
-    target 28
-    weight 0
-  ]
-  edge [
-    source 13
-    target 29
-    weight 0
-  ]
-  edge [
-    source 13
-    target 30
-    weight 0
-  ]
-  edge [
-    source 13
-    target 31
-    weight 0
-  ]
-  edge [
-    source 13
-    target 32
-    weight 0
-  ]
-  edge [
-    source 13
-    target 33
-    weight 0
-  ]
-  edge [
-    source 13
-    target 34
-    weight -0.1
-  ]
-  edge [
-    source 13
-    target 35
-    weight 0
-  ]
-  edge [
-    source 13
-    target 36
-    weight 0
-  ]
-  edge [
-    source 13
-    target 37
-    weight 0
-  ]
-  edge [
-    source 13
-    target 38
-    weight 0
-  ]
-  edge [
-    source 13
-    target 39
-    weight 0
-  ]
-  edge [
-    source 13
-    target 40
-    weight 0
-  ]
-  edge [
-    source 13
-    target 41
-    weight 0
-  ]
-  edge [
-    source 13
-    target 42
-    weight 0
-  ]
-  edge [
-    source 13
-    target 43
-    weight 0
-  ]
-  edge [
-    source 13
-    target 44
-    weight 0
-  ]
-  edge [
-    source 13
-    target 45
-    weight 0
-  ]
-  edge [
-    source 13
-    target 46
-    weight 0
-  ]
-  edge [
-    source 13
-    target 47
-    weight 0
-  ]
-  edge [
-    source 13
-    target 48
-    weight 0
-  ]
-  edge [
-    source 13
-    target 49
-    weight 0
-  ]
-  edge [
-    source 13
-    target 50
-    weight 0
-  ]
-  edge [
-    source 13
-    target 51
-    weight 0
-  ]
-  edge [
-    source 13
-    target 52
-    weight 0
-  ]
-  edge [
-    source 13
-    target 53
-    weight 0
-  ]
-  edge [
-    source 13
-    target 54
-    weight 0
-  ]
-  edge [
-    source 13
-    target 55
-    weight 0
-  ]
-  edge [
-    source 13
-    target 56
-    weight 0
-  ]
-  edge [
-    source 13
-    target 57
-    weight 0
-  ]
-  edge [
-    source 13
-    target 58
-    weight 0
-  ]
-  edge [
-    source 13
-    target 59
-    weight 0
-  ]
-  edge [
-    source 13
-    target 60
-    weight 0
-  ]
-  edge [
-    source 13
-    target 61
-    weight 0
-  ]
-  edge [
-    source 13
-    target 62
-    weight 0
-  ]
-  edge [
-    source 13
-    target 63
-    weight 0
-  ]
-  edge [
-    source 13
-    target 64
-    weight 0
-  ]
-  edge [
-    source 13
-    target 65
-    weight 0
-  ]
-  edge [
-    source 13
-    target 66
-    weight 0
-  ]
-  edge [
-    source 13
-    target 67
-    weight 0
-  ]
-  edge [
-    source 13
-    target 68
-    weight 0
-  ]
-  edge [
-    source 13
-    target 69
-    weight 0
-  ]
-  edge [
-    source 13
-    target 70
-    weight 0
-  ]
-  edge [
-    source 13
-    target 71
-    weight 0
-  ]
-  edge [
-    source 13
-    target 72
-    weight 0
-  ]
-  edge [
-    source 13
-    target 73
-    weight 0
-  ]
-  edge [
-    source 13
-    target 74
-    weight 0
-  ]
-  edge [
-    source 13
-    target 75
-    weight 0
-  ]
-  edge [
-    source 13
-    target 76
-    weight 0
-  ]
-  edge [
-    source 13
-    target 77
-    weight 0
-  ]
-  edge [
-    source 13
-    target 78
-    weight 0
-  ]
-  edge [
-    source 13
-    target 79
-    weight 0
-  ]
-  edge [
-    source 13
-    target 80
-    weight 0
-  ]
-  edge [
-    source 13
-    target 81
-    weight 0
-  ]
-  edge [
-    source 13
-    target 82
-    weight 0
-  ]
-  edge [
-    source 13
-    target 83
-    weight 0
-  ]
-  edge [
-    source 13
-    target 84
-    weight -0.1
-  ]
-  edge [
-    source 13
-    target 85
-    weight 0
-  ]
-  edge [
-    source 13
-    target 86
-    weight 0
-  ]
-  edge [
-    source 13
-    target 87
-    weight 0
-  ]
-  edge [
-    source 13
-    target 88
-    weight 0
-  ]
-  edge [
-    source 13
-    target 89
-    weight 0
-  ]
-  edge [
-    source 13
-    target 90
-    weight 0
-  ]
-  edge [
-    source 13
-    target 91
-    weight 0
-  ]
-  edge [
-    source 13
-    target 92
-    weight 0
-  ]
-  edge [
-    source 13
-    target 93
-    weight 0
-  ]
-  edge [
-    source 13
-    target 94
-    weight 0
-  ]
-  edge [
-    source 13
-    target 95
-    weight 0
-  ]
-  edge [
-    source 13
-    target 96
-    weight 0
-  ]
-  edge [
-    source 13
-    target 97
-    weight 0
-  ]
-  edge [
-    source 13
-    target 98
-    weight 0
-  ]
-  edge [
-    source 13
-    target 99
-    weight 0
-  ]
-  edge [
-    source 13
-    target 100
-    weight 0
-  ]
-  edge [
-    source 14
-    target 15
-    weight 0
-  ]
-  edge [
-    source 14
-    target 16
-    weight 0
-  ]
-  edge [
-    source 14
-    target 17
-    weight 0
-  ]
-  edge [
-    source 14
-    target 18
-    weight 0
-  ]
-  edge [
-    source 14
-    target 19
-    weight 0
-  ]
-  edge [
-    source 14
-    target 20
-    weight 0
-  ]
-  edge [
-    source 14
-    target 21
-    weight 0
-  ]
-  edge [
-    source 14
-    target 22
-    weight 0
-  ]
-  edge [
-    source 14
-    target 23
-    weight 0
-  ]
-  edge [
-    source 14
-    target 24
-    weight 0
-  ]
-  edge [
-    source 14
-    target 25
-    weight 0.1
-  ]
-  edge [
-    source 14
-    target 26
-    weight 0
-  ]
-  edge [
-    source 14
-    target 27
-    weight 0
-  ]
-  edge [
-    source 14
-    target 28
-    weight 0
-  ]
-  edge [
-    source 14
-    target 29
-    weight 0
-  ]
-  edge [
-    source 14
-    target 30
-    weight 0
-  ]
-  edge [
-    source 14
-    target 31
-    weight 0.1
-  ]
-  edge [
-    source 14
-    target 32
-    weight 0
-  ]
-  edge [
-    source 14
-    target 33
-    weight 0
-  ]
-  edge [
-    source 14
-    target 34
-    weight 0
-  ]
-  edge [
-    source 14
-    target 35
-    weight 0
-  ]
-  edge [
-    source 14
-    target 36
-    weight 0
-  ]
-  edge [
-    source 14
-    target 37
-    weight 0
-  ]
-  edge [
-    source 14
-    target 38
-    weight 0
-  ]
-  edge [
-    source 14
-    target 39
-    weight 0
-  ]
-  edge [
-    source 14
-    target 40
-    weight 0
-  ]
-  edge [
-    source 14
-    target 41
-    weight 0
-  ]
-  edge [
-    source 14
-    target 42
-    weight 0
-  ]
-  edge [
-    source 14
-    target 43
-    weight 0
-  ]
-  edge [
-    source 14
-    target 44
-    weight 0
-  ]
-  edge [
-    source 14
-    target 45
-    weight 0
-  ]
-  edge [
-    source 14
-    target 46
-    weight 0
-  ]
-  edge [
-    source 14
-    target 47
-    weight 0
-  ]
-  edge [
-    source 14
-    target 48
-    weight 0
-  ]
-  edge [
-    source 14
-    target 49
-    weight 0
-  ]
-  edge [
-    source 14
-    target 50
-    weight 0
-  ]
-  edge [
-    source 14
-    target 51
-    weight 0
-  ]
-  edge [
-    source 14
-    target 52
-    weight 0
-  ]
-  edge [
-    source 14
-    target 53
-    weight 0
-  ]
-  edge [
-    source 14
-    target 54
-    weight 0
-  ]
-  edge [
-    source 14
-    target 55
-    weight 0
-  ]
-  edge [
-    source 14
-    target 56
-    weight 0
-  ]
-  edge [
-    source 14
-    target 57
-    weight 0
-  ]
-  edge [
-    source 14
-    target 58
-    weight 0
-  ]
-  edge [
-    source 14
-    target 59
-    weight 0
-  ]
-  edge [
-    source 14
-    target 60
-    weight 0
-  ]
-  edge [
-    source 14
-    target 61
-    weight 0
-  ]
-  edge [
-    source 14
-    target 62
-    weight 0
-  ]
-  edge [
-    source 14
-    target 63
-    weight 0
-  ]
-  edge [
-    source 14
-    target 64
-    weight 0
-  ]
-  edge [
-    source 14
-    target 65
-    weight 0
-  ]
-  edge [
-    source 14
-    target 66
-    weight 0
-  ]
-  edge [
-    source 14
-    target 67
-    weight 0
-  ]
-  edge [
-    source 14
-    target 68
-    weight 0
-  ]
-  edge [
-    source 14
-    target 69
-    weight 0
-  ]
-  edge [
-    source 14
-    target 70
-    weight 0
-  ]
-  edge [
-    source 14
-    target 71
-    weight 0
-  ]
-  edge [
-    source 14
-    target 72
-    weight 0
-  ]
-  edge [
-    source 14
-    target 73
-    weight 0
-  ]
-  edge [
-    source 14
-    target 74
-    weight 0
-  ]
-  edge [
-    source 14
-    target 75
-    weight 0
-  ]
-  edge [
-    source 14
-    target 76
-    weight 0
-  ]
-  edge [
-    source 14
-    target 77
-    weight 0
-  ]
-  edge [
-    source 14
-    target 78
-    weight 0
-  ]
-  edge [
-    source 14
-    target 79
-    weight 0
-  ]
-  edge [
-    source 14
-    target 80
-    weight 0
-  ]
-  edge [
-    source 14
-    target 81
-    weight 0
-  ]
-  edge [
-    source 14
-    target 82
-    weight 0
-  ]
-  edge [
-    source 14
-    target 83
-    weight 0
-  ]
-  edge [
-    source 14
-    target 84
-    weight 0
-  ]
-  edge [
-    source 14
-    target 85
-    weight 0
-  ]
-  edge [
-    source 14
-    target 86
-    weight 0
-  ]
-  edge [
-    source 14
-    target 87
-    weight 0
-  ]
-  edge [
-    source 14
-    target 88
-    weight 0
-  ]
-  edge [
-    source 14
-    target 89
-    weight 0
-  ]
-  edge [
-    source 14
-    target 90
-    weight 0
-  ]
-  edge [
-    source 14
-    target 91
-    weight 0
-  ]
-  edge [
-    source 14
-    target 92
-    weight 0
-  ]
-  edge [
-    source 14
-    target 93
-    weight 0
-  ]
-  edge [
-    source 14
-    target 94
-    weight 0
-  ]
-  edge [
-    source 14
-    target 95
-    weight 0
-  ]
-  edge [
-    source 14
-    target 96
-    weight 0
-  ]
-  edge [
-    source 14
-    target 97
-    weight 0
-  ]
-  edge [
-    source 14
-    target 98
-    weight 0
-  ]
-  edge [
-    source 14
-    target 99
-    weight 0
-  ]
-  edge [
-    source 14
-    target 100
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 16
-    weight 0
-  ]
-  edge [
-    source 15
-    target 17
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 18
-    weight 0
-  ]
-  edge [
-    source 15
-    target 19
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 20
-    weight 0.1
-  ]
-  edge [
-    source 15
-    target 21
-    weight 0
-  ]
-  edge [
-    source 15
-    target 22
-    weight 0
-  ]
-  edge [
-    source 15
-    target 23
-    weight 0
-  ]
-  edge [
-    source 15
-    target 24
-    weight 0
-  ]
-  edge [
-    source 15
-    target 25
-    weight 0
-  ]
-  edge [
-    source 15
-    target 26
-    weight 0
-  ]
-  edge [
-    source 15
-    target 27
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 28
-    weight 0
-  ]
-  edge [
-    source 15
-    target 29
-    weight 0
-  ]
-  edge [
-    source 15
-    target 30
-    weight 0.1
-  ]
-  edge [
-    source 15
-    target 31
-    weight 0.1
-  ]
-  edge [
-    source 15
-    target 32
-    weight 0
-  ]
-  edge [
-    source 15
-    target 33
-    weight 0
-  ]
-  edge [
-    source 15
-    target 34
-    weight 0
-  ]
-  edge [
-    source 15
-    target 35
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 36
-    weight 0
-  ]
-  edge [
-    source 15
-    target 37
-    weight 0
-  ]
-  edge [
-    source 15
-    target 38
-    weight 0
-  ]
-  edge [
-    source 15
-    target 39
-    weight 0
-  ]
-  edge [
-    source 15
-    target 40
-    weight 0
-  ]
-  edge [
-    source 15
-    target 41
-    weight 0
-  ]
-  edge [
-    source 15
-    target 42
-    weight 0
-  ]
-  edge [
-    source 15
-    target 43
-    weight 0
-  ]
-  edge [
-    source 15
-    target 44
-    weight 0
-  ]
-  edge [
-    source 15
-    target 45
-    weight 0
-  ]
-  edge [
-    source 15
-    target 46
-    weight 0
-  ]
-  edge [
-    source 15
-    target 47
-    weight 0
-  ]
-  edge [
-    source 15
-    target 48
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 49
-    weight 0
-  ]
-  edge [
-    source 15
-    target 50
-    weight 0
-  ]
-  edge [
-    source 15
-    target 51
-    weight 0
-  ]
-  edge [
-    source 15
-    target 52
-    weight 0
-  ]
-  edge [
-    source 15
-    target 53
-    weight 0
-  ]
-  edge [
-    source 15
-    target 54
-    weight 0
-  ]
-  edge [
-    source 15
-    target 55
-    weight 0
-  ]
-  edge [
-    source 15
-    target 56
-    weight 0
-  ]
-  edge [
-    source 15
-    target 57
-    weight 0
-  ]
-  edge [
-    source 15
-    target 58
-    weight 0
-  ]
-  edge [
-    source 15
-    target 59
-    weight 0
-  ]
-  edge [
-    source 15
-    target 60
-    weight 0
-  ]
-  edge [
-    source 15
-    target 61
-    weight 0
-  ]
-  edge [
-    source 15
-    target 62
-    weight 0
-  ]
-  edge [
-    source 15
-    target 63
-    weight 0
-  ]
-  edge [
-    source 15
-    target 64
-    weight 0
-  ]
-  edge [
-    source 15
-    target 65
-    weight 0
-  ]
-  edge [
-    source 15
-    target 66
-    weight 0
-  ]
-  edge [
-    source 15
-    target 67
-    weight 0
-  ]
-  edge [
-    source 15
-    target 68
-    weight 0
-  ]
-  edge [
-    source 15
-    target 69
-    weight 0
-  ]
-  edge [
-    source 15
-    target 70
-    weight 0
-  ]
-  edge [
-    source 15
-    target 71
-    weight 0
-  ]
-  edge [
-    source 15
-    target 72
-    weight 0
-  ]
-  edge [
-    source 15
-    target 73
-    weight 0
-  ]
-  edge [
-    source 15
-    target 74
-    weight 0
-  ]
-  edge [
-    source 15
-    target 75
-    weight 0
-  ]
-  edge [
-    source 15
-    target 76
-    weight 0
-  ]
-  edge [
-    source 15
-    target 77
-    weight 0
-  ]
-  edge [
-    source 15
-    target 78
-    weight 0
-  ]
-  edge [
-    source 15
-    target 79
-    weight 0
-  ]
-  edge [
-    source 15
-    target 80
-    weight 0
-  ]
-  edge [
-    source 15
-    target 81
-    weight 0
-  ]
-  edge [
-    source 15
-    target 82
-    weight 0
-  ]
-  edge [
-    source 15
-    target 83
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 84
-    weight 0
-  ]
-  edge [
-    source 15
-    target 85
-    weight 0
-  ]
-  edge [
-    source 15
-    target 86
-    weight 0
-  ]
-  edge [
-    source 15
-    target 87
-    weight 0
-  ]
-  edge [
-    source 15
-    target 88
-    weight 0
-  ]
-  edge [
-    source 15
-    target 89
-    weight 0
-  ]
-  edge [
-    source 15
-    target 90
-    weight 0
-  ]
-  edge [
-    source 15
-    target 91
-    weight 0
-  ]
-  edge [
-    source 15
-    target 92
-    weight 0
-  ]
-  edge [
-    source 15
-    target 93
-    weight 0
-  ]
-  edge [
-    source 15
-    target 94
-    weight 0
-  ]
-  edge [
-    source 15
-    target 95
-    weight 0.1
-  ]
-  edge [
-    source 15
-    target 96
-    weight -0.1
-  ]
-  edge [
-    source 15
-    target 97
-    weight 0
-  ]
-  edge [
-    source 15
-    target 98
-    weight 0
-  ]
-  edge [
-    source 15
-    target 99
-    weight 0
-  ]
-  edge [
-    source 15
-    target 100
-    weight 0
-  ]
-  edge [
-    source 16
-    target 17
-    weight 0.1
-  ]
-  edge [
-    source 16
-    target 18
-    weight 0
-  ]
-  edge [
-    source 16
-    target 19
-    weight 0
-  ]
-  edge [
-    source 16
-    target 20
-    weight 0
-  ]
-  edge [
-    source 16
-    target 21
-    weight 0
-  ]
-  edge [
-    source 16
-    target 22
-    weight 0
-  ]
-  edge [
-    source 16
-    target 23
-    weight 0.1
-  ]
-  edge [
-    source 16
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 16
-    target 25
-    weight 0
-  ]
-  edge [
-    source 16
-    target 26
-    weight 0
-  ]
-  edge [
-    source 16
-    target 27
-    weight 0
-  ]
-  edge [
-    source 16
-    target 28
-    weight -0.1
-  ]
-  edge [
-    source 16
-    target 29
-    weight 0
-  ]
-  edge [
-    source 16
-    target 30
-    weight 0
-  ]
-  edge [
-    source 16
-    target 31
-    weight 0.1
-  ]
-  edge [
-    source 16
-    target 32
-    weight -0.1
-  ]
-  edge [
-    source 16
-    target 33
-    weight -0.1
-  ]
-  edge [
-    source 16
-    target 34
-    weight 0
-  ]
-  edge [
-    source 16
-    target 35
-    weight 0
-  ]
-  edge [
-    source 16
-    target 36
-    weight 0
-  ]
-  edge [
-    source 16
-    target 37
-    weight 0
-  ]
-  edge [
-    source 16
-    target 38
-    weight 0
-  ]
-  edge [
-    source 16
-    target 39
-    weight 0
-  ]
-  edge [
-    source 16
-    target 40
-    weight 0
-  ]
-  edge [
-    source 16
-    target 41
-    weight 0
-  ]
-  edge [
-    source 16
-    target 42
-    weight 0
-  ]
-  edge [
-    source 16
-    target 43
-    weight 0
-  ]
-  edge [
-    source 16
-    target 44
-    weight 0
-  ]
-  edge [
-    source 16
-    target 45
-    weight 0
-  ]
-  edge [
-    source 16
-    target 46
-    weight 0
-  ]
-  edge [
-    source 16
-    target 47
-    weight 0
-  ]
-  edge [
-    source 16
-    target 48
-    weight 0
-  ]
-  edge [
-    source 16
-    target 49
-    weight 0
-  ]
-  edge [
-    source 16
-    target 50
-    weight 0
-  ]
-  edge [
-    source 16
-    target 51
-    weight 0
-  ]
-  edge [
-    source 16
-    target 52
-    weight 0
-  ]
-  edge [
-    source 16
-    target 53
-    weight 0
-  ]
-  edge [
-    source 16
-    target 54
-    weight 0
-  ]
-  edge [
-    source 16
-    target 55
-    weight 0
-  ]
-  edge [
-    source 16
-    target 56
-    weight 0
-  ]
-  edge [
-    source 16
-    target 57
-    weight 0
-  ]
-  edge [
-    source 16
-    target 58
-    weight 0
-  ]
-  edge [
-    source 16
-    target 59
-    weight 0
-  ]
-  edge [
-    source 16
-    target 60
-    weight 0
-  ]
-  edge [
-    source 16
-    target 61
-    weight 0
-  ]
-  edge [
-    source 16
-    target 62
-    weight 0
-  ]
-  edge [
-    source 16
-    target 63
-    weight 0
-  ]
-  edge [
-    source 16
-    target 64
-    weight 0
-  ]
-  edge [
-    source 16
-    target 65
-    weight 0
-  ]
-  edge [
-    source 16
-    target 66
-    weight 0
-  ]
-  edge [
-    source 16
-    target 67
-    weight 0
-  ]
-  edge [
-    source 16
-    target 68
-    weight 0
-  ]
-  edge [
-    source 16
-    target 69
-    weight 0
-  ]
-  edge [
-    source 16
-    target 70
-    weight 0
-  ]
-  edge [
-    source 16
-    target 71
-    weight 0
-  ]
-  edge [
-    source 16
-    target 72
-    weight 0
-  ]
-  edge [
-    source 16
-    target 73
-    weight 0
-  ]
-  edge [
-    source 16
-    target 74
-    weight 0
-  ]
-  edge [
-    source 16
-    target 75
-    weight 0
-  ]
-  edge [
-    source 16
-    target 76
-    weight 0
-  ]
-  edge [
-    source 16
-    target 77
-    weight 0
-  ]
-  edge [
-    source 16
-    target 78
-    weight 0
-  ]
-  edge [
-    source 16
-    target 79
-    weight -0.1
-  ]
-  edge [
-    source 16
-    target 80
-    weight 0
-  ]
-  edge [
-    source 16
-    target 81
-    weight 0
-  ]
-  edge [
-    source 16
-    target 82
-    weight 0
-  ]
-  edge [
-    source 16
-    target 83
-    weight 0
-  ]
-  edge [
-    source 16
-    target 84
-    weight 0
-  ]
-  edge [
-    source 16
-    target 85
-    weight 0
-  ]
-  edge [
-    source 16
-    target 86
-    weight 0
-  ]
-  edge [
-    source 16
-    target 87
-    weight 0
-  ]
-  edge [
-    source 16
-    target 88
-    weight 0
-  ]
-  edge [
-    source 16
-    target 89
-    weight 0
-  ]
-  edge [
-    source 16
-    target 90
-    weight 0
-  ]
-  edge [
-    source 16
-    target 91
-    weight 0
-  ]
-  edge [
-    source 16
-    target 92
-    weight 0
-  ]
-  edge [
-    source 16
-    target 93
-    weight 0
-  ]
-  edge [
-    source 16
-    target 94
-    weight 0
-  ]
-  edge [
-    source 16
-    target 95
-    weight 0.1
-  ]
-  edge [
-    source 16
-    target 96
-    weight 0
-  ]
-  edge [
-    source 16
-    target 97
-    weight 0
-  ]
-  edge [
-    source 16
-    target 98
-    weight 0
-  ]
-  edge [
-    source 16
-    target 99
-    weight 0
-  ]
-  edge [
-    source 16
-    target 100
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 18
-    weight 0
-  ]
-  edge [
-    source 17
-    target 19
-    weight 0.1
-  ]
-  edge [
-    source 17
-    target 20
-    weight 0
-  ]
-  edge [
-    source 17
-    target 21
-    weight 0
-  ]
-  edge [
-    source 17
-    target 22
-    weight 0
-  ]
-  edge [
-    source 17
-    target 23
-    weight 0
-  ]
-  edge [
-    source 17
-    target 24
-    weight 0
-  ]
-  edge [
-    source 17
-    target 25
-    weight 0
-  ]
-  edge [
-    source 17
-    target 26
-    weight 0
-  ]
-  edge [
-    source 17
-    target 27
-    weight 0
-  ]
-  edge [
-    source 17
-    target 28
-    weight 0
-  ]
-  edge [
-    source 17
-    target 29
-    weight 0
-  ]
-  edge [
-    source 17
-    target 30
-    weight 0.1
-  ]
-  edge [
-    source 17
-    target 31
-    weight 0.1
-  ]
-  edge [
-    source 17
-    target 32
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 33
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 34
-    weight 0
-  ]
-  edge [
-    source 17
-    target 35
-    weight 0
-  ]
-  edge [
-    source 17
-    target 36
-    weight 0
-  ]
-  edge [
-    source 17
-    target 37
-    weight 0
-  ]
-  edge [
-    source 17
-    target 38
-    weight 0
-  ]
-  edge [
-    source 17
-    target 39
-    weight 0
-  ]
-  edge [
-    source 17
-    target 40
-    weight 0
-  ]
-  edge [
-    source 17
-    target 41
-    weight 0
-  ]
-  edge [
-    source 17
-    target 42
-    weight 0
-  ]
-  edge [
-    source 17
-    target 43
-    weight 0
-  ]
-  edge [
-    source 17
-    target 44
-    weight 0
-  ]
-  edge [
-    source 17
-    target 45
-    weight 0
-  ]
-  edge [
-    source 17
-    target 46
-    weight 0
-  ]
-  edge [
-    source 17
-    target 47
-    weight 0
-  ]
-  edge [
-    source 17
-    target 48
-    weight 0
-  ]
-  edge [
-    source 17
-    target 49
-    weight 0
-  ]
-  edge [
-    source 17
-    target 50
-    weight 0
-  ]
-  edge [
-    source 17
-    target 51
-    weight 0
-  ]
-  edge [
-    source 17
-    target 52
-    weight 0
-  ]
-  edge [
-    source 17
-    target 53
-    weight 0
-  ]
-  edge [
-    source 17
-    target 54
-    weight 0
-  ]
-  edge [
-    source 17
-    target 55
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 56
-    weight 0
-  ]
-  edge [
-    source 17
-    target 57
-    weight 0
-  ]
-  edge [
-    source 17
-    target 58
-    weight 0
-  ]
-  edge [
-    source 17
-    target 59
-    weight 0
-  ]
-  edge [
-    source 17
-    target 60
-    weight 0
-  ]
-  edge [
-    source 17
-    target 61
-    weight 0
-  ]
-  edge [
-    source 17
-    target 62
-    weight 0
-  ]
-  edge [
-    source 17
-    target 63
-    weight 0
-  ]
-  edge [
-    source 17
-    target 64
-    weight 0
-  ]
-  edge [
-    source 17
-    target 65
-    weight 0
-  ]
-  edge [
-    source 17
-    target 66
-    weight 0
-  ]
-  edge [
-    source 17
-    target 67
-    weight 0
-  ]
-  edge [
-    source 17
-    target 68
-    weight 0
-  ]
-  edge [
-    source 17
-    target 69
-    weight 0
-  ]
-  edge [
-    source 17
-    target 70
-    weight 0
-  ]
-  edge [
-    source 17
-    target 71
-    weight 0
-  ]
-  edge [
-    source 17
-    target 72
-    weight 0
-  ]
-  edge [
-    source 17
-    target 73
-    weight 0
-  ]
-  edge [
-    source 17
-    target 74
-    weight 0
-  ]
-  edge [
-    source 17
-    target 75
-    weight 0
-  ]
-  edge [
-    source 17
-    target 76
-    weight 0
-  ]
-  edge [
-    source 17
-    target 77
-    weight 0
-  ]
-  edge [
-    source 17
-    target 78
-    weight 0
-  ]
-  edge [
-    source 17
-    target 79
-    weight 0
-  ]
-  edge [
-    source 17
-    target 80
-    weight 0
-  ]
-  edge [
-    source 17
-    target 81
-    weight 0
-  ]
-  edge [
-    source 17
-    target 82
-    weight 0
-  ]
-  edge [
-    source 17
-    target 83
-    weight 0
-  ]
-  edge [
-    source 17
-    target 84
-    weight 0
-  ]
-  edge [
-    source 17
-    target 85
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 86
-    weight 0
-  ]
-  edge [
-    source 17
-    target 87
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 88
-    weight 0
-  ]
-  edge [
-    source 17
-    target 89
-    weight 0
-  ]
-  edge [
-    source 17
-    target 90
-    weight 0
-  ]
-  edge [
-    source 17
-    target 91
-    weight 0
-  ]
-  edge [
-    source 17
-    target 92
-    weight 0
-  ]
-  edge [
-    source 17
-    target 93
-    weight 0
-  ]
-  edge [
-    source 17
-    target 94
-    weight 0
-  ]
-  edge [
-    source 17
-    target 95
-    weight 0
-  ]
-  edge [
-    source 17
-    target 96
-    weight 0
-  ]
-  edge [
-    source 17
-    target 97
-    weight 0
-  ]
-  edge [
-    source 17
-    target 98
-    weight 0
-  ]
-  edge [
-    source 17
-    target 99
-    weight -0.1
-  ]
-  edge [
-    source 17
-    target 100
-    weight -0.1
-  ]
-  edge [
-    source 18
-    target 19
-    weight 0.1
-  ]
-  edge [
-    source 18
-    target 20
-    weight 0.2
-  ]
-  edge [
-    source 18
-    target 21
-    weight 0
-  ]
-  edge [
-    source 18
-    target 22
-    weight 0
-  ]
-  edge [
-    source 18
-    target 23
-    weight 0
-  ]
-  edge [
-    source 18
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 18
-    target 25
-    weight 0.1
-  ]
-  edge [
-    source 18
-    target 26
-    weight 0
-  ]
-  edge [
-    source 18
-    target 27
-    weight 0
-  ]
-  edge [
-    source 18
-    target 28
-    weight 0
-  ]
-  edge [
-    source 18
-    target 29
-    weight 0
-  ]
-  edge [
-    source 18
-    target 30
-    weight 0.1
-  ]
-  edge [
-    source 18
-    target 31
-    weight 0
-  ]
-  edge [
-    source 18
-    target 32
-    weight 0
-  ]
-  edge [
-    source 18
-    target 33
-    weight 0
-  ]
-  edge [
-    source 18
-    target 34
-    weight 0
-  ]
-  edge [
-    source 18
-    target 35
-    weight 0
-  ]
-  edge [
-    source 18
-    target 36
-    weight 0
-  ]
-  edge [
-    source 18
-    target 37
-    weight 0
-  ]
-  edge [
-    source 18
-    target 38
-    weight 0
-  ]
-  edge [
-    source 18
-    target 39
-    weight 0
-  ]
-  edge [
-    source 18
-    target 40
-    weight 0
-  ]
-  edge [
-    source 18
-    target 41
-    weight 0
-  ]
-  edge [
-    source 18
-    target 42
-    weight 0
-  ]
-  edge [
-    source 18
-    target 43
-    weight 0
-  ]
-  edge [
-    source 18
-    target 44
-    weight 0
-  ]
-  edge [
-    source 18
-    target 45
-    weight 0
-  ]
-  edge [
-    source 18
-    target 46
-    weight 0
-  ]
-  edge [
-    source 18
-    target 47
-    weight 0
-  ]
-  edge [
-    source 18
-    target 48
-    weight 0
-  ]
-  edge [
-    source 18
-    target 49
-    weight 0
-  ]
-  edge [
-    source 18
-    target 50
-    weight 0
-  ]
-  edge [
-    source 18
-    target 51
-    weight 0
-  ]
-  edge [
-    source 18
-    target 52
-    weight 0
-  ]
-  edge [
-    source 18
-    target 53
-    weight 0
-  ]
-  edge [
-    source 18
-    target 54
-    weight 0
-  ]
-  edge [
-    source 18
-    target 55
-    weight 0
-  ]
-  edge [
-    source 18
-    target 56
-    weight 0
-  ]
-  edge [
-    source 18
-    target 57
-    weight 0
-  ]
-  edge [
-    source 18
-    target 58
-    weight 0
-  ]
-  edge [
-    source 18
-    target 59
-    weight 0
-  ]
-  edge [
-    source 18
-    target 60
-    weight 0
-  ]
-  edge [
-    source 18
-    target 61
-    weight 0
-  ]
-  edge [
-    source 18
-    target 62
-    weight 0
-  ]
-  edge [
-    source 18
-    target 63
-    weight 0
-  ]
-  edge [
-    source 18
-    target 64
-    weight 0
-  ]
-  edge [
-    source 18
-    target 65
-    weight 0
-  ]
-  edge [
-    source 18
-    target 66
-    weight 0
-  ]
-  edge [
-    source 18
-    target 67
-    weight 0
-  ]
-  edge [
-    source 18
-    target 68
-    weight 0
-  ]
-  edge [
-    source 18
-    target 69
-    weight 0
-  ]
-  edge [
-    source 18
-    target 70
-    weight 0
-  ]
-  edge [
-    source 18
-    target 71
-    weight 0
-  ]
-  edge [
-    source 18
-    target 72
-    weight 0
-  ]
-  edge [
-    source 18
-    target 73
-    weight 0
-  ]
-  edge [
-    source 18
-    target 74
-    weight 0
-  ]
-  edge [
-    source 18
-    target 75
-    weight 0
-  ]
-  edge [
-    source 18
-    target 76
-    weight 0
-  ]
-  edge [
-    source 18
-    target 77
-    weight 0
-  ]
-  edge [
-    source 18
-    target 78
-    weight 0
-  ]
-  edge [
-    source 18
-    target 79
-    weight 0
-  ]
-  edge [
-    source 18
-    target 80
-    weight 0
-  ]
-  edge [
-    source 18
-    target 81
-    weight 0
-  ]
-  edge [
-    source 18
-    target 82
-    weight 0
-  ]
-  edge [
-    source 18
-    target 83
-    weight 0
-  ]
-  edge [
-    source 18
-    target 84
-    weight -0.1
-  ]
-  edge [
-    source 18
-    target 85
-    weight 0
-  ]
-  edge [
-    source 18
-    target 86
-    weight 0
-  ]
-  edge [
-    source 18
-    target 87
-    weight 0
-  ]
-  edge [
-    source 18
-    target 88
-    weight 0
-  ]
-  edge [
-    source 18
-    target 89
-    weight 0
-  ]
-  edge [
-    source 18
-    target 90
-    weight 0
-  ]
-  edge [
-    source 18
-    target 91
-    weight 0
-  ]
-  edge [
-    source 18
-    target 92
-    weight 0
-  ]
-  edge [
-    source 18
-    target 93
-    weight 0
-  ]
-  edge [
-    source 18
-    target 94
-    weight 0
-  ]
-  edge [
-    source 18
-    target 95
-    weight 0
-  ]
-  edge [
-    source 18
-    target 96
-    weight 0
-  ]
-  edge [
-    source 18
-    target 97
-    weight 0
-  ]
-  edge [
-    source 18
-    target 98
-    weight 0
-  ]
-  edge [
-    source 18
-    target 99
-    weight 0
-  ]
-  edge [
-    source 18
-    target 100
-    weight 0
-  ]
-  edge [
-    source 19
-    target 20
-    weight 0
-  ]
-  edge [
-    source 19
-    target 21
-    weight 0
-  ]
-  edge [
-    source 19
-    target 22
-    weight 0
-  ]
-  edge [
-    source 19
-    target 23
-    weight -0.1
-  ]
-  edge [
-    source 19
-    target 24
-    weight 0
-  ]
-  edge [
-    source 19
-    target 25
-    weight 0
-  ]
-  edge [
-    source 19
-    target 26
-    weight 0
-  ]
-  edge [
-    source 19
-    target 27
-    weight 0
-  ]
-  edge [
-    source 19
-    target 28
-    weight 0
-  ]
-  edge [
-    source 19
-    target 29
-    weight 0
-  ]
-  edge [
-    source 19
-    target 30
-    weight 0
-  ]
-  edge [
-    source 19
-    target 31
-    weight -0.1
-  ]
-  edge [
-    source 19
-    target 32
-    weight 0
-  ]
-  edge [
-    source 19
-    target 33
-    weight 0
-  ]
-  edge [
-    source 19
-    target 34
-    weight 0
-  ]
-  edge [
-    source 19
-    target 35
-    weight 0
-  ]
-  edge [
-    source 19
-    target 36
-    weight 0
-  ]
-  edge [
-    source 19
-    target 37
-    weight -0.1
-  ]
-  edge [
-    source 19
-    target 38
-    weight 0
-  ]
-  edge [
-    source 19
-    target 39
-    weight 0
-  ]
-  edge [
-    source 19
-    target 40
-    weight 0
-  ]
-  edge [
-    source 19
-    target 41
-    weight 0
-  ]
-  edge [
-    source 19
-    target 42
-    weight 0
-  ]
-  edge [
-    source 19
-    target 43
-    weight 0
-  ]
-  edge [
-    source 19
-    target 44
-    weight 0
-  ]
-  edge [
-    source 19
-    target 45
-    weight 0
-  ]
-  edge [
-    source 19
-    target 46
-    weight 0
-  ]
-  edge [
-    source 19
-    target 47
-    weight 0
-  ]
-  edge [
-    source 19
-    target 48
-    weight 0
-  ]
-  edge [
-    source 19
-    target 49
-    weight 0
-  ]
-  edge [
-    source 19
-    target 50
-    weight 0
-  ]
-  edge [
-    source 19
-    target 51
-    weight 0
-  ]
-  edge [
-    source 19
-    target 52
-    weight 0
-  ]
-  edge [
-    source 19
-    target 53
-    weight 0
-  ]
-  edge [
-    source 19
-    target 54
-    weight 0
-  ]
-  edge [
-    source 19
-    target 55
-    weight 0
-  ]
-  edge [
-    source 19
-    target 56
-    weight 0
-  ]
-  edge [
-    source 19
-    target 57
-    weight 0
-  ]
-  edge [
-    source 19
-    target 58
-    weight 0
-  ]
-  edge [
-    source 19
-    target 59
-    weight 0
-  ]
-  edge [
-    source 19
-    target 60
-    weight 0
-  ]
-  edge [
-    source 19
-    target 61
-    weight 0
-  ]
-  edge [
-    source 19
-    target 62
-    weight 0
-  ]
-  edge [
-    source 19
-    target 63
-    weight 0
-  ]
-  edge [
-    source 19
-    target 64
-    weight 0
-  ]
-  edge [
-    source 19
-    target 65
-    weight 0
-  ]
-  edge [
-    source 19
-    target 66
-    weight 0
-  ]
-  edge [
-    source 19
-    target 67
-    weight 0
-  ]
-  edge [
-    source 19
-    target 68
-    weight 0
-  ]
-  edge [
-    source 19
-    target 69
-    weight 0
-  ]
-  edge [
-    source 19
-    target 70
-    weight 0
-  ]
-  edge [
-    source 19
-    target 71
-    weight 0
-  ]
-  edge [
-    source 19
-    target 72
-    weight 0
-  ]
-  edge [
-    source 19
-    target 73
-    weight 0
-  ]
-  edge [
-    source 19
-    target 74
-    weight 0
-  ]
-  edge [
-    source 19
-    target 75
-    weight 0
-  ]
-  edge [
-    source 19
-    target 76
-    weight 0
-  ]
-  edge [
-    source 19
-    target 77
-    weight 0
-  ]
-  edge [
-    source 19
-    target 78
-    weight 0
-  ]
-  edge [
-    source 19
-    target 79
-    weight 0
-  ]
-  edge [
-    source 19
-    target 80
-    weight 0
-  ]
-  edge [
-    source 19
-    target 81
-    weight 0
-  ]
-  edge [
-    source 19
-    target 82
-    weight 0
-  ]
-  edge [
-    source 19
-    target 83
-    weight 0
-  ]
-  edge [
-    source 19
-    target 84
-    weight 0
-  ]
-  edge [
-    source 19
-    target 85
-    weight 0
-  ]
-  edge [
-    source 19
-    target 86
-    weight 0
-  ]
-  edge [
-    source 19
-    target 87
-    weight -0.1
-  ]
-  edge [
-    source 19
-    target 88
-    weight 0
-  ]
-  edge [
-    source 19
-    target 89
-    weight 0
-  ]
-  edge [
-    source 19
-    target 90
-    weight 0
-  ]
-  edge [
-    source 19
-    target 91
-    weight 0
-  ]
-  edge [
-    source 19
-    target 92
-    weight 0
-  ]
-  edge [
-    source 19
-    target 93
-    weight 0
-  ]
-  edge [
-    source 19
-    target 94
-    weight 0
-  ]
-  edge [
-    source 19
-    target 95
-    weight 0
-  ]
-  edge [
-    source 19
-    target 96
-    weight 0
-  ]
-  edge [
-    source 19
-    target 97
-    weight 0
-  ]
-  edge [
-    source 19
-    target 98
-    weight 0.1
-  ]
-  edge [
-    source 19
-    target 99
-    weight 0
-  ]
-  edge [
-    source 19
-    target 100
-    weight 0
-  ]
-  edge [
-    source 20
-    target 21
-    weight 0
-  ]
-  edge [
-    source 20
-    target 22
-    weight 0
-  ]
-  edge [
-    source 20
-    target 23
-    weight 0
-  ]
-  edge [
-    source 20
-    target 24
-    weight 0.0
-  ]
-  edge [
-    source 20
-    target 25
-    weight 0.1
-  ]
-  edge [
-    source 20
-    target 26
-    weight 0
-  ]
-  edge [
-    source 20
-    target 27
-    weight 0
-  ]
-  edge [
-    source 20
-    target 28
-    weight 0
-  ]
-  edge [
-    source 20
-    target 29
-    weight 0.1
-  ]
-  edge [
-    source 20
-    target 30
-    weight 0
-  ]
-  edge [
-    source 20
-    target 31
-    weight 0
-  ]
-  edge [
-    source 20
-    target 32
-    weight -0.1
-  ]
-  edge [
-    source 20
-    target 33
-    weight 0
-  ]
-  edge [
-    source 20
-    target 34
-    weight 0
-  ]
-  edge [
-    source 20
-    target 35
-    weight 0
-  ]
-  edge [
-    source 20
-    target 36
-    weight 0
-  ]
-  edge [
-    source 20
-    target 37
-    weight -0.1
-  ]
-  edge [
-    source 20
-    target 38
-    weight 0
-  ]
-  edge [
-    source 20
-    target 39
-    weight 0
-  ]
-  edge [
-    source 20
-    target 40
-    weight 0
-  ]
-  edge [
-    source 20
-    target 41
-    weight 0
-  ]
-  edge [
-    source 20
-    target 42
-    weight 0
-  ]
-  edge [
-    source 20
-    target 43
-    weight 0
-  ]
-  edge [
-    source 20
-    target 44
-    weight 0
-  ]
-  edge [
-    source 20
-    target 45
-    weight 0
-  ]
-  edge [
-    source 20
-    target 46
-    weight 0
-  ]
-  edge [
-    source 20
-    target 47
-    weight 0
-  ]
-  edge [
-    source 20
-    target 48
-    weight 0
-  ]
-  edge [
-    source 20
-    target 49
-    weight 0
-  ]
-  edge [
-    source 20
-    target 50
-    weight 0
-  ]
-  edge [
-    source 20
-    target 51
-    weight 0
-  ]
-  edge [
-    source 20
-    target 52
-    weight 0
-  ]
-  edge [
-    source 20
-    target 53
-    weight 0
-  ]
-  edge [
-    source 20
-    target 54
-    weight 0
-  ]
-  edge [
-    source 20
-    target 55
-    weight 0
-  ]
-  edge [
-    source 20
-    target 56
-    weight 0
-  ]
-  edge [
-    source 20
-    target 57
-    weight 0
-  ]
-  edge [
-    source 20
-    target 58
-    weight 0
-  ]
-  edge [
-    source 20
-    target 59
-    weight 0
-  ]
-  edge [
-    source 20
-    target 60
-    weight 0
-  ]
-  edge [
-    source 20
-    target 61
-    weight 0
-  ]
-  edge [
-    source 20
-    target 62
-    weight 0
-  ]
-  edge [
-    source 20
-    target 63
-    weight 0
-  ]
-  edge [
-    source 20
-    target 64
-    weight 0
-  ]
-  edge [
-    source 20
-    target 65
-    weight 0
-  ]
-  edge [
-    source 20
-    target 66
-    weight 0
-  ]
-  edge [
-    source 20
-    target 67
-    weight 0
-  ]
-  edge [
-    source 20
-    target 68
-    weight 0
-  ]
-  edge [
-    source 20
-    target 69
-    weight 0
-  ]
-  edge [
-    source 20
-    target 70
-    weight 0
-  ]
-  edge [
-    source 20
-    target 71
-    weight 0
-  ]
-  edge [
-    source 20
-    target 72
-    weight 0
-  ]
-  edge [
-    source 20
-    target 73
-    weight 0
-  ]
-  edge [
-    source 20
-    target 74
-    weight 0
-  ]
-  edge [
-    source 20
-    target 75
-    weight 0
-  ]
-  edge [
-    source 20
-    target 76
-    weight 0
-  ]
-  edge [
-    source 20
-    target 77
-    weight 0
-  ]
-  edge [
-    source 20
-    target 78
-    weight 0
-  ]
-  edge [
-    source 20
-    target 79
-    weight 0
-  ]
-  edge [
-    source 20
-    target 80
-    weight 0
-  ]
-  edge [
-    source 20
-    target 81
-    weight 0
-  ]
-  edge [
-    source 20
-    target 82
-    weight 0
-  ]
-  edge [
-    source 20
-    target 83
-    weight 0
-  ]
-  edge [
-    source 20
-    target 84
-    weight 0.1
-  ]
-  edge [
-    source 20
-    target 85
-    weight 0
-  ]
-  edge [
-    source 20
-    target 86
-    weight 0
-  ]
-  edge [
-    source 20
-    target 87
-    weight 0
-  ]
-  edge [
-    source 20
-    target 88
-    weight 0
-  ]
-  edge [
-    source 20
-    target 89
-    weight 0
-  ]
-  edge [
-    source 20
-    target 90
-    weight 0
-  ]
-  edge [
-    source 20
-    target 91
-    weight 0
-  ]
-  edge [
-    source 20
-    target 92
-    weight 0
-  ]
-  edge [
-    source 20
-    target 93
-    weight 0
-  ]
-  edge [
-    source 20
-    target 94
-    weight 0
-  ]
-  edge [
-    source 20
-    target 95
-    weight 0
-  ]
-  edge [
-    source 20
-    target 96
-    weight 0
-  ]
-  edge [
-    source 20
-    target 97
-    weight 0
-  ]
-  edge [
-    source 20
-    target 98
-    weight 0.1
-  ]
-  edge [
-    source 20
-    target 99
-    weight 0
-  ]
-  edge [
-    source 20
-    target 100
-    weight 0
-  ]
-  edge [
-    source 21
-    target 22
-    weight 0
-  ]
-  edge [
-    source 21
-    target 23
-    weight 0
-  ]
-  edge [
-    source 21
-    target 24
-    weight 0
-  ]
-  edge [
-    source 21
-    target 25
-    weight 0
-  ]
-  edge [
-    source 21
-    target 26
-    weight 0.1
-  ]
-  edge [
-    source 21
-    target 27
-    weight 0
-  ]
-  edge [
-    source 21
-    target 28
-    weight 0
-  ]
-  edge [
-    source 21
-    target 29
-    weight 0
-  ]
-  edge [
-    source 21
-    target 30
-    weight 0
-  ]
-  edge [
-    source 21
-    target 31
-    weight 0
-  ]
-  edge [
-    source 21
-    target 32
-    weight 0
-  ]
-  edge [
-    source 21
-    target 33
-    weight 0
-  ]
-  edge [
-    source 21
-    target 34
-    weight -0.1
-  ]
-  edge [
-    source 21
-    target 35
-    weight 0
-  ]
-  edge [
-    source 21
-    target 36
-    weight 0
-  ]
-  edge [
-    source 21
-    target 37
-    weight 0
-  ]
-  edge [
-    source 21
-    target 38
-    weight 0
-  ]
-  edge [
-    source 21
-    target 39
-    weight 0
-  ]
-  edge [
-    source 21
-    target 40
-    weight 0
-  ]
-  edge [
-    source 21
-    target 41
-    weight 0
-  ]
-  edge [
-    source 21
-    target 42
-    weight 0
-  ]
-  edge [
-    source 21
-    target 43
-    weight 0
-  ]
-  edge [
-    source 21
-    target 44
-    weight 0
-  ]
-  edge [
-    source 21
-    target 45
-    weight 0
-  ]
-  edge [
-    source 21
-    target 46
-    weight 0
-  ]
-  edge [
-    source 21
-    target 47
-    weight 0
-  ]
-  edge [
-    source 21
-    target 48
-    weight 0
-  ]
-  edge [
-    source 21
-    target 49
-    weight 0
-  ]
-  edge [
-    source 21
-    target 50
-    weight 0
-  ]
-  edge [
-    source 21
-    target 51
-    weight 0
-  ]
-  edge [
-    source 21
-    target 52
-    weight 0
-  ]
-  edge [
-    source 21
-    target 53
-    weight 0
-  ]
-  edge [
-    source 21
-    target 54
-    weight 0
-  ]
-  edge [
-    source 21
-    target 55
-    weight 0
-  ]
-  edge [
-    source 21
-    target 56
-    weight 0
-  ]
-  edge [
-    source 21
-    target 57
-    weight 0
-  ]
-  edge [
-    source 21
-    target 58
-    weight 0
-  ]
-  edge [
-    source 21
-    target 59
-    weight 0
-  ]
-  edge [
-    source 21
-    target 60
-    weight 0
-  ]
-  edge [
-    source 21
-    target 61
-    weight 0
-  ]
-  edge [
-    source 21
-    target 62
-    weight 0
-  ]
-  edge [
-    source 21
-    target 63
-    weight 0
-  ]
-  edge [
-    source 21
-    target 64
-    weight 0
-  ]
-  edge [
-    source 21
-    target 65
-    weight 0
-  ]
-  edge [
-    source 21
-    target 66
-    weight 0
-  ]
-  edge [
-    source 21
-    target 67
-    weight 0
-  ]
-  edge [
-    source 21
-    target 68
-    weight 0
-  ]
-  edge [
-    source 21
-    target 69
-    weight 0
-  ]
-  edge [
-    source 21
-    target 70
-    weight 0
-  ]
-  edge [
-    source 21
-    target 71
-    weight 0
-  ]
-  edge [
-    source 21
-    target 72
-    weight 0
-  ]
-  edge [
-    source 21
-    target 73
-    weight 0
-  ]
-  edge [
-    source 21
-    target 74
-    weight 0
-  ]
-  edge [
-    source 21
-    target 75
-    weight 0
-  ]
-  edge [
-    source 21
-    target 76
-    weight 0
-  ]
-  edge [
-    source 21
-    target 77
-    weight 0
-  ]
-  edge [
-    source 21
-    target 78
-    weight 0
-  ]
-  edge [
-    source 21
-    target 79
-    weight -0.1
-  ]
-  edge [
-    source 21
-    target 80
-    weight 0
-  ]
-  edge [
-    source 21
-    target 81
-    weight 0
-  ]
-  edge [
-    source 21
-    target 82
-    weight 0
-  ]
-  edge [
-    source 21
-    target 83
-    weight 0
-  ]
-  edge [
-    source 21
-    target 84
-    weight 0
-  ]
-  edge [
-    source 21
-    target 85
-    weight 0
-  ]
-  edge [
-    source 21
-    target 86
-    weight 0
-  ]
-  edge [
-    source 21
-    target 87
-    weight 0
-  ]
-  edge [
-    source 21
-    target 88
-    weight 0
-  ]
-  edge [
-    source 21
-    target 89
-    weight 0
-  ]
-  edge [
-    source 21
-    target 90
-    weight 0
-  ]
-  edge [
-    source 21
-    target 91
-    weight -0.1
-  ]
-  edge [
-    source 21
-    target 92
-    weight 0
-  ]
-  edge [
-    source 21
-    target 93
-    weight 0
-  ]
-  edge [
-    source 21
-    target 94
-    weight 0
-  ]
-  edge [
-    source 21
-    target 95
-    weight 0
-  ]
-  edge [
-    source 21
-    target 96
-    weight 0
-  ]
-  edge [
-    source 21
-    target 97
-    weight 0
-  ]
-  edge [
-    source 21
-    target 98
-    weight 0
-  ]
-  edge [
-    source 21
-    target 99
-    weight 0
-  ]
-  edge [
-    source 21
-    target 100
-    weight 0
-  ]
-  edge [
-    source 22
-    target 23
-    weight 0
-  ]
-  edge [
-    source 22
-    target 24
-    weight 0
-  ]
-  edge [
-    source 22
-    target 25
-    weight 0
-  ]
-  edge [
-    source 22
-    target 26
-    weight 0.0
-  ]
-  edge [
-    source 22
-    target 27
-    weight -0.1
-  ]
-  edge [
-    source 22
-    target 28
-    weight -0.1
-  ]
-  edge [
-    source 22
-    target 29
-    weight 0
-  ]
-  edge [
-    source 22
-    target 30
-    weight 0
-  ]
-  edge [
-    source 22
-    target 31
-    weight 0
-  ]
-  edge [
-    source 22
-    target 32
-    weight 0
-  ]
-  edge [
-    source 22
-    target 33
-    weight -0.1
-  ]
-  edge [
-    source 22
-    target 34
-    weight 0
-  ]
-  edge [
-    source 22
-    target 35
-    weight 0
-  ]
-  edge [
-    source 22
-    target 36
-    weight 0
-  ]
-  edge [
-    source 22
-    target 37
-    weight 0
-  ]
-  edge [
-    source 22
-    target 38
-    weight 0
-  ]
-  edge [
-    source 22
-    target 39
-    weight 0
-  ]
-  edge [
-    source 22
-    target 40
-    weight 0
-  ]
-  edge [
-    source 22
-    target 41
-    weight 0
-  ]
-  edge [
-    source 22
-    target 42
-    weight 0
-  ]
-  edge [
-    source 22
-    target 43
-    weight 0
-  ]
-  edge [
-    source 22
-    target 44
-    weight 0
-  ]
-  edge [
-    source 22
-    target 45
-    weight 0
-  ]
-  edge [
-    source 22
-    target 46
-    weight 0
-  ]
-  edge [
-    source 22
-    target 47
-    weight 0
-  ]
-  edge [
-    source 22
-    target 48
-    weight 0
-  ]
-  edge [
-    source 22
-    target 49
-    weight 0
-  ]
-  edge [
-    source 22
-    target 50
-    weight 0
-  ]
-  edge [
-    source 22
-    target 51
-    weight 0
-  ]
-  edge [
-    source 22
-    target 52
-    weight 0
-  ]
-  edge [
-    source 22
-    target 53
-    weight 0
-  ]
-  edge [
-    source 22
-    target 54
-    weight 0
-  ]
-  edge [
-    source 22
-    target 55
-    weight 0
-  ]
-  edge [
-    source 22
-    target 56
-    weight 0
-  ]
-  edge [
-    source 22
-    target 57
-    weight 0
-  ]
-  edge [
-    source 22
-    target 58
-    weight 0
-  ]
-  edge [
-    source 22
-    target 59
-    weight 0
-  ]
-  edge [
-    source 22
-    target 60
-    weight 0
-  ]
-  edge [
-    source 22
-    target 61
-    weight 0
-  ]
-  edge [
-    source 22
-    target 62
-    weight 0
-  ]
-  edge [
-    source 22
-    target 63
-    weight 0
-  ]
-  edge [
-    source 22
-    target 64
-    weight 0
-  ]
-  edge [
-    source 22
-    target 65
-    weight 0
-  ]
-  edge [
-    source 22
-    target 66
-    weight 0
-  ]
-  edge [
-    source 22
-    target 67
-    weight 0
-  ]
-  edge [
-    source 22
-    target 68
-    weight 0
-  ]
-  edge [
-    source 22
-    target 69
-    weight 0
-  ]
-  edge [
-    source 22
-    target 70
-    weight 0
-  ]
-  edge [
-    source 22
-    target 71
-    weight 0
-  ]
-  edge [
-    source 22
-    target 72
-    weight 0
-  ]
-  edge [
-    source 22
-    target 73
-    weight 0
-  ]
-  edge [
-    source 22
-    target 74
-    weight 0
-  ]
-  edge [
-    source 22
-    target 75
-    weight 0
-  ]
-  edge [
-    source 22
-    target 76
-    weight 0
-  ]
-  edge [
-    source 22
-    target 77
-    weight 0
-  ]
-  edge [
-    source 22
-    target 78
-    weight 0
-  ]
-  edge [
-    source 22
-    target 79
-    weight 0
-  ]
-  edge [
-    source 22
-    target 80
-    weight 0
-  ]
-  edge [
-    source 22
-    target 81
-    weight 0
-  ]
-  edge [
-    source 22
-    target 82
-    weight 0
-  ]
-  edge [
-    source 22
-    target 83
-    weight 0
-  ]
-  edge [
-    source 22
-    target 84
-    weight 0
-  ]
-  edge [
-    source 22
-    target 85
-    weight 0
-  ]
-  edge [
-    source 22
-    target 86
-    weight 0
-  ]
-  edge [
-    source 22
-    target 87
-    weight 0
-  ]
-  edge [
-    source 22
-    target 88
-    weight 0
-  ]
-  edge [
-    source 22
-    target 89
-    weight 0
-  ]
-  edge [
-    source 22
-    target 90
-    weight 0
-  ]
-  edge [
-    source 22
-    target 91
-    weight 0
-  ]
-  edge [
-    source 22
-    target 92
-    weight 0
-  ]
-  edge [
-    source 22
-    target 93
-    weight 0
-  ]
-  edge [
-    source 22
-    target 94
-    weight 0
-  ]
-  edge [
-    source 22
-    target 95
-    weight 0
-  ]
-  edge [
-    source 22
-    target 96
-    weight 0
-  ]
-  edge [
-    source 22
-    target 97
-    weight 0
-  ]
-  edge [
-    source 22
-    target 98
-    weight 0
-  ]
-  edge [
-    source 22
-    target 99
-    weight 0
-  ]
-  edge [
-    source 22
-    target 100
-    weight -0.1
-  ]
-  edge [
-    source 23
-    target 24
-    weight 0.1
-  ]
-  edge [
-    source 23
-    target 25
-    weight 0.1
-  ]
-  edge [
-    source 23
-    target 26
-    weight 0
-  ]
-  edge [
-    source 23
-    target 27
-    weight 0
-  ]
-  edge [
-    source 23
-    target 28
-    weight 0
-  ]
-  edge [
-    source 23
-    target 29
-    weight 0.1
-  ]
-  edge [
-    source 23
-    target 30
-    weight 0
-  ]
-  edge [
-    source 23
-    target 31
-    weight 0
-  ]
-  edge [
-    source 23
-    target 32
-    weight 0
-  ]
-  edge [
-    source 23
-    target 33
-    weight -0.1
-  ]
-  edge [
-    source 23
-    target 34
-    weight 0
-  ]
-  edge [
-    source 23
-    target 35
-    weight 0
-  ]
-  edge [
-    source 23
-    target 36
-    weight 0
-  ]
-  edge [
-    source 23
-    target 37
-    weight -0.1
-  ]
-  edge [
-    source 23
-    target 38
-    weight 0
-  ]
-  edge [
-    source 23
-    target 39
-    weight 0
-  ]
-  edge [
-    source 23
-    target 40
-    weight 0
-  ]
-  edge [
-    source 23
-    target 41
-    weight 0
-  ]
-  edge [
-    source 23
-    target 42
-    weight 0
-  ]
-  edge [
-    source 23
-    target 43
-    weight 0
-  ]
-  edge [
-    source 23
-    target 44
-    weight 0
-  ]
-  edge [
-    source 23
-    target 45
-    weight 0
-  ]
-  edge [
-    source 23
-    target 46
-    weight 0
-  ]
-  edge [
-    source 23
-    target 47
-    weight 0
-  ]
-  edge [
-    source 23
-    target 48
-    weight 0
-  ]
-  edge [
-    source 23
-    target 49
-    weight 0
-  ]
-  edge [
-    source 23
-    target 50
-    weight 0
-  ]
-  edge [
-    source 23
-    target 51
-    weight 0
-  ]
-  edge [
-    source 23
-    target 52
-    weight 0
-  ]
-  edge [
-    source 23
-    target 53
-    weight 0
-  ]
-  edge [
-    source 23
-    target 54
-    weight 0
-  ]
-  edge [
-    source 23
-    target 55
-    weight 0
-  ]
-  edge [
-    source 23
-    target 56
-    weight 0
-  ]
-  edge [
-    source 23
-    target 57
-    weight 0
-  ]
-  edge [
-    source 23
-    target 58
-    weight 0
-  ]
-  edge [
-    source 23
-    target 59
-    weight 0
-  ]
-  edge [
-    source 23
-    target 60
-    weight 0
-  ]
-  edge [
-    source 23
-    target 61
-    weight 0
-  ]
-  edge [
-    source 23
-    target 62
-    weight 0
-  ]
-  edge [
-    source 23
-    target 63
-    weight 0
-  ]
-  edge [
-    source 23
-    target 64
-    weight 0
-  ]
-  edge [
-    source 23
-    target 65
-    weight 0
-  ]
-  edge [
-    source 23
-    target 66
-    weight 0
-  ]
-  edge [
-    source 23
-    target 67
-    weight 0
-  ]
-  edge [
-    source 23
-    target 68
-    weight 0
-  ]
-  edge [
-    source 23
-    target 69
-    weight 0
-  ]
-  edge [
-    source 23
-    target 70
-    weight 0
-  ]
-  edge [
-    source 23
-    target 71
-    weight 0
-  ]
-  edge [
-    source 23
-    target 72
-    weight 0
-  ]
-  edge [
-    source 23
-    target 73
-    weight 0
-  ]
-  edge [
-    source 23
-    target 74
-    weight 0
-  ]
-  edge [
-    source 23
-    target 75
-    weight 0
-  ]
-  edge [
-    source 23
-    target 76
-    weight 0
-  ]
-  edge [
-    source 23
-    target 77
-    weight 0
-  ]
-  edge [
-    source 23
-    target 78
-    weight 0
-  ]
-  edge [
-    source 23
-    target 79
-    weight 0
-  ]
-  edge [
-    source 23
-    target 80
-    weight 0
-  ]
-  edge [
-    source 23
-    target 81
-    weight 0
-  ]
-  edge [
-    source 23
-    target 82
-    weight 0
-  ]
-  edge [
-    source 23
-    target 83
-    weight 0
-  ]
-  edge [
-    source 23
-    target 84
-    weight 0
-  ]
-  edge [
-    source 23
-    target 85
-    weight 0
-  ]
-  edge [
-    source 23
-    target 86
-    weight 0
-  ]
-  edge [
-    source 23
-    target 87
-    weight 0
-  ]
-  edge [
-    source 23
-    target 88
-    weight 0
-  ]
-  edge [
-    source 23
-    target 89
-    weight 0
-  ]
-  edge [
-    source 23
-    target 90
-    weight 0
-  ]
-  edge [
-    source 23
-    target 91
-    weight -0.1
-  ]
-  edge [
-    source 23
-    target 92
-    weight 0
-  ]
-  edge [
-    source 23
-    target 93
-    weight 0
-  ]
-  edge [
-    source 23
-    target 94
-    weight 0
-  ]
-  edge [
-    source 23
-    target 95
-    weight 0
-  ]
-  edge [
-    source 23
-    target 96
-    weight 0
-  ]
-  edge [
-    source 23
-    target 97
-    weight 0
-  ]
-  edge [
-    source 23
-    target 98
-    weight 0
-  ]
-  edge [
-    source 23
-    target 99
-    weight 0
-  ]
-  edge [
-    source 23
-    target 100
-    weight 0
-  ]
-  edge [
-    source 24
-    target 25
-    weight 0.1
-  ]
-  edge [
-    source 24
-    target 26
-    weight 0
-  ]
-  edge [
-    source 24
-    target 27
-    weight -0.1
-  ]
-  edge [
-    source 24
-    target 28
-    weight 0
-  ]
-  edge [
-    source 24
-    target 29
-    weight 0
-  ]
-  edge [
-    source 24
-    target 30
-    weight 0
-  ]
-  edge [
-    source 24
-    target 31
-    weight 0
-  ]
-  edge [
-    source 24
-    target 32
-    weight 0
-  ]
-  edge [
-    source 24
-    target 33
-    weight 0
-  ]
-  edge [
-    source 24
-    target 34
-    weight 0
-  ]
-  edge [
-    source 24
-    target 35
-    weight 0
-  ]
-  edge [
-    source 24
-    target 36
-    weight 0
-  ]
-  edge [
-    source 24
-    target 37
-    weight -0.1
-  ]
-  edge [
-    source 24
-    target 38
-    weight 0
-  ]
-  edge [
-    source 24
-    target 39
-    weight 0
-  ]
-  edge [
-    source 24
-    target 40
-    weight 0
-  ]
-  edge [
-    source 24
-    target 41
-    weight 0
-  ]
-  edge [
-    source 24
-    target 42
-    weight 0
-  ]
-  edge [
-    source 24
-    target 43
-    weight 0
-  ]
-  edge [
-    source 24
-    target 44
-    weight 0
-  ]
-  edge [
-    source 24
-    target 45
-    weight 0
-  ]
-  edge [
-    source 24
-    target 46
-    weight 0
-  ]
-  edge [
-    source 24
-    target 47
-    weight 0
-  ]
-  edge [
-    source 24
-    target 48
-    weight 0
-  ]
-  edge [
-    source 24
-    target 49
-    weight 0
-  ]
-  edge [
-    source 24
-    target 50
-    weight -0.1
-  ]
-  edge [
-    source 24
-    target 51
-    weight 0
-  ]
-  edge [
-    source 24
-    target 52
-    weight 0
-  ]
-  edge [
-    source 24
-    target 53
-    weight 0
-  ]
-  edge [
-    source 24
-    target 54
-    weight 0
-  ]
-  edge [
-    source 24
-    target 55
-    weight 0.1
-  ]
-  edge [
-    source 24
-    target 56
-    weight 0
-  ]
-  edge [
-    source 24
-    target 57
-    weight 0
-  ]
-  edge [
-    source 24
-    target 58
-    weight 0
-  ]
-  edge [
-    source 24
-    target 59
-    weight 0
-  ]
-  edge [
-    source 24
-    target 60
-    weight 0
-  ]
-  edge [
-    source 24
-    target 61
-    weight 0
-  ]
-  edge [
-    source 24
-    target 62
-    weight 0
-  ]
-  edge [
-    source 24
-    target 63
-    weight 0
-  ]
-  edge [
-    source 24
-    target 64
-    weight 0
-  ]
-  edge [
-    source 24
-    target 65
-    weight 0
-  ]
-  edge [
-    source 24
-    target 66
-    weight 0
-  ]
-  edge [
-    source 24
-    target 67
-    weight 0
-  ]
-  edge [
-    source 24
-    target 68
-    weight 0.1
-  ]
-  edge [
-    source 24
-    target 69
-    weight 0
-  ]
-  edge [
-    source 24
-    target 70
-    weight 0
-  ]
-  edge [
-    source 24
-    target 71
-    weight 0
-  ]
-  edge [
-    source 24
-    target 72
-    weight 0
-  ]
-  edge [
-    source 24
-    target 73
-    weight 0
-  ]
-  edge [
-    source 24
-    target 74
-    weight 0
-  ]
-  edge [
-    source 24
-    target 75
-    weight 0
-  ]
-  edge [
-    source 24
-    target 76
-    weight 0
-  ]
-  edge [
-    source 24
-    target 77
-    weight 0
-  ]
-  edge [
-    source 24
-    target 78
-    weight 0
-  ]
-  edge [
-    source 24
-    target 79
-    weight 0
-  ]
-  edge [
-    source 24
-    target 80
-    weight 0
-  ]
-  edge [
-    source 24
-    target 81
-    weight -0.1
-  ]
-  edge [
-    source 24
-    target 82
-    weight -0.1
-  ]
-  edge [
-    source 24
-    target 83
-    weight 0
-  ]
-  edge [
-    source 24
-    target 84
-    weight 0
-  ]
-  edge [
-    source 24
-    target 85
-    weight 0
-  ]
-  edge [
-    source 24
-    target 86
-    weight 0
-  ]
-  edge [
-    source 24
-    target 87
-    weight 0
-  ]
-  edge [
-    source 24
-    target 88
-    weight -0.1
-  ]
-  edge [
-    source 24
-    target 89
-    weight 0
-  ]
-  edge [
-    source 24
-    target 90
-    weight 0
-  ]
-  edge [
-    source 24
-    target 91
-    weight 0
-  ]
-  edge [
-    source 24
-    target 92
-    weight 0
-  ]
-  edge [
-    source 24
-    target 93
-    weight 0
-  ]
-  edge [
-    source 24
-    target 94
-    weight 0
-  ]
-  edge [
-    source 24
-    target 95
-    weight 0
-  ]
-  edge [
-    source 24
-    target 96
-    weight 0
-  ]
-  edge [
-    source 24
-    target 97
-    weight 0
-  ]
-  edge [
-    source 24
-    target 98
-    weight 0
-  ]
-  edge [
-    source 24
-    target 99
-    weight 0
-  ]
-  edge [
-    source 24
-    target 100
-    weight 0
-  ]
-  edge [
-    source 25
-    target 26
-    weight 0.1
-  ]
-  edge [
-    source 25
-    target 27
-    weight -0.1
-  ]
-  edge [
-    source 25
-    target 28
-    weight 0
-  ]
-  edge [
-    source 25
-    target 29
-    weight 0
-  ]
-  edge [
-    source 25
-    target 30
-    weight 0
-  ]
-  edge [
-    source 25
-    target 31
-    weight 0
-  ]
-  edge [
-    source 25
-    target 32
-    weight 0
-  ]
-  edge [
-    source 25
-    target 33
-    weight 0
-  ]
-  edge [
-    source 25
-    target 34
-    weight 0
-  ]
-  edge [
-    source 25
-    target 35
-    weight 0
-  ]
-  edge [
-    source 25
-    target 36
-    weight 0
-  ]
-  edge [
-    source 25
-    target 37
-    weight 0
-  ]
-  edge [
-    source 25
-    target 38
-    weight 0
-  ]
-  edge [
-    source 25
-    target 39
-    weight 0
-  ]
-  edge [
-    source 25
-    target 40
-    weight 0
-  ]
-  edge [
-    source 25
-    target 41
-    weight 0
-  ]
-  edge [
-    source 25
-    target 42
-    weight 0
-  ]
-  edge [
-    source 25
-    target 43
-    weight 0
-  ]
-  edge [
-    source 25
-    target 44
-    weight 0
-  ]
-  edge [
-    source 25
-    target 45
-    weight 0
-  ]
-  edge [
-    source 25
-    target 46
-    weight 0
-  ]
-  edge [
-    source 25
-    target 47
-    weight 0
-  ]
-  edge [
-    source 25
-    target 48
-    weight 0
-  ]
-  edge [
-    source 25
-    target 49
-    weight 0
-  ]
-  edge [
-    source 25
-    target 50
-    weight 0
-  ]
-  edge [
-    source 25
-    target 51
-    weight 0
-  ]
-  edge [
-    source 25
-    target 52
-    weight 0
-  ]
-  edge [
-    source 25
-    target 53
-    weight 0
-  ]
-  edge [
-    source 25
-    target 54
-    weight 0
-  ]
-  edge [
-    source 25
-    target 55
-    weight 0
-  ]
-  edge [
-    source 25
-    target 56
-    weight 0
-  ]
-  edge [
-    source 25
-    target 57
-    weight 0
-  ]
-  edge [
-    source 25
-    target 58
-    weight 0
-  ]
-  edge [
-    source 25
-    target 59
-    weight 0
-  ]
-  edge [
-    source 25
-    target 60
-    weight 0
-  ]
-  edge [
-    source 25
-    target 61
-    weight 0
-  ]
-  edge [
-    source 25
-    target 62
-    weight 0
-  ]
-  edge [
-    source 25
-    target 63
-    weight 0
-  ]
-  edge [
-    source 25
-    target 64
-    weight 0
-  ]
-  edge [
-    source 25
-    target 65
-    weight 0
-  ]
-  edge [
-    source 25
-    target 66
-    weight 0
-  ]
-  edge [
-    source 25
-    target 67
-    weight 0
-  ]
-  edge [
-    source 25
-    target 68
-    weight 0
-  ]
-  edge [
-    source 25
-    target 69
-    weight 0
-  ]
-  edge [
-    source 25
-    target 70
-    weight 0
-  ]
-  edge [
-    source 25
-    target 71
-    weight 0
-  ]
-  edge [
-    source 25
-    target 72
-    weight 0
-  ]
-  edge [
-    source 25
-    target 73
-    weight 0
-  ]
-  edge [
-    source 25
-    target 74
-    weight 0
-  ]
-  edge [
-    source 25
-    target 75
-    weight 0
-  ]
-  edge [
-    source 25
-    target 76
-    weight 0
-  ]
-  edge [
-    source 25
-    target 77
-    weight 0
-  ]
-  edge [
-    source 25
-    target 78
-    weight 0
-  ]
-  edge [
-    source 25
-    target 79
-    weight 0
-  ]
-  edge [
-    source 25
-    target 80
-    weight 0
-  ]
-  edge [
-    source 25
-    target 81
-    weight 0
-  ]
-  edge [
-    source 25
-    target 82
-    weight 0
-  ]
-  edge [
-    source 25
-    target 83
-    weight 0
-  ]
-  edge [
-    source 25
-    target 84
-    weight 0
-  ]
-  edge [
-    source 25
-    target 85
-    weight 0
-  ]
-  edge [
-    source 25
-    target 86
-    weight 0
-  ]
-  edge [
-    source 25
-    target 87
-    weight 0
-  ]
-  edge [
-    source 25
-    target 88
-    weight 0
-  ]
-  edge [
-    source 25
-    target 89
-    weight 0
-  ]
-  edge [
-    source 25
-    target 90
-    weight 0
-  ]
-  edge [
-    source 25
-    target 91
-    weight 0
-  ]
-  edge [
-    source 25
-    target 92
-    weight 0
-  ]
-  edge [
-    source 25
-    target 93
-    weight 0
-  ]
-  edge [
-    source 25
-    target 94
-    weight 0
-  ]
-  edge [
-    source 25
-    target 95
-    weight 0
-  ]
-  edge [
-    source 25
-    target 96
-    weight 0
-  ]
-  edge [
-    source 25
-    target 97
-    weight 0
-  ]
-  edge [
-    source 25
-    target 98
-    weight 0
-  ]
-  edge [
-    source 25
-    target 99
-    weight 0
-  ]
-  edge [
-    source 25
-    target 100
-    weight 0
-  ]
-  edge [
-    source 26
-    target 27
-    weight -0.1
-  ]
-  edge [
-    source 26
-    target 28
-    weight 0
-  ]
-  edge [
-    source 26
-    target 29
-    weight -0.1
-  ]
-  edge [
-    source 26
-    target 30
-    weight -0.1
-  ]
-  edge [
-    source 26
-    target 31
-    weight -0.1
-  ]
-  edge [
-    source 26
-    target 32
-    weight 0
-  ]
-  edge [
-    source 26
-    target 33
-    weight 0
-  ]
-  edge [
-    source 26
-    target 34
-    weight 0
-  ]
-  edge [
-    source 26
-    target 35
-    weight 0
-  ]
-  edge [
-    source 26
-    target 36
-    weight 0
-  ]
-  edge [
-    source 26
-    target 37
-    weight 0
-  ]
-  edge [
-    source 26
-    target 38
-    weight 0
-  ]
-  edge [
-    source 26
-    target 39
-    weight 0
-  ]
-  edge [
-    source 26
-    target 40
-    weight 0
-  ]
-  edge [
-    source 26
-    target 41
-    weight 0
-  ]
-  edge [
-    source 26
-    target 42
-    weight 0
-  ]
-  edge [
-    source 26
-    target 43
-    weight 0
-  ]
-  edge [
-    source 26
-    target 44
-    weight 0
-  ]
-  edge [
-    source 26
-    target 45
-    weight 0
-  ]
-  edge [
-    source 26
-    target 46
-    weight 0
-  ]
-  edge [
-    source 26
-    target 47
-    weight 0
-  ]
-  edge [
-    source 26
-    target 48
-    weight 0
-  ]
-  edge [
-    source 26
-    target 49
-    weight 0
-  ]
-  edge [
-    source 26
-    target 50
-    weight 0
-  ]
-  edge [
-    source 26
-    target 51
-    weight 0
-  ]
-  edge [
-    source 26
-    target 52
-    weight 0
-  ]
-  edge [
-    source 26
-    target 53
-    weight 0
-  ]
-  edge [
-    source 26
-    target 54
-    weight 0
-  ]
-  edge [
-    source 26
-    target 55
-    weight 0
-  ]
-  edge [
-    source 26
-    target 56
-    weight 0
-  ]
-  edge [
-    source 26
-    target 57
-    weight 0
-  ]
-  edge [
-    source 26
-    target 58
-    weight 0
-  ]
-  edge [
-    source 26
-    target 59
-    weight 0
-  ]
-  edge [
-    source 26
-    target 60
-    weight 0
-  ]
-  edge [
-    source 26
-    target 61
-    weight 0
-  ]
-  edge [
-    source 26
-    target 62
-    weight 0
-  ]
-  edge [
-    source 26
-    target 63
-    weight 0
-  ]
-  edge [
-    source 26
-    target 64
-    weight 0
-  ]
-  edge [
-    source 26
-    target 65
-    weight 0
-  ]
-  edge [
-    source 26
-    target 66
-    weight 0
-  ]
-  edge [
-    source 26
-    target 67
-    weight 0
-  ]
-  edge [
-    source 26
-    target 68
-    weight 0
-  ]
-  edge [
-    source 26
-    target 69
-    weight 0
-  ]
-  edge [
-    source 26
-    target 70
-    weight 0
-  ]
-  edge [
-    source 26
-    target 71
-    weight 0
-  ]
-  edge [
-    source 26
-    target 72
-    weight 0
-  ]
-  edge [
-    source 26
-    target 73
-    weight 0
-  ]
-  edge [
-    source 26
-    target 74
-    weight 0
-  ]
-  edge [
-    source 26
-    target 75
-    weight 0
-  ]
-  edge [
-    source 26
-    target 76
-    weight 0
-  ]
-  edge [
-    source 26
-    target 77
-    weight 0
-  ]
-  edge [
-    source 26
-    target 78
-    weight 0
-  ]
-  edge [
-    source 26
-    target 79
-    weight 0
-  ]
-  edge [
-    source 26
-    target 80
-    weight 0
-  ]
-  edge [
-    source 26
-    target 81
-    weight 0
-  ]
-  edge [
-    source 26
-    target 82
-    weight 0
-  ]
-  edge [
-    source 26
-    target 83
-    weight 0
-  ]
-  edge [
-    source 26
-    target 84
-    weight 0
-  ]
-  edge [
-    source 26
-    target 85
-    weight 0
-  ]
-  edge [
-    source 26
-    target 86
-    weight 0
-  ]
-  edge [
-    source 26
-    target 87
-    weight 0
-  ]
-  edge [
-    source 26
-    target 88
-    weight 0
-  ]
-  edge [
-    source 26
-    target 89
-    weight 0
-  ]
-  edge [
-    source 26
-    target 90
-    weight 0
-  ]
-  edge [
-    source 26
-    target 91
-    weight 0
-  ]
-  edge [
-    source 26
-    target 92
-    weight 0
-  ]
-  edge [
-    source 26
-    target 93
-    weight 0
-  ]
-  edge [
-    source 26
-    target 94
-    weight 0
-  ]
-  edge [
-    source 26
-    target 95
-    weight 0
-  ]
-  edge [
-    source 26
-    target 96
-    weight 0.1
-  ]
-  edge [
-    source 26
-    target 97
-    weight 0
-  ]
-  edge [
-    source 26
-    target 98
-    weight 0
-  ]
-  edge [
-    source 26
-    target 99
-    weight 0
-  ]
-  edge [
-    source 26
-    target 100
-    weight 0
-  ]
-  edge [
-    source 27
-    target 28
-    weight 0
-  ]
-  edge [
-    source 27
-    target 29
-    weight 0
-  ]
-  edge [
-    source 27
-    target 30
-    weight 0
-  ]
-  edge [
-    source 27
-    target 31
-    weight 0
-  ]
-  edge [
-    source 27
-    target 32
-    weight -0.1
-  ]
-  edge [
-    source 27
-    target 33
-    weight 0
-  ]
-  edge [
-    source 27
-    target 34
-    weight 0
-  ]
-  edge [
-    source 27
-    target 35
-    weight 0
-  ]
-  edge [
-    source 27
-    target 36
-    weight 0
-  ]
-  edge [
-    source 27
-    target 37
-    weight 0
-  ]
-  edge [
-    source 27
-    target 38
-    weight 0
-  ]
-  edge [
-    source 27
-    target 39
-    weight 0
-  ]
-  edge [
-    source 27
-    target 40
-    weight 0
-  ]
-  edge [
-    source 27
-    target 41
-    weight 0
-  ]
-  edge [
-    source 27
-    target 42
-    weight 0
-  ]
-  edge [
-    source 27
-    target 43
-    weight 0
-  ]
-  edge [
-    source 27
-    target 44
-    weight 0
-  ]
-  edge [
-    source 27
-    target 45
-    weight 0
-  ]
-  edge [
-    source 27
-    target 46
-    weight 0
-  ]
-  edge [
-    source 27
-    target 47
-    weight 0
-  ]
-  edge [
-    source 27
-    target 48
-    weight 0
-  ]
-  edge [
-    source 27
-    target 49
-    weight 0
-  ]
-  edge [
-    source 27
-    target 50
-    weight 0
-  ]
-  edge [
-    source 27
-    target 51
-    weight 0
-  ]
-  edge [
-    source 27
-    target 52
-    weight 0
-  ]
-  edge [
-    source 27
-    target 53
-    weight 0
-  ]
-  edge [
-    source 27
-    target 54
-    weight 0
-  ]
-  edge [
-    source 27
-    target 55
-    weight 0
-  ]
-  edge [
-    source 27
-    target 56
-    weight 0
-  ]
-  edge [
-    source 27
-    target 57
-    weight 0
-  ]
-  edge [
-    source 27
-    target 58
-    weight 0
-  ]
-  edge [
-    source 27
-    target 59
-    weight 0
-  ]
-  edge [
-    source 27
-    target 60
-    weight 0
-  ]
-  edge [
-    source 27
-    target 61
-    weight 0
-  ]
-  edge [
-    source 27
-    target 62
-    weight 0
-  ]
-  edge [
-    source 27
-    target 63
-    weight 0
-  ]
-  edge [
-    source 27
-    target 64
-    weight 0
-  ]
-  edge [
-    source 27
-    target 65
-    weight 0
-  ]
-  edge [
-    source 27
-    target 66
-    weight 0
-  ]
-  edge [
-    source 27
-    target 67
-    weight 0
-  ]
-  edge [
-    source 27
-    target 68
-    weight 0
-  ]
-  edge [
-    source 27
-    target 69
-    weight 0
-  ]
-  edge [
-    source 27
-    target 70
-    weight 0
-  ]
-  edge [
-    source 27
-    target 71
-    weight 0
-  ]
-  edge [
-    source 27
-    target 72
-    weight 0
-  ]
-  edge [
-    source 27
-    target 73
-    weight 0
-  ]
-  edge [
-    source 27
-    target 74
-    weight 0
-  ]
-  edge [
-    source 27
-    target 75
-    weight 0
-  ]
-  edge [
-    source 27
-    target 76
-    weight 0
-  ]
-  edge [
-    source 27
-    target 77
-    weight 0
-  ]
-  edge [
-    source 27
-    target 78
-    weight 0
-  ]
-  edge [
-    source 27
-    target 79
-    weight 0
-  ]
-  edge [
-    source 27
-    target 80
-    weight 0
-  ]
-  edge [
-    source 27
-    target 81
-    weight 0
-  ]
-  edge [
-    source 27
-    target 82
-    weight 0
-  ]
-  edge [
-    source 27
-    target 83
-    weight -0.1
-  ]
-  edge [
-    source 27
-    target 84
-    weight 0
-  ]
-  edge [
-    source 27
-    target 85
-    weight 0
-  ]
-  edge [
-    source 27
-    target 86
-    weight 0
-  ]
-  edge [
-    source 27
-    target 87
-    weight 0
-  ]
-  edge [
-    source 27
-    target 88
-    weight 0
-  ]
-  edge [
-    source 27
-    target 89
-    weight 0
-  ]
-  edge [
-    source 27
-    target 90
-    weight 0
-  ]
-  edge [
-    source 27
-    target 91
-    weight 0
-  ]
-  edge [
-    source 27
-    target 92
-    weight 0
-  ]
-  edge [
-    source 27
-    target 93
-    weight 0
-  ]
-  edge [
-    source 27
-    target 94
-    weight 0
-  ]
-  edge [
-    source 27
-    target 95
-    weight 0
-  ]
-  edge [
-    source 27
-    target 96
-    weight 0
-  ]
-  edge [
-    source 27
-    target 97
-    weight 0
-  ]
-  edge [
-    source 27
-    target 98
-    weight 0.1
-  ]
-  edge [
-    source 27
-    target 99
-    weight 0
-  ]
-  edge [
-    source 27
-    target 100
-    weight 0
-  ]
-  edge [
-    source 28
-    target 29
-    weight 0
-  ]
-  edge [
-    source 28
-    target 30
-    weight 0.1
-  ]
-  edge [
-    source 28
-    target 31
-    weight 0
-  ]
-  edge [
-    source 28
-    target 32
-    weight 0
-  ]
-  edge [
-    source 28
-    target 33
-    weight 0
-  ]
-  edge [
-    source 28
-    target 34
-    weight 0
-  ]
-  edge [
-    source 28
-    target 35
-    weight 0
-  ]
-  edge [
-    source 28
-    target 36
-    weight 0
-  ]
-  edge [
-    source 28
-    target 37
-    weight 0
-  ]
-  edge [
-    source 28
-    target 38
-    weight 0
-  ]
-  edge [
-    source 28
-    target 39
-    weight 0
-  ]
-  edge [
-    source 28
-    target 40
-    weight 0
-  ]
-  edge [
-    source 28
-    target 41
-    weight 0
-  ]
-  edge [
-    source 28
-    target 42
-    weight 0
-  ]
-  edge [
-    source 28
-    target 43
-    weight 0
-  ]
-  edge [
-    source 28
-    target 44
-    weight 0
-  ]
-  edge [
-    source 28
-    target 45
-    weight 0
-  ]
-  edge [
-    source 28
-    target 46
-    weight 0
-  ]
-  edge [
-    source 28
-    target 47
-    weight 0
-  ]
-  edge [
-    source 28
-    target 48
-    weight 0
-  ]
-  edge [
-    source 28
-    target 49
-    weight 0
-  ]
-  edge [
-    source 28
-    target 50
-    weight 0
-  ]
-  edge [
-    source 28
-    target 51
-    weight 0
-  ]
-  edge [
-    source 28
-    target 52
-    weight 0
-  ]
-  edge [
-    source 28
-    target 53
-    weight 0
-  ]
-  edge [
-    source 28
-    target 54
-    weight 0
-  ]
-  edge [
-    source 28
-    target 55
-    weight 0
-  ]
-  edge [
-    source 28
-    target 56
-    weight 0
-  ]
-  edge [
-    source 28
-    target 57
-    weight 0
-  ]
-  edge [
-    source 28
-    target 58
-    weight 0
-  ]
-  edge [
-    source 28
-    target 59
-    weight 0
-  ]
-  edge [
-    source 28
-    target 60
-    weight 0
-  ]
-  edge [
-    source 28
-    target 61
-    weight 0
-  ]
-  edge [
-    source 28
-    target 62
-    weight 0
-  ]
-  edge [
-    source 28
-    target 63
-    weight 0
-  ]
-  edge [
-    source 28
-    target 64
-    weight 0
-  ]
-  edge [
-    source 28
-    target 65
-    weight 0
-  ]
-  edge [
-    source 28
-    target 66
-    weight 0
-  ]
-  edge [
-    source 28
-    target 67
-    weight 0
-  ]
-  edge [
-    source 28
-    target 68
-    weight 0
-  ]
-  edge [
-    source 28
-    target 69
-    weight 0
-  ]
-  edge [
-    source 28
-    target 70
-    weight 0
-  ]
-  edge [
-    source 28
-    target 71
-    weight 0
-  ]
-  edge [
-    source 28
-    target 72
-    weight 0
-  ]
-  edge [
-    source 28
-    target 73
-    weight 0
-  ]
-  edge [
-    source 28
-    target 74
-    weight 0
-  ]
-  edge [
-    source 28
-    target 75
-    weight 0
-  ]
-  edge [
-    source 28
-    target 76
-    weight 0
-  ]
-  edge [
-    source 28
-    target 77
-    weight 0
-  ]
-  edge [
-    source 28
-    target 78
-    weight 0
-  ]
-  edge [
-    source 28
-    target 79
-    weight 0
-  ]
-  edge [
-    source 28
-    target 80
-    weight 0
-  ]
-  edge [
-    source 28
-    target 81
-    weight 0
-  ]
-  edge [
-    source 28
-    target 82
-    weight 0
-  ]
-  edge [
-    source 28
-    target 83
-    weight 0
-  ]
-  edge [
-    source 28
-    target 84
-    weight 0
-  ]
-  edge [
-    source 28
-    target 85
-    weight 0
-  ]
-  edge [
-    source 28
-    target 86
-    weight 0
-  ]
-  edge [
-    source 28
-    target 87
-    weight 0
-  ]
-  edge [
-    source 28
-    target 88
-    weight 0
-  ]
-  edge [
-    source 28
-    target 89
-    weight 0
-  ]
-  edge [
-    source 28
-    target 90
-    weight 0
-  ]
-  edge [
-    source 28
-    target 91
-    weight 0
-  ]
-  edge [
-    source 28
-    target 92
-    weight 0
-  ]
-  edge [
-    source 28
-    target 93
-    weight 0
-  ]
-  edge [
-    source 28
-    target 94
-    weight 0
-  ]
-  edge [
-    source 28
-    target 95
-    weight 0
-  ]
-  edge [
-    source 28
-    target 96
-    weight 0
-  ]
-  edge [
-    source 28
-    target 97
-    weight 0
-  ]
-  edge [
-    source 28
-    target 98
-    weight 0
-  ]
-  edge [
-    source 28
-    target 99
-    weight 0
-  ]
-  edge [
-    source 28
-    target 100
-    weight 0
-  ]
-  edge [
-    source 29
-    target 30
-    weight 0
-  ]
-  edge [
-    source 29
-    target 31
-    weight 0
-  ]
-  edge [
-    source 29
-    target 32
-    weight 0
-  ]
-  edge [
-    source 29
-    target 33
-    weight 0
-  ]
-  edge [
-    source 29
-    target 34
-    weight 0
-  ]
-  edge [
-    source 29
-    target 35
-    weight 0
-  ]
-  edge [
-    source 29
-    target 36
-    weight 0
-  ]
-  edge [
-    source 29
-    target 37
-    weight 0
-  ]
-  edge [
-    source 29
-    target 38
-    weight 0
-  ]
-  edge [
-    source 29
-    target 39
-    weight 0
-  ]
-  edge [
-    source 29
-    target 40
-    weight 0
-  ]
-  edge [
-    source 29
-    target 41
-    weight 0
-  ]
-  edge [
-    source 29
-    target 42
-    weight 0
-  ]
-  edge [
-    source 29
-    target 43
-    weight 0
-  ]
-  edge [
-    source 29
-    target 44
-    weight 0
-  ]
-  edge [
-    source 29
-    target 45
-    weight 0
-  ]
-  edge [
-    source 29
-    target 46
-    weight 0
-  ]
-  edge [
-    source 29
-    target 47
-    weight 0
-  ]
-  edge [
-    source 29
-    target 48
-    weight 0
-  ]
-  edge [
-    source 29
-    target 49
-    weight 0
-  ]
-  edge [
-    source 29
-    target 50
-    weight 0
-  ]
-  edge [
-    source 29
-    target 51
-    weight 0
-  ]
-  edge [
-    source 29
-    target 52
-    weight 0
-  ]
-  edge [
-    source 29
-    target 53
-    weight 0
-  ]
-  edge [
-    source 29
-    target 54
-    weight 0
-  ]
-  edge [
-    source 29
-    target 55
-    weight 0
-  ]
-  edge [
-    source 29
-    target 56
-    weight 0
-  ]
-  edge [
-    source 29
-    target 57
-    weight 0
-  ]
-  edge [
-    source 29
-    target 58
-    weight 0
-  ]
-  edge [
-    source 29
-    target 59
-    weight 0
-  ]
-  edge [
-    source 29
-    target 60
-    weight 0
-  ]
-  edge [
-    source 29
-    target 61
-    weight 0
-  ]
-  edge [
-    source 29
-    target 62
-    weight 0
-  ]
-  edge [
-    source 29
-    target 63
-    weight 0
-  ]
-  edge [
-    source 29
-    target 64
-    weight 0
-  ]
-  edge [
-    source 29
-    target 65
-    weight 0
-  ]
-  edge [
-    source 29
-    target 66
-    weight 0
-  ]
-  edge [
-    source 29
-    target 67
-    weight 0
-  ]
-  edge [
-    source 29
-    target 68
-    weight 0
-  ]
-  edge [
-    source 29
-    target 69
-    weight 0
-  ]
-  edge [
-    source 29
-    target 70
-    weight 0
-  ]
-  edge [
-    source 29
-    target 71
-    weight 0
-  ]
-  edge [
-    source 29
-    target 72
-    weight 0
-  ]
-  edge [
-    source 29
-    target 73
-    weight 0
-  ]
-  edge [
-    source 29
-    target 74
-    weight 0
-  ]
-  edge [
-    source 29
-    target 75
-    weight 0
-  ]
-  edge [
-    source 29
-    target 76
-    weight 0
-  ]
-  edge [
-    source 29
-    target 77
-    weight 0
-  ]
-  edge [
-    source 29
-    target 78
-    weight 0
-  ]
-  edge [
-    source 29
-    target 79
-    weight 0
-  ]
-  edge [
-    source 29
-    target 80
-    weight 0
-  ]
-  edge [
-    source 29
-    target 81
-    weight 0
-  ]
-  edge [
-    source 29
-    target 82
-    weight 0
-  ]
-  edge [
-    source 29
-    target 83
-    weight 0
-  ]
-  edge [
-    source 29
-    target 84
-    weight 0
-  ]
-  edge [
-    source 29
-    target 85
-    weight 0
-  ]
-  edge [
-    source 29
-    target 86
-    weight 0
-  ]
-  edge [
-    source 29
-    target 87
-    weight 0
-  ]
-  edge [
-    source 29
-    target 88
-    weight 0
-  ]
-  edge [
-    source 29
-    target 89
-    weight 0
-  ]
-  edge [
-    source 29
-    target 90
-    weight -0.1
-  ]
-  edge [
-    source 29
-    target 91
-    weight 0
-  ]
-  edge [
-    source 29
-    target 92
-    weight 0
-  ]
-  edge [
-    source 29
-    target 93
-    weight 0
-  ]
-  edge [
-    source 29
-    target 94
-    weight 0
-  ]
-  edge [
-    source 29
-    target 95
-    weight 0
-  ]
-  edge [
-    source 29
-    target 96
-    weight 0
-  ]
-  edge [
-    source 29
-    target 97
-    weight 0
-  ]
-  edge [
-    source 29
-    target 98
-    weight 0.1
-  ]
-  edge [
-    source 29
-    target 99
-    weight 0
-  ]
-  edge [
-    source 29
-    target 100
-    weight 0
-  ]
-  edge [
-    source 30
-    target 31
-    weight 0
-  ]
-  edge [
-    source 30
-    target 32
-    weight 0
-  ]
-  edge [
-    source 30
-    target 33
-    weight 0
-  ]
-  edge [
-    source 30
-    target 34
-    weight -0.1
-  ]
-  edge [
-    source 30
-    target 35
-    weight 0
-  ]
-  edge [
-    source 30
-    target 36
-    weight 0
-  ]
-  edge [
-    source 30
-    target 37
-    weight 0
-  ]
-  edge [
-    source 30
-    target 38
-    weight 0
-  ]
-  edge [
-    source 30
-    target 39
-    weight 0
-  ]
-  edge [
-    source 30
-    target 40
-    weight 0
-  ]
-  edge [
-    source 30
-    target 41
-    weight 0
-  ]
-  edge [
-    source 30
-    target 42
-    weight 0
-  ]
-  edge [
-    source 30
-    target 43
-    weight 0
-  ]
-  edge [
-    source 30
-    target 44
-    weight 0
-  ]
-  edge [
-    source 30
-    target 45
-    weight 0
-  ]
-  edge [
-    source 30
-    target 46
-    weight 0
-  ]
-  edge [
-    source 30
-    target 47
-    weight 0
-  ]
-  edge [
-    source 30
-    target 48
-    weight 0
-  ]
-  edge [
-    source 30
-    target 49
-    weight 0
-  ]
-  edge [
-    source 30
-    target 50
-    weight 0
-  ]
-  edge [
-    source 30
-    target 51
-    weight 0
-  ]
-  edge [
-    source 30
-    target 52
-    weight 0
-  ]
-  edge [
-    source 30
-    target 53
-    weight 0
-  ]
-  edge [
-    source 30
-    target 54
-    weight 0
-  ]
-  edge [
-    source 30
-    target 55
-    weight 0
-  ]
-  edge [
-    source 30
-    target 56
-    weight 0
-  ]
-  edge [
-    source 30
-    target 57
-    weight 0
-  ]
-  edge [
-    source 30
-    target 58
-    weight 0
-  ]
-  edge [
-    source 30
-    target 59
-    weight 0
-  ]
-  edge [
-    source 30
-    target 60
-    weight 0
-  ]
-  edge [
-    source 30
-    target 61
-    weight 0
-  ]
-  edge [
-    source 30
-    target 62
-    weight 0
-  ]
-  edge [
-    source 30
-    target 63
-    weight 0
-  ]
-  edge [
-    source 30
-    target 64
-    weight 0
-  ]
-  edge [
-    source 30
-    target 65
-    weight 0
-  ]
-  edge [
-    source 30
-    target 66
-    weight 0
-  ]
-  edge [
-    source 30
-    target 67
-    weight 0
-  ]
-  edge [
-    source 30
-    target 68
-    weight 0
-  ]
-  edge [
-    source 30
-    target 69
-    weight 0
-  ]
-  edge [
-    source 30
-    target 70
-    weight 0
-  ]
-  edge [
-    source 30
-    target 71
-    weight 0
-  ]
-  edge [
-    source 30
-    target 72
-    weight 0
-  ]
-  edge [
-    source 30
-    target 73
-    weight 0
-  ]
-  edge [
-    source 30
-    target 74
-    weight 0
-  ]
-  edge [
-    source 30
-    target 75
-    weight 0
-  ]
-  edge [
-    source 30
-    target 76
-    weight 0
-  ]
-  edge [
-    source 30
-    target 77
-    weight 0
-  ]
-  edge [
-    source 30
-    target 78
-    weight 0
-  ]
-  edge [
-    source 30
-    target 79
-    weight 0
-  ]
-  edge [
-    source 30
-    target 80
-    weight 0
-  ]
-  edge [
-    source 30
-    target 81
-    weight 0
-  ]
-  edge [
-    source 30
-    target 82
-    weight 0
-  ]
-  edge [
-    source 30
-    target 83
-    weight 0
-  ]
-  edge [
-    source 30
-    target 84
-    weight 0
-  ]
-  edge [
-    source 30
-    target 85
-    weight 0
-  ]
-  edge [
-    source 30
-    target 86
-    weight 0
-  ]
-  edge [
-    source 30
-    target 87
-    weight 0
-  ]
-  edge [
-    source 30
-    target 88
-    weight 0
-  ]
-  edge [
-    source 30
-    target 89
-    weight 0
-  ]
-  edge [
-    source 30
-    target 90
-    weight 0
-  ]
-  edge [
-    source 30
-    target 91
-    weight 0
-  ]
-  edge [
-    source 30
-    target 92
-    weight 0
-  ]
-  edge [
-    source 30
-    target 93
-    weight 0
-  ]
-  edge [
-    source 30
-    target 94
-    weight 0
-  ]
-  edge [
-    source 30
-    target 95
-    weight 0
-  ]
-  edge [
-    source 30
-    target 96
-    weight 0
-  ]
-  edge [
-    source 30
-    target 97
-    weight 0
-  ]
-  edge [
-    source 30
-    target 98
-    weight 0
-  ]
-  edge [
-    source 30
-    target 99
-    weight 0
-  ]
-  edge [
-    source 30
-    target 100
-    weight 0
-  ]
-  edge [
-    source 31
-    target 32
-    weight 0
-  ]
-  edge [
-    source 31
-    target 33
-    weight 0
-  ]
-  edge [
-    source 31
-    target 34
-    weight -0.1
-  ]
-  edge [
-    source 31
-    target 35
-    weight -0.1
-  ]
-  edge [
-    source 31
-    target 36
-    weight 0
-  ]
-  edge [
-    source 31
-    target 37
-    weight 0
-  ]
-  edge [
-    source 31
-    target 38
-    weight 0
-  ]
-  edge [
-    source 31
-    target 39
-    weight 0
-  ]
-  edge [
-    source 31
-    target 40
-    weight 0
-  ]
-  edge [
-    source 31
-    target 41
-    weight 0
-  ]
-  edge [
-    source 31
-    target 42
-    weight 0
-  ]
-  edge [
-    source 31
-    target 43
-    weight 0
-  ]
-  edge [
-    source 31
-    target 44
-    weight 0
-  ]
-  edge [
-    source 31
-    target 45
-    weight 0
-  ]
-  edge [
-    source 31
-    target 46
-    weight 0
-  ]
-  edge [
-    source 31
-    target 47
-    weight 0
-  ]
-  edge [
-    source 31
-    target 48
-    weight 0
-  ]
-  edge [
-    source 31
-    target 49
-    weight 0
-  ]
-  edge [
-    source 31
-    target 50
-    weight 0
-  ]
-  edge [
-    source 31
-    target 51
-    weight 0
-  ]
-  edge [
-    source 31
-    target 52
-    weight 0
-  ]
-  edge [
-    source 31
-    target 53
-    weight 0
-  ]
-  edge [
-    source 31
-    target 54
-    weight 0
-  ]
-  edge [
-    source 31
-    target 55
-    weight 0
-  ]
-  edge [
-    source 31
-    target 56
-    weight 0
-  ]
-  edge [
-    source 31
-    target 57
-    weight 0
-  ]
-  edge [
-    source 31
-    target 58
-    weight 0
-  ]
-  edge [
-    source 31
-    target 59
-    weight 0
-  ]
-  edge [
-    source 31
-    target 60
-    weight 0
-  ]
-  edge [
-    source 31
-    target 61
-    weight 0
-  ]
-  edge [
-    source 31
-    target 62
-    weight 0
-  ]
-  edge [
-    source 31
-    target 63
-    weight 0
-  ]
-  edge [
-    source 31
-    target 64
-    weight 0
-  ]
-  edge [
-    source 31
-    target 65
-    weight 0
-  ]
-  edge [
-    source 31
-    target 66
-    weight 0
-  ]
-  edge [
-    source 31
-    target 67
-    weight 0
-  ]
-  edge [
-    source 31
-    target 68
-    weight 0
-  ]
-  edge [
-    source 31
-    target 69
-    weight 0
-  ]
-  edge [
-    source 31
-    target 70
-    weight 0
-  ]
-  edge [
-    source 31
-    target 71
-    weight 0
-  ]
-  edge [
-    source 31
-    target 72
-    weight 0
-  ]
-  edge [
-    source 31
-    target 73
-    weight 0
-  ]
-  edge [
-    source 31
-    target 74
-    weight 0
-  ]
-  edge [
-    source 31
-    target 75
-    weight 0
-  ]
-  edge [
-    source 31
-    target 76
-    weight 0
-  ]
-  edge [
-    source 31
-    target 77
-    weight 0
-  ]
-  edge [
-    source 31
-    target 78
-    weight 0
-  ]
-  edge [
-    source 31
-    target 79
-    weight 0
-  ]
-  edge [
-    source 31
-    target 80
-    weight 0
-  ]
-  edge [
-    source 31
-    target 81
-    weight 0
-  ]
-  edge [
-    source 31
-    target 82
-    weight 0
-  ]
-  edge [
-    source 31
-    target 83
-    weight 0
-  ]
-  edge [
-    source 31
-    target 84
-    weight 0
-  ]
-  edge [
-    source 31
-    target 85
-    weight 0
-  ]
-  edge [
-    source 31
-    target 86
-    weight 0
-  ]
-  edge [
-    source 31
-    target 87
-    weight 0
-  ]
-  edge [
-    source 31
-    target 88
-    weight 0
-  ]
-  edge [
-    source 31
-    target 89
-    weight 0
-  ]
-  edge [
-    source 31
-    target 90
-    weight 0
-  ]
-  edge [
-    source 31
-    target 91
-    weight 0
-  ]
-  edge [
-    source 31
-    target 92
-    weight 0
-  ]
-  edge [
-    source 31
-    target 93
-    weight -0.1
-  ]
-  edge [
-    source 31
-    target 94
-    weight 0
-  ]
-  edge [
-    source 31
-    target 95
-    weight 0
-  ]
-  edge [
-    source 31
-    target 96
-    weight 0
-  ]
-  edge [
-    source 31
-    target 97
-    weight 0
-  ]
-  edge [
-    source 31
-    target 98
-    weight 0
-  ]
-  edge [
-    source 31
-    target 99
-    weight 0
-  ]
-  edge [
-    source 31
-    target 100
-    weight 0
-  ]
-  edge [
-    source 32
-    target 33
-    weight 0
-  ]
-  edge [
-    source 32
-    target 34
-    weight -0.1
-  ]
-  edge [
-    source 32
-    target 35
-    weight 0
-  ]
-  edge [
-    source 32
-    target 36
-    weight 0
-  ]
-  edge [
-    source 32
-    target 37
-    weight 0
-  ]
-  edge [
-    source 32
-    target 38
-    weight 0
-  ]
-  edge [
-    source 32
-    target 39
-    weight 0
-  ]
-  edge [
-    source 32
-    target 40
-    weight 0
-  ]
-  edge [
-    source 32
-    target 41
-    weight 0
-  ]
-  edge [
-    source 32
-    target 42
-    weight 0
-  ]
-  edge [
-    source 32
-    target 43
-    weight 0
-  ]
-  edge [
-    source 32
-    target 44
-    weight 0
-  ]
-  edge [
-    source 32
-    target 45
-    weight 0
-  ]
-  edge [
-    source 32
-    target 46
-    weight 0
-  ]
-  edge [
-    source 32
-    target 47
-    weight 0
-  ]
-  edge [
-    source 32
-    target 48
-    weight 0
-  ]
-  edge [
-    source 32
-    target 49
-    weight 0
-  ]
-  edge [
-    source 32
-    target 50
-    weight 0
-  ]
-  edge [
-    source 32
-    target 51
-    weight 0
-  ]
-  edge [
-    source 32
-    target 52
-    weight 0
-  ]
-  edge [
-    source 32
-    target 53
-    weight 0
-  ]
-  edge [
-    source 32
-    target 54
-    weight 0
-  ]
-  edge [
-    source 32
-    target 55
-    weight 0
-  ]
-  edge [
-    source 32
-    target 56
-    weight 0
-  ]
-  edge [
-    source 32
-    target 57
-    weight 0
-  ]
-  edge [
-    source 32
-    target 58
-    weight 0
-  ]
-  edge [
-    source 32
-    target 59
-    weight 0
-  ]
-  edge [
-    source 32
-    target 60
-    weight 0
-  ]
-  edge [
-    source 32
-    target 61
-    weight 0
-  ]
-  edge [
-    source 32
-    target 62
-    weight 0
-  ]
-  edge [
-    source 32
-    target 63
-    weight 0
-  ]
-  edge [
-    source 32
-    target 64
-    weight 0
-  ]
-  edge [
-    source 32
-    target 65
-    weight 0
-  ]
-  edge [
-    source 32
-    target 66
-    weight 0
-  ]
-  edge [
-    source 32
-    target 67
-    weight 0
-  ]
-  edge [
-    source 32
-    target 68
-    weight 0
-  ]
-  edge [
-    source 32
-    target 69
-    weight 0
-  ]
-  edge [
-    source 32
-    target 70
-    weight 0
-  ]
-  edge [
-    source 32
-    target 71
-    weight 0
-  ]
-  edge [
-    source 32
-    target 72
-    weight 0
-  ]
-  edge [
-    source 32
-    target 73
-    weight 0
-  ]
-  edge [
-    source 32
-    target 74
-    weight 0
-  ]
-  edge [
-    source 32
-    target 75
-    weight 0
-  ]
-  edge [
-    source 32
-    target 76
-    weight 0
-  ]
-  edge [
-    source 32
-    target 77
-    weight 0
-  ]
-  edge [
-    source 32
-    target 78
-    weight 0
-  ]
-  edge [
-    source 32
-    target 79
-    weight 0
-  ]
-  edge [
-    source 32
-    target 80
-    weight 0
-  ]
-  edge [
-    source 32
-    target 81
-    weight 0
-  ]
-  edge [
-    source 32
-    target 82
-    weight 0
-  ]
-  edge [
-    source 32
-    target 83
-    weight 0
-  ]
-  edge [
-    source 32
-    target 84
-    weight 0
-  ]
-  edge [
-    source 32
-    target 85
-    weight 0
-  ]
-  edge [
-    source 32
-    target 86
-    weight -0.1
-  ]
-  edge [
-    source 32
-    target 87
-    weight 0
-  ]
-  edge [
-    source 32
-    target 88
-    weight 0
-  ]
-  edge [
-    source 32
-    target 89
-    weight -0.1
-  ]
-  edge [
-    source 32
-    target 90
-    weight 0
-  ]
-  edge [
-    source 32
-    target 91
-    weight 0
-  ]
-  edge [
-    source 32
-    target 92
-    weight 0
-  ]
-  edge [
-    source 32
-    target 93
-    weight 0
-  ]
-  edge [
-    source 32
-    target 94
-    weight 0
-  ]
-  edge [
-    source 32
-    target 95
-    weight 0
-  ]
-  edge [
-    source 32
-    target 96
-    weight 0
-  ]
-  edge [
-    source 32
-    target 97
-    weight 0
-  ]
-  edge [
-    source 32
-    target 98
-    weight 0
-  ]
-  edge [
-    source 32
-    target 99
-    weight 0
-  ]
-  edge [
-    source 32
-    target 100
-    weight 0
-  ]
-  edge [
-    source 33
-    target 34
-    weight 0
-  ]
-  edge [
-    source 33
-    target 35
-    weight -0.1
-  ]
-  edge [
-    source 33
-    target 36
-    weight 0
-  ]
-  edge [
-    source 33
-    target 37
-    weight 0
-  ]
-  edge [
-    source 33
-    target 38
-    weight 0
-  ]
-  edge [
-    source 33
-    target 39
-    weight 0
-  ]
-  edge [
-    source 33
-    target 40
-    weight 0
-  ]
-  edge [
-    source 33
-    target 41
-    weight 0
-  ]
-  edge [
-    source 33
-    target 42
-    weight 0
-  ]
-  edge [
-    source 33
-    target 43
-    weight 0
-  ]
-  edge [
-    source 33
-    target 44
-    weight 0
-  ]
-  edge [
-    source 33
-    target 45
-    weight 0
-  ]
-  edge [
-    source 33
-    target 46
-    weight 0
-  ]
-  edge [
-    source 33
-    target 47
-    weight 0
-  ]
-  edge [
-    source 33
-    target 48
-    weight 0
-  ]
-  edge [
-    source 33
-    target 49
-    weight 0
-  ]
-  edge [
-    source 33
-    target 50
-    weight 0
-  ]
-  edge [
-    source 33
-    target 51
-    weight 0
-  ]
-  edge [
-    source 33
-    target 52
-    weight 0
-  ]
-  edge [
-    source 33
-    target 53
-    weight 0
-  ]
-  edge [
-    source 33
-    target 54
-    weight 0
-  ]
-  edge [
-    source 33
-    target 55
-    weight 0
-  ]
-  edge [
-    source 33
-    target 56
-    weight 0
-  ]
-  edge [
-    source 33
-    target 57
-    weight 0
-  ]
-  edge [
-    source 33
-    target 58
-    weight 0
-  ]
-  edge [
-    source 33
-    target 59
-    weight 0
-  ]
-  edge [
-    source 33
-    target 60
-    weight 0
-  ]
-  edge [
-    source 33
-    target 61
-    weight 0
-  ]
-  edge [
-    source 33
-    target 62
-    weight 0
-  ]
-  edge [
-    source 33
-    target 63
-    weight 0
-  ]
-  edge [
-    source 33
-    target 64
-    weight 0
-  ]
-  edge [
-    source 33
-    target 65
-    weight 0
-  ]
-  edge [
-    source 33
-    target 66
-    weight 0
-  ]
-  edge [
-    source 33
-    target 67
-    weight 0
-  ]
-  edge [
-    source 33
-    target 68
-    weight 0
-  ]
-  edge [
-    source 33
-    target 69
-    weight 0
-  ]
-  edge [
-    source 33
-    target 70
-    weight 0
-  ]
-  edge [
-    source 33
-    target 71
-    weight 0
-  ]
-  edge [
-    source 33
-    target 72
-    weight 0
-  ]
-  edge [
-    source 33
-    target 73
-    weight 0
-  ]
-  edge [
-    source 33
-    target 74
-    weight 0
-  ]
-  edge [
-    source 33
-    target 75
-    weight 0
-  ]
-  edge [
-    source 33
-    target 76
-    weight 0
-  ]
-  edge [
-    source 33
-    target 77
-    weight 0
-  ]
-  edge [
-    source 33
-    target 78
-    weight 0
-  ]
-  edge [
-    source 33
-    target 79
-    weight 0
-  ]
-  edge [
-    source 33
-    target 80
-    weight 0
-  ]
-  edge [
-    source 33
-    target 81
-    weight 0
-  ]
-  edge [
-    source 33
-    target 82
-    weight 0
-  ]
-  edge [
-    source 33
-    target 83
-    weight 0
-  ]
-  edge [
-    source 33
-    target 84
-    weight 0
-  ]
-  edge [
-    source 33
-    target 85
-    weight 0
-  ]
-  edge [
-    source 33
-    target 86
-    weight 0
-  ]
-  edge [
-    source 33
-    target 87
-    weight 0
-  ]
-  edge [
-    source 33
-    target 88
-    weight 0
-  ]
-  edge [
-    source 33
-    target 89
-    weight 0
-  ]
-  edge [
-    source 33
-    target 90
-    weight 0
-  ]
-  edge [
-    source 33
-    target 91
-    weight 0
-  ]
-  edge [
-    source 33
-    target 92
-    weight 0
-  ]
-  edge [
-    source 33
-    target 93
-    weight 0
-  ]
-  edge [
-    source 33
-    target 94
-    weight 0.1
-  ]
-  edge [
-    source 33
-    target 95
-    weight 0
-  ]
-  edge [
-    source 33
-    target 96
-    weight 0
-  ]
-  edge [
-    source 33
-    target 97
-    weight 0.1
-  ]
-  edge [
-    source 33
-    target 98
-    weight 0
-  ]
-  edge [
-    source 33
-    target 99
-    weight 0
-  ]
-  edge [
-    source 33
-    target 100
-    weight 0
-  ]
-  edge [
-    source 34
-    target 35
-    weight -0.1
-  ]
-  edge [
-    source 34
-    target 36
-    weight 0
-  ]
-  edge [
-    source 34
-    target 37
-    weight -0.1
-  ]
-  edge [
-    source 34
-    target 38
-    weight 0
-  ]
-  edge [
-    source 34
-    target 39
-    weight 0
-  ]
-  edge [
-    source 34
-    target 40
-    weight 0
-  ]
-  edge [
-    source 34
-    target 41
-    weight 0
-  ]
-  edge [
-    source 34
-    target 42
-    weight 0
-  ]
-  edge [
-    source 34
-    target 43
-    weight 0
-  ]
-  edge [
-    source 34
-    target 44
-    weight 0
-  ]
-  edge [
-    source 34
-    target 45
-    weight 0
-  ]
-  edge [
-    source 34
-    target 46
-    weight 0
-  ]
-  edge [
-    source 34
-    target 47
-    weight 0
-  ]
-  edge [
-    source 34
-    target 48
-    weight 0
-  ]
-  edge [
-    source 34
-    target 49
-    weight 0
-  ]
-  edge [
-    source 34
-    target 50
-    weight 0
-  ]
-  edge [
-    source 34
-    target 51
-    weight 0
-  ]
-  edge [
-    source 34
-    target 52
-    weight 0
-  ]
-  edge [
-    source 34
-    target 53
-    weight 0
-  ]
-  edge [
-    source 34
-    target 54
-    weight 0
-  ]
-  edge [
-    source 34
-    target 55
-    weight 0
-  ]
-  edge [
-    source 34
-    target 56
-    weight 0
-  ]
-  edge [
-    source 34
-    target 57
-    weight 0
-  ]
-  edge [
-    source 34
-    target 58
-    weight 0
-  ]
-  edge [
-    source 34
-    target 59
-    weight 0
-  ]
-  edge [
-    source 34
-    target 60
-    weight 0
-  ]
-  edge [
-    source 34
-    target 61
-    weight 0
-  ]
-  edge [
-    source 34
-    target 62
-    weight 0
-  ]
-  edge [
-    source 34
-    target 63
-    weight 0
-  ]
-  edge [
-    source 34
-    target 64
-    weight 0
-  ]
-  edge [
-    source 34
-    target 65
-    weight 0
-  ]
-  edge [
-    source 34
-    target 66
-    weight 0
-  ]
-  edge [
-    source 34
-    target 67
-    weight 0
-  ]
-  edge [
-    source 34
-    target 68
-    weight 0
-  ]
-  edge [
-    source 34
-    target 69
-    weight 0
-  ]
-  edge [
-    source 34
-    target 70
-    weight 0
-  ]
-  edge [
-    source 34
-    target 71
-    weight 0
-  ]
-  edge [
-    source 34
-    target 72
-    weight 0
-  ]
-  edge [
-    source 34
-    target 73
-    weight 0
-  ]
-  edge [
-    source 34
-    target 74
-    weight 0
-  ]
-  edge [
-    source 34
-    target 75
-    weight 0
-  ]
-  edge [
-    source 34
-    target 76
-    weight 0
-  ]
-  edge [
-    source 34
-    target 77
-    weight 0
-  ]
-  edge [
-    source 34
-    target 78
-    weight 0
-  ]
-  edge [
-    source 34
-    target 79
-    weight 0
-  ]
-  edge [
-    source 34
-    target 80
-    weight 0
-  ]
-  edge [
-    source 34
-    target 81
-    weight 0
-  ]
-  edge [
-    source 34
-    target 82
-    weight 0
-  ]
-  edge [
-    source 34
-    target 83
-    weight 0
-  ]
-  edge [
-    source 34
-    target 84
-    weight 0
-  ]
-  edge [
-    source 34
-    target 85
-    weight 0
-  ]
-  edge [
-    source 34
-    target 86
-    weight 0
-  ]
-  edge [
-    source 34
-    target 87
-    weight 0
-  ]
-  edge [
-    source 34
-    target 88
-    weight 0
-  ]
-  edge [
-    source 34
-    target 89
-    weight 0
-  ]
-  edge [
-    source 34
-    target 90
-    weight 0
-  ]
-  edge [
-    source 34
-    target 91
-    weight 0
-  ]
-  edge [
-    source 34
-    target 92
-    weight 0
-  ]
-  edge [
-    source 34
-    target 93
-    weight -0.1
-  ]
-  edge [
-    source 34
-    target 94
-    weight 0
-  ]
-  edge [
-    source 34
-    target 95
-    weight 0
-  ]
-  edge [
-    source 34
-    target 96
-    weight 0
-  ]
-  edge [
-    source 34
-    target 97
-    weight 0
-  ]
-  edge [
-    source 34
-    target 98
-    weight 0
-  ]
-  edge [
-    source 34
-    target 99
-    weight 0
-  ]
-  edge [
-    source 34
-    target 100
-    weight 0
-  ]
-  edge [
-    source 35
-    target 36
-    weight 0
-  ]
-  edge [
-    source 35
-    target 37
-    weight -0.1
-  ]
-  edge [
-    source 35
-    target 38
-    weight 0
-  ]
-  edge [
-    source 35
-    target 39
-    weight 0
-  ]
-  edge [
-    source 35
-    target 40
-    weight 0
-  ]
-  edge [
-    source 35
-    target 41
-    weight 0
-  ]
-  edge [
-    source 35
-    target 42
-    weight 0
-  ]
-  edge [
-    source 35
-    target 43
-    weight 0
-  ]
-  edge [
-    source 35
-    target 44
-    weight 0
-  ]
-  edge [
-    source 35
-    target 45
-    weight 0
-  ]
-  edge [
-    source 35
-    target 46
-    weight 0
-  ]
-  edge [
-    source 35
-    target 47
-    weight 0
-  ]
-  edge [
-    source 35
-    target 48
-    weight 0
-  ]
-  edge [
-    source 35
-    target 49
-    weight 0
-  ]
-  edge [
-    source 35
-    target 50
-    weight 0
-  ]
-  edge [
-    source 35
-    target 51
-    weight 0
-  ]
-  edge [
-    source 35
-    target 52
-    weight 0
-  ]
-  edge [
-    source 35
-    target 53
-    weight 0
-  ]
-  edge [
-    source 35
-    target 54
-    weight 0
-  ]
-  edge [
-    source 35
-    target 55
-    weight 0
-  ]
-  edge [
-    source 35
-    target 56
-    weight 0
-  ]
-  edge [
-    source 35
-    target 57
-    weight 0
-  ]
-  edge [
-    source 35
-    target 58
-    weight 0
-  ]
-  edge [
-    source 35
-    target 59
-    weight 0
-  ]
-  edge [
-    source 35
-    target 60
-    weight 0
-  ]
-  edge [
-    source 35
-    target 61
-    weight 0
-  ]
-  edge [
-    source 35
-    target 62
-    weight 0
-  ]
-  edge [
-    source 35
-    target 63
-    weight 0
-  ]
-  edge [
-    source 35
-    target 64
-    weight 0
-  ]
-  edge [
-    source 35
-    target 65
-    weight 0
-  ]
-  edge [
-    source 35
-    target 66
-    weight 0
-  ]
-  edge [
-    source 35
-    target 67
-    weight 0
-  ]
-  edge [
-    source 35
-    target 68
-    weight 0
-  ]
-  edge [
-    source 35
-    target 69
-    weight 0
-  ]
-  edge [
-    source 35
-    target 70
-    weight 0
-  ]
-  edge [
-    source 35
-    target 71
-    weight 0
-  ]
-  edge [
-    source 35
-    target 72
-    weight 0
-  ]
-  edge [
-    source 35
-    target 73
-    weight 0
-  ]
-  edge [
-    source 35
-    target 74
-    weight 0
-  ]
-  edge [
-    source 35
-    target 75
-    weight 0
-  ]
-  edge [
-    source 35
-    target 76
-    weight 0
-  ]
-  edge [
-    source 35
-    target 77
-    weight 0
-  ]
-  edge [
-    source 35
-    target 78
-    weight 0
-  ]
-  edge [
-    source 35
-    target 79
-    weight 0
-  ]
-  edge [
-    source 35
-    target 80
-    weight 0
-  ]
-  edge [
-    source 35
-    target 81
-    weight 0
-  ]
-  edge [
-    source 35
-    target 82
-    weight 0
-  ]
-  edge [
-    source 35
-    target 83
-    weight 0
-  ]
-  edge [
-    source 35
-    target 84
-    weight 0
-  ]
-  edge [
-    source 35
-    target 85
-    weight 0
-  ]
-  edge [
-    source 35
-    target 86
-    weight 0
-  ]
-  edge [
-    source 35
-    target 87
-    weight 0
-  ]
-  edge [
-    source 35
-    target 88
-    weight 0
-  ]
-  edge [
-    source 35
-    target 89
-    weight 0
-  ]
-  edge [
-    source 35
-    target 90
-    weight 0
-  ]
-  edge [
-    source 35
-    target 91
-    weight 0
-  ]
-  edge [
-    source 35
-    target 92
-    weight 0
-  ]
-  edge [
-    source 35
-    target 93
-    weight 0
-  ]
-  edge [
-    source 35
-    target 94
-    weight 0
-  ]
-  edge [
-    source 35
-    target 95
-    weight 0
-  ]
-  edge [
-    source 35
-    target 96
-    weight 0
-  ]
-  edge [
-    source 35
-    target 97
-    weight 0
-  ]
-  edge [
-    source 35
-    target 98
-    weight 0
-  ]
-  edge [
-    source 35
-    target 99
-    weight 0
-  ]
-  edge [
-    source 35
-    target 100
-    weight 0
-  ]
-  edge [
-    source 36
-    target 37
-    weight 0
-  ]
-  edge [
-    source 36
-    target 38
-    weight 0
-  ]
-  edge [
-    source 36
-    target 39
-    weight 0
-  ]
-  edge [
-    source 36
-    target 40
-    weight 0
-  ]
-  edge [
-    source 36
-    target 41
-    weight 0
-  ]
-  edge [
-    source 36
-    target 42
-    weight 0
-  ]
-  edge [
-    source 36
-    target 43
-    weight 0
-  ]
-  edge [
-    source 36
-    target 44
-    weight 0
-  ]
-  edge [
-    source 36
-    target 45
-    weight 0
-  ]
-  edge [
-    source 36
-    target 46
-    weight 0
-  ]
-  edge [
-    source 36
-    target 47
-    weight 0
-  ]
-  edge [
-    source 36
-    target 48
-    weight 0
-  ]
-  edge [
-    source 36
-    target 49
-    weight 0
-  ]
-  edge [
-    source 36
-    target 50
-    weight 0
-  ]
-  edge [
-    source 36
-    target 51
-    weight 0
-  ]
-  edge [
-    source 36
-    target 52
-    weight 0
-  ]
-  edge [
-    source 36
-    target 53
-    weight 0
-  ]
-  edge [
-    source 36
-    target 54
-    weight 0
-  ]
-  edge [
-    source 36
-    target 55
-    weight 0
-  ]
-  edge [
-    source 36
-    target 56
-    weight 0
-  ]
-  edge [
-    source 36
-    target 57
-    weight 0
-  ]
-  edge [
-    source 36
-    target 58
-    weight 0
-  ]
-  edge [
-    source 36
-    target 59
-    weight 0
-  ]
-  edge [
-    source 36
-    target 60
-    weight 0
-  ]
-  edge [
-    source 36
-    target 61
-    weight 0
-  ]
-  edge [
-    source 36
-    target 62
-    weight 0
-  ]
-  edge [
-    source 36
-    target 63
-    weight 0
-  ]
-  edge [
-    source 36
-    target 64
-    weight 0
-  ]
-  edge [
-    source 36
-    target 65
-    weight 0
-  ]
-  edge [
-    source 36
-    target 66
-    weight 0
-  ]
-  edge [
-    source 36
-    target 67
-    weight 0
-  ]
-  edge [
-    source 36
-    target 68
-    weight 0
-  ]
-  edge [
-    source 36
-    target 69
-    weight 0
-  ]
-  edge [
-    source 36
-    target 70
-    weight 0
-  ]
-  edge [
-    source 36
-    target 71
-    weight 0
-  ]
-  edge [
-    source 36
-    target 72
-    weight 0
-  ]
-  edge [
-    source 36
-    target 73
-    weight 0
-  ]
-  edge [
-    source 36
-    target 74
-    weight 0
-  ]
-  edge [
-    source 36
-    target 75
-    weight 0
-  ]
-  edge [
-    source 36
-    target 76
-    weight 0
-  ]
-  edge [
-    source 36
-    target 77
-    weight 0
-  ]
-  edge [
-    source 36
-    target 78
-    weight 0
-  ]
-  edge [
-    source 36
-    target 79
-    weight 0
-  ]
-  edge [
-    source 36
-    target 80
-    weight 0
-  ]
-  edge [
-    source 36
-    target 81
-    weight 0
-  ]
-  edge [
-    source 36
-    target 82
-    weight 0
-  ]
-  edge [
-    source 36
-    target 83
-    weight 0
-  ]
-  edge [
-    source 36
-    target 84
-    weight 0
-  ]
-  edge [
-    source 36
-    target 85
-    weight 0
-  ]
-  edge [
-    source 36
-    target 86
-    weight -0.1
-  ]
-  edge [
-    source 36
-    target 87
-    weight 0
-  ]
-  edge [
-    source 36
-    target 88
-    weight 0
-  ]
-  edge [
-    source 36
-    target 89
-    weight -0.1
-  ]
-  edge [
-    source 36
-    target 90
-    weight 0
-  ]
-  edge [
-    source 36
-    target 91
-    weight 0
-  ]
-  edge [
-    source 36
-    target 92
-    weight 0
-  ]
-  edge [
-    source 36
-    target 93
-    weight 0
-  ]
-  edge [
-    source 36
-    target 94
-    weight 0
-  ]
-  edge [
-    source 36
-    target 95
-    weight 0
-  ]
-  edge [
-    source 36
-    target 96
-    weight 0
-  ]
-  edge [
-    source 36
-    target 97
-    weight 0
-  ]
-  edge [
-    source 36
-    target 98
-    weight 0
-  ]
-  edge [
-    source 36
-    target 99
-    weight 0
-  ]
-  edge [
-    source 36
-    target 100
-    weight 0
-  ]
-  edge [
-    source 37
-    target 38
-    weight 0
-  ]
-  edge [
-    source 37
-    target 39
-    weight 0
-  ]
-  edge [
-    source 37
-    target 40
-    weight 0
-  ]
-  edge [
-    source 37
-    target 41
-    weight 0
-  ]
-  edge [
-    source 37
-    target 42
-    weight 0
-  ]
-  edge [
-    source 37
-    target 43
-    weight 0
-  ]
-  edge [
-    source 37
-    target 44
-    weight 0
-  ]
-  edge [
-    source 37
-    target 45
-    weight 0
-  ]
-  edge [
-    source 37
-    target 46
-    weight 0
-  ]
-  edge [
-    source 37
-    target 47
-    weight 0
-  ]
-  edge [
-    source 37
-    target 48
-    weight 0
-  ]
-  edge [
-    source 37
-    target 49
-    weight 0
-  ]
-  edge [
-    source 37
-    target 50
-    weight 0
-  ]
-  edge [
-    source 37
-    target 51
-    weight 0
-  ]
-  edge [
-    source 37
-    target 52
-    weight 0
-  ]
-  edge [
-    source 37
-    target 53
-    weight 0
-  ]
-  edge [
-    source 37
-    target 54
-    weight 0
-  ]
-  edge [
-    source 37
-    target 55
-    weight 0
-  ]
-  edge [
-    source 37
-    target 56
-    weight 0
-  ]
-  edge [
-    source 37
-    target 57
-    weight 0
-  ]
-  edge [
-    source 37
-    target 58
-    weight 0
-  ]
-  edge [
-    source 37
-    target 59
-    weight 0
-  ]
-  edge [
-    source 37
-    target 60
-    weight 0
-  ]
-  edge [
-    source 37
-    target 61
-    weight 0
-  ]
-  edge [
-    source 37
-    target 62
-    weight 0
-  ]
-  edge [
-    source 37
-    target 63
-    weight 0
-  ]
-  edge [
-    source 37
-    target 64
-    weight 0
-  ]
-  edge [
-    source 37
-    target 65
-    weight 0
-  ]
-  edge [
-    source 37
-    target 66
-    weight 0
-  ]
-  edge [
-    source 37
-    target 67
-    weight 0
-  ]
-  edge [
-    source 37
-    target 68
-    weight 0
-  ]
-  edge [
-    source 37
-    target 69
-    weight 0
-  ]
-  edge [
-    source 37
-    target 70
-    weight 0
-  ]
-  edge [
-    source 37
-    target 71
-    weight 0
-  ]
-  edge [
-    source 37
-    target 72
-    weight 0
-  ]
-  edge [
-    source 37
-    target 73
-    weight 0
-  ]
-  edge [
-    source 37
-    target 74
-    weight 0
-  ]
-  edge [
-    source 37
-    target 75
-    weight 0
-  ]
-  edge [
-    source 37
-    target 76
-    weight 0
-  ]
-  edge [
-    source 37
-    target 77
-    weight 0
-  ]
-  edge [
-    source 37
-    target 78
-    weight 0
-  ]
-  edge [
-    source 37
-    target 79
-    weight 0
-  ]
-  edge [
-    source 37
-    target 80
-    weight 0
-  ]
-  edge [
-    source 37
-    target 81
-    weight 0
-  ]
-  edge [
-    source 37
-    target 82
-    weight 0
-  ]
-  edge [
-    source 37
-    target 83
-    weight 0
-  ]
-  edge [
-    source 37
-    target 84
-    weight 0
-  ]
-  edge [
-    source 37
-    target 85
-    weight 0
-  ]
-  edge [
-    source 37
-    target 86
-    weight 0
-  ]
-  edge [
-    source 37
-    target 87
-    weight 0
-  ]
-  edge [
-    source 37
-    target 88
-    weight 0
-  ]
-  edge [
-    source 37
-    target 89
-    weight 0
-  ]
-  edge [
-    source 37
-    target 90
-    weight 0
-  ]
-  edge [
-    source 37
-    target 91
-    weight 0
-  ]
-  edge [
-    source 37
-    target 92
-    weight 0
-  ]
-  edge [
-    source 37
-    target 93
-    weight 0
-  ]
-  edge [
-    source 37
-    target 94
-    weight 0.1
-  ]
-  edge [
-    source 37
-    target 95
-    weight 0
-  ]
-  edge [
-    source 37
-    target 96
-    weight 0
-  ]
-  edge [
-    source 37
-    target 97
-    weight 0
-  ]
-  edge [
-    source 37
-    target 98
-    weight 0
-  ]
-  edge [
-    source 37
-    target 99
-    weight 0
-  ]
-  edge [
-    source 37
-    target 100
-    weight 0
-  ]
-  edge [
-    source 38
-    target 39
-    weight 0
-  ]
-  edge [
-    source 38
-    target 40
-    weight 0
-  ]
-  edge [
-    source 38
-    target 41
-    weight 0
-  ]
-  edge [
-    source 38
-    target 42
-    weight 0
-  ]
-  edge [
-    source 38
-    target 43
-    weight 0
-  ]
-  edge [
-    source 38
-    target 44
-    weight 0
-  ]
-  edge [
-    source 38
-    target 45
-    weight 0
-  ]
-  edge [
-    source 38
-    target 46
-    weight 0
-  ]
-  edge [
-    source 38
-    target 47
-    weight 0
-  ]
-  edge [
-    source 38
-    target 48
-    weight 0
-  ]
-  edge [
-    source 38
-    target 49
-    weight 0
-  ]
-  edge [
-    source 38
-    target 50
-    weight 0
-  ]
-  edge [
-    source 38
-    target 51
-    weight 0
-  ]
-  edge [
-    source 38
-    target 52
-    weight 0
-  ]
-  edge [
-    source 38
-    target 53
-    weight 0
-  ]
-  edge [
-    source 38
-    target 54
-    weight 0
-  ]
-  edge [
-    source 38
-    target 55
-    weight 0
-  ]
-  edge [
-    source 38
-    target 56
-    weight 0
-  ]
-  edge [
-    source 38
-    target 57
-    weight 0
-  ]
-  edge [
-    source 38
-    target 58
-    weight 0
-  ]
-  edge [
-    source 38
-    target 59
-    weight 0
-  ]
-  edge [
-    source 38
-    target 60
-    weight 0
-  ]
-  edge [
-    source 38
-    target 61
-    weight 0
-  ]
-  edge [
-    source 38
-    target 62
-    weight 0
-  ]
-  edge [
-    source 38
-    target 63
-    weight 0
-  ]
-  edge [
-    source 38
-    target 64
-    weight 0
-  ]
-  edge [
-    source 38
-    target 65
-    weight 0
-  ]
-  edge [
-    source 38
-    target 66
-    weight 0
-  ]
-  edge [
-    source 38
-    target 67
-    weight 0
-  ]
-  edge [
-    source 38
-    target 68
-    weight 0
-  ]
-  edge [
-    source 38
-    target 69
-    weight 0
-  ]
-  edge [
-    source 38
-    target 70
-    weight 0
-  ]
-  edge [
-    source 38
-    target 71
-    weight 0
-  ]
-  edge [
-    source 38
-    target 72
-    weight 0
-  ]
-  edge [
-    source 38
-    target 73
-    weight 0
-  ]
-  edge [
-    source 38
-    target 74
-    weight 0
-  ]
-  edge [
-    source 38
-    target 75
-    weight 0
-  ]
-  edge [
-    source 38
-    target 76
-    weight 0
-  ]
-  edge [
-    source 38
-    target 77
-    weight 0
-  ]
-  edge [
-    source 38
-    target 78
-    weight 0
-  ]
-  edge [
-    source 38
-    target 79
-    weight 0
-  ]
-  edge [
-    source 38
-    target 80
-    weight 0
-  ]
-  edge [
-    source 38
-    target 81
-    weight 0
-  ]
-  edge [
-    source 38
-    target 82
-    weight 0
-  ]
-  edge [
-    source 38
-    target 83
-    weight 0
-  ]
-  edge [
-    source 38
-    target 84
-    weight 0
-  ]
-  edge [
-    source 38
-    target 85
-    weight 0
-  ]
-  edge [
-    source 38
-    target 86
-    weight 0
-  ]
-  edge [
-    source 38
-    target 87
-    weight -0.1
-  ]
-  edge [
-    source 38
-    target 88
-    weight 0
-  ]
-  edge [
-    source 38
-    target 89
-    weight 0
-  ]
-  edge [
-    source 38
-    target 90
-    weight 0
-  ]
-  edge [
-    source 38
-    target 91
-    weight 0
-  ]
-  edge [
-    source 38
-    target 92
-    weight 0
-  ]
-  edge [
-    source 38
-    target 93
-    weight 0
-  ]
-  edge [
-    source 38
-    target 94
-    weight 0
-  ]
-  edge [
-    source 38
-    target 95
-    weight 0
-  ]
-  edge [
-    source 38
-    target 96
-    weight 0
-  ]
-  edge [
-    source 38
-    target 97
-    weight 0
-  ]
-  edge [
-    source 38
-    target 98
-    weight 0
-  ]
-  edge [
-    source 38
-    target 99
-    weight 0
-  ]
-  edge [
-    source 38
-    target 100
-    weight 0
-  ]
-  edge [
-    source 39
-    target 40
-    weight 0
-  ]
-  edge [
-    source 39
-    target 41
-    weight 0
-  ]
-  edge [
-    source 39
-    target 42
-    weight 0
-  ]
-  edge [
-    source 39
-    target 43
-    weight 0
-  ]
-  edge [
-    source 39
-    target 44
-    weight 0
-  ]
-  edge [
-    source 39
-    target 45
-    weight 0
-  ]
-  edge [
-    source 39
-    target 46
-    weight 0
-  ]
-  edge [
-    source 39
-    target 47
-    weight 0
-  ]
-  edge [
-    source 39
-    target 48
-    weight 0
-  ]
-  edge [
-    source 39
-    target 49
-    weight 0
-  ]
-  edge [
-    source 39
-    target 50
-    weight 0
-  ]
-  edge [
-    source 39
-    target 51
-    weight 0
-  ]
-  edge [
-    source 39
-    target 52
-    weight 0
-  ]
-  edge [
-    source 39
-    target 53
-    weight 0
-  ]
-  edge [
-    source 39
-    target 54
-    weight 0
-  ]
-  edge [
-    source 39
-    target 55
-    weight 0
-  ]
-  edge [
-    source 39
-    target 56
-    weight 0
-  ]
-  edge [
-    source 39
-    target 57
-    weight 0
-  ]
-  edge [
-    source 39
-    target 58
-    weight 0
-  ]
-  edge [
-    source 39
-    target 59
-    weight 0
-  ]
-  edge [
-    source 39
-    target 60
-    weight 0
-  ]
-  edge [
-    source 39
-    target 61
-    weight 0
-  ]
-  edge [
-    source 39
-    target 62
-    weight 0
-  ]
-  edge [
-    source 39
-    target 63
-    weight 0
-  ]
-  edge [
-    source 39
-    target 64
-    weight 0
-  ]
-  edge [
-    source 39
-    target 65
-    weight 0
-  ]
-  edge [
-    source 39
-    target 66
-    weight 0
-  ]
-  edge [
-    source 39
-    target 67
-    weight 0
-  ]
-  edge [
-    source 39
-    target 68
-    weight 0
-  ]
-  edge [
-    source 39
-    target 69
-    weight 0
-  ]
-  edge [
-    source 39
-    target 70
-    weight 0
-  ]
-  edge [
-    source 39
-    target 71
-    weight 0
-  ]
-  edge [
-    source 39
-    target 72
-    weight 0
-  ]
-  edge [
-    source 39
-    target 73
-    weight 0
-  ]
-  edge [
-    source 39
-    target 74
-    weight 0
-  ]
-  edge [
-    source 39
-    target 75
-    weight 0
-  ]
-  edge [
-    source 39
-    target 76
-    weight 0
-  ]
-  edge [
-    source 39
-    target 77
-    weight 0
-  ]
-  edge [
-    source 39
-    target 78
-    weight 0
-  ]
-  edge [
-    source 39
-    target 79
-    weight 0
-  ]
-  edge [
-    source 39
-    target 80
-    weight 0
-  ]
-  edge [
-    source 39
-    target 81
-    weight 0
-  ]
-  edge [
-    source 39
-    target 82
-    weight 0
-  ]
-  edge [
-    source 39
-    target 83
-    weight 0
-  ]
-  edge [
-    source 39
-    target 84
-    weight 0
-  ]
-  edge [
-    source 39
-    target 85
-    weight 0
-  ]
-  edge [
-    source 39
-    target 86
-    weight 0
-  ]
-  edge [
-    source 39
-    target 87
-    weight 0
-  ]
-  edge [
-    source 39
-    target 88
-    weight 0
-  ]
-  edge [
-    source 39
-    target 89
-    weight 0
-  ]
-  edge [
-    source 39
-    target 90
-    weight 0
-  ]
-  edge [
-    source 39
-    target 91
-    weight 0
-  ]
-  edge [
-    source 39
-    target 92
-    weight 0
-  ]
-  edge [
-    source 39
-    target 93
-    weight 0
-  ]
-  edge [
-    source 39
-    target 94
-    weight 0
-  ]
-  edge [
-    source 39
-    target 95
-    weight 0
-  ]
-  edge [
-    source 39
-    target 96
-    weight 0.1
-  ]
-  edge [
-    source 39
-    target 97
-    weight 0
-  ]
-  edge [
-    source 39
-    target 98
-    weight 0
-  ]
-  edge [
-    source 39
-    target 99
-    weight 0
-  ]
-  edge [
-    source 39
-    target 100
-    weight 0
-  ]
-  edge [
-    source 40
-    target 41
-    weight 0
-  ]
-  edge [
-    source 40
-    target 42
-    weight 0
-  ]
-  edge [
-    source 40
-    target 43
-    weight 0
-  ]
-  edge [
-    source 40
-    target 44
-    weight 0
-  ]
-  edge [
-    source 40
-    target 45
-    weight 0
-  ]
-  edge [
-    source 40
-    target 46
-    weight 0
-  ]
-  edge [
-    source 40
-    target 47
-    weight 0
-  ]
-  edge [
-    source 40
-    target 48
-    weight 0
-  ]
-  edge [
-    source 40
-    target 49
-    weight 0
-  ]
-  edge [
-    source 40
-    target 50
-    weight 0
-  ]
-  edge [
-    source 40
-    target 51
-    weight 0
-  ]
-  edge [
-    source 40
-    target 52
-    weight 0
-  ]
-  edge [
-    source 40
-    target 53
-    weight 0
-  ]
-  edge [
-    source 40
-    target 54
-    weight 0
-  ]
-  edge [
-    source 40
-    target 55
-    weight 0
-  ]
-  edge [
-    source 40
-    target 56
-    weight 0
-  ]
-  edge [
-    source 40
-    target 57
-    weight 0
-  ]
-  edge [
-    source 40
-    target 58
-    weight 0
-  ]
-  edge [
-    source 40
-    target 59
-    weight 0
-  ]
-  edge [
-    source 40
-    target 60
-    weight 0
-  ]
-  edge [
-    source 40
-    target 61
-    weight 0
-  ]
-  edge [
-    source 40
-    target 62
-    weight 0
-  ]
-  edge [
-    source 40
-    target 63
-    weight 0
-  ]
-  edge [
-    source 40
-    target 64
-    weight 0
-  ]
-  edge [
-    source 40
-    target 65
-    weight 0
-  ]
-  edge [
-    source 40
-    target 66
-    weight 0
-  ]
-  edge [
-    source 40
-    target 67
-    weight 0
-  ]
-  edge [
-    source 40
-    target 68
-    weight 0
-  ]
-  edge [
-    source 40
-    target 69
-    weight 0
-  ]
-  edge [
-    source 40
-    target 70
-    weight 0
-  ]
-  edge [
-    source 40
-    target 71
-    weight 0
-  ]
-  edge [
-    source 40
-    target 72
-    weight 0
-  ]
-  edge [
-    source 40
-    target 73
-    weight 0
-  ]
-  edge [
-    source 40
-    target 74
-    weight 0
-  ]
-  edge [
-    source 40
-    target 75
-    weight 0
-  ]
-  edge [
-    source 40
-    target 76
-    weight 0
-  ]
-  edge [
-    source 40
-    target 77
-    weight 0
-  ]
-  edge [
-    source 40
-    target 78
-    weight 0
-  ]
-  edge [
-    source 40
-    target 79
-    weight 0
-  ]
-  edge [
-    source 40
-    target 80
-    weight 0
-  ]
-  edge [
-    source 40
-    target 81
-    weight 0
-  ]
-  edge [
-    source 40
-    target 82
-    weight 0
-  ]
-  edge [
-    source 40
-    target 83
-    weight 0
-  ]
-  edge [
-    source 40
-    target 84
-    weight 0
-  ]
-  edge [
-    source 40
-    target 85
-    weight 0
-  ]
-  edge [
-    source 40
-    target 86
-    weight 0
-  ]
-  edge [
-    source 40
-    target 87
-    weight 0
-  ]
-  edge [
-    source 40
-    target 88
-    weight 0
-  ]
-  edge [
-    source 40
-    target 89
-    weight 0
-  ]
-  edge [
-    source 40
-    target 90
-    weight -0.1
-  ]
-  edge [
-    source 40
-    target 91
-    weight 0
-  ]
-  edge [
-    source 40
-    target 92
-    weight 0
-  ]
-  edge [
-    source 40
-    target 93
-    weight 0
-  ]
-  edge [
-    source 40
-    target 94
-    weight 0
-  ]
-  edge [
-    source 40
-    target 95
-    weight 0
-  ]
-  edge [
-    source 40
-    target 96
-    weight 0
-  ]
-  edge [
-    source 40
-    target 97
-    weight 0
-  ]
-  edge [
-    source 40
-    target 98
-    weight 0
-  ]
-  edge [
-    source 40
-    target 99
-    weight 0
-  ]
-  edge [
-    source 40
-    target 100
-    weight -0.1
-  ]
-  edge [
-    source 41
-    target 42
-    weight 0
-  ]
-  edge [
-    source 41
-    target 43
-    weight 0
-  ]
-  edge [
-    source 41
-    target 44
-    weight 0
-  ]
-  edge [
-    source 41
-    target 45
-    weight 0
-  ]
-  edge [
-    source 41
-    target 46
-    weight 0
-  ]
-  edge [
-    source 41
-    target 47
-    weight 0
-  ]
-  edge [
-    source 41
-    target 48
-    weight 0
-  ]
-  edge [
-    source 41
-    target 49
-    weight 0
-  ]
-  edge [
-    source 41
-    target 50
-    weight 0
-  ]
-  edge [
-    source 41
-    target 51
-    weight 0
-  ]
-  edge [
-    source 41
-    target 52
-    weight 0
-  ]
-  edge [
-    source 41
-    target 53
-    weight 0
-  ]
-  edge [
-    source 41
-    target 54
-    weight 0
-  ]
-  edge [
-    source 41
-    target 55
-    weight 0
-  ]
-  edge [
-    source 41
-    target 56
-    weight 0
-  ]
-  edge [
-    source 41
-    target 57
-    weight 0
-  ]
-  edge [
-    source 41
-    target 58
-    weight 0
-  ]
-  edge [
-    source 41
-    target 59
-    weight 0
-  ]
-  edge [
-    source 41
-    target 60
-    weight 0
-  ]
-  edge [
-    source 41
-    target 61
-    weight 0
-  ]
-  edge [
-    source 41
-    target 62
-    weight 0
-  ]
-  edge [
-    source 41
-    target 63
-    weight 0
-  ]
-  edge [
-    source 41
-    target 64
-    weight 0
-  ]
-  edge [
-    source 41
-    target 65
-    weight 0
-  ]
-  edge [
-    source 41
-    target 66
-    weight 0
-  ]
-  edge [
-    source 41
-    target 67
-    weight 0
-  ]
-  edge [
-    source 41
-    target 68
-    weight 0
-  ]
-  edge [
-    source 41
-    target 69
-    weight 0
-  ]
-  edge [
-    source 41
-    target 70
-    weight 0
-  ]
-  edge [
-    source 41
-    target 71
-    weight 0
-  ]
-  edge [
-    source 41
-    target 72
-    weight 0
-  ]
-  edge [
-    source 41
-    target 73
-    weight 0
-  ]
-  edge [
-    source 41
-    target 74
-    weight 0
-  ]
-  edge [
-    source 41
-    target 75
-    weight 0
-  ]
-  edge [
-    source 41
-    target 76
-    weight 0
-  ]
-  edge [
-    source 41
-    target 77
-    weight 0
-  ]
-  edge [
-    source 41
-    target 78
-    weight 0
-  ]
-  edge [
-    source 41
-    target 79
-    weight 0
-  ]
-  edge [
-    source 41
-    target 80
-    weight 0
-  ]
-  edge [
-    source 41
-    target 81
-    weight 0
-  ]
-  edge [
-    source 41
-    target 82
-    weight 0
-  ]
-  edge [
-    source 41
-    target 83
-    weight 0
-  ]
-  edge [
-    source 41
-    target 84
-    weight 0
-  ]
-  edge [
-    source 41
-    target 85
-    weight 0
-  ]
-  edge [
-    source 41
-    target 86
-    weight 0
-  ]
-  edge [
-    source 41
-    target 87
-    weight 0
-  ]
-  edge [
-    source 41
-    target 88
-    weight 0
-  ]
-  edge [
-    source 41
-    target 89
-    weight 0
-  ]
-  edge [
-    source 41
-    target 90
-    weight -0.1
-  ]
-  edge [
-    source 41
-    target 91
-    weight 0
-  ]
-  edge [
-    source 41
-    target 92
-    weight 0
-  ]
-  edge [
-    source 41
-    target 93
-    weight 0
-  ]
-  edge [
-    source 41
-    target 94
-    weight 0
-  ]
-  edge [
-    source 41
-    target 95
-    weight 0
-  ]
-  edge [
-    source 41
-    target 96
-    weight 0
-  ]
-  edge [
-    source 41
-    target 97
-    weight 0
-  ]
-  edge [
-    source 41
-    target 98
-    weight 0
-  ]
-  edge [
-    source 41
-    target 99
-    weight 0
-  ]
-  edge [
-    source 41
-    target 100
-    weight 0
-  ]
-  edge [
-    source 42
-    target 43
-    weight 0
-  ]
-  edge [
-    source 42
-    target 44
-    weight 0
-  ]
-  edge [
-    source 42
-    target 45
-    weight 0
-  ]
-  edge [
-    source 42
-    target 46
-    weight 0
-  ]
-  edge [
-    source 42
-    target 47
-    weight 0
-  ]
-  edge [
-    source 42
-    target 48
-    weight 0
-  ]
-  edge [
-    source 42
-    target 49
-    weight 0
-  ]
-  edge [
-    source 42
-    target 50
-    weight 0
-  ]
-  edge [
-    source 42
-    target 51
-    weight 0
-  ]
-  edge [
-    source 42
-    target 52
-    weight 0
-  ]
-  edge [
-    source 42
-    target 53
-    weight 0
-  ]
-  edge [
-    source 42
-    target 54
-    weight 0
-  ]
-  edge [
-    source 42
-    target 55
-    weight 0
-  ]
-  edge [
-    source 42
-    target 56
-    weight 0
-  ]
-  edge [
-    source 42
-    target 57
-    weight 0
-  ]
-  edge [
-    source 42
-    target 58
-    weight 0
-  ]
-  edge [
-    source 42
-    target 59
-    weight 0
-  ]
-  edge [
-    source 42
-    target 60
-    weight 0
-  ]
-  edge [
-    source 42
-    target 61
-    weight 0
-  ]
-  edge [
-    source 42
-    target 62
-    weight 0
-  ]
-  edge [
-    source 42
-    target 63
-    weight 0
-  ]
-  edge [
-    source 42
-    target 64
-    weight 0
-  ]
-  edge [
-    source 42
-    target 65
-    weight 0
-  ]
-  edge [
-    source 42
-    target 66
-    weight 0
-  ]
-  edge [
-    source 42
-    target 67
-    weight 0
-  ]
-  edge [
-    source 42
-    target 68
-    weight 0
-  ]
-  edge [
-    source 42
-    target 69
-    weight 0
-  ]
-  edge [
-    source 42
-    target 70
-    weight 0
-  ]
-  edge [
-    source 42
-    target 71
-    weight 0
-  ]
-  edge [
-    source 42
-    target 72
-    weight 0
-  ]
-  edge [
-    source 42
-    target 73
-    weight 0
-  ]
-  edge [
-    source 42
-    target 74
-    weight 0
-  ]
-  edge [
-    source 42
-    target 75
-    weight 0
-  ]
-  edge [
-    source 42
-    target 76
-    weight 0
-  ]
-  edge [
-    source 42
-    target 77
-    weight 0
-  ]
-  edge [
-    source 42
-    target 78
-    weight 0
-  ]
-  edge [
-    source 42
-    target 79
-    weight 0
-  ]
-  edge [
-    source 42
-    target 80
-    weight 0
-  ]
-  edge [
-    source 42
-    target 81
-    weight 0
-  ]
-  edge [
-    source 42
-    target 82
-    weight 0
-  ]
-  edge [
-    source 42
-    target 83
-    weight -0.1
-  ]
-  edge [
-    source 42
-    target 84
-    weight 0
-  ]
-  edge [
-    source 42
-    target 85
-    weight 0
-  ]
-  edge [
-    source 42
-    target 86
-    weight 0
-  ]
-  edge [
-    source 42
-    target 87
-    weight 0
-  ]
-  edge [
-    source 42
-    target 88
-    weight 0
-  ]
-  edge [
-    source 42
-    target 89
-    weight 0
-  ]
-  edge [
-    source 42
-    target 90
-    weight 0
-  ]
-  edge [
-    source 42
-    target 91
-    weight 0
-  ]
-  edge [
-    source 42
-    target 92
-    weight 0
-  ]
-  edge [
-    source 42
-    target 93
-    weight 0
-  ]
-  edge [
-    source 42
-    target 94
-    weight 0
-  ]
-  edge [
-    source 42
-    target 95
-    weight 0
-  ]
-  edge [
-    source 42
-    target 96
-    weight 0
-  ]
-  edge [
-    source 42
-    target 97
-    weight 0
-  ]
-  edge [
-    source 42
-    target 98
-    weight 0
-  ]
-  edge [
-    source 42
-    target 99
-    weight 0
-  ]
-  edge [
-    source 42
-    target 100
-    weight 0
-  ]
-  edge [
-    source 43
-    target 44
-    weight 0
-  ]
-  edge [
-    source 43
-    target 45
-    weight 0
-  ]
-  edge [
-    source 43
-    target 46
-    weight 0
-  ]
-  edge [
-    source 43
-    target 47
-    weight 0
-  ]
-  edge [
-    source 43
-    target 48
-    weight 0
-  ]
-  edge [
-    source 43
-    target 49
-    weight 0
-  ]
-  edge [
-    source 43
-    target 50
-    weight 0
-  ]
-  edge [
-    source 43
-    target 51
-    weight 0
-  ]
-  edge [
-    source 43
-    target 52
-    weight 0
-  ]
-  edge [
-    source 43
-    target 53
-    weight 0
-  ]
-  edge [
-    source 43
-    target 54
-    weight 0
-  ]
-  edge [
-    source 43
-    target 55
-    weight 0
-  ]
-  edge [
-    source 43
-    target 56
-    weight 0
-  ]
-  edge [
-    source 43
-    target 57
-    weight 0
-  ]
-  edge [
-    source 43
-    target 58
-    weight 0
-  ]
-  edge [
-    source 43
-    target 59
-    weight 0
-  ]
-  edge [
-    source 43
-    target 60
-    weight 0
-  ]
-  edge [
-    source 43
-    target 61
-    weight 0
-  ]
-  edge [
-    source 43
-    target 62
-    weight 0
-  ]
-  edge [
-    source 43
-    target 63
-    weight 0
-  ]
-  edge [
-    source 43
-    target 64
-    weight 0
-  ]
-  edge [
-    source 43
-    target 65
-    weight 0
-  ]
-  edge [
-    source 43
-    target 66
-    weight 0
-  ]
-  edge [
-    source 43
-    target 67
-    weight 0
-  ]
-  edge [
-    source 43
-    target 68
-    weight 0
-  ]
-  edge [
-    source 43
-    target 69
-    weight 0
-  ]
-  edge [
-    source 43
-    target 70
-    weight 0
-  ]
-  edge [
-    source 43
-    target 71
-    weight 0
-  ]
-  edge [
-    source 43
-    target 72
-    weight 0
-  ]
-  edge [
-    source 43
-    target 73
-    weight 0
-  ]
-  edge [
-    source 43
-    target 74
-    weight 0
-  ]
-  edge [
-    source 43
-    target 75
-    weight 0
-  ]
-  edge [
-    source 43
-    target 76
-    weight 0
-  ]
-  edge [
-    source 43
-    target 77
-    weight 0
-  ]
-  edge [
-    source 43
-    target 78
-    weight 0
-  ]
-  edge [
-    source 43
-    target 79
-    weight 0
-  ]
-  edge [
-    source 43
-    target 80
-    weight 0
-  ]
-  edge [
-    source 43
-    target 81
-    weight 0
-  ]
-  edge [
-    source 43
-    target 82
-    weight 0
-  ]
-  edge [
-    source 43
-    target 83
-    weight 0
-  ]
-  edge [
-    source 43
-    target 84
-    weight 0
-  ]
-  edge [
-    source 43
-    target 85
-    weight 0
-  ]
-  edge [
-    source 43
-    target 86
-    weight 0
-  ]
-  edge [
-    source 43
-    target 87
-    weight 0
-  ]
-  edge [
-    source 43
-    target 88
-    weight 0
-  ]
-  edge [
-    source 43
-    target 89
-    weight -0.1
-  ]
-  edge [
-    source 43
-    target 90
-    weight 0
-  ]
-  edge [
-    source 43
-    target 91
-    weight 0
-  ]
-  edge [
-    source 43
-    target 92
-    weight 0
-  ]
-  edge [
-    source 43
-    target 93
-    weight 0
-  ]
-  edge [
-    source 43
-    target 94
-    weight 0
-  ]
-  edge [
-    source 43
-    target 95
-    weight 0
-  ]
-  edge [
-    source 43
-    target 96
-    weight 0
-  ]
-  edge [
-    source 43
-    target 97
-    weight 0
-  ]
-  edge [
-    source 43
-    target 98
-    weight 0
-  ]
-  edge [
-    source 43
-    target 99
-    weight 0
-  ]
-  edge [
-    source 43
-    target 100
-    weight 0
-  ]
-  edge [
-    source 44
-    target 45
-    weight 0
-  ]
-  edge [
-    source 44
-    target 46
-    weight 0
-  ]
-  edge [
-    source 44
-    target 47
-    weight 0
-  ]
-  edge [
-    source 44
-    target 48
-    weight 0
-  ]
-  edge [
-    source 44
-    target 49
-    weight 0
-  ]
-  edge [
-    source 44
-    target 50
-    weight 0
-  ]
-  edge [
-    source 44
-    target 51
-    weight 0
-  ]
-  edge [
-    source 44
-    target 52
-    weight 0
-  ]
-  edge [
-    source 44
-    target 53
-    weight 0
-  ]
-  edge [
-    source 44
-    target 54
-    weight 0
-  ]
-  edge [
-    source 44
-    target 55
-    weight 0
-  ]
-  edge [
-    source 44
-    target 56
-    weight 0
-  ]
-  edge [
-    source 44
-    target 57
-    weight 0
-  ]
-  edge [
-    source 44
-    target 58
-    weight 0
-  ]
-  edge [
-    source 44
-    target 59
-    weight 0
-  ]
-  edge [
-    source 44
-    target 60
-    weight 0
-  ]
-  edge [
-    source 44
-    target 61
-    weight 0
-  ]
-  edge [
-    source 44
-    target 62
-    weight 0
-  ]
-  edge [
-    source 44
-    target 63
-    weight 0
-  ]
-  edge [
-    source 44
-    target 64
-    weight 0
-  ]
-  edge [
-    source 44
-    target 65
-    weight 0
-  ]
-  edge [
-    source 44
-    target 66
-    weight 0
-  ]
-  edge [
-    source 44
-    target 67
-    weight 0
-  ]
-  edge [
-    source 44
-    target 68
-    weight 0
-  ]
-  edge [
-    source 44
-    target 69
-    weight 0
-  ]
-  edge [
-    source 44
-    target 70
-    weight 0
-  ]
-  edge [
-    source 44
-    target 71
-    weight 0
-  ]
-  edge [
-    source 44
-    target 72
-    weight 0
-  ]
-  edge [
-    source 44
-    target 73
-    weight 0
-  ]
-  edge [
-    source 44
-    target 74
-    weight 0
-  ]
-  edge [
-    source 44
-    target 75
-    weight 0
-  ]
-  edge [
-    source 44
-    target 76
-    weight 0
-  ]
-  edge [
-    source 44
-    target 77
-    weight 0
-  ]
-  edge [
-    source 44
-    target 78
-    weight 0
-  ]
-  edge [
-    source 44
-    target 79
-    weight 0
-  ]
-  edge [
-    source 44
-    target 80
-    weight 0
-  ]
-  edge [
-    source 44
-    target 81
-    weight 0
-  ]
-  edge [
-    source 44
-    target 82
-    weight 0
-  ]
-  edge [
-    source 44
-    target 83
-    weight 0
-  ]
-  edge [
-    source 44
-    target 84
-    weight 0
-  ]
-  edge [
-    source 44
-    target 85
-    weight 0
-  ]
-  edge [
-    source 44
-    target 86
-    weight 0
-  ]
-  edge [
-    source 44
-    target 87
-    weight 0
-  ]
-  edge [
-    source 44
-    target 88
-    weight 0
-  ]
-  edge [
-    source 44
-    target 89
-    weight 0
-  ]
-  edge [
-    source 44
-    target 90
-    weight 0
-  ]
-  edge [
-    source 44
-    target 91
-    weight 0
-  ]
-  edge [
-    source 44
-    target 92
-    weight 0
-  ]
-  edge [
-    source 44
-    target 93
-    weight 0
-  ]
-  edge [
-    source 44
-    target 94
-    weight 0
-  ]
-  edge [
-    source 44
-    target 95
-    weight 0
-  ]
-  edge [
-    source 44
-    target 96
-    weight 0
-  ]
-  edge [
-    source 44
-    target 97
-    weight 0
-  ]
-  edge [
-    source 44
-    target 98
-    weight 0
-  ]
-  edge [
-    source 44
-    target 99
-    weight 0
-  ]
-  edge [
-    source 44
-    target 100
-    weight 0
-  ]
-  edge [
-    source 45
-    target 46
-    weight 0
-  ]
-  edge [
-    source 45
-    target 47
-    weight 0
-  ]
-  edge [
-    source 45
-    target 48
-    weight 0
-  ]
-  edge [
-    source 45
-    target 49
-    weight 0
-  ]
-  edge [
-    source 45
-    target 50
-    weight 0
-  ]
-  edge [
-    source 45
-    target 51
-    weight 0
-  ]
-  edge [
-    source 45
-    target 52
-    weight 0
-  ]
-  edge [
-    source 45
-    target 53
-    weight 0
-  ]
-  edge [
-    source 45
-    target 54
-    weight 0
-  ]
-  edge [
-    source 45
-    target 55
-    weight 0
-  ]
-  edge [
-    source 45
-    target 56
-    weight 0
-  ]
-  edge [
-    source 45
-    target 57
-    weight 0
-  ]
-  edge [
-    source 45
-    target 58
-    weight 0
-  ]
-  edge [
-    source 45
-    target 59
-    weight 0
-  ]
-  edge [
-    source 45
-    target 60
-    weight 0
-  ]
-  edge [
-    source 45
-    target 61
-    weight 0
-  ]
-  edge [
-    source 45
-    target 62
-    weight 0
-  ]
-  edge [
-    source 45
-    target 63
-    weight 0
-  ]
-  edge [
-    source 45
-    target 64
-    weight 0
-  ]
-  edge [
-    source 45
-    target 65
-    weight 0
-  ]
-  edge [
-    source 45
-    target 66
-    weight 0
-  ]
-  edge [
-    source 45
-    target 67
-    weight 0
-  ]
-  edge [
-    source 45
-    target 68
-    weight 0
-  ]
-  edge [
-    source 45
-    target 69
-    weight 0
-  ]
-  edge [
-    source 45
-    target 70
-    weight 0
-  ]
-  edge [
-    source 45
-    target 71
-    weight 0
-  ]
-  edge [
-    source 45
-    target 72
-    weight 0
-  ]
-  edge [
-    source 45
-    target 73
-    weight 0
-  ]
-  edge [
-    source 45
-    target 74
-    weight 0
-  ]
-  edge [
-    source 45
-    target 75
-    weight 0
-  ]
-  edge [
-    source 45
-    target 76
-    weight 0
-  ]
-  edge [
-    source 45
-    target 77
-    weight 0
-  ]
-  edge [
-    source 45
-    target 78
-    weight 0
-  ]
-  edge [
-    source 45
-    target 79
-    weight 0
-  ]
-  edge [
-    source 45
-    target 80
-    weight 0
-  ]
-  edge [
-    source 45
-    target 81
-    weight 0
-  ]
-  edge [
-    source 45
-    target 82
-    weight 0
-  ]
-  edge [
-    source 45
-    target 83
-    weight 0
-  ]
-  edge [
-    source 45
-    target 84
-    weight 0
-  ]
-  edge [
-    source 45
-    target 85
-    weight 0
-  ]
-  edge [
-    source 45
-    target 86
-    weight 0
-  ]
-  edge [
-    source 45
-    target 87
-    weight 0
-  ]
-  edge [
-    source 45
-    target 88
-    weight 0
-  ]
-  edge [
-    source 45
-    target 89
-    weight -0.1
-  ]
-  edge [
-    source 45
-    target 90
-    weight 0
-  ]
-  edge [
-    source 45
-    target 91
-    weight 0
-  ]
-  edge [
-    source 45
-    target 92
-    weight 0
-  ]
-  edge [
-    source 45
-    target 93
-    weight 0
-  ]
-  edge [
-    source 45
-    target 94
-    weight 0
-  ]
-  edge [
-    source 45
-    target 95
-    weight 0
-  ]
-  edge [
-    source 45
-    target 96
-    weight 0
-  ]
-  edge [
-    source 45
-    target 97
-    weight 0
-  ]
-  edge [
-    source 45
-    target 98
-    weight 0
-  ]
-  edge [
-    source 45
-    target 99
-    weight 0
-  ]
-  edge [
-    source 45
-    target 100
-    weight 0
-  ]
-  edge [
-    source 46
-    target 47
-    weight 0
-  ]
-  edge [
-    source 46
-    target 48
-    weight 0
-  ]
-  edge [
-    source 46
-    target 49
-    weight 0
-  ]
-  edge [
-    source 46
-    target 50
-    weight 0
-  ]
-  edge [
-    source 46
-    target 51
-    weight 0
-  ]
-  edge [
-    source 46
-    target 52
-    weight 0
-  ]
-  edge [
-    source 46
-    target 53
-    weight 0
-  ]
-  edge [
-    source 46
-    target 54
-    weight 0
-  ]
-  edge [
-    source 46
-    target 55
-    weight 0
-  ]
-  edge [
-    source 46
-    target 56
-    weight 0
-  ]
-  edge [
-    source 46
-    target 57
-    weight 0
-  ]
-  edge [
-    source 46
-    target 58
-    weight 0
-  ]
-  edge [
-    source 46
-    target 59
-    weight 0
-  ]
-  edge [
-    source 46
-    target 60
-    weight 0
-  ]
-  edge [
-    source 46
-    target 61
-    weight 0
-  ]
-  edge [
-    source 46
-    target 62
-    weight 0
-  ]
-  edge [
-    source 46
-    target 63
-    weight 0
-  ]
-  edge [
-    source 46
-    target 64
-    weight 0
-  ]
-  edge [
-    source 46
-    target 65
-    weight 0
-  ]
-  edge [
-    source 46
-    target 66
-    weight 0
-  ]
-  edge [
-    source 46
-    target 67
-    weight 0
-  ]
-  edge [
-    source 46
-    target 68
-    weight 0
-  ]
-  edge [
-    source 46
-    target 69
-    weight 0
-  ]
-  edge [
-    source 46
-    target 70
-    weight 0
-  ]
-  edge [
-    source 46
-    target 71
-    weight 0
-  ]
-  edge [
-    source 46
-    target 72
-    weight 0
-  ]
-  edge [
-    source 46
-    target 73
-    weight 0
-  ]
-  edge [
-    source 46
-    target 74
-    weight 0
-  ]
-  edge [
-    source 46
-    target 75
-    weight 0
-  ]
-  edge [
-    source 46
-    target 76
-    weight 0
-  ]
-  edge [
-    source 46
-    target 77
-    weight 0
-  ]
-  edge [
-    source 46
-    target 78
-    weight 0
-  ]
-  edge [
-    source 46
-    target 79
-    weight 0
-  ]
-  edge [
-    source 46
-    target 80
-    weight 0
-  ]
-  edge [
-    source 46
-    target 81
-    weight 0
-  ]
-  edge [
-    source 46
-    target 82
-    weight 0
-  ]
-  edge [
-    source 46
-    target 83
-    weight 0
-  ]
-  edge [
-    source 46
-    target 84
-    weight 0
-  ]
-  edge [
-    source 46
-    target 85
-    weight 0
-  ]
-  edge [
-    source 46
-    target 86
-    weight 0
-  ]
-  edge [
-    source 46
-    target 87
-    weight 0
-  ]
-  edge [
-    source 46
-    target 88
-    weight 0
-  ]
-  edge [
-    source 46
-    target 89
-    weight 0
-  ]
-  edge [
-    source 46
-    target 90
-    weight 0
-  ]
-  edge [
-    source 46
-    target 91
-    weight 0
-  ]
-  edge [
-    source 46
-    target 92
-    weight 0
-  ]
-  edge [
-    source 46
-    target 93
-    weight 0
-  ]
-  edge [
-    source 46
-    target 94
-    weight 0
-  ]
-  edge [
-    source 46
-    target 95
-    weight 0
-  ]
-  edge [
-    source 46
-    target 96
-    weight 0
-  ]
-  edge [
-    source 46
-    target 97
-    weight 0
-  ]
-  edge [
-    source 46
-    target 98
-    weight 0
-  ]
-  edge [
-    source 46
-    target 99
-    weight 0
-  ]
-  edge [
-    source 46
-    target 100
-    weight 0
-  ]
-  edge [
-    source 47
-    target 48
-    weight 0
-  ]
-  edge [
-    source 47
-    target 49
-    weight 0
-  ]
-  edge [
-    source 47
-    target 50
-    weight 0
-  ]
-  edge [
-    source 47
-    target 51
-    weight 0
-  ]
-  edge [
-    source 47
-    target 52
-    weight 0
-  ]
-  edge [
-    source 47
-    target 53
-    weight 0
-  ]
-  edge [
-    source 47
-    target 54
-    weight 0
-  ]
-  edge [
-    source 47
-    target 55
-    weight 0
-  ]
-  edge [
-    source 47
-    target 56
-    weight 0
-  ]
-  edge [
-    source 47
-    target 57
-    weight 0
-  ]
-  edge [
-    source 47
-    target 58
-    weight 0
-  ]
-  edge [
-    source 47
-    target 59
-    weight 0
-  ]
-  edge [
-    source 47
-    target 60
-    weight 0
-  ]
-  edge [
-    source 47
-    target 61
-    weight 0
-  ]
-  edge [
-    source 47
-    target 62
-    weight 0
-  ]
-  edge [
-    source 47
-    target 63
-    weight 0
-  ]
-  edge [
-    source 47
-    target 64
-    weight 0
-  ]
-  edge [
-    source 47
-    target 65
-    weight 0
-  ]
-  edge [
-    source 47
-    target 66
-    weight 0
-  ]
-  edge [
-    source 47
-    target 67
-    weight 0
-  ]
-  edge [
-    source 47
-    target 68
-    weight 0
-  ]
-  edge [
-    source 47
-    target 69
-    weight 0
-  ]
-  edge [
-    source 47
-    target 70
-    weight 0
-  ]
-  edge [
-    source 47
-    target 71
-    weight 0
-  ]
-  edge [
-    source 47
-    target 72
-    weight 0
-  ]
-  edge [
-    source 47
-    target 73
-    weight 0
-  ]
-  edge [
-    source 47
-    target 74
-    weight 0
-  ]
-  edge [
-    source 47
-    target 75
-    weight 0
-  ]
-  edge [
-    source 47
-    target 76
-    weight 0
-  ]
-  edge [
-    source 47
-    target 77
-    weight 0
-  ]
-  edge [
-    source 47
-    target 78
-    weight 0
-  ]
-  edge [
-    source 47
-    target 79
-    weight 0
-  ]
-  edge [
-    source 47
-    target 80
-    weight 0
-  ]
-  edge [
-    source 47
-    target 81
-    weight 0
-  ]
-  edge [
-    source 47
-    target 82
-    weight 0
-  ]
-  edge [
-    source 47
-    target 83
-    weight 0
-  ]
-  edge [
-    source 47
-    target 84
-    weight 0
-  ]
-  edge [
-    source 47
-    target 85
-    weight 0
-  ]
-  edge [
-    source 47
-    target 86
-    weight 0
-  ]
-  edge [
-    source 47
-    target 87
-    weight 0
-  ]
-  edge [
-    source 47
-    target 88
-    weight 0
-  ]
-  edge [
-    source 47
-    target 89
-    weight -0.1
-  ]
-  edge [
-    source 47
-    target 90
-    weight 0
-  ]
-  edge [
-    source 47
-    target 91
-    weight 0
-  ]
-  edge [
-    source 47
-    target 92
-    weight 0
-  ]
-  edge [
-    source 47
-    target 93
-    weight 0
-  ]
-  edge [
-    source 47
-    target 94
-    weight 0
-  ]
-  edge [
-    source 47
-    target 95
-    weight 0
-  ]
-  edge [
-    source 47
-    target 96
-    weight 0.1
-  ]
-  edge [
-    source 47
-    target 97
-    weight 0
-  ]
-  edge [
-    source 47
-    target 98
-    weight 0
-  ]
-  edge [
-    source 47
-    target 99
-    weight 0
-  ]
-  edge [
-    source 47
-    target 100
-    weight 0
-  ]
-  edge [
-    source 48
-    target 49
-    weight 0
-  ]
-  edge [
-    source 48
-    target 50
-    weight 0
-  ]
-  edge [
-    source 48
-    target 51
-    weight 0
-  ]
-  edge [
-    source 48
-    target 52
-    weight 0
-  ]
-  edge [
-    source 48
-    target 53
-    weight 0
-  ]
-  edge [
-    source 48
-    target 54
-    weight 0
-  ]
-  edge [
-    source 48
-    target 55
-    weight 0
-  ]
-  edge [
-    source 48
-    target 56
-    weight 0
-  ]
-  edge [
-    source 48
-    target 57
-    weight 0
-  ]
-  edge [
-    source 48
-    target 58
-    weight 0
-  ]
-  edge [
-    source 48
-    target 59
-    weight 0
-  ]
-  edge [
-    source 48
-    target 60
-    weight 0
-  ]
-  edge [
-    source 48
-    target 61
-    weight 0
-  ]
-  edge [
-    source 48
-    target 62
-    weight 0
-  ]
-  edge [
-    source 48
-    target 63
-    weight 0
-  ]
-  edge [
-    source 48
-    target 64
-    weight 0
-  ]
-  edge [
-    source 48
-    target 65
-    weight 0
-  ]
-  edge [
-    source 48
-    target 66
-    weight 0
-  ]
-  edge [
-    source 48
-    target 67
-    weight 0
-  ]
-  edge [
-    source 48
-    target 68
-    weight 0
-  ]
-  edge [
-    source 48
-    target 69
-    weight 0
-  ]
-  edge [
-    source 48
-    target 70
-    weight 0
-  ]
-  edge [
-    source 48
-    target 71
-    weight 0
-  ]
-  edge [
-    source 48
-    target 72
-    weight 0
-  ]
-  edge [
-    source 48
-    target 73
-    weight 0
-  ]
-  edge [
-    source 48
-    target 74
-    weight 0
-  ]
-  edge [
-    source 48
-    target 75
-    weight 0
-  ]
-  edge [
-    source 48
-    target 76
-    weight 0
-  ]
-  edge [
-    source 48
-    target 77
-    weight 0
-  ]
-  edge [
-    source 48
-    target 78
-    weight 0
-  ]
-  edge [
-    source 48
-    target 79
-    weight 0
-  ]
-  edge [
-    source 48
-    target 80
-    weight 0
-  ]
-  edge [
-    source 48
-    target 81
-    weight 0
-  ]
-  edge [
-    source 48
-    target 82
-    weight 0
-  ]
-  edge [
-    source 48
-    target 83
-    weight 0
-  ]
-  edge [
-    source 48
-    target 84
-    weight 0
-  ]
-  edge [
-    source 48
-    target 85
-    weight 0
-  ]
-  edge [
-    source 48
-    target 86
-    weight 0
-  ]
-  edge [
-    source 48
-    target 87
-    weight -0.1
-  ]
-  edge [
-    source 48
-    target 88
-    weight 0
-  ]
-  edge [
-    source 48
-    target 89
-    weight 0
-  ]
-  edge [
-    source 48
-    target 90
-    weight 0
-  ]
-  edge [
-    source 48
-    target 91
-    weight 0
-  ]
-  edge [
-    source 48
-    target 92
-    weight 0
-  ]
-  edge [
-    source 48
-    target 93
-    weight 0
-  ]
-  edge [
-    source 48
-    target 94
-    weight 0
-  ]
-  edge [
-    source 48
-    target 95
-    weight 0
-  ]
-  edge [
-    source 48
-    target 96
-    weight 0
-  ]
-  edge [
-    source 48
-    target 97
-    weight 0
-  ]
-  edge [
-    source 48
-    target 98
-    weight 0
-  ]
-  edge [
-    source 48
-    target 99
-    weight 0
-  ]
-  edge [
-    source 48
-    target 100
-    weight 0
-  ]
-  edge [
-    source 49
-    target 50
-    weight 0
-  ]
-  edge [
-    source 49
-    target 51
-    weight 0
-  ]
-  edge [
-    source 49
-    target 52
-    weight 0
-  ]
-  edge [
-    source 49
-    target 53
-    weight 0
-  ]
-  edge [
-    source 49
-    target 54
-    weight 0
-  ]
-  edge [
-    source 49
-    target 55
-    weight 0
-  ]
-  edge [
-    source 49
-    target 56
-    weight 0
-  ]
-  edge [
-    source 49
-    target 57
-    weight 0
-  ]
-  edge [
-    source 49
-    target 58
-    weight 0
-  ]
-  edge [
-    source 49
-    target 59
-    weight 0
-  ]
-  edge [
-    source 49
-    target 60
-    weight 0
-  ]
-  edge [
-    source 49
-    target 61
-    weight 0
-  ]
-  edge [
-    source 49
-    target 62
-    weight 0
-  ]
-  edge [
-    source 49
-    target 63
-    weight 0
-  ]
-  edge [
-    source 49
-    target 64
-    weight 0
-  ]
-  edge [
-    source 49
-    target 65
-    weight 0
-  ]
-  edge [
-    source 49
-    target 66
-    weight 0
-  ]
-  edge [
-    source 49
-    target 67
-    weight 0
-  ]
-  edge [
-    source 49
-    target 68
-    weight 0
-  ]
-  edge [
-    source 49
-    target 69
-    weight 0
-  ]
-  edge [
-    source 49
-    target 70
-    weight 0
-  ]
-  edge [
-    source 49
-    target 71
-    weight 0
-  ]
-  edge [
-    source 49
-    target 72
-    weight 0
-  ]
-  edge [
-    source 49
-    target 73
-    weight 0
-  ]
-  edge [
-    source 49
-    target 74
-    weight 0
-  ]
-  edge [
-    source 49
-    target 75
-    weight 0
-  ]
-  edge [
-    source 49
-    target 76
-    weight 0
-  ]
-  edge [
-    source 49
-    target 77
-    weight 0
-  ]
-  edge [
-    source 49
-    target 78
-    weight 0
-  ]
-  edge [
-    source 49
-    target 79
-    weight 0
-  ]
-  edge [
-    source 49
-    target 80
-    weight 0
-  ]
-  edge [
-    source 49
-    target 81
-    weight 0
-  ]
-  edge [
-    source 49
-    target 82
-    weight 0
-  ]
-  edge [
-    source 49
-    target 83
-    weight 0
-  ]
-  edge [
-    source 49
-    target 84
-    weight 0
-  ]
-  edge [
-    source 49
-    target 85
-    weight 0
-  ]
-  edge [
-    source 49
-    target 86
-    weight 0
-  ]
-  edge [
-    source 49
-    target 87
-    weight 0
-  ]
-  edge [
-    source 49
-    target 88
-    weight 0
-  ]
-  edge [
-    source 49
-    target 89
-    weight 0
-  ]
-  edge [
-    source 49
-    target 90
-    weight 0
-  ]
-  edge [
-    source 49
-    target 91
-    weight 0
-  ]
-  edge [
-    source 49
-    target 92
-    weight 0
-  ]
-  edge [
-    source 49
-    target 93
-    weight 0
-  ]
-  edge [
-    source 49
-    target 94
-    weight 0
-  ]
-  edge [
-    source 49
-    target 95
-    weight 0
-  ]
-  edge [
-    source 49
-    target 96
-    weight 0
-  ]
-  edge [
-    source 49
-    target 97
-    weight 0
-  ]
-  edge [
-    source 49
-    target 98
-    weight 0
-  ]
-  edge [
-    source 49
-    target 99
-    weight 0
-  ]
-  edge [
-    source 49
-    target 100
-    weight 0
-  ]
-  edge [
-    source 50
-    target 51
-    weight 0
-  ]
-  edge [
-    source 50
-    target 52
-    weight 0
-  ]
-  edge [
-    source 50
-    target 53
-    weight 0
-  ]
-  edge [
-    source 50
-    target 54
-    weight 0
-  ]
-  edge [
-    source 50
-    target 55
-    weight 0
-  ]
-  edge [
-    source 50
-    target 56
-    weight 0
-  ]
-  edge [
-    source 50
-    target 57
-    weight 0
-  ]
-  edge [
-    source 50
-    target 58
-    weight 0
-  ]
-  edge [
-    source 50
-    target 59
-    weight 0
-  ]
-  edge [
-    source 50
-    target 60
-    weight 0
-  ]
-  edge [
-    source 50
-    target 61
-    weight 0
-  ]
-  edge [
-    source 50
-    target 62
-    weight 0
-  ]
-  edge [
-    source 50
-    target 63
-    weight 0
-  ]
-  edge [
-    source 50
-    target 64
-    weight 0
-  ]
-  edge [
-    source 50
-    target 65
-    weight 0
-  ]
-  edge [
-    source 50
-    target 66
-    weight 0
-  ]
-  edge [
-    source 50
-    target 67
-    weight 0
-  ]
-  edge [
-    source 50
-    target 68
-    weight 0
-  ]
-  edge [
-    source 50
-    target 69
-    weight 0
-  ]
-  edge [
-    source 50
-    target 70
-    weight 0
-  ]
-  edge [
-    source 50
-    target 71
-    weight 0
-  ]
-  edge [
-    source 50
-    target 72
-    weight 0
-  ]
-  edge [
-    source 50
-    target 73
-    weight 0
-  ]
-  edge [
-    source 50
-    target 74
-    weight 0
-  ]
-  edge [
-    source 50
-    target 75
-    weight 0
-  ]
-  edge [
-    source 50
-    target 76
-    weight 0
-  ]
-  edge [
-    source 50
-    target 77
-    weight 0
-  ]
-  edge [
-    source 50
-    target 78
-    weight 0
-  ]
-  edge [
-    source 50
-    target 79
-    weight 0
-  ]
-  edge [
-    source 50
-    target 80
-    weight 0
-  ]
-  edge [
-    source 50
-    target 81
-    weight 0
-  ]
-  edge [
-    source 50
-    target 82
-    weight 0
-  ]
-  edge [
-    source 50
-    target 83
-    weight 0
-  ]
-  edge [
-    source 50
-    target 84
-    weight 0
-  ]
-  edge [
-    source 50
-    target 85
-    weight 0
-  ]
-  edge [
-    source 50
-    target 86
-    weight 0
-  ]
-  edge [
-    source 50
-    target 87
-    weight 0
-  ]
-  edge [
-    source 50
-    target 88
-    weight 0
-  ]
-  edge [
-    source 50
-    target 89
-    weight 0
-  ]
-  edge [
-    source 50
-    target 90
-    weight 0
-  ]
-  edge [
-    source 50
-    target 91
-    weight 0
-  ]
-  edge [
-    source 50
-    target 92
-    weight 0
-  ]
-  edge [
-    source 50
-    target 93
-    weight 0
-  ]
-  edge [
-    source 50
-    target 94
-    weight 0.1
-  ]
-  edge [
-    source 50
-    target 95
-    weight 0
-  ]
-  edge [
-    source 50
-    target 96
-    weight 0
-  ]
-  edge [
-    source 50
-    target 97
-    weight 0
-  ]
-  edge [
-    source 50
-    target 98
-    weight 0
-  ]
-  edge [
-    source 50
-    target 99
-    weight 0
-  ]
-  edge [
-    source 50
-    target 100
-    weight 0
-  ]
-  edge [
-    source 51
-    target 52
-    weight 0
-  ]
-  edge [
-    source 51
-    target 53
-    weight 0
-  ]
-  edge [
-    source 51
-    target 54
-    weight 0
-  ]
-  edge [
-    source 51
-    target 55
-    weight 0
-  ]
-  edge [
-    source 51
-    target 56
-    weight 0
-  ]
-  edge [
-    source 51
-    target 57
-    weight 0
-  ]
-  edge [
-    source 51
-    target 58
-    weight 0
-  ]
-  edge [
-    source 51
-    target 59
-    weight 0
-  ]
-  edge [
-    source 51
-    target 60
-    weight 0
-  ]
-  edge [
-    source 51
-    target 61
-    weight 0
-  ]
-  edge [
-    source 51
-    target 62
-    weight 0
-  ]
-  edge [
-    source 51
-    target 63
-    weight 0
-  ]
-  edge [
-    source 51
-    target 64
-    weight 0
-  ]
-  edge [
-    source 51
-    target 65
-    weight 0
-  ]
-  edge [
-    source 51
-    target 66
-    weight 0
-  ]
-  edge [
-    source 51
-    target 67
-    weight 0
-  ]
-  edge [
-    source 51
-    target 68
-    weight 0
-  ]
-  edge [
-    source 51
-    target 69
-    weight 0
-  ]
-  edge [
-    source 51
-    target 70
-    weight 0
-  ]
-  edge [
-    source 51
-    target 71
-    weight 0
-  ]
-  edge [
-    source 51
-    target 72
-    weight 0
-  ]
-  edge [
-    source 51
-    target 73
-    weight 0
-  ]
-  edge [
-    source 51
-    target 74
-    weight 0
-  ]
-  edge [
-    source 51
-    target 75
-    weight 0
-  ]
-  edge [
-    source 51
-    target 76
-    weight 0
-  ]
-  edge [
-    source 51
-    target 77
-    weight 0
-  ]
-  edge [
-    source 51
-    target 78
-    weight 0
-  ]
-  edge [
-    source 51
-    target 79
-    weight -0.1
-  ]
-  edge [
-    source 51
-    target 80
-    weight 0
-  ]
-  edge [
-    source 51
-    target 81
-    weight 0
-  ]
-  edge [
-    source 51
-    target 82
-    weight 0
-  ]
-  edge [
-    source 51
-    target 83
-    weight 0
-  ]
-  edge [
-    source 51
-    target 84
-    weight 0
-  ]
-  edge [
-    source 51
-    target 85
-    weight 0
-  ]
-  edge [
-    source 51
-    target 86
-    weight 0
-  ]
-  edge [
-    source 51
-    target 87
-    weight 0
-  ]
-  edge [
-    source 51
-    target 88
-    weight 0
-  ]
-  edge [
-    source 51
-    target 89
-    weight 0
-  ]
-  edge [
-    source 51
-    target 90
-    weight 0
-  ]
-  edge [
-    source 51
-    target 91
-    weight 0
-  ]
-  edge [
-    source 51
-    target 92
-    weight 0
-  ]
-  edge [
-    source 51
-    target 93
-    weight 0
-  ]
-  edge [
-    source 51
-    target 94
-    weight 0
-  ]
-  edge [
-    source 51
-    target 95
-    weight 0
-  ]
-  edge [
-    source 51
-    target 96
-    weight 0
-  ]
-  edge [
-    source 51
-    target 97
-    weight 0
-  ]
-  edge [
-    source 51
-    target 98
-    weight 0
-  ]
-  edge [
-    source 51
-    target 99
-    weight 0
-  ]
-  edge [
-    source 51
-    target 100
-    weight 0
-  ]
-  edge [
-    source 52
-    target 53
-    weight 0
-  ]
-  edge [
-    source 52
-    target 54
-    weight 0
-  ]
-  edge [
-    source 52
-    target 55
-    weight 0
-  ]
-  edge [
-    source 52
-    target 56
-    weight 0
-  ]
-  edge [
-    source 52
-    target 57
-    weight 0
-  ]
-  edge [
-    source 52
-    target 58
-    weight 0
-  ]
-  edge [
-    source 52
-    target 59
-    weight 0
-  ]
-  edge [
-    source 52
-    target 60
-    weight 0
-  ]
-  edge [
-    source 52
-    target 61
-    weight 0
-  ]
-  edge [
-    source 52
-    target 62
-    weight 0
-  ]
-  edge [
-    source 52
-    target 63
-    weight 0
-  ]
-  edge [
-    source 52
-    target 64
-    weight 0
-  ]
-  edge [
-    source 52
-    target 65
-    weight 0
-  ]
-  edge [
-    source 52
-    target 66
-    weight 0
-  ]
-  edge [
-    source 52
-    target 67
-    weight 0
-  ]
-  edge [
-    source 52
-    target 68
-    weight 0
-  ]
-  edge [
-    source 52
-    target 69
-    weight 0
-  ]
-  edge [
-    source 52
-    target 70
-    weight 0
-  ]
-  edge [
-    source 52
-    target 71
-    weight 0
-  ]
-  edge [
-    source 52
-    target 72
-    weight 0
-  ]
-  edge [
-    source 52
-    target 73
-    weight 0
-  ]
-  edge [
-    source 52
-    target 74
-    weight 0
-  ]
-  edge [
-    source 52
-    target 75
-    weight 0
-  ]
-  edge [
-    source 52
-    target 76
-    weight 0
-  ]
-  edge [
-    source 52
-    target 77
-    weight 0
-  ]
-  edge [
-    source 52
-    target 78
-    weight 0
-  ]
-  edge [
-    source 52
-    target 79
-    weight 0
-  ]
-  edge [
-    source 52
-    target 80
-    weight 0
-  ]
-  edge [
-    source 52
-    target 81
-    weight 0
-  ]
-  edge [
-    source 52
-    target 82
-    weight 0
-  ]
-  edge [
-    source 52
-    target 83
-    weight 0
-  ]
-  edge [
-    source 52
-    target 84
-    weight 0
-  ]
-  edge [
-    source 52
-    target 85
-    weight -0.1
-  ]
-  edge [
-    source 52
-    target 86
-    weight 0
-  ]
-  edge [
-    source 52
-    target 87
-    weight 0
-  ]
-  edge [
-    source 52
-    target 88
-    weight 0
-  ]
-  edge [
-    source 52
-    target 89
-    weight 0
-  ]
-  edge [
-    source 52
-    target 90
-    weight 0
-  ]
-  edge [
-    source 52
-    target 91
-    weight 0
-  ]
-  edge [
-    source 52
-    target 92
-    weight 0
-  ]
-  edge [
-    source 52
-    target 93
-    weight 0
-  ]
-  edge [
-    source 52
-    target 94
-    weight 0
-  ]
-  edge [
-    source 52
-    target 95
-    weight 0
-  ]
-  edge [
-    source 52
-    target 96
-    weight 0
-  ]
-  edge [
-    source 52
-    target 97
-    weight 0
-  ]
-  edge [
-    source 52
-    target 98
-    weight 0
-  ]
-  edge [
-    source 52
-    target 99
-    weight 0
-  ]
-  edge [
-    source 52
-    target 100
-    weight 0
-  ]
-  edge [
-    source 53
-    target 54
-    weight 0
-  ]
-  edge [
-    source 53
-    target 55
-    weight 0
-  ]
-  edge [
-    source 53
-    target 56
-    weight 0
-  ]
-  edge [
-    source 53
-    target 57
-    weight 0
-  ]
-  edge [
-    source 53
-    target 58
-    weight 0
-  ]
-  edge [
-    source 53
-    target 59
-    weight 0
-  ]
-  edge [
-    source 53
-    target 60
-    weight 0
-  ]
-  edge [
-    source 53
-    target 61
-    weight 0
-  ]
-  edge [
-    source 53
-    target 62
-    weight 0
-  ]
-  edge [
-    source 53
-    target 63
-    weight 0
-  ]
-  edge [
-    source 53
-    target 64
-    weight 0
-  ]
-  edge [
-    source 53
-    target 65
-    weight 0
-  ]
-  edge [
-    source 53
-    target 66
-    weight 0
-  ]
-  edge [
-    source 53
-    target 67
-    weight 0
-  ]
-  edge [
-    source 53
-    target 68
-    weight 0
-  ]
-  edge [
-    source 53
-    target 69
-    weight 0
-  ]
-  edge [
-    source 53
-    target 70
-    weight 0
-  ]
-  edge [
-    source 53
-    target 71
-    weight 0
-  ]
-  edge [
-    source 53
-    target 72
-    weight 0
-  ]
-  edge [
-    source 53
-    target 73
-    weight 0
-  ]
-  edge [
-    source 53
-    target 74
-    weight 0
-  ]
-  edge [
-    source 53
-    target 75
-    weight 0
-  ]
-  edge [
-    source 53
-    target 76
-    weight 0
-  ]
-  edge [
-    source 53
-    target 77
-    weight 0
-  ]
-  edge [
-    source 53
-    target 78
-    weight 0
-  ]
-  edge [
-    source 53
-    target 79
-    weight 0
-  ]
-  edge [
-    source 53
-    target 80
-    weight 0
-  ]
-  edge [
-    source 53
-    target 81
-    weight 0
-  ]
-  edge [
-    source 53
-    target 82
-    weight 0
-  ]
-  edge [
-    source 53
-    target 83
-    weight 0
-  ]
-  edge [
-    source 53
-    target 84
-    weight 0
-  ]
-  edge [
-    source 53
-    target 85
-    weight 0
-  ]
-  edge [
-    source 53
-    target 86
-    weight 0
-  ]
-  edge [
-    source 53
-    target 87
-    weight 0
-  ]
-  edge [
-    source 53
-    target 88
-    weight 0
-  ]
-  edge [
-    source 53
-    target 89
-    weight 0
-  ]
-  edge [
-    source 53
-    target 90
-    weight -0.1
-  ]
-  edge [
-    source 53
-    target 91
-    weight 0
-  ]
-  edge [
-    source 53
-    target 92
-    weight 0
-  ]
-  edge [
-    source 53
-    target 93
-    weight 0
-  ]
-  edge [
-    source 53
-    target 94
-    weight 0
-  ]
-  edge [
-    source 53
-    target 95
-    weight 0
-  ]
-  edge [
-    source 53
-    target 96
-    weight 0
-  ]
-  edge [
-    source 53
-    target 97
-    weight 0
-  ]
-  edge [
-    source 53
-    target 98
-    weight 0
-  ]
-  edge [
-    source 53
-    target 99
-    weight 0
-  ]
-  edge [
-    source 53
-    target 100
-    weight 0
-  ]
-  edge [
-    source 54
-    target 55
-    weight 0
-  ]
-  edge [
-    source 54
-    target 56
-    weight 0
-  ]
-  edge [
-    source 54
-    target 57
-    weight 0
-  ]
-  edge [
-    source 54
-    target 58
-    weight 0
-  ]
-  edge [
-    source 54
-    target 59
-    weight 0
-  ]
-  edge [
-    source 54
-    target 60
-    weight 0
-  ]
-  edge [
-    source 54
-    target 61
-    weight 0
-  ]
-  edge [
-    source 54
-    target 62
-    weight 0
-  ]
-  edge [
-    source 54
-    target 63
-    weight 0
-  ]
-  edge [
-    source 54
-    target 64
-    weight 0
-  ]
-  edge [
-    source 54
-    target 65
-    weight 0
-  ]
-  edge [
-    source 54
-    target 66
-    weight 0
-  ]
-  edge [
-    source 54
-    target 67
-    weight 0
-  ]
-  edge [
-    source 54
-    target 68
-    weight 0
-  ]
-  edge [
-    source 54
-    target 69
-    weight 0
-  ]
-  edge [
-    source 54
-    target 70
-    weight 0
-  ]
-  edge [
-    source 54
-    target 71
-    weight 0
-  ]
-  edge [
-    source 54
-    target 72
-    weight 0
-  ]
-  edge [
-    source 54
-    target 73
-    weight 0
-  ]
-  edge [
-    source 54
-    target 74
-    weight 0
-  ]
-  edge [
-    source 54
-    target 75
-    weight 0
-  ]
-  edge [
-    source 54
-    target 76
-    weight 0
-  ]
-  edge [
-    source 54
-    target 77
-    weight 0
-  ]
-  edge [
-    source 54
-    target 78
-    weight 0
-  ]
-  edge [
-    source 54
-    target 79
-    weight 0
-  ]
-  edge [
-    source 54
-    target 80
-    weight 0
-  ]
-  edge [
-    source 54
-    target 81
-    weight 0
-  ]
-  edge [
-    source 54
-    target 82
-    weight 0
-  ]
-  edge [
-    source 54
-    target 83
-    weight 0
-  ]
-  edge [
-    source 54
-    target 84
-    weight 0
-  ]
-  edge [
-    source 54
-    target 85
-    weight 0
-  ]
-  edge [
-    source 54
-    target 86
-    weight -0.1
-  ]
-  edge [
-    source 54
-    target 87
-    weight 0
-  ]
-  edge [
-    source 54
-    target 88
-    weight 0
-  ]
-  edge [
-    source 54
-    target 89
-    weight 0
-  ]
-  edge [
-    source 54
-    target 90
-    weight 0
-  ]
-  edge [
-    source 54
-    target 91
-    weight 0
-  ]
-  edge [
-    source 54
-    target 92
-    weight 0
-  ]
-  edge [
-    source 54
-    target 93
-    weight 0
-  ]
-  edge [
-    source 54
-    target 94
-    weight 0
-  ]
-  edge [
-    source 54
-    target 95
-    weight 0
-  ]
-  edge [
-    source 54
-    target 96
-    weight 0
-  ]
-  edge [
-    source 54
-    target 97
-    weight 0
-  ]
-  edge [
-    source 54
-    target 98
-    weight 0
-  ]
-  edge [
-    source 54
-    target 99
-    weight 0
-  ]
-  edge [
-    source 54
-    target 100
-    weight 0
-  ]
-  edge [
-    source 55
-    target 56
-    weight 0
-  ]
-  edge [
-    source 55
-    target 57
-    weight 0
-  ]
-  edge [
-    source 55
-    target 58
-    weight 0
-  ]
-  edge [
-    source 55
-    target 59
-    weight 0
-  ]
-  edge [
-    source 55
-    target 60
-    weight 0
-  ]
-  edge [
-    source 55
-    target 61
-    weight 0
-  ]
-  edge [
-    source 55
-    target 62
-    weight 0
-  ]
-  edge [
-    source 55
-    target 63
-    weight 0
-  ]
-  edge [
-    source 55
-    target 64
-    weight 0
-  ]
-  edge [
-    source 55
-    target 65
-    weight 0
-  ]
-  edge [
-    source 55
-    target 66
-    weight 0
-  ]
-  edge [
-    source 55
-    target 67
-    weight 0
-  ]
-  edge [
-    source 55
-    target 68
-    weight 0
-  ]
-  edge [
-    source 55
-    target 69
-    weight 0
-  ]
-  edge [
-    source 55
-    target 70
-    weight 0
-  ]
-  edge [
-    source 55
-    target 71
-    weight 0
-  ]
-  edge [
-    source 55
-    target 72
-    weight 0
-  ]
-  edge [
-    source 55
-    target 73
-    weight 0
-  ]
-  edge [
-    source 55
-    target 74
-    weight 0
-  ]
-  edge [
-    source 55
-    target 75
-    weight 0
-  ]
-  edge [
-    source 55
-    target 76
-    weight 0
-  ]
-  edge [
-    source 55
-    target 77
-    weight 0
-  ]
-  edge [
-    source 55
-    target 78
-    weight 0
-  ]
-  edge [
-    source 55
-    target 79
-    weight 0
-  ]
-  edge [
-    source 55
-    target 80
-    weight 0
-  ]
-  edge [
-    source 55
-    target 81
-    weight 0
-  ]
-  edge [
-    source 55
-    target 82
-    weight 0
-  ]
-  edge [
-    source 55
-    target 83
-    weight 0
-  ]
-  edge [
-    source 55
-    target 84
-    weight -0.1
-  ]
-  edge [
-    source 55
-    target 85
-    weight 0
-  ]
-  edge [
-    source 55
-    target 86
-    weight -0.1
-  ]
-  edge [
-    source 55
-    target 87
-    weight 0
-  ]
-  edge [
-    source 55
-    target 88
-    weight 0
-  ]
-  edge [
-    source 55
-    target 89
-    weight 0
-  ]
-  edge [
-    source 55
-    target 90
-    weight 0
-  ]
-  edge [
-    source 55
-    target 91
-    weight 0
-  ]
-  edge [
-    source 55
-    target 92
-    weight 0
-  ]
-  edge [
-    source 55
-    target 93
-    weight 0
-  ]
-  edge [
-    source 55
-    target 94
-    weight 0
-  ]
-  edge [
-    source 55
-    target 95
-    weight 0
-  ]
-  edge [
-    source 55
-    target 96
-    weight 0.1
-  ]
-  edge [
-    source 55
-    target 97
-    weight 0
-  ]
-  edge [
-    source 55
-    target 98
-    weight 0
-  ]
-  edge [
-    source 55
-    target 99
-    weight 0
-  ]
-  edge [
-    source 55
-    target 100
-    weight 0
-  ]
-  edge [
-    source 56
-    target 57
-    weight 0
-  ]
-  edge [
-    source 56
-    target 58
-    weight 0
-  ]
-  edge [
-    source 56
-    target 59
-    weight 0
-  ]
-  edge [
-    source 56
-    target 60
-    weight 0
-  ]
-  edge [
-    source 56
-    target 61
-    weight 0
-  ]
-  edge [
-    source 56
-    target 62
-    weight 0
-  ]
-  edge [
-    source 56
-    target 63
-    weight 0
-  ]
-  edge [
-    source 56
-    target 64
-    weight 0
-  ]
-  edge [
-    source 56
-    target 65
-    weight 0
-  ]
-  edge [
-    source 56
-    target 66
-    weight 0
-  ]
-  edge [
-    source 56
-    target 67
-    weight 0
-  ]
-  edge [
-    source 56
-    target 68
-    weight 0
-  ]
-  edge [
-    source 56
-    target 69
-    weight 0
-  ]
-  edge [
-    source 56
-    target 70
-    weight 0
-  ]
-  edge [
-    source 56
-    target 71
-    weight 0
-  ]
-  edge [
-    source 56
-    target 72
-    weight 0
-  ]
-  edge [
-    source 56
-    target 73
-    weight 0
-  ]
-  edge [
-    source 56
-    target 74
-    weight 0
-  ]
-  edge [
-    source 56
-    target 75
-    weight 0
-  ]
-  edge [
-    source 56
-    target 76
-    weight 0
-  ]
-  edge [
-    source 56
-    target 77
-    weight 0
-  ]
-  edge [
-    source 56
-    target 78
-    weight 0
-  ]
-  edge [
-    source 56
-    target 79
-    weight 0
-  ]
-  edge [
-    source 56
-    target 80
-    weight 0
-  ]
-  edge [
-    source 56
-    target 81
-    weight 0
-  ]
-  edge [
-    source 56
-    target 82
-    weight 0
-  ]
-  edge [
-    source 56
-    target 83
-    weight 0
-  ]
-  edge [
-    source 56
-    target 84
-    weight 0
-  ]
-  edge [
-    source 56
-    target 85
-    weight 0
-  ]
-  edge [
-    source 56
-    target 86
-    weight 0
-  ]
-  edge [
-    source 56
-    target 87
-    weight 0
-  ]
-  edge [
-    source 56
-    target 88
-    weight 0
-  ]
-  edge [
-    source 56
-    target 89
-    weight 0
-  ]
-  edge [
-    source 56
-    target 90
-    weight 0
-  ]
-  edge [
-    source 56
-    target 91
-    weight 0
-  ]
-  edge [
-    source 56
-    target 92
-    weight 0
-  ]
-  edge [
-    source 56
-    target 93
-    weight 0
-  ]
-  edge [
-    source 56
-    target 94
-    weight 0
-  ]
-  edge [
-    source 56
-    target 95
-    weight 0
-  ]
-  edge [
-    source 56
-    target 96
-    weight 0
-  ]
-  edge [
-    source 56
-    target 97
-    weight 0
-  ]
-  edge [
-    source 56
-    target 98
-    weight 0
-  ]
-  edge [
-    source 56
-    target 99
-    weight 0
-  ]
-  edge [
-    source 56
-    target 100
-    weight 0
-  ]
-  edge [
-    source 57
-    target 58
-    weight 0
-  ]
-  edge [
-    source 57
-    target 59
-    weight 0
-  ]
-  edge [
-    source 57
-    target 60
-    weight 0
-  ]
-  edge [
-    source 57
-    target 61
-    weight 0
-  ]
-  edge [
-    source 57
-    target 62
-    weight 0
-  ]
-  edge [
-    source 57
-    target 63
-    weight 0
-  ]
-  edge [
-    source 57
-    target 64
-    weight 0
-  ]
-  edge [
-    source 57
-    target 65
-    weight 0
-  ]
-  edge [
-    source 57
-    target 66
-    weight 0
-  ]
-  edge [
-    source 57
-    target 67
-    weight 0
-  ]
-  edge [
-    source 57
-    target 68
-    weight 0
-  ]
-  edge [
-    source 57
-    target 69
-    weight 0
-  ]
-  edge [
-    source 57
-    target 70
-    weight 0
-  ]
-  edge [
-    source 57
-    target 71
-    weight 0
-  ]
-  edge [
-    source 57
-    target 72
-    weight 0
-  ]
-  edge [
-    source 57
-    target 73
-    weight 0
-  ]
-  edge [
-    source 57
-    target 74
-    weight 0
-  ]
-  edge [
-    source 57
-    target 75
-    weight 0
-  ]
-  edge [
-    source 57
-    target 76
-    weight 0
-  ]
-  edge [
-    source 57
-    target 77
-    weight 0
-  ]
-  edge [
-    source 57
-    target 78
-    weight 0
-  ]
-  edge [
-    source 57
-    target 79
-    weight 0
-  ]
-  edge [
-    source 57
-    target 80
-    weight 0
-  ]
-  edge [
-    source 57
-    target 81
-    weight 0
-  ]
-  edge [
-    source 57
-    target 82
-    weight 0
-  ]
-  edge [
-    source 57
-    target 83
-    weight 0
-  ]
-  edge [
-    source 57
-    target 84
-    weight 0
-  ]
-  edge [
-    source 57
-    target 85
-    weight 0
-  ]
-  edge [
-    source 57
-    target 86
-    weight 0
-  ]
-  edge [
-    source 57
-    target 87
-    weight 0
-  ]
-  edge [
-    source 57
-    target 88
-    weight 0
-  ]
-  edge [
-    source 57
-    target 89
-    weight 0
-  ]
-  edge [
-    source 57
-    target 90
-    weight 0
-  ]
-  edge [
-    source 57
-    target 91
-    weight 0
-  ]
-  edge [
-    source 57
-    target 92
-    weight 0
-  ]
-  edge [
-    source 57
-    target 93
-    weight 0
-  ]
-  edge [
-    source 57
-    target 94
-    weight 0
-  ]
-  edge [
-    source 57
-    target 95
-    weight 0
-  ]
-  edge [
-    source 57
-    target 96
-    weight 0
-  ]
-  edge [
-    source 57
-    target 97
-    weight 0
-  ]
-  edge [
-    source 57
-    target 98
-    weight 0
-  ]
-  edge [
-    source 57
-    target 99
-    weight 0
-  ]
-  edge [
-    source 57
-    target 100
-    weight 0
-  ]
-  edge [
-    source 58
-    target 59
-    weight 0
-  ]
-  edge [
-    source 58
-    target 60
-    weight 0
-  ]
-  edge [
-    source 58
-    target 61
-    weight 0
-  ]
-  edge [
-    source 58
-    target 62
-    weight 0
-  ]
-  edge [
-    source 58
-    target 63
-    weight 0
-  ]
-  edge [
-    source 58
-    target 64
-    weight 0
-  ]
-  edge [
-    source 58
-    target 65
-    weight 0
-  ]
-  edge [
-    source 58
-    target 66
-    weight 0
-  ]
-  edge [
-    source 58
-    target 67
-    weight 0
-  ]
-  edge [
-    source 58
-    target 68
-    weight 0
-  ]
-  edge [
-    source 58
-    target 69
-    weight 0
-  ]
-  edge [
-    source 58
-    target 70
-    weight 0
-  ]
-  edge [
-    source 58
-    target 71
-    weight 0
-  ]
-  edge [
-    source 58
-    target 72
-    weight 0
-  ]
-  edge [
-    source 58
-    target 73
-    weight 0
-  ]
-  edge [
-    source 58
-    target 74
-    weight 0
-  ]
-  edge [
-    source 58
-    target 75
-    weight 0
-  ]
-  edge [
-    source 58
-    target 76
-    weight 0
-  ]
-  edge [
-    source 58
-    target 77
-    weight 0
-  ]
-  edge [
-    source 58
-    target 78
-    weight 0
-  ]
-  edge [
-    source 58
-    target 79
-    weight 0
-  ]
-  edge [
-    source 58
-    target 80
-    weight 0
-  ]
-  edge [
-    source 58
-    target 81
-    weight 0
-  ]
-  edge [
-    source 58
-    target 82
-    weight 0
-  ]
-  edge [
-    source 58
-    target 83
-    weight 0
-  ]
-  edge [
-    source 58
-    target 84
-    weight -0.1
-  ]
-  edge [
-    source 58
-    target 85
-    weight 0
-  ]
-  edge [
-    source 58
-    target 86
-    weight 0
-  ]
-  edge [
-    source 58
-    target 87
-    weight 0
-  ]
-  edge [
-    source 58
-    target 88
-    weight 0
-  ]
-  edge [
-    source 58
-    target 89
-    weight 0
-  ]
-  edge [
-    source 58
-    target 90
-    weight 0
-  ]
-  edge [
-    source 58
-    target 91
-    weight 0
-  ]
-  edge [
-    source 58
-    target 92
-    weight 0
-  ]
-  edge [
-    source 58
-    target 93
-    weight 0
-  ]
-  edge [
-    source 58
-    target 94
-    weight 0
-  ]
-  edge [
-    source 58
-    target 95
-    weight 0
-  ]
-  edge [
-    source 58
-    target 96
-    weight 0
-  ]
-  edge [
-    source 58
-    target 97
-    weight 0
-  ]
-  edge [
-    source 58
-    target 98
-    weight 0
-  ]
-  edge [
-    source 58
-    target 99
-    weight 0
-  ]
-  edge [
-    source 58
-    target 100
-    weight 0
-  ]
-  edge [
-    source 59
-    target 60
-    weight 0
-  ]
-  edge [
-    source 59
-    target 61
-    weight 0
-  ]
-  edge [
-    source 59
-    target 62
-    weight 0
-  ]
-  edge [
-    source 59
-    target 63
-    weight 0
-  ]
-  edge [
-    source 59
-    target 64
-    weight 0
-  ]
-  edge [
-    source 59
-    target 65
-    weight 0
-  ]
-  edge [
-    source 59
-    target 66
-    weight 0
-  ]
-  edge [
-    source 59
-    target 67
-    weight 0
-  ]
-  edge [
-    source 59
-    target 68
-    weight 0
-  ]
-  edge [
-    source 59
-    target 69
-    weight 0
-  ]
-  edge [
-    source 59
-    target 70
-    weight 0
-  ]
-  edge [
-    source 59
-    target 71
-    weight 0
-  ]
-  edge [
-    source 59
-    target 72
-    weight 0
-  ]
-  edge [
-    source 59
-    target 73
-    weight 0
-  ]
-  edge [
-    source 59
-    target 74
-    weight 0
-  ]
-  edge [
-    source 59
-    target 75
-    weight 0
-  ]
-  edge [
-    source 59
-    target 76
-    weight 0
-  ]
-  edge [
-    source 59
-    target 77
-    weight 0
-  ]
-  edge [
-    source 59
-    target 78
-    weight 0
-  ]
-  edge [
-    source 59
-    target 79
-    weight 0
-  ]
-  edge [
-    source 59
-    target 80
-    weight 0
-  ]
-  edge [
-    source 59
-    target 81
-    weight 0
-  ]
-  edge [
-    source 59
-    target 82
-    weight 0
-  ]
-  edge [
-    source 59
-    target 83
-    weight 0
-  ]
-  edge [
-    source 59
-    target 84
-    weight 0
-  ]
-  edge [
-    source 59
-    target 85
-    weight 0
-  ]
-  edge [
-    source 59
-    target 86
-    weight 0
-  ]
-  edge [
-    source 59
-    target 87
-    weight 0
-  ]
-  edge [
-    source 59
-    target 88
-    weight 0
-  ]
-  edge [
-    source 59
-    target 89
-    weight 0
-  ]
-  edge [
-    source 59
-    target 90
-    weight 0
-  ]
-  edge [
-    source 59
-    target 91
-    weight 0
-  ]
-  edge [
-    source 59
-    target 92
-    weight 0
-  ]
-  edge [
-    source 59
-    target 93
-    weight 0
-  ]
-  edge [
-    source 59
-    target 94
-    weight 0
-  ]
-  edge [
-    source 59
-    target 95
-    weight 0
-  ]
-  edge [
-    source 59
-    target 96
-    weight 0
-  ]
-  edge [
-    source 59
-    target 97
-    weight 0
-  ]
-  edge [
-    source 59
-    target 98
-    weight 0
-  ]
-  edge [
-    source 59
-    target 99
-    weight 0
-  ]
-  edge [
-    source 59
-    target 100
-    weight 0
-  ]
-  edge [
-    source 60
-    target 61
-    weight 0
-  ]
-  edge [
-    source 60
-    target 62
-    weight 0
-  ]
-  edge [
-    source 60
-    target 63
-    weight 0
-  ]
-  edge [
-    source 60
-    target 64
-    weight 0
-  ]
-  edge [
-    source 60
-    target 65
-    weight 0
-  ]
-  edge [
-    source 60
-    target 66
-    weight 0
-  ]
-  edge [
-    source 60
-    target 67
-    weight 0
-  ]
-  edge [
-    source 60
-    target 68
-    weight 0
-  ]
-  edge [
-    source 60
-    target 69
-    weight 0
-  ]
-  edge [
-    source 60
-    target 70
-    weight 0
-  ]
-  edge [
-    source 60
-    target 71
-    weight 0
-  ]
-  edge [
-    source 60
-    target 72
-    weight 0
-  ]
-  edge [
-    source 60
-    target 73
-    weight 0
-  ]
-  edge [
-    source 60
-    target 74
-    weight 0
-  ]
-  edge [
-    source 60
-    target 75
-    weight 0
-  ]
-  edge [
-    source 60
-    target 76
-    weight 0
-  ]
-  edge [
-    source 60
-    target 77
-    weight 0
-  ]
-  edge [
-    source 60
-    target 78
-    weight 0
-  ]
-  edge [
-    source 60
-    target 79
-    weight 0
-  ]
-  edge [
-    source 60
-    target 80
-    weight 0
-  ]
-  edge [
-    source 60
-    target 81
-    weight 0
-  ]
-  edge [
-    source 60
-    target 82
-    weight 0
-  ]
-  edge [
-    source 60
-    target 83
-    weight 0
-  ]
-  edge [
-    source 60
-    target 84
-    weight 0
-  ]
-  edge [
-    source 60
-    target 85
-    weight 0
-  ]
-  edge [
-    source 60
-    target 86
-    weight -0.1
-  ]
-  edge [
-    source 60
-    target 87
-    weight 0
-  ]
-  edge [
-    source 60
-    target 88
-    weight 0
-  ]
-  edge [
-    source 60
-    target 89
-    weight 0
-  ]
-  edge [
-    source 60
-    target 90
-    weight 0
-  ]
-  edge [
-    source 60
-    target 91
-    weight 0
-  ]
-  edge [
-    source 60
-    target 92
-    weight 0
-  ]
-  edge [
-    source 60
-    target 93
-    weight 0
-  ]
-  edge [
-    source 60
-    target 94
-    weight 0
-  ]
-  edge [
-    source 60
-    target 95
-    weight 0
-  ]
-  edge [
-    source 60
-    target 96
-    weight 0
-  ]
-  edge [
-    source 60
-    target 97
-    weight 0
-  ]
-  edge [
-    source 60
-    target 98
-    weight 0
-  ]
-  edge [
-    source 60
-    target 99
-    weight 0
-  ]
-  edge [
-    source 60
-    target 100
-    weight 0
-  ]
-  edge [
-    source 61
-    target 62
-    weight 0
-  ]
-  edge [
-    source 61
-    target 63
-    weight 0
-  ]
-  edge [
-    source 61
-    target 64
-    weight 0
-  ]
-  edge [
-    source 61
-    target 65
-    weight 0
-  ]
-  edge [
-    source 61
-    target 66
-    weight 0
-  ]
-  edge [
-    source 61
-    target 67
-    weight 0
-  ]
-  edge [
-    source 61
-    target 68
-    weight 0
-  ]
-  edge [
-    source 61
-    target 69
-    weight 0
-  ]
-  edge [
-    source 61
-    target 70
-    weight 0
-  ]
-  edge [
-    source 61
-    target 71
-    weight 0
-  ]
-  edge [
-    source 61
-    target 72
-    weight 0
-  ]
-  edge [
-    source 61
-    target 73
-    weight 0
-  ]
-  edge [
-    source 61
-    target 74
-    weight 0
-  ]
-  edge [
-    source 61
-    target 75
-    weight 0
-  ]
-  edge [
-    source 61
-    target 76
-    weight 0
-  ]
-  edge [
-    source 61
-    target 77
-    weight 0
-  ]
-  edge [
-    source 61
-    target 78
-    weight 0
-  ]
-  edge [
-    source 61
-    target 79
-    weight 0
-  ]
-  edge [
-    source 61
-    target 80
-    weight 0
-  ]
-  edge [
-    source 61
-    target 81
-    weight 0
-  ]
-  edge [
-    source 61
-    target 82
-    weight 0
-  ]
-  edge [
-    source 61
-    target 83
-    weight 0
-  ]
-  edge [
-    source 61
-    target 84
-    weight -0.1
-  ]
-  edge [
-    source 61
-    target 85
-    weight 0
-  ]
-  edge [
-    source 61
-    target 86
-    weight 0
-  ]
-  edge [
-    source 61
-    target 87
-    weight 0
-  ]
-  edge [
-    source 61
-    target 88
-    weight 0
-  ]
-  edge [
-    source 61
-    target 89
-    weight 0
-  ]
-  edge [
-    source 61
-    target 90
-    weight 0
-  ]
-  edge [
-    source 61
-    target 91
-    weight 0
-  ]
-  edge [
-    source 61
-    target 92
-    weight 0
-  ]
-  edge [
-    source 61
-    target 93
-    weight 0
-  ]
-  edge [
-    source 61
-    target 94
-    weight 0
-  ]
-  edge [
-    source 61
-    target 95
-    weight 0
-  ]
-  edge [
-    source 61
-    target 96
-    weight 0
-  ]
-  edge [
-    source 61
-    target 97
-    weight 0
-  ]
-  edge [
-    source 61
-    target 98
-    weight 0
-  ]
-  edge [
-    source 61
-    target 99
-    weight 0
-  ]
-  edge [
-    source 61
-    target 100
-    weight 0
-  ]
-  edge [
-    source 62
-    target 63
-    weight 0
-  ]
-  edge [
-    source 62
-    target 64
-    weight 0
-  ]
-  edge [
-    source 62
-    target 65
-    weight 0
-  ]
-  edge [
-    source 62
-    target 66
-    weight 0
-  ]
-  edge [
-    source 62
-    target 67
-    weight 0
-  ]
-  edge [
-    source 62
-    target 68
-    weight 0
-  ]
-  edge [
-    source 62
-    target 69
-    weight 0
-  ]
-  edge [
-    source 62
-    target 70
-    weight 0
-  ]
-  edge [
-    source 62
-    target 71
-    weight 0
-  ]
-  edge [
-    source 62
-    target 72
-    weight 0
-  ]
-  edge [
-    source 62
-    target 73
-    weight 0
-  ]
-  edge [
-    source 62
-    target 74
-    weight 0
-  ]
-  edge [
-    source 62
-    target 75
-    weight 0
-  ]
-  edge [
-    source 62
-    target 76
-    weight 0
-  ]
-  edge [
-    source 62
-    target 77
-    weight 0
-  ]
-  edge [
-    source 62
-    target 78
-    weight 0
-  ]
-  edge [
-    source 62
-    target 79
-    weight 0
-  ]
-  edge [
-    source 62
-    target 80
-    weight 0
-  ]
-  edge [
-    source 62
-    target 81
-    weight 0
-  ]
-  edge [
-    source 62
-    target 82
-    weight 0
-  ]
-  edge [
-    source 62
-    target 83
-    weight 0
-  ]
-  edge [
-    source 62
-    target 84
-    weight 0
-  ]
-  edge [
-    source 62
-    target 85
-    weight 0
-  ]
-  edge [
-    source 62
-    target 86
-    weight 0
-  ]
-  edge [
-    source 62
-    target 87
-    weight 0
-  ]
-  edge [
-    source 62
-    target 88
-    weight 0
-  ]
-  edge [
-    source 62
-    target 89
-    weight 0
-  ]
-  edge [
-    source 62
-    target 90
-    weight 0
-  ]
-  edge [
-    source 62
-    target 91
-    weight 0
-  ]
-  edge [
-    source 62
-    target 92
-    weight 0
-  ]
-  edge [
-    source 62
-    target 93
-    weight 0
-  ]
-  edge [
-    source 62
-    target 94
-    weight 0
-  ]
-  edge [
-    source 62
-    target 95
-    weight 0
-  ]
-  edge [
-    source 62
-    target 96
-    weight 0
-  ]
-  edge [
-    source 62
-    target 97
-    weight 0
-  ]
-  edge [
-    source 62
-    target 98
-    weight 0
-  ]
-  edge [
-    source 62
-    target 99
-    weight 0
-  ]
-  edge [
-    source 62
-    target 100
-    weight 0
-  ]
-  edge [
-    source 63
-    target 64
-    weight 0
-  ]
-  edge [
-    source 63
-    target 65
-    weight 0
-  ]
-  edge [
-    source 63
-    target 66
-    weight 0
-  ]
-  edge [
-    source 63
-    target 67
-    weight 0
-  ]
-  edge [
-    source 63
-    target 68
-    weight 0
-  ]
-  edge [
-    source 63
-    target 69
-    weight 0
-  ]
-  edge [
-    source 63
-    target 70
-    weight 0
-  ]
-  edge [
-    source 63
-    target 71
-    weight 0
-  ]
-  edge [
-    source 63
-    target 72
-    weight 0
-  ]
-  edge [
-    source 63
-    target 73
-    weight 0
-  ]
-  edge [
-    source 63
-    target 74
-    weight 0
-  ]
-  edge [
-    source 63
-    target 75
-    weight 0
-  ]
-  edge [
-    source 63
-    target 76
-    weight 0
-  ]
-  edge [
-    source 63
-    target 77
-    weight 0
-  ]
-  edge [
-    source 63
-    target 78
-    weight 0
-  ]
-  edge [
-    source 63
-    target 79
-    weight 0
-  ]
-  edge [
-    source 63
-    target 80
-    weight 0
-  ]
-  edge [
-    source 63
-    target 81
-    weight 0
-  ]
-  edge [
-    source 63
-    target 82
-    weight 0
-  ]
-  edge [
-    source 63
-    target 83
-    weight 0
-  ]
-  edge [
-    source 63
-    target 84
-    weight 0
-  ]
-  edge [
-    source 63
-    target 85
-    weight 0
-  ]
-  edge [
-    source 63
-    target 86
-    weight 0
-  ]
-  edge [
-    source 63
-    target 87
-    weight 0
-  ]
-  edge [
-    source 63
-    target 88
-    weight 0
-  ]
-  edge [
-    source 63
-    target 89
-    weight 0
-  ]
-  edge [
-    source 63
-    target 90
-    weight 0
-  ]
-  edge [
-    source 63
-    target 91
-    weight 0
-  ]
-  edge [
-    source 63
-    target 92
-    weight 0
-  ]
-  edge [
-    source 63
-    target 93
-    weight 0
-  ]
-  edge [
-    source 63
-    target 94
-    weight 0
-  ]
-  edge [
-    source 63
-    target 95
-    weight 0
-  ]
-  edge [
-    source 63
-    target 96
-    weight 0
-  ]
-  edge [
-    source 63
-    target 97
-    weight 0
-  ]
-  edge [
-    source 63
-    target 98
-    weight 0
-  ]
-  edge [
-    source 63
-    target 99
-    weight 0
-  ]
-  edge [
-    source 63
-    target 100
-    weight 0
-  ]
-  edge [
-    source 64
-    target 65
-    weight 0
-  ]
-  edge [
-    source 64
-    target 66
-    weight 0
-  ]
-  edge [
-    source 64
-    target 67
-    weight 0
-  ]
-  edge [
-    source 64
-    target 68
-    weight 0
-  ]
-  edge [
-    source 64
-    target 69
-    weight 0
-  ]
-  edge [
-    source 64
-    target 70
-    weight 0
-  ]
-  edge [
-    source 64
-    target 71
-    weight 0
-  ]
-  edge [
-    source 64
-    target 72
-    weight 0
-  ]
-  edge [
-    source 64
-    target 73
-    weight 0
-  ]
-  edge [
-    source 64
-    target 74
-    weight 0
-  ]
-  edge [
-    source 64
-    target 75
-    weight 0
-  ]
-  edge [
-    source 64
-    target 76
-    weight 0
-  ]
-  edge [
-    source 64
-    target 77
-    weight 0
-  ]
-  edge [
-    source 64
-    target 78
-    weight 0
-  ]
-  edge [
-    source 64
-    target 79
-    weight 0
-  ]
-  edge [
-    source 64
-    target 80
-    weight 0
-  ]
-  edge [
-    source 64
-    target 81
-    weight 0
-  ]
-  edge [
-    source 64
-    target 82
-    weight 0
-  ]
-  edge [
-    source 64
-    target 83
-    weight 0
-  ]
-  edge [
-    source 64
-    target 84
-    weight 0
-  ]
-  edge [
-    source 64
-    target 85
-    weight 0
-  ]
-  edge [
-    source 64
-    target 86
-    weight 0
-  ]
-  edge [
-    source 64
-    target 87
-    weight 0
-  ]
-  edge [
-    source 64
-    target 88
-    weight 0
-  ]
-  edge [
-    source 64
-    target 89
-    weight 0
-  ]
-  edge [
-    source 64
-    target 90
-    weight 0
-  ]
-  edge [
-    source 64
-    target 91
-    weight 0
-  ]
-  edge [
-    source 64
-    target 92
-    weight 0
-  ]
-  edge [
-    source 64
-    target 93
-    weight 0
-  ]
-  edge [
-    source 64
-    target 94
-    weight 0
-  ]
-  edge [
-    source 64
-    target 95
-    weight 0
-  ]
-  edge [
-    source 64
-    target 96
-    weight 0
-  ]
-  edge [
-    source 64
-    target 97
-    weight 0
-  ]
-  edge [
-    source 64
-    target 98
-    weight 0
-  ]
-  edge [
-    source 64
-    target 99
-    weight 0
-  ]
-  edge [
-    source 64
-    target 100
-    weight 0
-  ]
-  edge [
-    source 65
-    target 66
-    weight 0
-  ]
-  edge [
-    source 65
-    target 67
-    weight 0
-  ]
-  edge [
-    source 65
-    target 68
-    weight 0
-  ]
-  edge [
-    source 65
-    target 69
-    weight 0
-  ]
-  edge [
-    source 65
-    target 70
-    weight 0
-  ]
-  edge [
-    source 65
-    target 71
-    weight 0
-  ]
-  edge [
-    source 65
-    target 72
-    weight 0
-  ]
-  edge [
-    source 65
-    target 73
-    weight 0
-  ]
-  edge [
-    source 65
-    target 74
-    weight 0
-  ]
-  edge [
-    source 65
-    target 75
-    weight 0
-  ]
-  edge [
-    source 65
-    target 76
-    weight 0
-  ]
-  edge [
-    source 65
-    target 77
-    weight 0
-  ]
-  edge [
-    source 65
-    target 78
-    weight 0
-  ]
-  edge [
-    source 65
-    target 79
-    weight 0
-  ]
-  edge [
-    source 65
-    target 80
-    weight 0
-  ]
-  edge [
-    source 65
-    target 81
-    weight 0
-  ]
-  edge [
-    source 65
-    target 82
-    weight 0
-  ]
-  edge [
-    source 65
-    target 83
-    weight 0
-  ]
-  edge [
-    source 65
-    target 84
-    weight 0
-  ]
-  edge [
-    source 65
-    target 85
-    weight -0.1
-  ]
-  edge [
-    source 65
-    target 86
-    weight 0
-  ]
-  edge [
-    source 65
-    target 87
-    weight 0
-  ]
-  edge [
-    source 65
-    target 88
-    weight 0
-  ]
-  edge [
-    source 65
-    target 89
-    weight 0
-  ]
-  edge [
-    source 65
-    target 90
-    weight 0
-  ]
-  edge [
-    source 65
-    target 91
-    weight 0
-  ]
-  edge [
-    source 65
-    target 92
-    weight 0
-  ]
-  edge [
-    source 65
-    target 93
-    weight 0
-  ]
-  edge [
-    source 65
-    target 94
-    weight 0
-  ]
-  edge [
-    source 65
-    target 95
-    weight 0
-  ]
-  edge [
-    source 65
-    target 96
-    weight 0
-  ]
-  edge [
-    source 65
-    target 97
-    weight 0.1
-  ]
-  edge [
-    source 65
-    target 98
-    weight 0.1
-  ]
-  edge [
-    source 65
-    target 99
-    weight 0
-  ]
-  edge [
-    source 65
-    target 100
-    weight 0
-  ]
-  edge [
-    source 66
-    target 67
-    weight 0
-  ]
-  edge [
-    source 66
-    target 68
-    weight 0
-  ]
-  edge [
-    source 66
-    target 69
-    weight 0
-  ]
-  edge [
-    source 66
-    target 70
-    weight 0
-  ]
-  edge [
-    source 66
-    target 71
-    weight 0
-  ]
-  edge [
-    source 66
-    target 72
-    weight 0
-  ]
-  edge [
-    source 66
-    target 73
-    weight 0
-  ]
-  edge [
-    source 66
-    target 74
-    weight 0
-  ]
-  edge [
-    source 66
-    target 75
-    weight 0
-  ]
-  edge [
-    source 66
-    target 76
-    weight 0
-  ]
-  edge [
-    source 66
-    target 77
-    weight 0
-  ]
-  edge [
-    source 66
-    target 78
-    weight 0
-  ]
-  edge [
-    source 66
-    target 79
-    weight 0
-  ]
-  edge [
-    source 66
-    target 80
-    weight 0
-  ]
-  edge [
-    source 66
-    target 81
-    weight 0
-  ]
-  edge [
-    source 66
-    target 82
-    weight 0
-  ]
-  edge [
-    source 66
-    target 83
-    weight 0
-  ]
-  edge [
-    source 66
-    target 84
-    weight 0
-  ]
-  edge [
-    source 66
-    target 85
-    weight 0
-  ]
-  edge [
-    source 66
-    target 86
-    weight 0
-  ]
-  edge [
-    source 66
-    target 87
-    weight 0
-  ]
-  edge [
-    source 66
-    target 88
-    weight 0
-  ]
-  edge [
-    source 66
-    target 89
-    weight 0
-  ]
-  edge [
-    source 66
-    target 90
-    weight 0
-  ]
-  edge [
-    source 66
-    target 91
-    weight 0
-  ]
-  edge [
-    source 66
-    target 92
-    weight 0
-  ]
-  edge [
-    source 66
-    target 93
-    weight 0
-  ]
-  edge [
-    source 66
-    target 94
-    weight 0
-  ]
-  edge [
-    source 66
-    target 95
-    weight 0
-  ]
-  edge [
-    source 66
-    target 96
-    weight 0
-  ]
-  edge [
-    source 66
-    target 97
-    weight 0
-  ]
-  edge [
-    source 66
-    target 98
-    weight 0
-  ]
-  edge [
-    source 66
-    target 99
-    weight 0
-  ]
-  edge [
-    source 66
-    target 100
-    weight 0
-  ]
-  edge [
-    source 67
-    target 68
-    weight 0
-  ]
-  edge [
-    source 67
-    target 69
-    weight 0
-  ]
-  edge [
-    source 67
-    target 70
-    weight 0
-  ]
-  edge [
-    source 67
-    target 71
-    weight 0
-  ]
-  edge [
-    source 67
-    target 72
-    weight 0
-  ]
-  edge [
-    source 67
-    target 73
-    weight 0
-  ]
-  edge [
-    source 67
-    target 74
-    weight 0
-  ]
-  edge [
-    source 67
-    target 75
-    weight 0
-  ]
-  edge [
-    source 67
-    target 76
-    weight 0
-  ]
-  edge [
-    source 67
-    target 77
-    weight 0
-  ]
-  edge [
-    source 67
-    target 78
-    weight 0
-  ]
-  edge [
-    source 67
-    target 79
-    weight 0
-  ]
-  edge [
-    source 67
-    target 80
-    weight 0
-  ]
-  edge [
-    source 67
-    target 81
-    weight 0
-  ]
-  edge [
-    source 67
-    target 82
-    weight 0
-  ]
-  edge [
-    source 67
-    target 83
-    weight 0
-  ]
-  edge [
-    source 67
-    target 84
-    weight 0
-  ]
-  edge [
-    source 67
-    target 85
-    weight 0
-  ]
-  edge [
-    source 67
-    target 86
-    weight 0
-  ]
-  edge [
-    source 67
-    target 87
-    weight 0
-  ]
-  edge [
-    source 67
-    target 88
-    weight 0
-  ]
-  edge [
-    source 67
-    target 89
-    weight 0
-  ]
-  edge [
-    source 67
-    target 90
-    weight -0.1
-  ]
-  edge [
-    source 67
-    target 91
-    weight 0
-  ]
-  edge [
-    source 67
-    target 92
-    weight 0
-  ]
-  edge [
-    source 67
-    target 93
-    weight 0
-  ]
-  edge [
-    source 67
-    target 94
-    weight 0
-  ]
-  edge [
-    source 67
-    target 95
-    weight 0
-  ]
-  edge [
-    source 67
-    target 96
-    weight 0
-  ]
-  edge [
-    source 67
-    target 97
-    weight 0
-  ]
-  edge [
-    source 67
-    target 98
-    weight 0
-  ]
-  edge [
-    source 67
-    target 99
-    weight 0
-  ]
-  edge [
-    source 67
-    target 100
-    weight 0
-  ]
-  edge [
-    source 68
-    target 69
-    weight 0
-  ]
-  edge [
-    source 68
-    target 70
-    weight 0
-  ]
-  edge [
-    source 68
-    target 71
-    weight 0
-  ]
-  edge [
-    source 68
-    target 72
-    weight 0
-  ]
-  edge [
-    source 68
-    target 73
-    weight 0
-  ]
-  edge [
-    source 68
-    target 74
-    weight 0
-  ]
-  edge [
-    source 68
-    target 75
-    weight 0
-  ]
-  edge [
-    source 68
-    target 76
-    weight 0
-  ]
-  edge [
-    source 68
-    target 77
-    weight 0
-  ]
-  edge [
-    source 68
-    target 78
-    weight 0
-  ]
-  edge [
-    source 68
-    target 79
-    weight 0
-  ]
-  edge [
-    source 68
-    target 80
-    weight 0
-  ]
-  edge [
-    source 68
-    target 81
-    weight 0
-  ]
-  edge [
-    source 68
-    target 82
-    weight 0
-  ]
-  edge [
-    source 68
-    target 83
-    weight 0
-  ]
-  edge [
-    source 68
-    target 84
-    weight 0
-  ]
-  edge [
-    source 68
-    target 85
-    weight 0
-  ]
-  edge [
-    source 68
-    target 86
-    weight 0
-  ]
-  edge [
-    source 68
-    target 87
-    weight -0.1
-  ]
-  edge [
-    source 68
-    target 88
-    weight 0
-  ]
-  edge [
-    source 68
-    target 89
-    weight 0
-  ]
-  edge [
-    source 68
-    target 90
-    weight 0
-  ]
-  edge [
-    source 68
-    target 91
-    weight 0
-  ]
-  edge [
-    source 68
-    target 92
-    weight 0
-  ]
-  edge [
-    source 68
-    target 93
-    weight 0
-  ]
-  edge [
-    source 68
-    target 94
-    weight 0
-  ]
-  edge [
-    source 68
-    target 95
-    weight 0
-  ]
-  edge [
-    source 68
-    target 96
-    weight 0
-  ]
-  edge [
-    source 68
-    target 97
-    weight 0.1
-  ]
-  edge [
-    source 68
-    target 98
-    weight 0
-  ]
-  edge [
-    source 68
-    target 99
-    weight 0
-  ]
-  edge [
-    source 68
-    target 100
-    weight 0
-  ]
-  edge [
-    source 69
-    target 70
-    weight 0
-  ]
-  edge [
-    source 69
-    target 71
-    weight 0
-  ]
-  edge [
-    source 69
-    target 72
-    weight 0
-  ]
-  edge [
-    source 69
-    target 73
-    weight 0
-  ]
-  edge [
-    source 69
-    target 74
-    weight 0
-  ]
-  edge [
-    source 69
-    target 75
-    weight 0
-  ]
-  edge [
-    source 69
-    target 76
-    weight 0
-  ]
-  edge [
-    source 69
-    target 77
-    weight 0
-  ]
-  edge [
-    source 69
-    target 78
-    weight 0
-  ]
-  edge [
-    source 69
-    target 79
-    weight 0
-  ]
-  edge [
-    source 69
-    target 80
-    weight 0
-  ]
-  edge [
-    source 69
-    target 81
-    weight 0
-  ]
-  edge [
-    source 69
-    target 82
-    weight 0
-  ]
-  edge [
-    source 69
-    target 83
-    weight 0
-  ]
-  edge [
-    source 69
-    target 84
-    weight 0
-  ]
-  edge [
-    source 69
-    target 85
-    weight 0
-  ]
-  edge [
-    source 69
-    target 86
-    weight 0
-  ]
-  edge [
-    source 69
-    target 87
-    weight 0
-  ]
-  edge [
-    source 69
-    target 88
-    weight 0
-  ]
-  edge [
-    source 69
-    target 89
-    weight 0
-  ]
-  edge [
-    source 69
-    target 90
-    weight 0
-  ]
-  edge [
-    source 69
-    target 91
-    weight 0
-  ]
-  edge [
-    source 69
-    target 92
-    weight 0
-  ]
-  edge [
-    source 69
-    target 93
-    weight 0
-  ]
-  edge [
-    source 69
-    target 94
-    weight 0
-  ]
-  edge [
-    source 69
-    target 95
-    weight 0
-  ]
-  edge [
-    source 69
-    target 96
-    weight 0
-  ]
-  edge [
-    source 69
-    target 97
-    weight 0
-  ]
-  edge [
-    source 69
-    target 98
-    weight 0
-  ]
-  edge [
-    source 69
-    target 99
-    weight 0
-  ]
-  edge [
-    source 69
-    target 100
-    weight 0
-  ]
-  edge [
-    source 70
-    target 71
-    weight 0
-  ]
-  edge [
-    source 70
-    target 72
-    weight 0
-  ]
-  edge [
-    source 70
-    target 73
-    weight 0
-  ]
-  edge [
-    source 70
-    target 74
-    weight 0
-  ]
-  edge [
-    source 70
-    target 75
-    weight 0
-  ]
-  edge [
-    source 70
-    target 76
-    weight 0
-  ]
-  edge [
-    source 70
-    target 77
-    weight 0
-  ]
-  edge [
-    source 70
-    target 78
-    weight 0
-  ]
-  edge [
-    source 70
-    target 79
-    weight 0
-  ]
-  edge [
-    source 70
-    target 80
-    weight 0
-  ]
-  edge [
-    source 70
-    target 81
-    weight 0
-  ]
-  edge [
-    source 70
-    target 82
-    weight 0
-  ]
-  edge [
-    source 70
-    target 83
-    weight 0
-  ]
-  edge [
-    source 70
-    target 84
-    weight 0
-  ]
-  edge [
-    source 70
-    target 85
-    weight 0
-  ]
-  edge [
-    source 70
-    target 86
-    weight 0
-  ]
-  edge [
-    source 70
-    target 87
-    weight 0
-  ]
-  edge [
-    source 70
-    target 88
-    weight 0
-  ]
-  edge [
-    source 70
-    target 89
-    weight 0
-  ]
-  edge [
-    source 70
-    target 90
-    weight 0
-  ]
-  edge [
-    source 70
-    target 91
-    weight 0
-  ]
-  edge [
-    source 70
-    target 92
-    weight 0
-  ]
-  edge [
-    source 70
-    target 93
-    weight 0
-  ]
-  edge [
-    source 70
-    target 94
-    weight 0
-  ]
-  edge [
-    source 70
-    target 95
-    weight 0
-  ]
-  edge [
-    source 70
-    target 96
-    weight 0
-  ]
-  edge [
-    source 70
-    target 97
-    weight 0
-  ]
-  edge [
-    source 70
-    target 98
-    weight 0
-  ]
-  edge [
-    source 70
-    target 99
-    weight 0
-  ]
-  edge [
-    source 70
-    target 100
-    weight 0
-  ]
-  edge [
-    source 71
-    target 72
-    weight 0
-  ]
-  edge [
-    source 71
-    target 73
-    weight 0
-  ]
-  edge [
-    source 71
-    target 74
-    weight 0
-  ]
-  edge [
-    source 71
-    target 75
-    weight 0
-  ]
-  edge [
-    source 71
-    target 76
-    weight 0
-  ]
-  edge [
-    source 71
-    target 77
-    weight 0
-  ]
-  edge [
-    source 71
-    target 78
-    weight 0
-  ]
-  edge [
-    source 71
-    target 79
-    weight 0
-  ]
-  edge [
-    source 71
-    target 80
-    weight 0
-  ]
-  edge [
-    source 71
-    target 81
-    weight 0
-  ]
-  edge [
-    source 71
-    target 82
-    weight 0
-  ]
-  edge [
-    source 71
-    target 83
-    weight 0
-  ]
-  edge [
-    source 71
-    target 84
-    weight 0
-  ]
-  edge [
-    source 71
-    target 85
-    weight 0
-  ]
-  edge [
-    source 71
-    target 86
-    weight 0
-  ]
-  edge [
-    source 71
-    target 87
-    weight 0
-  ]
-  edge [
-    source 71
-    target 88
-    weight 0
-  ]
-  edge [
-    source 71
-    target 89
-    weight 0
-  ]
-  edge [
-    source 71
-    target 90
-    weight 0
-  ]
-  edge [
-    source 71
-    target 91
-    weight 0
-  ]
-  edge [
-    source 71
-    target 92
-    weight 0
-  ]
-  edge [
-    source 71
-    target 93
-    weight 0
-  ]
-  edge [
-    source 71
-    target 94
-    weight 0
-  ]
-  edge [
-    source 71
-    target 95
-    weight 0
-  ]
-  edge [
-    source 71
-    target 96
-    weight 0
-  ]
-  edge [
-    source 71
-    target 97
-    weight 0
-  ]
-  edge [
-    source 71
-    target 98
-    weight 0
-  ]
-  edge [
-    source 71
-    target 99
-    weight 0
-  ]
-  edge [
-    source 71
-    target 100
-    weight 0
-  ]
-  edge [
-    source 72
-    target 73
-    weight 0
-  ]
-  edge [
-    source 72
-    target 74
-    weight 0
-  ]
-  edge [
-    source 72
-    target 75
-    weight 0
-  ]
-  edge [
-    source 72
-    target 76
-    weight 0
-  ]
-  edge [
-    source 72
-    target 77
-    weight 0
-  ]
-  edge [
-    source 72
-    target 78
-    weight 0
-  ]
-  edge [
-    source 72
-    target 79
-    weight 0
-  ]
-  edge [
-    source 72
-    target 80
-    weight 0
-  ]
-  edge [
-    source 72
-    target 81
-    weight 0
-  ]
-  edge [
-    source 72
-    target 82
-    weight 0
-  ]
-  edge [
-    source 72
-    target 83
-    weight 0
-  ]
-  edge [
-    source 72
-    target 84
-    weight 0
-  ]
-  edge [
-    source 72
-    target 85
-    weight 0
-  ]
-  edge [
-    source 72
-    target 86
-    weight 0
-  ]
-  edge [
-    source 72
-    target 87
-    weight 0
-  ]
-  edge [
-    source 72
-    target 88
-    weight 0
-  ]
-  edge [
-    source 72
-    target 89
-    weight 0
-  ]
-  edge [
-    source 72
-    target 90
-    weight 0
-  ]
-  edge [
-    source 72
-    target 91
-    weight 0
-  ]
-  edge [
-    source 72
-    target 92
-    weight 0
-  ]
-  edge [
-    source 72
-    target 93
-    weight 0
-  ]
-  edge [
-    source 72
-    target 94
-    weight 0
-  ]
-  edge [
-    source 72
-    target 95
-    weight 0
-  ]
-  edge [
-    source 72
-    target 96
-    weight 0
-  ]
-  edge [
-    source 72
-    target 97
-    weight 0
-  ]
-  edge [
-    source 72
-    target 98
-    weight 0
-  ]
-  edge [
-    source 72
-    target 99
-    weight 0
-  ]
-  edge [
-    source 72
-    target 100
-    weight 0
-  ]
-  edge [
-    source 73
-    target 74
-    weight 0
-  ]
-  edge [
-    source 73
-    target 75
-    weight 0
-  ]
-  edge [
-    source 73
-    target 76
-    weight 0
-  ]
-  edge [
-    source 73
-    target 77
-    weight 0
-  ]
-  edge [
-    source 73
-    target 78
-    weight 0
-  ]
-  edge [
-    source 73
-    target 79
-    weight 0
-  ]
-  edge [
-    source 73
-    target 80
-    weight 0
-  ]
-  edge [
-    source 73
-    target 81
-    weight 0
-  ]
-  edge [
-    source 73
-    target 82
-    weight 0
-  ]
-  edge [
-    source 73
-    target 83
-    weight 0
-  ]
-  edge [
-    source 73
-    target 84
-    weight 0
-  ]
-  edge [
-    source 73
-    target 85
-    weight 0
-  ]
-  edge [
-    source 73
-    target 86
-    weight 0
-  ]
-  edge [
-    source 73
-    target 87
-    weight 0
-  ]
-  edge [
-    source 73
-    target 88
-    weight 0
-  ]
-  edge [
-    source 73
-    target 89
-    weight 0
-  ]
-  edge [
-    source 73
-    target 90
-    weight 0
-  ]
-  edge [
-    source 73
-    target 91
-    weight 0
-  ]
-  edge [
-    source 73
-    target 92
-    weight 0
-  ]
-  edge [
-    source 73
-    target 93
-    weight 0
-  ]
-  edge [
-    source 73
-    target 94
-    weight 0
-  ]
-  edge [
-    source 73
-    target 95
-    weight 0
-  ]
-  edge [
-    source 73
-    target 96
-    weight 0
-  ]
-  edge [
-    source 73
-    target 97
-    weight 0
-  ]
-  edge [
-    source 73
-    target 98
-    weight 0
-  ]
-  edge [
-    source 73
-    target 99
-    weight 0
-  ]
-  edge [
-    source 73
-    target 100
-    weight 0
-  ]
-  edge [
-    source 74
-    target 75
-    weight 0
-  ]
-  edge [
-    source 74
-    target 76
-    weight 0
-  ]
-  edge [
-    source 74
-    target 77
-    weight 0
-  ]
-  edge [
-    source 74
-    target 78
-    weight 0
-  ]
-  edge [
-    source 74
-    target 79
-    weight 0
-  ]
-  edge [
-    source 74
-    target 80
-    weight 0
-  ]
-  edge [
-    source 74
-    target 81
-    weight 0
-  ]
-  edge [
-    source 74
-    target 82
-    weight 0
-  ]
-  edge [
-    source 74
-    target 83
-    weight 0
-  ]
-  edge [
-    source 74
-    target 84
-    weight 0
-  ]
-  edge [
-    source 74
-    target 85
-    weight 0
-  ]
-  edge [
-    source 74
-    target 86
-    weight 0
-  ]
-  edge [
-    source 74
-    target 87
-    weight 0
-  ]
-  edge [
-    source 74
-    target 88
-    weight 0
-  ]
-  edge [
-    source 74
-    target 89
-    weight 0
-  ]
-  edge [
-    source 74
-    target 90
-    weight 0
-  ]
-  edge [
-    source 74
-    target 91
-    weight 0
-  ]
-  edge [
-    source 74
-    target 92
-    weight 0
-  ]
-  edge [
-    source 74
-    target 93
-    weight 0
-  ]
-  edge [
-    source 74
-    target 94
-    weight 0.1
-  ]
-  edge [
-    source 74
-    target 95
-    weight 0
-  ]
-  edge [
-    source 74
-    target 96
-    weight 0
-  ]
-  edge [
-    source 74
-    target 97
-    weight 0
-  ]
-  edge [
-    source 74
-    target 98
-    weight 0
-  ]
-  edge [
-    source 74
-    target 99
-    weight 0
-  ]
-  edge [
-    source 74
-    target 100
-    weight 0
-  ]
-  edge [
-    source 75
-    target 76
-    weight 0
-  ]
-  edge [
-    source 75
-    target 77
-    weight 0
-  ]
-  edge [
-    source 75
-    target 78
-    weight 0
-  ]
-  edge [
-    source 75
-    target 79
-    weight 0
-  ]
-  edge [
-    source 75
-    target 80
-    weight 0
-  ]
-  edge [
-    source 75
-    target 81
-    weight 0
-  ]
-  edge [
-    source 75
-    target 82
-    weight 0
-  ]
-  edge [
-    source 75
-    target 83
-    weight 0
-  ]
-  edge [
-    source 75
-    target 84
-    weight 0
-  ]
-  edge [
-    source 75
-    target 85
-    weight 0
-  ]
-  edge [
-    source 75
-    target 86
-    weight 0
-  ]
-  edge [
-    source 75
-    target 87
-    weight 0
-  ]
-  edge [
-    source 75
-    target 88
-    weight 0
-  ]
-  edge [
-    source 75
-    target 89
-    weight 0
-  ]
-  edge [
-    source 75
-    target 90
-    weight 0
-  ]
-  edge [
-    source 75
-    target 91
-    weight 0
-  ]
-  edge [
-    source 75
-    target 92
-    weight 0
-  ]
-  edge [
-    source 75
-    target 93
-    weight 0
-  ]
-  edge [
-    source 75
-    target 94
-    weight 0
-  ]
-  edge [
-    source 75
-    target 95
-    weight 0
-  ]
-  edge [
-    source 75
-    target 96
-    weight 0
-  ]
-  edge [
-    source 75
-    target 97
-    weight 0
-  ]
-  edge [
-    source 75
-    target 98
-    weight 0
-  ]
-  edge [
-    source 75
-    target 99
-    weight 0
-  ]
-  edge [
-    source 75
-    target 100
-    weight 0
-  ]
-  edge [
-    source 76
-    target 77
-    weight 0
-  ]
-  edge [
-    source 76
-    target 78
-    weight 0
-  ]
-  edge [
-    source 76
-    target 79
-    weight 0
-  ]
-  edge [
-    source 76
-    target 80
-    weight 0
-  ]
-  edge [
-    source 76
-    target 81
-    weight 0
-  ]
-  edge [
-    source 76
-    target 82
-    weight 0
-  ]
-  edge [
-    source 76
-    target 83
-    weight 0
-  ]
-  edge [
-    source 76
-    target 84
-    weight 0
-  ]
-  edge [
-    source 76
-    target 85
-    weight 0
-  ]
-  edge [
-    source 76
-    target 86
-    weight 0
-  ]
-  edge [
-    source 76
-    target 87
-    weight 0
-  ]
-  edge [
-    source 76
-    target 88
-    weight 0
-  ]
-  edge [
-    source 76
-    target 89
-    weight 0
-  ]
-  edge [
-    source 76
-    target 90
-    weight 0
-  ]
-  edge [
-    source 76
-    target 91
-    weight 0
-  ]
-  edge [
-    source 76
-    target 92
-    weight 0
-  ]
-  edge [
-    source 76
-    target 93
-    weight 0
-  ]
-  edge [
-    source 76
-    target 94
-    weight 0
-  ]
-  edge [
-    source 76
-    target 95
-    weight 0
-  ]
-  edge [
-    source 76
-    target 96
-    weight 0
-  ]
-  edge [
-    source 76
-    target 97
-    weight 0
-  ]
-  edge [
-    source 76
-    target 98
-    weight 0
-  ]
-  edge [
-    source 76
-    target 99
-    weight 0
-  ]
-  edge [
-    source 76
-    target 100
-    weight 0
-  ]
-  edge [
-    source 77
-    target 78
-    weight 0
-  ]
-  edge [
-    source 77
-    target 79
-    weight 0
-  ]
-  edge [
-    source 77
-    target 80
-    weight 0
-  ]
-  edge [
-    source 77
-    target 81
-    weight 0
-  ]
-  edge [
-    source 77
-    target 82
-    weight 0
-  ]
-  edge [
-    source 77
-    target 83
-    weight 0
-  ]
-  edge [
-    source 77
-    target 84
-    weight 0
-  ]
-  edge [
-    source 77
-    target 85
-    weight 0
-  ]
-  edge [
-    source 77
-    target 86
-    weight 0
-  ]
-  edge [
-    source 77
-    target 87
-    weight 0
-  ]
-  edge [
-    source 77
-    target 88
-    weight 0
-  ]
-  edge [
-    source 77
-    target 89
-    weight 0
-  ]
-  edge [
-    source 77
-    target 90
-    weight 0
-  ]
-  edge [
-    source 77
-    target 91
-    weight 0
-  ]
-  edge [
-    source 77
-    target 92
-    weight 0
-  ]
-  edge [
-    source 77
-    target 93
-    weight 0
-  ]
-  edge [
-    source 77
-    target 94
-    weight 0
-  ]
-  edge [
-    source 77
-    target 95
-    weight 0
-  ]
-  edge [
-    source 77
-    target 96
-    weight 0
-  ]
-  edge [
-    source 77
-    target 97
-    weight 0
-  ]
-  edge [
-    source 77
-    target 98
-    weight 0
-  ]
-  edge [
-    source 77
-    target 99
-    weight 0
-  ]
-  edge [
-    source 77
-    target 100
-    weight 0
-  ]
-  edge [
-    source 78
-    target 79
-    weight 0
-  ]
-  edge [
-    source 78
-    target 80
-    weight 0
-  ]
-  edge [
-    source 78
-    target 81
-    weight 0
-  ]
-  edge [
-    source 78
-    target 82
-    weight 0
-  ]
-  edge [
-    source 78
-    target 83
-    weight 0
-  ]
-  edge [
-    source 78
-    target 84
-    weight 0
-  ]
-  edge [
-    source 78
-    target 85
-    weight 0
-  ]
-  edge [
-    source 78
-    target 86
-    weight 0
-  ]
-  edge [
-    source 78
-    target 87
-    weight 0
-  ]
-  edge [
-    source 78
-    target 88
-    weight 0
-  ]
-  edge [
-    source 78
-    target 89
-    weight 0
-  ]
-  edge [
-    source 78
-    target 90
-    weight 0
-  ]
-  edge [
-    source 78
-    target 91
-    weight 0
-  ]
-  edge [
-    source 78
-    target 92
-    weight 0
-  ]
-  edge [
-    source 78
-    target 93
-    weight 0
-  ]
-  edge [
-    source 78
-    target 94
-    weight 0
-  ]
-  edge [
-    source 78
-    target 95
-    weight 0
-  ]
-  edge [
-    source 78
-    target 96
-    weight 0
-  ]
-  edge [
-    source 78
-    target 97
-    weight 0
-  ]
-  edge [
-    source 78
-    target 98
-    weight 0
-  ]
-  edge [
-    source 78
-    target 99
-    weight 0
-  ]
-  edge [
-    source 78
-    target 100
-    weight 0
-  ]
-  edge [
-    source 79
-    target 80
-    weight 0
-  ]
-  edge [
-    source 79
-    target 81
-    weight -0.1
-  ]
-  edge [
-    source 79
-    target 82
-    weight 0
-  ]
-  edge [
-    source 79
-    target 83
-    weight 0
-  ]
-  edge [
-    source 79
-    target 84
-    weight 0
-  ]
-  edge [
-    source 79
-    target 85
-    weight 0
-  ]
-  edge [
-    source 79
-    target 86
-    weight 0
-  ]
-  edge [
-    source 79
-    target 87
-    weight 0
-  ]
-  edge [
-    source 79
-    target 88
-    weight 0
-  ]
-  edge [
-    source 79
-    target 89
-    weight 0
-  ]
-  edge [
-    source 79
-    target 90
-    weight 0
-  ]
-  edge [
-    source 79
-    target 91
-    weight 0
-  ]
-  edge [
-    source 79
-    target 92
-    weight 0
-  ]
-  edge [
-    source 79
-    target 93
-    weight 0
-  ]
-  edge [
-    source 79
-    target 94
-    weight 0
-  ]
-  edge [
-    source 79
-    target 95
-    weight 0
-  ]
-  edge [
-    source 79
-    target 96
-    weight 0
-  ]
-  edge [
-    source 79
-    target 97
-    weight 0
-  ]
-  edge [
-    source 79
-    target 98
-    weight 0
-  ]
-  edge [
-    source 79
-    target 99
-    weight 0
-  ]
-  edge [
-    source 79
-    target 100
-    weight 0
-  ]
-  edge [
-    source 80
-    target 81
-    weight 0
-  ]
-  edge [
-    source 80
-    target 82
-    weight 0
-  ]
-  edge [
-    source 80
-    target 83
-    weight 0
-  ]
-  edge [
-    source 80
-    target 84
-    weight 0
-  ]
-  edge [
-    source 80
-    target 85
-    weight 0
-  ]
-  edge [
-    source 80
-    target 86
-    weight 0
-  ]
-  edge [
-    source 80
-    target 87
-    weight 0
-  ]
-  edge [
-    source 80
-    target 88
-    weight 0
-  ]
-  edge [
-    source 80
-    target 89
-    weight 0
-  ]
-  edge [
-    source 80
-    target 90
-    weight 0
-  ]
-  edge [
-    source 80
-    target 91
-    weight 0
-  ]
-  edge [
-    source 80
-    target 92
-    weight 0
-  ]
-  edge [
-    source 80
-    target 93
-    weight 0
-  ]
-  edge [
-    source 80
-    target 94
-    weight 0
-  ]
-  edge [
-    source 80
-    target 95
-    weight 0
-  ]
-  edge [
-    source 80
-    target 96
-    weight 0
-  ]
-  edge [
-    source 80
-    target 97
-    weight 0
-  ]
-  edge [
-    source 80
-    target 98
-    weight 0
-  ]
-  edge [
-    source 80
-    target 99
-    weight 0
-  ]
-  edge [
-    source 80
-    target 100
-    weight 0
-  ]
-  edge [
-    source 81
-    target 82
-    weight 0
-  ]
-  edge [
-    source 81
-    target 83
-    weight 0
-  ]
-  edge [
-    source 81
-    target 84
-    weight 0
-  ]
-  edge [
-    source 81
-    target 85
-    weight 0
-  ]
-  edge [
-    source 81
-    target 86
-    weight 0
-  ]
-  edge [
-    source 81
-    target 87
-    weight 0
-  ]
-  edge [
-    source 81
-    target 88
-    weight 0
-  ]
-  edge [
-    source 81
-    target 89
-    weight 0
-  ]
-  edge [
-    source 81
-    target 90
-    weight 0
-  ]
-  edge [
-    source 81
-    target 91
-    weight 0
-  ]
-  edge [
-    source 81
-    target 92
-    weight 0
-  ]
-  edge [
-    source 81
-    target 93
-    weight 0
-  ]
-  edge [
-    source 81
-    target 94
-    weight 0.1
-  ]
-  edge [
-    source 81
-    target 95
-    weight 0
-  ]
-  edge [
-    source 81
-    target 96
-    weight 0
-  ]
-  edge [
-    source 81
-    target 97
-    weight 0
-  ]
-  edge [
-    source 81
-    target 98
-    weight 0
-  ]
-  edge [
-    source 81
-    target 99
-    weight 0
-  ]
-  edge [
-    source 81
-    target 100
-    weight 0
-  ]
-  edge [
-    source 82
-    target 83
-    weight 0
-  ]
-  edge [
-    source 82
-    target 84
-    weight 0
-  ]
-  edge [
-    source 82
-    target 85
-    weight 0
-  ]
-  edge [
-    source 82
-    target 86
-    weight 0
-  ]
-  edge [
-    source 82
-    target 87
-    weight 0
-  ]
-  edge [
-    source 82
-    target 88
-    weight 0
-  ]
-  edge [
-    source 82
-    target 89
-    weight 0
-  ]
-  edge [
-    source 82
-    target 90
-    weight 0
-  ]
-  edge [
-    source 82
-    target 91
-    weight 0
-  ]
-  edge [
-    source 82
-    target 92
-    weight 0
-  ]
-  edge [
-    source 82
-    target 93
-    weight 0
-  ]
-  edge [
-    source 82
-    target 94
-    weight 0
-  ]
-  edge [
-    source 82
-    target 95
-    weight 0
-  ]
-  edge [
-    source 82
-    target 96
-    weight 0
-  ]
-  edge [
-    source 82
-    target 97
-    weight 0
-  ]
-  edge [
-    source 82
-    target 98
-    weight 0
-  ]
-  edge [
-    source 82
-    target 99
-    weight 0
-  ]
-  edge [
-    source 82
-    target 100
-    weight 0
-  ]
-  edge [
-    source 83
-    target 84
-    weight 0
-  ]
-  edge [
-    source 83
-    target 85
-    weight -0.1
-  ]
-  edge [
-    source 83
-    target 86
-    weight 0
-  ]
-  edge [
-    source 83
-    target 87
-    weight 0
-  ]
-  edge [
-    source 83
-    target 88
-    weight 0
-  ]
-  edge [
-    source 83
-    target 89
-    weight 0
-  ]
-  edge [
-    source 83
-    target 90
-    weight 0
-  ]
-  edge [
-    source 83
-    target 91
-    weight 0
-  ]
-  edge [
-    source 83
-    target 92
-    weight 0
-  ]
-  edge [
-    source 83
-    target 93
-    weight 0
-  ]
-  edge [
-    source 83
-    target 94
-    weight 0
-  ]
-  edge [
-    source 83
-    target 95
-    weight 0
-  ]
-  edge [
-    source 83
-    target 96
-    weight 0.1
-  ]
-  edge [
-    source 83
-    target 97
-    weight 0
-  ]
-  edge [
-    source 83
-    target 98
-    weight 0
-  ]
-  edge [
-    source 83
-    target 99
-    weight 0
-  ]
-  edge [
-    source 83
-    target 100
-    weight 0
-  ]
-  edge [
-    source 84
-    target 85
-    weight 0
-  ]
-  edge [
-    source 84
-    target 86
-    weight 0
-  ]
-  edge [
-    source 84
-    target 87
-    weight 0
-  ]
-  edge [
-    source 84
-    target 88
-    weight 0
-  ]
-  edge [
-    source 84
-    target 89
-    weight 0
-  ]
-  edge [
-    source 84
-    target 90
-    weight 0
-  ]
-  edge [
-    source 84
-    target 91
-    weight 0
-  ]
-  edge [
-    source 84
-    target 92
-    weight 0
-  ]
-  edge [
-    source 84
-    target 93
-    weight 0
-  ]
-  edge [
-    source 84
-    target 94
-    weight 0
-  ]
-  edge [
-    source 84
-    target 95
-    weight 0
-  ]
-  edge [
-    source 84
-    target 96
-    weight 0
-  ]
-  edge [
-    source 84
-    target 97
-    weight 0
-  ]
-  edge [
-    source 84
-    target 98
-    weight 0
-  ]
-  edge [
-    source 84
-    target 99
-    weight 0
-  ]
-  edge [
-    source 84
-    target 100
-    weight 0
-  ]
-  edge [
-    source 85
-    target 86
-    weight 0
-  ]
-  edge [
-    source 85
-    target 87
-    weight 0
-  ]
-  edge [
-    source 85
-    target 88
-    weight 0
-  ]
-  edge [
-    source 85
-    target 89
-    weight 0
-  ]
-  edge [
-    source 85
-    target 90
-    weight 0
-  ]
-  edge [
-    source 85
-    target 91
-    weight 0
-  ]
-  edge [
-    source 85
-    target 92
-    weight -0.1
-  ]
-  edge [
-    source 85
-    target 93
-    weight 0
-  ]
-  edge [
-    source 85
-    target 94
-    weight 0
-  ]
-  edge [
-    source 85
-    target 95
-    weight 0
-  ]
-  edge [
-    source 85
-    target 96
-    weight 0
-  ]
-  edge [
-    source 85
-    target 97
-    weight 0
-  ]
-  edge [
-    source 85
-    target 98
-    weight 0
-  ]
-  edge [
-    source 85
-    target 99
-    weight 0
-  ]
-  edge [
-    source 85
-    target 100
-    weight 0
-  ]
-  edge [
-    source 86
-    target 87
-    weight 0
-  ]
-  edge [
-    source 86
-    target 88
-    weight -0.1
-  ]
-  edge [
-    source 86
-    target 89
-    weight 0
-  ]
-  edge [
-    source 86
-    target 90
-    weight 0
-  ]
-  edge [
-    source 86
-    target 91
-    weight 0
-  ]
-  edge [
-    source 86
-    target 92
-    weight -0.1
-  ]
-  edge [
-    source 86
-    target 93
-    weight 0
-  ]
-  edge [
-    source 86
-    target 94
-    weight 0
-  ]
-  edge [
-    source 86
-    target 95
-    weight 0
-  ]
-  edge [
-    source 86
-    target 96
-    weight 0
-  ]
-  edge [
-    source 86
-    target 97
-    weight 0.1
-  ]
-  edge [
-    source 86
-    target 98
-    weight 0
-  ]
-  edge [
-    source 86
-    target 99
-    weight 0
-  ]
-  edge [
-    source 86
-    target 100
-    weight 0
-  ]
-  edge [
-    source 87
-    target 88
-    weight 0
-  ]
-  edge [
-    source 87
-    target 89
-    weight 0
-  ]
-  edge [
-    source 87
-    target 90
-    weight 0
-  ]
-  edge [
-    source 87
-    target 91
-    weight 0
-  ]
-  edge [
-    source 87
-    target 92
-    weight 0
-  ]
-  edge [
-    source 87
-    target 93
-    weight 0
-  ]
-  edge [
-    source 87
-    target 94
-    weight 0
-  ]
-  edge [
-    source 87
-    target 95
-    weight 0
-  ]
-  edge [
-    source 87
-    target 96
-    weight 0
-  ]
-  edge [
-    source 87
-    target 97
-    weight 0
-  ]
-  edge [
-    source 87
-    target 98
-    weight 0
-  ]
-  edge [
-    source 87
-    target 99
-    weight 0
-  ]
-  edge [
-    source 87
-    target 100
-    weight 0
-  ]
-  edge [
-    source 88
-    target 89
-    weight 0
-  ]
-  edge [
-    source 88
-    target 90
-    weight 0
-  ]
-  edge [
-    source 88
-    target 91
-    weight 0
-  ]
-  edge [
-    source 88
-    target 92
-    weight -0.1
-  ]
-  edge [
-    source 88
-    target 93
-    weight 0
-  ]
-  edge [
-    source 88
-    target 94
-    weight 0
-  ]
-  edge [
-    source 88
-    target 95
-    weight 0
-  ]
-  edge [
-    source 88
-    target 96
-    weight 0
-  ]
-  edge [
-    source 88
-    target 97
-    weight 0
-  ]
-  edge [
-    source 88
-    target 98
-    weight 0
-  ]
-  edge [
-    source 88
-    target 99
-    weight 0
-  ]
-  edge [
-    source 88
-    target 100
-    weight 0
-  ]
-  edge [
-    source 89
-    target 90
-    weight 0
-  ]
-  edge [
-    source 89
-    target 91
-    weight 0
-  ]
-  edge [
-    source 89
-    target 92
-    weight -0.1
-  ]
-  edge [
-    source 89
-    target 93
-    weight 0
-  ]
-  edge [
-    source 89
-    target 94
-    weight 0
+    source 28
+    target 30
+    weight 0.1
   ]
   edge [
-    source 89
-    target 95
-    weight 0
+    source 29
+    target 90
+    weight -0.1
   ]
   edge [
-    source 89
-    target 96
-    weight 0
+    source 29
+    target 98
+    weight 0.1
   ]
   edge [
-    source 89
-    target 97
-    weight 0
+    source 30
+    target 34
+    weight -0.1
   ]
   edge [
-    source 89
-    target 98
-    weight 0
+    source 31
+    target 34
+    weight -0.1
   ]
   edge [
-    source 89
-    target 99
-    weight 0
+    source 31
+    target 35
+    weight -0.1
   ]
   edge [
-    source 89
-    target 100
-    weight 0
+    source 31
+    target 93
+    weight -0.1
   ]
   edge [
-    source 90
-    target 91
-    weight 0
+    source 32
+    target 34
+    weight -0.1
   ]
   edge [
-    source 90
-    target 92
+    source 32
+    target 86
     weight -0.1
   ]
   edge [
-    source 90
-    target 93
-    weight 0
+    source 32
+    target 89
+    weight -0.1
   ]
   edge [
-    source 90
-    target 94
-    weight 0
+    source 33
+    target 35
+    weight -0.1
   ]
   edge [
-    source 90
-    target 95
-    weight 0
+    source 33
+    target 94
+    weight 0.1
   ]
   edge [
-    source 90
-    target 96
-    weight 0
+    source 33
+    target 97
+    weight 0.1
   ]
   edge [
-    source 90
-    target 97
-    weight 0
+    source 34
+    target 35
+    weight -0.1
   ]
   edge [
-    source 90
-    target 98
-    weight 0
+    source 34
+    target 37
+    weight -0.1
   ]
   edge [
-    source 90
-    target 99
-    weight 0
+    source 34
+    target 93
+    weight -0.1
   ]
   edge [
-    source 90
-    target 100
-    weight 0
+    source 35
+    target 37
+    weight -0.1
   ]
   edge [
-    source 91
-    target 92
-    weight 0
+    source 36
+    target 86
+    weight -0.1
   ]
   edge [
-    source 91
-    target 93
-    weight 0
+    source 36
+    target 89
+    weight -0.1
   ]
   edge [
-    source 91
+    source 37
     target 94
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 91
-    target 95
-    weight 0
+    source 38
+    target 87
+    weight -0.1
   ]
   edge [
-    source 91
+    source 39
     target 96
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 91
-    target 97
-    weight 0
+    source 40
+    target 90
+    weight -0.1
   ]
   edge [
-    source 91
-    target 98
-    weight 0
+    source 40
+    target 100
+    weight -0.1
   ]
   edge [
-    source 91
-    target 99
-    weight 0
+    source 41
+    target 90
+    weight -0.1
   ]
   edge [
-    source 91
-    target 100
-    weight 0
+    source 42
+    target 83
+    weight -0.1
   ]
   edge [
-    source 92
-    target 93
-    weight 0
+    source 43
+    target 89
+    weight -0.1
   ]
   edge [
-    source 92
-    target 94
-    weight 0
+    source 45
+    target 89
+    weight -0.1
   ]
   edge [
-    source 92
-    target 95
-    weight 0
+    source 47
+    target 89
+    weight -0.1
   ]
   edge [
-    source 92
+    source 47
     target 96
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 92
-    target 97
-    weight 0
+    source 48
+    target 87
+    weight -0.1
   ]
   edge [
-    source 92
-    target 98
-    weight 0
+    source 50
+    target 94
+    weight 0.1
   ]
   edge [
-    source 92
-    target 99
-    weight 0
+    source 51
+    target 79
+    weight -0.1
   ]
   edge [
-    source 92
-    target 100
-    weight 0
+    source 52
+    target 85
+    weight -0.1
   ]
   edge [
-    source 93
-    target 94
-    weight 0
+    source 53
+    target 90
+    weight -0.1
   ]
   edge [
-    source 93
-    target 95
-    weight 0
+    source 54
+    target 86
+    weight -0.1
   ]
   edge [
-    source 93
-    target 96
-    weight 0
+    source 55
+    target 84
+    weight -0.1
   ]
   edge [
-    source 93
-    target 97
-    weight 0
+    source 55
+    target 86
+    weight -0.1
   ]
   edge [
-    source 93
-    target 98
-    weight 0
+    source 55
+    target 96
+    weight 0.1
   ]
   edge [
-    source 93
-    target 99
-    weight 0
+    source 58
+    target 84
+    weight -0.1
   ]
   edge [
-    source 93
-    target 100
-    weight 0
+    source 60
+    target 86
+    weight -0.1
   ]
   edge [
-    source 94
-    target 95
-    weight 0
+    source 61
+    target 84
+    weight -0.1
   ]
   edge [
-    source 94
-    target 96
-    weight 0
+    source 65
+    target 85
+    weight -0.1
   ]
   edge [
-    source 94
+    source 65
     target 97
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 94
+    source 65
     target 98
-    weight 0
-  ]
-  edge [
-    source 94
-    target 99
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 94
-    target 100
-    weight 0
+    source 67
+    target 90
+    weight -0.1
   ]
   edge [
-    source 95
-    target 96
-    weight 0
+    source 68
+    target 87
+    weight -0.1
   ]
   edge [
-    source 95
+    source 68
     target 97
-    weight 0
+    weight 0.1
   ]
   edge [
-    source 95
-    target 98
-    weight 0
+    source 74
+    target 94
+    weight 0.1
   ]
   edge [
-    source 95
-    target 99
-    weight 0
+    source 79
+    target 81
+    weight -0.1
   ]
   edge [
-    source 95
-    target 100
-    weight 0
+    source 81
+    target 94
+    weight 0.1
   ]
   edge [
-    source 96
-    target 97
-    weight 0.1
+    source 83
+    target 85
+    weight -0.1
   ]
   edge [
-    source 96
-    target 98
-    weight 0
+    source 83
+    target 96
+    weight 0.1
   ]
   edge [
-    source 96
-    target 99
-    weight 0
+    source 85
+    target 92
+    weight -0.1
   ]
   edge [
-    source 96
-    target 100
-    weight 0
+    source 86
+    target 88
+    weight -0.1
   ]
   edge [
-    source 97
-    target 98
-    weight 0
+    source 86
+    target 92
+    weight -0.1
   ]
   edge [
-    source 97
-    target 99
-    weight 0
+    source 86
+    target 97
+    weight 0.1
   ]
   edge [
-    source 97
-    target 100
-    weight 0
+    source 88
+    target 92
+    weight -0.1
   ]
   edge [
-    source 98
-    target 99
-    weight 0
+    source 89
+    target 92
+    weight -0.1
   ]
   edge [
-    source 98
-    target 100
-    weight 0
+    source 90
+    target 92
+    weight -0.1
   ]
   edge [
-    source 99
-    target 100
-    weight 0
+    source 96
+    target 97
+    weight 0.1
   ]
 ]
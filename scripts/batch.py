@@ -0,0 +1,250 @@
+import sys
+import json
+import argparse
+import traceback
+from re import fullmatch
+from typing import Dict, Iterable, List, TextIO
+import captcha
+
+
+#########################
+# Batch commands        #
+#########################
+
+# Runs the CLI commands of a model without the prompt, from a command file
+# or from stdin, in one process, and answers every command with one JSON
+# line on stdout:
+#     {"line": <n>, "command": <name>, "ok": true, ...the results}
+#     {"line": <n>, "command": <name>, "ok": false, "error": <text>}
+# The commands are the ones of the CLI (see the README) except test and
+# learn: a post is judged unless it is labeled, "post [hum|mac] <word>".
+# Blank lines and "#" comments are skipped, "quit" ends the batch early.
+# The graph is loaded by the first command and the database is saved at
+# the end (folding the journal into it) unless --no-save is given, the
+# changes then stay in the journal and are replayed on the next import.
+# No riddle prefetching and no scoring processes are started, matplotlib
+# is only loaded by "print" and scipy by the first resistance query, so
+# a maintenance job starts as fast as the graph loads.
+
+class Batch:
+        def __init__(self, model):
+                self.model = model
+                self.graph = None
+                # like the CLI's busy and await_state: busy spans a whole
+                # riddle sequence (no database updates until its verdict),
+                # awaiting a single riddle until its answer
+                self.busy = False
+                self.awaiting = False
+
+        def load(self) -> None:
+                if self.graph is None:
+                        self.graph = self.model.graph_db_import()
+
+        def close(self, save: bool) -> None:
+                if self.graph is not None and save:
+                        self.model.graph_db_save(self.graph)
+
+        def execute(self, line: str) -> Dict:
+                args = [arg for arg in line.strip().split(' ') if arg != '']
+                handler = getattr(self, 'do_' + args[0], None)
+                if handler is None:
+                        return {'ok': False, 'error': 'unknown command'}
+                self.load()
+                return handler(args[1:])
+
+        def denied(self) -> Dict:
+                return {'ok': False,
+                        'error': 'database update in progress, denied'}
+
+        def do_get(self, args: List) -> Dict:
+                if self.awaiting:
+                        return {'ok': False, 'error': 'answer the question'}
+                self.awaiting = True
+                self.busy = True
+                return {'ok': True,
+                        'riddle': self.model.process_get(self.graph)}
+
+        def do_post(self, args: List) -> Dict:
+                mode = None
+                if len(args) == 2 and args[0] in ('hum', 'mac'):
+                        mode = args.pop(0)
+                if len(args) != 1:
+                        return {'ok': False,
+                                'error': 'a single answer word expected'}
+                if not self.awaiting:
+                        return {'ok': False, 'error': 'request a question'}
+
+                sts = self.model.process_post(self.graph, args[0], mode)
+                self.model.remember_word_set(self.model.CLI_SESSION, [])
+                self.awaiting = False
+                msg = self.model.status_to_msg[sts]
+                if msg in ('[ Fail ]', '[ Pass ]'):
+                        self.busy = False
+                return {'ok': True, 'status': sts, 'message': msg}
+
+        def do_insert(self, args: List) -> Dict:
+                if self.busy:
+                        return self.denied()
+                if not args:
+                        return {'ok': False, 'error':
+                                'at least one word should be inserted'}
+                added, present, skipped = [], [], []
+                for word in args:
+                        if self.model.normalize_word(word) is None:
+                                skipped.append(word)
+                                continue
+                        word = self.model.normalize_word(word)
+                        if self.model.graph_db_add(self.graph, word):
+                                present.append(word)
+                        else:
+                                added.append(word)
+                return {'ok': True, 'added': added, 'present': present,
+                        'skipped': skipped}
+
+        def do_import(self, args: List) -> Dict:
+                if self.busy:
+                        return self.denied()
+                if len(args) != 1:
+                        return {'ok': False,
+                                'error': 'a single word list file expected'}
+                try:
+                        word_file = open(args[0], 'r')
+                except OSError:
+                        return {'ok': False, 'error': 'can not be read'}
+                with word_file:
+                        added, present, skipped = \
+                                self.model.graph_db_add_many(
+                                        self.graph,
+                                        self.model.iter_word_list(word_file))
+                return {'ok': True, 'added': added, 'present': present,
+                        'skipped': skipped}
+
+        def do_remove(self, args: List) -> Dict:
+                if self.busy:
+                        return self.denied()
+                if not args:
+                        return {'ok': False, 'error':
+                                'at least one word should be removed'}
+                doomed, absent, skipped = [], [], []
+                for word in dict.fromkeys(args): # deduped
+                        if self.model.normalize_word(word) is None:
+                                skipped.append(word)
+                                continue
+                        word = self.model.normalize_word(word)
+                        if word in doomed or word in absent:
+                                continue
+                        if self.graph.has_node(word):
+                                doomed.append(word)
+                        else:
+                                absent.append(word)
+                try:
+                        self.model.graph_db_remove_many(self.graph, doomed)
+                except ValueError:
+                        return {'ok': False, 'error':
+                                'the database can not be emptied, denied'}
+                return {'ok': True, 'removed': doomed, 'absent': absent,
+                        'skipped': skipped}
+
+        def do_prune(self, args: List) -> Dict:
+                if self.busy:
+                        return self.denied()
+                if args == ['unlearned']:
+                        predicate = self.model.is_unlearned
+                elif (len(args) == 2 and args[0] == 'below' and
+                      bool(fullmatch(r'[0-9]+', args[1]))):
+                        updates = int(args[1])
+                        learned_updates = self.model.learned_updates
+                        predicate = (lambda graph, word:
+                                     learned_updates(graph, word) < updates)
+                else:
+                        return {'ok': False, 'error':
+                                'prune unlearned or prune below <k> expected'}
+                try:
+                        removed = self.model.graph_db_remove_many(
+                                self.graph, predicate=predicate)
+                except ValueError:
+                        return {'ok': False, 'error':
+                                'the database can not be emptied, denied'}
+                return {'ok': True, 'removed': removed}
+
+        def do_stat(self, args: List) -> Dict:
+                self.model.metrics_report() # exposed to METRICS_PATH, if set
+                stages = {}
+                if self.model.METRICS_ENABLED:
+                        stages = {stage: {'count': count, 'seconds': seconds}
+                                  for stage, (count, seconds, _)
+                                  in self.model.METRICS.snapshot().items()}
+                return {'ok': True, 'nodes': self.graph.number_of_nodes(),
+                        'edges': self.graph.number_of_edges(),
+                        'stages': stages,
+                        'res_cache': self.model.RES_CACHE.stats()}
+
+        def do_print(self, args: List) -> Dict:
+                fmt = 'png'
+                if args and args[0] in self.model.PRINT_FILES.keys():
+                        fmt = args.pop(0)
+                view = self.model.graph_db_print(self.graph, fmt, args)
+                return {'ok': True, 'file': self.model.PRINT_FILES[fmt],
+                        'words': view.number_of_nodes(),
+                        'edges': view.number_of_edges(),
+                        'absent': [word for word in args
+                                   if not self.graph.has_node(word)]}
+
+        def do_save(self, args: List) -> Dict:
+                self.model.graph_db_save(self.graph)
+                return {'ok': True, 'path': self.model.DATABASE_PATH}
+
+def run_batch(batch: Batch, lines: Iterable, out: TextIO) -> int:
+        failed = 0
+        for line_no, line in enumerate(lines, 1):
+                if line.strip() == '' or line.lstrip().startswith('#'):
+                        continue
+                command = line.split()[0]
+                if command == 'quit':
+                        break
+                try:
+                        result = batch.execute(line)
+                except Exception:
+                        traceback.print_exc()
+                        result = {'ok': False, 'error': 'internal error'}
+                failed += not result['ok']
+                out.write(json.dumps(dict({'line': line_no,
+                                           'command': command},
+                                          **result)) + '\n')
+                out.flush()
+        return failed
+
+
+#########################
+# Entry point           #
+#########################
+
+# Run it from the repository root, the model's DATABASE_PATH is relative:
+#     python3 scripts/batch.py --model polydence maintenance.txt
+#     printf 'prune below 1\nstat\n' | python3 scripts/batch.py
+# The exit status is 1 if any command failed.
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('commands', nargs='?', default='-',
+                            help='command file (default: stdin)')
+        parser.add_argument('--model', default='decadence',
+                            choices=captcha.MODEL_NAMES)
+        parser.add_argument('--no-save', action='store_true',
+                            help='leave the changes in the journal')
+        args = parser.parse_args()
+
+        batch = Batch(captcha.use_model(args.model))
+        try:
+                if args.commands == '-':
+                        failed = run_batch(batch, sys.stdin, sys.stdout)
+                else:
+                        with open(args.commands, 'r') as command_file:
+                                failed = run_batch(batch, command_file,
+                                                   sys.stdout)
+        finally:
+                batch.close(not args.no_save)
+        sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+        main()
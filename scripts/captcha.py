@@ -0,0 +1,917 @@
+import sys
+import threading
+import importlib
+from re import fullmatch
+from statistics import mean
+from random import sample, randint
+from itertools import islice
+import numpy as np
+import networkx as nx
+from resistance import PinvEngine, SubgraphEngine, SketchEngine
+from riddle_pool import RiddlePool
+from parallel_scoring import SharedScorer
+from graph_store import read_graph, write_graph
+from journal import Journal
+from challenge_store import ChallengeStore
+from riddle_pipeline import RiddlePipeline
+from metrics import Metrics
+from res_cache import ResCache
+from spectral_index import SpectralIndex
+from graph_view import make_view, LayoutCache, write_edge_list, draw_view
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+#########################
+# Message-RetCode table #
+#########################
+
+status_to_msg = {
+        401: '[ The response should not contain spaces ]',
+        402: '[ The responce should not be empty and should only contain ASCII a-z characters ]',
+        404: '[ The word should not be presented in the riddle ]',
+        405: '[ Please solve one more riddle ]',
+        406: '[ Pass ]',
+        407: '[ Fail ]',
+        408: '< "Get" responce status >'
+}
+
+
+###################
+# Hyperparameters #
+###################
+
+PIPELINE = [('dense', True)] # (riddle kind, judged) stages
+PIPELINE_SHUFFLE = False
+
+DATABASE_PATH = 'database/graph.gml' # or a binary 'database/graph.bin'
+JOURNAL_FSYNC = False
+JOURNAL_COMPACT_SIZE = 10000
+IMPORT_CHUNK_SIZE = 10000
+
+CHALLENGE_CAPACITY = 10000
+CHALLENGE_TTL = 600
+CHALLENGE_SPILL_DIR = None # e.g. 'artifacts'
+CLI_SESSION = 'cli'
+
+WEIGHT_ELASTICITY = 0.1
+WEIGHT_LIMIT = 5
+WORD_SET_SIZE = 5
+THRESH = 0.5
+DEFUALT_EDGE_WEIGHT = 0
+HEURISTIC_RATE = 8
+DENSE_SAMPLING_RATE = 50
+DENSE_INDEX = True
+DENSE_NEIGHBOURS = 5
+SPECTRAL_DIM = 32
+SPECTRAL_STALENESS = 20
+
+RESISTANCE_ENGINE = 'pinv'
+assert RESISTANCE_ENGINE in ('pinv', 'subgraph', 'sketch'), \
+       'engine not supported'
+SKETCH_EPSILON = 0.3
+SKETCH_STALENESS = 20
+SCORING_PROCESSES = 0
+RES_CACHE_SIZE = 0
+
+RIDDLE_POOL_SIZE = 8
+RIDDLE_STALENESS = 50
+SNAPSHOT_STALENESS = 50
+
+PRINT_THRESHOLD = 0.1
+PRINT_HOPS = 1
+PRINT_MAX_NODES = 1000
+PRINT_ITERATIONS = 50
+PRINT_WARM_ITERATIONS = 10
+PRINT_DPI = 150
+
+METRICS_ENABLED = True
+METRICS_PATH = None # e.g. 'artifacts/metrics.prom'
+
+HYPERPARAMETERS = [name for name in list(globals()) if name.isupper()]
+
+
+###################
+# Backend section #
+###################
+
+# The graph is complete only implicitly: an edge is physically stored only
+# while its raw weight differs from DEFUALT_EDGE_WEIGHT, a missing edge
+# reads as a default-weighted one.
+
+def is_default_weight(weight: float) -> bool:
+        # snap the float drift of repeated +/- WEIGHT_ELASTICITY steps
+        return abs(weight - DEFUALT_EDGE_WEIGHT) < WEIGHT_ELASTICITY / 2
+
+def drop_default_edges(graph: nx.Graph) -> None:
+        graph.remove_edges_from([(node_1, node_2) for node_1, node_2, weight
+                                 in graph.edges(data='weight')
+                                 if is_default_weight(weight)])
+
+# Hot-path stage timers: counts, cumulative time and latency histograms,
+# reported by "stat". With METRICS_ENABLED off every stage is the plain
+# function. The engines, the index and the journal are timed per instance
+# (see the make_* functions), the module's own stages by decoration, so
+# every instance of the model (see tenants) reports its own work only.
+
+METRICS = Metrics(METRICS_ENABLED)
+
+def metrics_report() -> List:
+        if METRICS_PATH is not None:
+                METRICS.expose(METRICS_PATH, 'decadence')
+        return METRICS.report() if METRICS_ENABLED else []
+
+# Every change of the graph bumps its version, everything touching the
+# graph outside of the CLI thread holds GRAPH_LOCK.
+
+GRAPH_LOCK = threading.RLock()
+GRAPH_VERSION = 0
+
+def bump_graph_version() -> None:
+        global GRAPH_VERSION
+        GRAPH_VERSION += 1
+
+def graph_version() -> int:
+        return GRAPH_VERSION
+
+# The database file is only a snapshot: every change since it was written
+# is appended to JOURNAL and replayed on import. Compaction folds the
+# journal into a new snapshot in the background.
+
+def make_journal(database_path: str) -> Journal:
+        journal = Journal(database_path + '.journal', JOURNAL_FSYNC)
+        METRICS.instrument(journal, {'append': 'journal_append',
+                                     'extend': 'journal_extend',
+                                     'commit': 'journal_commit'})
+        return journal
+
+JOURNAL = make_journal(DATABASE_PATH)
+COMPACTION = None
+
+# Every word counts the learning updates its edges went through (the
+# 'updates' node attribute, stored with the database and replayed from
+# the journal): a word reweighted up and back again still counts as
+# learned. Databases written before the counts seed them with the word's
+# stored edges, each of which took at least one update.
+
+def count_learned_update(graph: nx.Graph, word_1: str, word_2: str) -> None:
+        for word in (word_1, word_2):
+                graph.nodes[word]['updates'] = learned_updates(graph, word) + 1
+
+def learned_updates(graph: nx.Graph, word: str) -> int:
+        return graph.nodes[word].get('updates', 0)
+
+def seed_learned_updates(graph: nx.Graph) -> None:
+        for word, degree in graph.degree():
+                if degree > 0 and 'updates' not in graph.nodes[word]:
+                        graph.nodes[word]['updates'] = degree
+
+def graph_db_replay(graph: nx.Graph) -> None:
+        for record in JOURNAL.read():
+                if record[0] == 'a':
+                        graph.add_node(record[1])
+                elif record[0] == 'r':
+                        if graph.has_node(record[1]):
+                                graph.remove_node(record[1])
+                else: # record[0] == 's'
+                        count_learned_update(graph, record[1], record[2])
+                        if not is_default_weight(float(record[3])):
+                                graph.add_edge(record[1], record[2],
+                                               weight=float(record[3]))
+                        elif graph.has_edge(record[1], record[2]):
+                                graph.remove_edge(record[1], record[2])
+
+@METRICS.timed('db_import')
+def graph_db_import() -> nx.Graph:
+        graph = read_graph(DATABASE_PATH)
+        seed_learned_updates(graph)
+        drop_default_edges(graph) # databases written with explicit edges
+        graph_db_replay(graph)
+        if JOURNAL.has_rotated(): # a compaction was interrupted
+                write_graph(graph, DATABASE_PATH)
+                JOURNAL.reset()
+        JOURNAL.open()
+        return graph
+
+@METRICS.timed('db_compact')
+def graph_db_compact(graph: nx.Graph) -> None:
+        with GRAPH_LOCK:
+                snapshot = graph.copy()
+                JOURNAL.rotate()
+        write_graph(snapshot, DATABASE_PATH)
+        JOURNAL.drop_rotated()
+
+def graph_db_checkpoint(graph: nx.Graph) -> None:
+        global COMPACTION
+        if ((COMPACTION is None or not COMPACTION.is_alive()) and
+            JOURNAL.records >= JOURNAL_COMPACT_SIZE):
+                COMPACTION = threading.Thread(target=graph_db_compact,
+                                              args=(graph,))
+                COMPACTION.start()
+
+def graph_db_save(graph: nx.Graph) -> None:
+        if COMPACTION is not None:
+                COMPACTION.join()
+        graph_db_compact(graph)
+
+# Every path taking words in (insert, import, remove) spells them the same:
+# stripped and lowercased, and skipped if not made of letters only.
+
+def normalize_word(word: str) -> Optional[str]:
+        word = word.strip().lower()
+        if not bool(fullmatch(r'[a-z]+', word)):
+                return None
+        return word
+
+def graph_db_add(graph: nx.Graph, word: str) -> bool:
+        with GRAPH_LOCK:
+                if graph.has_node(word):
+                        return True
+                else:
+                        graph.add_node(word)
+                        JOURNAL.append('a', word)
+                        RES_ENGINE.invalidate()
+                        SPECTRAL_INDEX.invalidate()
+                        bump_graph_version()
+                        return False
+
+# A bulk import streams the words in chunks of IMPORT_CHUNK_SIZE: every
+# chunk is validated, deduplicated and added at once, with one journal
+# write, one resistance engine invalidation and one version bump.
+
+def iter_word_list(lines: Iterable) -> Iterator:
+        for line in lines:
+                for word in line.split():
+                        yield word
+
+def graph_db_add_many(graph: nx.Graph, words: Iterable) -> Tuple:
+        added = present = invalid = 0
+        words = iter(words)
+        while True:
+                chunk = list(islice(words, IMPORT_CHUNK_SIZE))
+                if not chunk:
+                        break
+
+                valid = []
+                for word in chunk:
+                        if word.strip() == '':
+                                continue
+                        word = normalize_word(word)
+                        if word is None:
+                                invalid += 1
+                                continue
+                        valid.append(word)
+
+                with GRAPH_LOCK:
+                        fresh = [word for word in dict.fromkeys(valid)
+                                 if not graph.has_node(word)]
+                        if fresh:
+                                graph.add_nodes_from(fresh)
+                                JOURNAL.extend([('a', word) for word in fresh])
+                                JOURNAL.commit()
+                                RES_ENGINE.invalidate()
+                                SPECTRAL_INDEX.invalidate()
+                                bump_graph_version()
+                added += len(fresh)
+                present += len(valid) - len(fresh)
+
+        graph_db_checkpoint(graph)
+        return added, present, invalid
+
+# A bulk removal drops the listed words and (or) the ones matching a
+# predicate in one pass: the graph is refilled with the surviving words
+# and edges only, so it comes out compact, the resistance engine re-indexes
+# the words on its single rebuild. The database is never emptied: such a
+# removal raises ValueError and leaves the graph untouched.
+
+def is_unlearned(graph: nx.Graph, word: str) -> bool:
+        return learned_updates(graph, word) == 0
+
+def graph_db_remove_many(graph: nx.Graph, words: Iterable = [],
+                         predicate: Callable = None) -> int:
+        with GRAPH_LOCK:
+                doomed = set([word for word in words if graph.has_node(word)])
+                if predicate is not None:
+                        doomed.update([word for word in graph.nodes().keys()
+                                       if predicate(graph, word)])
+                if len(doomed) == graph.number_of_nodes():
+                        raise ValueError('the database can not be emptied')
+                if not doomed:
+                        return 0
+
+                nodes = [(word, data) for word, data
+                         in graph.nodes(data=True) if word not in doomed]
+                edges = [(word_1, word_2, data) for word_1, word_2, data
+                         in graph.edges(data=True)
+                         if word_1 not in doomed and word_2 not in doomed]
+                attrs = dict(graph.graph)
+                graph.clear()
+                graph.graph.update(attrs)
+                graph.add_nodes_from(nodes)
+                graph.add_edges_from(edges)
+
+                JOURNAL.extend([('r', word) for word in sorted(doomed)])
+                JOURNAL.commit()
+                RES_ENGINE.invalidate()
+                SPECTRAL_INDEX.invalidate()
+                bump_graph_version()
+                CHALLENGES.forget(doomed)
+
+        graph_db_checkpoint(graph)
+        return len(doomed)
+
+def graph_db_get_edge(graph: nx.Graph, word_1: str, word_2: str) -> float:
+        if graph.has_edge(word_1, word_2):
+                return graph[word_1][word_2]['weight']
+        else:
+                return DEFUALT_EDGE_WEIGHT
+
+def graph_db_set_edges(graph: nx.Graph, edges: List,
+                       new_weights: List) -> None:
+        # the resistance engine and the graph version see the whole batch
+        # as a single update; the words removed since their answer was
+        # postponed (by a spilled session) are not brought back
+        updates = []
+        for (word_1, word_2), new_weight in zip(edges, new_weights):
+                if not (graph.has_node(word_1) and graph.has_node(word_2)):
+                        continue
+                old_weight = graph_db_get_edge(graph, word_1, word_2)
+                if not is_default_weight(new_weight):
+                        graph.add_edge(word_1, word_2, weight=new_weight)
+                elif graph.has_edge(word_1, word_2):
+                        graph.remove_edge(word_1, word_2)
+                stored_weight = float(graph_db_get_edge(graph, word_1, word_2))
+                count_learned_update(graph, word_1, word_2)
+                JOURNAL.append('s', word_1, word_2, repr(stored_weight))
+                updates.append((word_1, word_2, old_weight, stored_weight))
+        RES_ENGINE.update_edges(updates)
+        bump_graph_version()
+
+def graph_db_get_all_words(graph: nx.Graph) -> List:
+        return list(graph.nodes().keys())
+
+def sigm_dist(edge_weight: float) -> float:
+        # works both on a single weight and on a numpy array of them
+        return 1.0 / (1 + np.exp(-1.0 * edge_weight))
+
+def make_res_engine(engine: str):
+        if engine == 'pinv':
+                res_engine = PinvEngine(sigm_dist, DEFUALT_EDGE_WEIGHT)
+        elif engine == 'subgraph':
+                res_engine = SubgraphEngine(sigm_dist, DEFUALT_EDGE_WEIGHT,
+                                            HEURISTIC_RATE)
+        else: # engine == 'sketch'
+                res_engine = SketchEngine(sigm_dist, DEFUALT_EDGE_WEIGHT,
+                                          SKETCH_EPSILON, SKETCH_STALENESS)
+
+        METRICS.instrument(res_engine, {'rebuild': 'engine_rebuild',
+                                        'update_edges': 'engine_update',
+                                        'res_dists': 'engine_query',
+                                        'batch_res_dists':
+                                        'engine_batch_query'})
+        if hasattr(res_engine, 'stages'):
+                METRICS.instrument(res_engine.stages,
+                                   {'pruned_reach': 'subgraph_reach',
+                                    'pruned_laplacian': 'subgraph_laplacian',
+                                    'grounded_res_dists': 'subgraph_solve',
+                                    'complete_res_dists': 'subgraph_complete',
+                                    'block_cg': 'cg_solve'})
+        return res_engine
+
+RES_ENGINE = make_res_engine(RESISTANCE_ENGINE)
+
+SCORER = SharedScorer(SCORING_PROCESSES)
+
+# Resistance queries repeat a lot: across the candidates of a dense bunch,
+# between a riddle's generation and its verdict, across the users shown
+# the same words. Every change of the graph bumps GRAPH_VERSION, so a
+# cached value is never served once it is stale. A resistance distance
+# depends on the whole graph, so there is no finer invalidation than the
+# version, and with learning on every post the cache hardly ever hits: it
+# is off by default (RES_CACHE_SIZE = 0) and only pays off on read-mostly
+# graphs (riddles served with little or no learning).
+
+RES_CACHE = ResCache(RES_CACHE_SIZE, graph_version)
+
+# Dense bunches come from nearest neighbour queries on a spectral
+# embedding of the words (see spectral_index) instead of scoring
+# DENSE_SAMPLING_RATE random candidates with full resistance computations.
+# The index follows the learning with a lag of at most SPECTRAL_STALENESS
+# graph versions, DENSE_INDEX = False restores the sampling.
+
+def make_spectral_index() -> SpectralIndex:
+        index = SpectralIndex(sigm_dist, DEFUALT_EDGE_WEIGHT, SPECTRAL_DIM,
+                              SPECTRAL_STALENESS, graph_version)
+        METRICS.instrument(index, {'rebuild': 'spectral_rebuild'})
+        return index
+
+SPECTRAL_INDEX = make_spectral_index()
+
+def res_dists(graph: nx.Graph, center: str, word_set: List,
+              restrictions: List = []) -> List:
+        if len(restrictions) > 1 or not RES_ENGINE.pairwise:
+                return RES_CACHE.fetch(('res_dists', center, tuple(word_set),
+                                        tuple(sorted(restrictions))),
+                                       lambda: RES_ENGINE.res_dists(
+                                               graph, center, word_set,
+                                               restrictions))
+
+        # nothing blocked: the distances are symmetric and cached per pair
+        return RES_CACHE.fetch_many(
+                [('res_dist', min(center, word), max(center, word))
+                 for word in word_set],
+                lambda missing: RES_ENGINE.res_dists(
+                        graph, center, [word_set[pos] for pos in missing]))
+
+def res_dist(graph: nx.Graph, word_1: str, word_2: str,
+             restrictions: List = []) -> float:
+        return res_dists(graph, word_1, [word_2], restrictions)[0]
+
+def mean_res_dist_dense(graph: nx.Graph, center: str, word_set: List) -> float:
+        return RES_CACHE.fetch(('mean_dense', center, tuple(sorted(word_set))),
+                               lambda: mean(res_dists(graph, center, word_set,
+                                                      word_set)))
+
+@METRICS.timed('learning_update')
+def enhance(graph: nx.Graph, blocks: List, human: bool) -> None:
+        # every (center, word_set) block steps its edges by WEIGHT_ELASTICITY,
+        # the steps are summed per edge and applied at once
+        step = -1.0 * WEIGHT_ELASTICITY if human else WEIGHT_ELASTICITY
+        pairs = [(min(center, word), max(center, word))
+                 for center, word_set in blocks for word in word_set]
+        edges = list(dict.fromkeys(pairs))
+        slots = {edge: slot for slot, edge in enumerate(edges)}
+
+        deltas = np.zeros(len(edges))
+        np.add.at(deltas, [slots[pair] for pair in pairs], step)
+        old_weights = np.array([graph_db_get_edge(graph, word_1, word_2)
+                                for word_1, word_2 in edges], dtype=float)
+        new_weights = np.clip(old_weights + deltas, -1.0 * WEIGHT_LIMIT,
+                              WEIGHT_LIMIT)
+        graph_db_set_edges(graph, edges, new_weights.tolist())
+
+def mean_res_dists(graph: nx.Graph, queries: List) -> List:
+        # (center, word_set, restrictions) queries, the ones not cached are
+        # resolved by the resistance engine in a single batch
+        if not queries:
+                return []
+        return RES_CACHE.fetch_many(
+                [('mean_dense' if restrictions else 'mean_rand', center,
+                  tuple(sorted(word_set)))
+                 for center, word_set, restrictions in queries],
+                lambda missing: [mean(dists) for dists
+                                 in RES_ENGINE.batch_res_dists(
+                                         graph, [queries[pos]
+                                                 for pos in missing])])
+
+def make_verdicts(graph: nx.Graph, queries: List) -> List:
+        return [bool(dist < THRESH) for dist in mean_res_dists(graph, queries)]
+
+def make_enhancements(graph: nx.Graph, session: str, center: str,
+                      word_set: List, human: bool) -> None:
+        # the judged answer learns together with the ones postponed before
+        challenge = CHALLENGES.get(session)
+        enhance(graph, challenge.postponed + [(center, word_set)], human)
+        challenge.postponed = []
+
+@METRICS.timed('candidate_scoring')
+def score_candidates(graph: nx.Graph, candidates: List,
+                     word_set: List) -> List:
+        if SCORER.pool is not None and RESISTANCE_ENGINE == 'subgraph':
+                return SCORER.mean_res_dists(RES_ENGINE, graph, candidates,
+                                             word_set)
+        else:
+                return [mean_res_dist_dense(graph, word, word_set) for word in candidates]
+
+@METRICS.timed('riddle_dense')
+def generate_word_set_dense(graph: nx.Graph) -> List:
+        if DENSE_INDEX:
+                return SPECTRAL_INDEX.dense_bunch(
+                        graph, min(WORD_SET_SIZE, graph.number_of_nodes()),
+                        DENSE_NEIGHBOURS)
+
+        all_words = graph_db_get_all_words(graph)
+
+        sampled_idx = randint(0, len(all_words) - 1)
+        word_set = [all_words[sampled_idx]]
+        all_words.pop(sampled_idx)
+
+        for i in range(min(WORD_SET_SIZE, graph.number_of_nodes()) - 1):
+                word_sample_set = sample(all_words,
+                                         min(DENSE_SAMPLING_RATE,
+                                             len(all_words)))
+                res_dists = score_candidates(graph, word_sample_set,
+                                             word_set)
+                best_idx = res_dists.index(max(res_dists))
+                word_set.append(word_sample_set[best_idx])
+                all_words.remove(word_sample_set[best_idx])
+        
+        return word_set
+
+@METRICS.timed('riddle_rand')
+def generate_word_set_rand(graph: nx.Graph) -> List:
+        all_words = graph_db_get_all_words(graph)
+        return sample(all_words, min(WORD_SET_SIZE, graph.number_of_nodes()))
+
+def postpone_enhancement(session: str, resp: str, word_set: List) -> None:
+        CHALLENGES.get(session).postponed.append((resp, list(word_set)))
+
+def remember_word_set(session: str, word_set: List) -> None:
+        CHALLENGES.get(session).word_set = list(word_set)
+
+def retrieve_word_set(session: str) -> List:
+        return CHALLENGES.get(session).word_set
+
+# The riddle kinds the pipeline stages may use: the bunch generator and
+# whether the verdict on a bunch blocks the edges inside it (a dense bunch
+# must not conduct the answer's current through itself). Only the kinds
+# of the pipeline are prefetched.
+
+RIDDLE_KINDS = {'dense': (generate_word_set_dense, True),
+                'rand': (generate_word_set_rand, False)}
+
+RIDDLE_PIPELINE = RiddlePipeline(PIPELINE,
+                                 {kind: blocks for kind, (_, blocks)
+                                  in RIDDLE_KINDS.items()},
+                                 PIPELINE_SHUFFLE)
+
+CHALLENGES = ChallengeStore(CHALLENGE_CAPACITY, CHALLENGE_TTL,
+                            RIDDLE_PIPELINE.new_order, CHALLENGE_SPILL_DIR)
+
+RIDDLE_POOL = RiddlePool({kind: RIDDLE_KINDS[kind][0]
+                          for kind, _ in RIDDLE_PIPELINE.stages},
+                         RIDDLE_POOL_SIZE, RIDDLE_STALENESS, GRAPH_LOCK,
+                         graph_version)
+
+# The snapshot serving (server.py --workers) hands the riddles out and
+# judges the answers in worker processes, it asks the model which kind of
+# riddle a session gets next and which bunch edges the verdict of its
+# answer blocks (None: the answer is not judged).
+
+def riddle_kind(session: str = CLI_SESSION) -> str:
+        return RIDDLE_PIPELINE.stage(CHALLENGES.get(session))[0]
+
+def verdict_restrictions(session: str, word_set: List) -> List:
+        kind, judged = RIDDLE_PIPELINE.stage(CHALLENGES.get(session))
+        return RIDDLE_PIPELINE.restrictions(kind, word_set) if judged else None
+
+@METRICS.timed('get')
+def process_get(graph: nx.Graph, session: str = CLI_SESSION) -> List:
+        word_set = RIDDLE_POOL.pop(graph, riddle_kind(session))
+        remember_word_set(session, word_set)
+        return word_set
+
+@METRICS.timed('post')
+def process_post(graph: nx.Graph, post_text: str, mode: str = None,
+                 session: str = CLI_SESSION, verdict: bool = None) -> int:
+        # verdict: computed beforehand on a published snapshot, if at all
+        with GRAPH_LOCK:
+                sts = judge_post(graph, post_text, mode, session, verdict)
+                JOURNAL.commit()
+        graph_db_checkpoint(graph)
+        return sts
+
+def judge_post(graph: nx.Graph, post_text: str, mode: str = None,
+               session: str = CLI_SESSION, verdict: bool = None) -> int:
+        if post_text.find(' ') != -1:
+                return 401
+
+        post_text = post_text.lower()
+
+        if not bool(fullmatch(r'[a-z]+', post_text)):
+                return 402
+        
+        word_set = retrieve_word_set(session)
+
+        if post_text in word_set:
+                return 404
+
+        if graph_db_add(graph, post_text) == False:
+                postpone_enhancement(session, post_text, word_set)
+                return 405
+
+        challenge = CHALLENGES.get(session)
+        kind, judged = RIDDLE_PIPELINE.stage(challenge)
+
+        if judged:
+                if mode is not None:
+                        assert mode in ('hum', 'mac'), 'oops, wrong "post" mode used'
+                        challenge.verdicts.append(mode == 'hum')
+                elif verdict is not None:
+                        challenge.verdicts.append(verdict)
+                else: # resolved together with the rest of the sequence
+                        challenge.queries.append(
+                                (post_text, list(word_set),
+                                 RIDDLE_PIPELINE.restrictions(kind, word_set)))
+
+        if not RIDDLE_PIPELINE.is_last(challenge):
+                RIDDLE_PIPELINE.advance(challenge)
+                postpone_enhancement(session, post_text, word_set)
+                return 405
+
+        queries = [query for query in challenge.queries
+                   if all([graph.has_node(word)
+                           for word in [query[0]] + list(query[1])])]
+        verdict = all(challenge.verdicts + make_verdicts(graph, queries))
+        RIDDLE_PIPELINE.restart(challenge)
+        make_enhancements(graph, session, post_text, word_set, verdict)
+        if verdict == True:
+                return 406
+        else:
+                return 407
+
+
+#########################
+# Visualization section #
+#########################
+
+# "print" draws a view of the graph (see graph_view): the edges learned at
+# least PRINT_THRESHOLD away from the default, around the given words if
+# any. The layout is kept for the next "print". The edge list format is a
+# plain "<word_1> <word_2> <raw weight>" text file.
+
+LAYOUT = LayoutCache(PRINT_ITERATIONS, PRINT_WARM_ITERATIONS)
+
+PRINT_FILES = {'png': 'graph.png', 'svg': 'graph.svg', 'edges': 'graph.edges'}
+
+def graph_db_print(graph: nx.Graph, fmt: str, words: List = []) -> nx.Graph:
+        with GRAPH_LOCK:
+                view = make_view(graph, sigm_dist, DEFUALT_EDGE_WEIGHT,
+                                 PRINT_THRESHOLD, words, PRINT_HOPS,
+                                 PRINT_MAX_NODES)
+                version = graph_version()
+
+        if fmt == 'edges':
+                write_edge_list(view, PRINT_FILES[fmt])
+        else:
+                draw_view(view, LAYOUT.layout(view, version),
+                          DEFUALT_EDGE_WEIGHT, PRINT_FILES[fmt], fmt,
+                          PRINT_DPI)
+        return view
+
+
+#########################
+# Configuration section #
+#########################
+
+# Overrides some hyperparameters (e.g. the ones travelling with a graph
+# database, see tenants) and rebuilds everything derived from them. Only
+# for a model whose graph is not imported yet; the stage timers keep the
+# METRICS_ENABLED of the import.
+
+def configure(params: dict) -> None:
+        global JOURNAL, RES_ENGINE, SCORER, RES_CACHE, SPECTRAL_INDEX
+        global RIDDLE_PIPELINE, CHALLENGES, RIDDLE_POOL, LAYOUT
+        for name, value in params.items():
+                assert name in HYPERPARAMETERS, \
+                       'unknown hyperparameter %s' % name
+                globals()[name] = value
+        assert RESISTANCE_ENGINE in ('pinv', 'subgraph', 'sketch'), \
+               'engine not supported'
+
+        JOURNAL = make_journal(DATABASE_PATH)
+        RES_ENGINE = make_res_engine(RESISTANCE_ENGINE)
+        SCORER = SharedScorer(SCORING_PROCESSES)
+        RES_CACHE = ResCache(RES_CACHE_SIZE, graph_version)
+        SPECTRAL_INDEX = make_spectral_index()
+        RIDDLE_PIPELINE = RiddlePipeline(PIPELINE,
+                                         {kind: blocks for kind, (_, blocks)
+                                          in RIDDLE_KINDS.items()},
+                                         PIPELINE_SHUFFLE)
+        CHALLENGES = ChallengeStore(CHALLENGE_CAPACITY, CHALLENGE_TTL,
+                                    RIDDLE_PIPELINE.new_order,
+                                    CHALLENGE_SPILL_DIR)
+        RIDDLE_POOL = RiddlePool({kind: RIDDLE_KINDS[kind][0]
+                                  for kind, _ in RIDDLE_PIPELINE.stages},
+                                 RIDDLE_POOL_SIZE, RIDDLE_STALENESS,
+                                 GRAPH_LOCK, graph_version)
+        LAYOUT = LayoutCache(PRINT_ITERATIONS, PRINT_WARM_ITERATIONS)
+
+
+# The named models are the scripts of the same names: each one holds the
+# PARAMS overriding the defaults above (e.g. polydence's PIPELINE) and runs
+# the CLI, the tools taking a --model name configure this module with them.
+
+MODEL_NAMES = ['decadence', 'polydence']
+
+def model_params(name: str) -> dict:
+        assert name in MODEL_NAMES, 'unknown model %s' % name
+        return dict(importlib.import_module(name).PARAMS)
+
+def use_model(name: str):
+        configure(model_params(name))
+        return sys.modules[__name__]
+
+
+#########################
+# CLI interface section #
+#########################
+
+# The CLI of a named model is its script (decadence.py, polydence.py),
+# which configures this module and runs the loop below.
+
+def run_cli() -> None:
+        await_state = 'await_get'
+        learn_state = 'test'
+        busy = False
+
+        graph = graph_db_import()
+        SCORER.start()
+        RIDDLE_POOL.start(graph)
+
+        while True:
+                assert await_state in ('await_get', 'await_post'), 'await state fault'
+                assert learn_state in ('learn', 'test'), 'learn/test state fault'
+
+                inp = input('\n   > ')
+                split_inp = inp.strip().split(' ')
+
+                if inp == 'get':
+                        if await_state != 'await_get':
+                                print('\n        answer the question, please.')
+                                continue
+                        print('\n        ' + ', '.join(process_get(graph)))
+                        await_state = 'await_post'
+                        busy = True
+
+                elif split_inp[0] == 'post':
+                        if await_state != 'await_post':
+                                print('\n        request a question, please.')
+                                continue
+
+                        if learn_state == 'learn':
+                                if split_inp[1] == 'mac':
+                                        sts = process_post(graph,
+                                                           split_inp[2],
+                                                           'mac')
+                                        assert sts in status_to_msg.keys(), 'wrong status'
+                                        msg = status_to_msg[sts]
+                                        print('\n        ' + msg)
+                                elif split_inp[1] == 'hum':
+                                        sts = process_post(graph,
+                                                           split_inp[2],
+                                                           'hum')
+                                        assert sts in status_to_msg.keys(), 'wrong status'
+                                        msg = status_to_msg[sts]
+                                        print('\n        ' + msg)
+                                else:
+                                        print('\n        ...')
+                                        continue
+                        else: # learn_state == 'test'
+                                sts = process_post(graph, split_inp[1])
+                                assert sts in status_to_msg.keys(), 'wrong status'
+                                msg = status_to_msg[sts]
+                                print('\n        ' + msg)
+
+                        await_state = 'await_get'
+                        if msg in ('[ Fail ]', '[ Pass ]'):
+                                busy = False
+
+                elif inp == 'quit':
+                        RIDDLE_POOL.stop()
+                        SCORER.stop()
+                        graph_db_save(graph)
+                        break
+                elif inp == 'test':
+                        print('\n        switched to test mode.')
+                        learn_state = 'test'
+                elif inp == 'learn':
+                        print('\n        switched to learn mode.')
+                        learn_state = 'learn'
+                elif split_inp[0] == 'print':
+                        fmt = 'png'
+                        words = [word for word in split_inp[1:] if word != '']
+                        if words and words[0] in PRINT_FILES.keys():
+                                fmt = words.pop(0)
+                        for word in words:
+                                if not graph.has_node(word):
+                                        print('\n        "%s" is not ' % word +
+                                              'present in the database.')
+                        view = graph_db_print(graph, fmt, words)
+                        print('\n        %s saved in the current dir ' %
+                              PRINT_FILES[fmt] +
+                              '(%d words, %d edges).' %
+                              (view.number_of_nodes(), view.number_of_edges()))
+                elif inp == 'stat':
+                        print('\n        %d nodes available.' % graph.number_of_nodes())
+                        for line in metrics_report():
+                                print('        ' + line)
+                        if RES_CACHE_SIZE > 0:
+                                for line in RES_CACHE.report():
+                                        print('        ' + line)
+                elif inp == 'save':
+                        graph_db_save(graph)
+                        print('\n        database state commited to %s.' %
+                              DATABASE_PATH)
+
+                elif split_inp[0] == 'insert':
+                        if busy:
+                                print('\n        database update in progress, denied.')
+                                continue
+
+                        if len(split_inp) < 2:
+                                print('\n        at least one word should be inserted.')
+                                continue
+
+                        for word in split_inp[1:]:
+                                if word.strip() == '':
+                                        continue
+                                if normalize_word(word) is None:
+                                        print('\n        "%s" was skipped ' % word +
+                                              'due to an inappropriate format.')
+                                        continue
+                                word = normalize_word(word)
+                                if graph_db_add(graph, word) == True:
+                                        print('\n        "%s" is already ' % word +
+                                              'present in the database.')
+                                else:
+                                        print('\n        "%s" added to ' % word +
+                                              'the database.')
+
+                elif split_inp[0] == 'import':
+                        if busy:
+                                print('\n        database update in progress, denied.')
+                                continue
+
+                        if len(split_inp) != 2:
+                                print('\n        a single word list file expected.')
+                                continue
+
+                        try:
+                                word_file = open(split_inp[1], 'r')
+                        except OSError:
+                                print('\n        "%s" can not be read.' %
+                                      split_inp[1])
+                                continue
+
+                        with word_file:
+                                added, present, invalid = graph_db_add_many(
+                                        graph, iter_word_list(word_file))
+                        print('\n        %d words added, ' % added +
+                              '%d already present, ' % present +
+                              '%d skipped due to an inappropriate format.' %
+                              invalid)
+
+                elif split_inp[0] == 'remove':
+                        if busy:
+                                print('\n        database update in progress, denied.')
+                                continue
+
+                        if len(split_inp) < 2:
+                                print('\n        at least one word should be removed.')
+                                continue
+
+                        doomed = []
+                        for word in dict.fromkeys(split_inp[1:]): # deduped
+                                if word.strip() == '':
+                                        continue
+                                if normalize_word(word) is None:
+                                        print('\n        "%s" was skipped ' % word +
+                                              'due to an inappropriate format.')
+                                        continue
+                                word = normalize_word(word)
+                                if word in doomed:
+                                        continue
+                                if graph.has_node(word):
+                                        doomed.append(word)
+                                else:
+                                        print('\n        "%s" is not ' % word +
+                                              'present in the database.')
+
+                        try:
+                                graph_db_remove_many(graph, doomed)
+                        except ValueError:
+                                print('\n        the database can not be emptied, denied.')
+                                continue
+                        for word in doomed:
+                                print('\n        "%s" removed ' % word +
+                                      'from the database.')
+
+                elif split_inp[0] == 'prune':
+                        if busy:
+                                print('\n        database update in progress, denied.')
+                                continue
+
+                        if split_inp[1:] == ['unlearned']:
+                                predicate = is_unlearned
+                        elif (len(split_inp) == 3 and split_inp[1] == 'below' and
+                              bool(fullmatch(r'[0-9]+', split_inp[2]))):
+                                updates = int(split_inp[2])
+                                predicate = (lambda graph, word:
+                                             learned_updates(graph, word) < updates)
+                        else:
+                                print('\n        ...')
+                                continue
+
+                        try:
+                                removed = graph_db_remove_many(graph,
+                                                               predicate=predicate)
+                        except ValueError:
+                                print('\n        the database can not be emptied, denied.')
+                        else:
+                                print('\n        %d words removed ' % removed +
+                                      'from the database.')
+
+                else:
+                        print('\n        ...')
+
+        print('')
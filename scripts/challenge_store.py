@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List
+
+
+#########################
+# Challenge store       #
+#########################
+
+# Per-session state of a challenge in flight: the riddle shown last, the
+# postponed enhancements (answer, riddle) waiting for the final verdict,
+# the position in the riddle sequence and its order of the pipeline stages
+# (see riddle_pipeline), the verdicts known so far and the judged answers'
+# resistance queries (center, riddle, restrictions) still to resolve.
+
+class Challenge:
+        def __init__(self, order: List):
+                self.word_set = []
+                self.postponed = []
+                self.batch_iter = 0
+                self.order = order
+                self.verdicts = []
+                self.queries = []
+
+        def to_dict(self) -> dict:
+                return dict(self.__dict__)
+
+        @staticmethod
+        def from_dict(fields: dict) -> 'Challenge':
+                challenge = Challenge([0])
+                challenge.__dict__.update(fields)
+                return challenge
+
+# A new session starts with the stage order made by `new_order`.
+# Sessions are kept in LRU order. The ones untouched for `ttl` seconds are
+# dropped as abandoned, the least recent ones above `capacity` are dropped
+# too, or written to `spill_dir` (when given) and read back on their next
+# request. A spilled session expires by the mtime of its file: the files
+# older than `ttl` are swept at most once every `ttl` seconds.
+
+class ChallengeStore:
+        def __init__(self, capacity: int, ttl: float,
+                     new_order: Callable = lambda: [0],
+                     spill_dir: str = None):
+                self.capacity = capacity
+                self.ttl = ttl
+                self.new_order = new_order
+                self.spill_dir = spill_dir
+                if spill_dir is not None:
+                        os.makedirs(spill_dir, exist_ok=True)
+                self.sessions = OrderedDict()
+                self.touched = {}
+                self.swept = time.monotonic()
+                self.lock = threading.Lock()
+
+        def spill_path(self, session: str) -> str:
+                return os.path.join(self.spill_dir, 'session_%s.json' % session)
+
+        def spill_expired(self, path: str) -> bool:
+                return time.time() - os.path.getmtime(path) > self.ttl
+
+        def sweep_spills(self) -> None:
+                for name in os.listdir(self.spill_dir):
+                        path = os.path.join(self.spill_dir, name)
+                        if not (name.startswith('session_') and
+                                name.endswith('.json')):
+                                continue
+                        try:
+                                if self.spill_expired(path):
+                                        os.remove(path)
+                        except OSError:
+                                pass # removed meanwhile
+
+        def evict(self) -> None:
+                now = time.monotonic()
+                while self.sessions:
+                        session = next(iter(self.sessions))
+                        if now - self.touched[session] > self.ttl:
+                                del self.sessions[session]
+                                del self.touched[session]
+                        elif len(self.sessions) > self.capacity:
+                                challenge = self.sessions.pop(session)
+                                if self.spill_dir is not None:
+                                        with open(self.spill_path(session),
+                                                  'w') as spill_file:
+                                                json.dump(challenge.to_dict(),
+                                                          spill_file)
+                                del self.touched[session]
+                        else:
+                                break
+
+                if self.spill_dir is not None and now - self.swept > self.ttl:
+                        self.sweep_spills()
+                        self.swept = now
+
+        def get(self, session: str) -> Challenge:
+                with self.lock:
+                        if session in self.sessions:
+                                self.sessions.move_to_end(session)
+                        elif (self.spill_dir is not None and
+                              os.path.exists(self.spill_path(session)) and
+                              not self.spill_expired(self.spill_path(session))):
+                                with open(self.spill_path(session),
+                                          'r') as spill_file:
+                                        self.sessions[session] = \
+                                                Challenge.from_dict(
+                                                        json.load(spill_file))
+                                os.remove(self.spill_path(session))
+                        else:
+                                self.sessions[session] = Challenge(
+                                        self.new_order())
+
+                        self.touched[session] = time.monotonic()
+                        challenge = self.sessions[session]
+                        self.evict()
+                        return challenge
+
+        def forget(self, words: Iterable) -> None:
+                # removed words: the postponed answers to them are dropped,
+                # they leave the postponed riddles and the pending queries
+                words = set(words)
+                with self.lock:
+                        for challenge in self.sessions.values():
+                                challenge.postponed = [
+                                        (center, [word for word in word_set
+                                                  if word not in words])
+                                        for center, word_set
+                                        in challenge.postponed
+                                        if center not in words]
+                                challenge.queries = [
+                                        (center,
+                                         [word for word in word_set
+                                          if word not in words],
+                                         [word for word in restrictions
+                                          if word not in words])
+                                        for center, word_set, restrictions
+                                        in challenge.queries
+                                        if center not in words]
+
+        def drop(self, session: str) -> None:
+                with self.lock:
+                        if session in self.sessions:
+                                del self.sessions[session]
+                                del self.touched[session]
+                        if (self.spill_dir is not None and
+                            os.path.exists(self.spill_path(session))):
+                                os.remove(self.spill_path(session))
+
+        def __len__(self) -> int:
+                return len(self.sessions)
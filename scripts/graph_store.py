@@ -0,0 +1,112 @@
+import os
+import numpy as np
+import networkx as nx
+
+
+#########################
+# Binary graph database #
+#########################
+
+# Layout of a .bin database (little-endian, every section 8-byte aligned):
+#     magic      8 bytes   b'DCDNCE02'
+#     counts     3 uint64  word_cnt, edge_cnt, vocab_size
+#     offsets    uint64[word_cnt + 1]  word boundaries in the vocabulary
+#     vocabulary vocab_size bytes of utf-8, zero-padded
+#     updates    uint32[word_cnt] learning updates per word, zero-padded
+#     edges      edge_cnt records (uint32 idx_1, uint32 idx_2, float64 weight)
+# Only the stored (learned) edges are written. The 'DCDNCE01' databases,
+# written before the update counts, are still read (without the counts).
+# The sections are read through np.memmap, which only makes the load
+# faster than parsing GML: every edge is copied into the nx.Graph on load,
+# nothing stays mapped or is paged in lazily afterwards.
+
+BINARY_MAGIC = b'DCDNCE02'
+BINARY_MAGIC_V1 = b'DCDNCE01'
+EDGE_DTYPE = np.dtype([('idx_1', '<u4'), ('idx_2', '<u4'), ('weight', '<f8')])
+
+def aligned(size: int) -> int:
+        return (size + 7) // 8 * 8
+
+def write_binary(graph: nx.Graph, path: str) -> None:
+        words = list(graph.nodes().keys())
+        index = {word: idx for idx, word in enumerate(words)}
+        encoded = [word.encode('utf-8') for word in words]
+        offsets = np.zeros(len(words) + 1, dtype='<u8')
+        offsets[1:] = np.cumsum([len(word) for word in encoded])
+        vocab = b''.join(encoded)
+        updates = np.array([graph.nodes[word].get('updates', 0)
+                            for word in words], dtype='<u4')
+
+        edges = np.array([(index[word_1], index[word_2], weight)
+                          for word_1, word_2, weight
+                          in graph.edges(data='weight')], dtype=EDGE_DTYPE)
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as db_file:
+                db_file.write(BINARY_MAGIC)
+                db_file.write(np.array([len(words), len(edges), len(vocab)],
+                                       dtype='<u8').tobytes())
+                db_file.write(offsets.tobytes())
+                db_file.write(vocab.ljust(aligned(len(vocab)), b'\0'))
+                db_file.write(updates.tobytes().ljust(aligned(updates.nbytes),
+                                                      b'\0'))
+                db_file.write(edges.tobytes())
+        os.replace(tmp_path, path) # never leave a half-written database
+
+def read_binary(path: str) -> nx.Graph:
+        with open(path, 'rb') as db_file:
+                magic = db_file.read(8)
+                assert magic in (BINARY_MAGIC, BINARY_MAGIC_V1), \
+                        'not a graph database'
+                word_cnt, edge_cnt, vocab_size = np.frombuffer(
+                        db_file.read(24), dtype='<u8').tolist()
+
+        pos = 32
+        offsets = np.memmap(path, dtype='<u8', mode='r', offset=pos,
+                            shape=(word_cnt + 1,))
+        pos += 8 * (word_cnt + 1)
+        vocab = (np.memmap(path, dtype=np.uint8, mode='r', offset=pos,
+                           shape=(vocab_size,)).tobytes()
+                 if vocab_size > 0 else b'')
+        pos += aligned(vocab_size)
+
+        graph = nx.Graph()
+        words = [vocab[offsets[idx]:offsets[idx + 1]].decode('utf-8')
+                 for idx in range(word_cnt)]
+        graph.add_nodes_from(words)
+        if magic == BINARY_MAGIC and word_cnt > 0:
+                updates = np.memmap(path, dtype='<u4', mode='r', offset=pos,
+                                    shape=(word_cnt,))
+                for word, count in zip(words, updates.tolist()):
+                        if count > 0:
+                                graph.nodes[word]['updates'] = count
+                pos += aligned(4 * word_cnt)
+
+        if edge_cnt > 0:
+                edges = np.memmap(path, dtype=EDGE_DTYPE, mode='r',
+                                  offset=pos, shape=(edge_cnt,))
+                graph.add_weighted_edges_from(
+                        (words[idx_1], words[idx_2], weight)
+                        for idx_1, idx_2, weight in zip(
+                                edges['idx_1'].tolist(),
+                                edges['idx_2'].tolist(),
+                                edges['weight'].tolist()))
+        return graph
+
+
+#########################
+# Format dispatch       #
+#########################
+
+def read_graph(path: str) -> nx.Graph:
+        if path.endswith('.bin'):
+                return read_binary(path)
+        else:
+                return nx.read_gml(path)
+
+def write_graph(graph: nx.Graph, path: str) -> None:
+        if path.endswith('.bin'):
+                write_binary(graph, path)
+        else:
+                nx.write_gml(graph, path + '.tmp')
+                os.replace(path + '.tmp', path)
@@ -0,0 +1,115 @@
+import networkx as nx
+from random import shuffle
+from typing import Callable, Dict, List
+
+
+#########################
+# Graph views           #
+#########################
+
+# Every absent edge holds the default weight, so a picture of the whole
+# implicitly complete graph is mostly noise. A view keeps only the edges
+# whose raw weight is at least `threshold` away from the default and the
+# words they touch. Given some words it is further limited to their
+# `hops`-hop neighbourhood (over the kept edges). A view above `max_nodes`
+# words is sampled down by its edges: random edges are taken while their
+# words fit (the given words always stay), so the sample is not a cloud of
+# isolated words. Every edge of a view carries its association strength,
+# the conductance 1 / edge_dist(weight).
+
+def make_view(graph: nx.Graph, edge_dist: Callable, default_weight: float,
+              threshold: float, words: List = [], hops: int = 1,
+              max_nodes: int = None) -> nx.Graph:
+        view = nx.Graph()
+        view.add_edges_from([(word_1, word_2,
+                              {'weight': weight,
+                               'strength': 1.0 / edge_dist(weight)})
+                             for word_1, word_2, weight
+                             in graph.edges(data='weight')
+                             if round(abs(weight - default_weight), 6) >=
+                             threshold])
+
+        words = [word for word in words if graph.has_node(word)]
+        if words:
+                view.add_nodes_from(words)
+                reach = set()
+                for word in words:
+                        reach.update(nx.single_source_shortest_path_length(
+                                view, word, cutoff=hops))
+                view = view.subgraph(reach).copy()
+
+        if max_nodes is not None and view.number_of_nodes() > max_nodes:
+                kept = set(words[:max_nodes])
+                edges = list(view.edges())
+                shuffle(edges)
+                for edge in edges:
+                        fresh = len(set(edge) - kept)
+                        if len(kept) + fresh <= max_nodes:
+                                kept.update(edge)
+                        if len(kept) == max_nodes:
+                                break
+                view = view.subgraph(kept).copy()
+        return view
+
+# The spring layout is the costly part of a drawing. The positions are
+# kept between calls: a view whose words and graph version match the last
+# drawn one is not laid out again, any other view starts from the known
+# positions of its words and only needs a few refining iterations.
+
+class LayoutCache:
+        def __init__(self, iterations: int, warm_iterations: int):
+                self.iterations = iterations
+                self.warm_iterations = warm_iterations
+                self.pos = {}
+                self.key = None
+
+        def layout(self, view: nx.Graph, version: int) -> Dict:
+                key = (version, frozenset(view.nodes()))
+                if key == self.key:
+                        return self.pos
+
+                known = [word for word in view.nodes() if word in self.pos]
+                warm = len(known) * 2 >= view.number_of_nodes() > 0
+                pos = nx.spring_layout(
+                        view, weight='strength', seed=0,
+                        pos={word: self.pos[word] for word in known} or None,
+                        iterations=(self.warm_iterations if warm
+                                    else self.iterations))
+                self.pos.update(pos)
+                self.key = key
+                return pos
+
+def write_edge_list(view: nx.Graph, path: str) -> None:
+        with open(path, 'w') as edge_file:
+                for word_1, word_2, weight in sorted(
+                                view.edges(data='weight')):
+                        edge_file.write('%s %s %r\n' % (word_1, word_2,
+                                                        weight))
+
+def draw_view(view: nx.Graph, pos: Dict, default_weight: float, path: str,
+              fmt: str, dpi: int) -> None:
+        # matplotlib takes longer to import than the rest of the model, so
+        # only a drawing loads it
+        import matplotlib
+        matplotlib.use('Agg') # files only, no display needed
+        import matplotlib.pyplot as plt
+
+        # human associations (lowered weights) in green, bot ones in red,
+        # the further from the default the bolder
+        fig, ax = plt.subplots(figsize=(12, 12), dpi=dpi)
+        edges = list(view.edges(data='weight'))
+        nx.draw_networkx_edges(view, pos, ax=ax, alpha=0.5,
+                               edgelist=[(word_1, word_2)
+                                         for word_1, word_2, _ in edges],
+                               edge_color=['#00a000' if weight < default_weight
+                                           else '#ff0000'
+                                           for _, _, weight in edges],
+                               width=[0.2 + 0.3 * abs(weight - default_weight)
+                                      for _, _, weight in edges])
+        nx.draw_networkx_nodes(view, pos, ax=ax, node_size=2,
+                               node_color='#000000', alpha=0.5)
+        nx.draw_networkx_labels(view, pos, ax=ax, font_size=4,
+                                font_family='monospace')
+        ax.set_axis_off()
+        fig.savefig(path, format=fmt)
+        plt.close(fig)
@@ -0,0 +1,86 @@
+import os
+from typing import List
+
+
+#########################
+# Write-ahead journal   #
+#########################
+
+# Every graph change is appended to the journal as one text record:
+#     a <word>                      word added
+#     r <word>                      word removed
+#     s <word_1> <word_2> <weight>  raw edge weight set
+# All the records hold absolute states, so replaying a record twice is
+# harmless. Compaction rotates the journal to <path>.old, writes a new
+# snapshot and only then deletes the rotated part: after a crash both
+# parts are replayed on top of whichever snapshot survived.
+
+class Journal:
+        def __init__(self, path: str, fsync: bool = False):
+                self.path = path
+                self.old_path = path + '.old'
+                self.fsync = fsync
+                self.file = None
+                self.records = 0
+
+        def read(self) -> List:
+                records = []
+                for path in (self.old_path, self.path):
+                        if os.path.exists(path):
+                                with open(path, 'r') as journal_file:
+                                        for line in journal_file:
+                                                if not line.endswith('\n'):
+                                                        break # torn tail
+                                                records.append(line.split())
+                return records
+
+        def has_rotated(self) -> bool:
+                return os.path.exists(self.old_path)
+
+        def close(self) -> None:
+                if self.file is not None:
+                        self.file.close()
+                        self.file = None
+
+        def open(self) -> None:
+                self.close() # a re-import reopens the same journal
+                self.records = len(self.read())
+                if os.path.exists(self.path):
+                        with open(self.path, 'rb+') as journal_file:
+                                content = journal_file.read()
+                                journal_file.truncate(content.rfind(b'\n') + 1)
+                self.file = open(self.path, 'a')
+
+        def append(self, *fields) -> None:
+                self.file.write(' '.join([str(field) for field in fields]) +
+                                '\n')
+                self.file.flush()
+                self.records += 1
+
+        def extend(self, records: List) -> None:
+                # a batch of records in a single write
+                self.file.write(''.join([' '.join([str(field)
+                                                   for field in fields]) + '\n'
+                                         for fields in records]))
+                self.file.flush()
+                self.records += len(records)
+
+        def commit(self) -> None:
+                if self.fsync:
+                        os.fsync(self.file.fileno())
+
+        def rotate(self) -> None:
+                self.commit()
+                self.file.close()
+                os.replace(self.path, self.old_path)
+                self.file = open(self.path, 'a')
+                self.records = 0
+
+        def drop_rotated(self) -> None:
+                if os.path.exists(self.old_path):
+                        os.remove(self.old_path)
+
+        def reset(self) -> None:
+                self.drop_rotated()
+                open(self.path, 'w').close()
+                self.records = 0
@@ -0,0 +1,124 @@
+import os
+import time
+import threading
+import functools
+from bisect import bisect_left
+from types import ModuleType
+from typing import Callable, Dict, List
+
+
+#########################
+# Stage timers          #
+#########################
+
+# Every instrumented function is a "stage": its calls are counted, timed
+# and sorted into a latency histogram (upper bucket bounds in seconds).
+# A disabled Metrics hands the functions back untouched, so switched off
+# the instrumentation does not add a single call.
+
+DEFAULT_BUCKETS = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+class Metrics:
+        def __init__(self, enabled: bool, buckets: List = DEFAULT_BUCKETS):
+                self.enabled = enabled
+                self.buckets = buckets
+                self.stages = {} # stage -> [count, seconds, bucket counts]
+                self.lock = threading.Lock()
+
+        def record(self, stage: str, seconds: float) -> None:
+                with self.lock:
+                        if stage not in self.stages:
+                                self.stages[stage] = [
+                                        0, 0.0, [0] * (len(self.buckets) + 1)]
+                        entry = self.stages[stage]
+                        entry[0] += 1
+                        entry[1] += seconds
+                        entry[2][bisect_left(self.buckets, seconds)] += 1
+
+        def wrap(self, stage: str, func: Callable) -> Callable:
+                if not self.enabled:
+                        return func
+
+                @functools.wraps(func)
+                def timed_func(*args, **kwargs):
+                        start = time.perf_counter()
+                        try:
+                                return func(*args, **kwargs)
+                        finally:
+                                self.record(stage,
+                                            time.perf_counter() - start)
+                return timed_func
+
+        def timed(self, stage: str) -> Callable:
+                return lambda func: self.wrap(stage, func)
+
+        def instrument(self, owner, stages: Dict) -> None:
+                # owner is an instance (an engine, a journal, ...), stages
+                # maps the names of its methods to stage names. Only the
+                # instance gets the timed methods: the classes and modules
+                # are shared by every model instance of the process (see
+                # tenants), each of which keeps its own Metrics
+                assert not isinstance(owner, (type, ModuleType)), \
+                       'instrument the instances, not the shared code'
+                for name, stage in stages.items():
+                        func = getattr(owner, name)
+                        if not hasattr(func, '__wrapped__'): # once per owner
+                                setattr(owner, name, self.wrap(stage, func))
+
+        def snapshot(self) -> Dict:
+                with self.lock:
+                        return {stage: (count, seconds, list(hist))
+                                for stage, (count, seconds, hist)
+                                in self.stages.items()}
+
+        def quantile(self, hist: List, q: float) -> str:
+                # the upper bound of the bucket holding the q-quantile
+                rank = q * sum(hist)
+                seen = 0
+                for bound, cnt in zip(self.buckets + [None], hist):
+                        seen += cnt
+                        if seen >= rank:
+                                break
+                if bound is None:
+                        return '>%g' % (self.buckets[-1] * 1000)
+                return '<%g' % (bound * 1000)
+
+        def report(self) -> List:
+                lines = ['%-20s %9s %11s %10s %9s %9s' %
+                         ('stage', 'count', 'total s', 'mean ms',
+                          'p50 ms', 'p99 ms')]
+                for stage, (count, seconds, hist) in sorted(
+                                self.snapshot().items()):
+                        lines.append('%-20s %9d %11.3f %10.3f %9s %9s' %
+                                     (stage, count, seconds,
+                                      seconds / count * 1000,
+                                      self.quantile(hist, 0.5),
+                                      self.quantile(hist, 0.99)))
+                return lines
+
+        def exposition(self, prefix: str) -> str:
+                # Prometheus text format, cumulative buckets
+                name = prefix + '_stage_seconds'
+                lines = ['# HELP %s Time spent in every instrumented stage.' %
+                         name, '# TYPE %s histogram' % name]
+                for stage, (count, seconds, hist) in sorted(
+                                self.snapshot().items()):
+                        cumulative = 0
+                        for bound, cnt in zip(self.buckets + [None], hist):
+                                cumulative += cnt
+                                lines.append('%s_bucket{stage="%s",le="%s"} %d' %
+                                             (name, stage,
+                                              '+Inf' if bound is None
+                                              else repr(bound), cumulative))
+                        lines.append('%s_sum{stage="%s"} %r' %
+                                     (name, stage, seconds))
+                        lines.append('%s_count{stage="%s"} %d' %
+                                     (name, stage, count))
+                return '\n'.join(lines) + '\n'
+
+        def expose(self, path: str, prefix: str) -> None:
+                # the scraper never sees a half-written file
+                with open(path + '.tmp', 'w') as exp_file:
+                        exp_file.write(self.exposition(prefix))
+                os.replace(path + '.tmp', path)
@@ -0,0 +1,113 @@
+import numpy as np
+import networkx as nx
+from multiprocessing import get_context, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+from resistance import SubgraphEngine, subgraph_res_dists
+
+
+#########################
+# Worker side           #
+#########################
+
+# Workers never receive the graph: the CSR arrays of the subgraph engine
+# are published once per graph state into shared memory blocks and every
+# task only carries their names. A worker maps the blocks of the latest
+# generation and drops the previous ones.
+
+WORKER_ARRAYS = {}
+
+def attach(meta: Tuple) -> List:
+        generation, blocks = meta
+        if generation not in WORKER_ARRAYS:
+                for shms, _ in WORKER_ARRAYS.values():
+                        for shm in shms:
+                                shm.close()
+                WORKER_ARRAYS.clear()
+
+                shms, arrays = [], []
+                for name, shape, dtype in blocks:
+                        shm = SharedMemory(name=name)
+                        # the publisher owns (and unlinks) the block
+                        resource_tracker.unregister(shm._name, 'shared_memory')
+                        shms.append(shm)
+                        arrays.append(np.ndarray(shape, dtype, buffer=shm.buf))
+                WORKER_ARRAYS[generation] = (shms, arrays)
+
+        return WORKER_ARRAYS[generation][1]
+
+def score_chunk(meta: Tuple, default_dist: float, heuristic_rate: float,
+                candidates: List, targets: np.ndarray,
+                blocked: np.ndarray) -> List:
+        indptr, indices, dists = attach(meta)
+        return [float(np.mean(subgraph_res_dists(indptr, indices, dists,
+                                                 default_dist, heuristic_rate,
+                                                 center, targets, blocked)))
+                for center in candidates]
+
+
+#########################
+# Publisher side        #
+#########################
+
+class SharedScorer:
+        def __init__(self, processes: int):
+                self.processes = processes
+                self.pool = None
+                self.blocks = []
+                self.meta = None
+                self.published = None
+                self.generation = 0
+
+        def start(self) -> None:
+                # fork before any thread is started, the CLI scripts can not
+                # be re-imported by spawned children
+                if self.processes > 0:
+                        self.pool = get_context('fork').Pool(self.processes)
+
+        def release(self) -> None:
+                for shm in self.blocks:
+                        shm.close()
+                        shm.unlink()
+                self.blocks = []
+                self.published = None
+
+        def stop(self) -> None:
+                if self.pool is not None:
+                        self.pool.terminate()
+                        self.pool = None
+                self.release()
+
+        def publish(self, engine: SubgraphEngine) -> None:
+                if self.published is engine.indptr:
+                        return
+                self.release()
+
+                blocks = []
+                for array in (engine.indptr, engine.indices, engine.dists):
+                        shm = SharedMemory(create=True,
+                                           size=max(array.nbytes, 1))
+                        np.ndarray(array.shape, array.dtype,
+                                   buffer=shm.buf)[:] = array
+                        self.blocks.append(shm)
+                        blocks.append((shm.name, array.shape, array.dtype.str))
+
+                self.generation += 1
+                self.meta = (self.generation, blocks)
+                self.published = engine.indptr
+
+        def mean_res_dists(self, engine: SubgraphEngine, graph: nx.Graph,
+                           candidates: List, word_set: List) -> List:
+                engine.bind(graph)
+                self.publish(engine)
+
+                centers = [engine.index[word] for word in candidates]
+                targets = np.array([engine.index[word] for word in word_set])
+                chunks = [chunk.tolist() for chunk
+                          in np.array_split(centers, self.processes)
+                          if len(chunk) > 0]
+                scores = self.pool.starmap(score_chunk, [
+                        (self.meta, engine.default_dist,
+                         engine.heuristic_rate, chunk, targets, targets)
+                        for chunk in chunks])
+                return [score for chunk in scores for score in chunk]
@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+
+#########################
+# Resistance cache      #
+#########################
+
+# A bounded LRU cache of resistance queries. The resistance distance of
+# every single pair depends on the whole graph, so an entry is tagged
+# with the graph version it was computed at (read before computing) and
+# is served only while the graph is still at that very version. Keys are
+# tuples starting with the kind of the query, hits and misses are counted
+# per kind.
+
+class ResCache:
+        def __init__(self, capacity: int, version: Callable):
+                self.capacity = capacity
+                self.version = version
+                self.entries = OrderedDict()
+                self.hits = {}
+                self.misses = {}
+                self.lock = threading.Lock()
+
+        def fetch(self, key: Tuple, compute: Callable):
+                if self.capacity <= 0:
+                        return compute()
+
+                version = self.version()
+                with self.lock:
+                        entry = self.entries.get(key)
+                        if entry is not None and entry[0] == version:
+                                self.entries.move_to_end(key)
+                                self.hits[key[0]] = self.hits.get(key[0], 0) + 1
+                                return entry[1]
+                        self.misses[key[0]] = self.misses.get(key[0], 0) + 1
+
+                value = compute()
+                with self.lock:
+                        self.entries[key] = (version, value)
+                        self.entries.move_to_end(key)
+                        while len(self.entries) > self.capacity:
+                                self.entries.popitem(last=False)
+                return value
+
+        def fetch_many(self, keys: List, compute: Callable) -> List:
+                # compute gets the positions of the missing keys only
+                if self.capacity <= 0:
+                        return compute(list(range(len(keys))))
+
+                version = self.version()
+                values = [None] * len(keys)
+                missing = []
+                with self.lock:
+                        for pos, key in enumerate(keys):
+                                entry = self.entries.get(key)
+                                if entry is not None and entry[0] == version:
+                                        self.entries.move_to_end(key)
+                                        values[pos] = entry[1]
+                                        self.hits[key[0]] = \
+                                                self.hits.get(key[0], 0) + 1
+                                else:
+                                        missing.append(pos)
+                                        self.misses[key[0]] = \
+                                                self.misses.get(key[0], 0) + 1
+
+                if missing:
+                        computed = compute(missing)
+                        with self.lock:
+                                for pos, value in zip(missing, computed):
+                                        values[pos] = value
+                                        self.entries[keys[pos]] = (version,
+                                                                   value)
+                                        self.entries.move_to_end(keys[pos])
+                                while len(self.entries) > self.capacity:
+                                        self.entries.popitem(last=False)
+                return values
+
+        def clear(self) -> None:
+                with self.lock:
+                        self.entries.clear()
+
+        def stats(self) -> Dict:
+                with self.lock:
+                        return {kind: (self.hits.get(kind, 0),
+                                       self.misses.get(kind, 0))
+                                for kind in sorted(set(self.hits) |
+                                                   set(self.misses))}
+
+        def report(self) -> List:
+                lines = ['%-20s %9s %9s %9s' % ('cache', 'hits', 'misses',
+                                                'hit rate')]
+                for kind, (hits, misses) in self.stats().items():
+                        lines.append('%-20s %9d %9d %9.3f' %
+                                     (kind, hits, misses,
+                                      hits / max(hits + misses, 1)))
+                lines.append('%-20s %9d / %d' % ('entries', len(self.entries),
+                                                 self.capacity))
+                return lines
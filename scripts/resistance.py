@@ -0,0 +1,744 @@
+import numpy as np
+import networkx as nx
+from itertools import combinations
+from typing import Callable, List, Tuple
+
+
+# denser reduced Laplacians are solved with LAPACK instead of SuperLU
+DENSE_SOLVE_FILL = 0.25
+
+# scipy is imported by the functions using it: a process that never
+# solves anything (e.g. a batch of maintenance commands) does not load it
+
+
+##########################
+# Pruned subgraph solves #
+##########################
+
+# Only the learned edges are kept, in a symmetric CSR layout (indptr,
+# indices, dists) over integer node ids with the SL weights precomputed;
+# every missing pair is a default_dist edge. A pruned subgraph keeps the
+# edges lighter than the heuristic threshold that are reachable from the
+# center and comes out as a sparse Laplacian.
+#
+# A threshold above default_dist keeps every default edge: the subgraph is
+# then the complete graph and is never built, its Laplacian is
+#     L = c0 (n I - 1 1^T) + D,    c0 = 1 / default_dist
+# with D the sparse Laplacian of the conductance changes (the learned edges
+# and the blocked pairs), and the grounded system is solved through the
+# sparse c0 n I + D by Sherman-Morrison (see complete_res_dists).
+
+def csr_edge_dist(indptr: np.ndarray, indices: np.ndarray, dists: np.ndarray,
+                  default_dist: float, idx_1: int, idx_2: int) -> float:
+        row = indices[indptr[idx_1]:indptr[idx_1 + 1]]
+        pos = np.searchsorted(row, idx_2)
+        if pos < len(row) and row[pos] == idx_2:
+                return float(dists[indptr[idx_1] + pos])
+        else:
+                return default_dist
+
+def pruned_reach(indptr: np.ndarray, indices: np.ndarray, dists: np.ndarray,
+                 default_dist: float, center: int,
+                 heur_thresh: float) -> np.ndarray:
+        node_cnt = len(indptr) - 1
+        reached = np.zeros(node_cnt, dtype=bool)
+        reached[center] = True
+        frontier = [center]
+
+        assert heur_thresh <= default_dist, 'see complete_res_dists'
+        while frontier and not reached.all():
+                node = frontier.pop()
+                row = slice(indptr[node], indptr[node + 1])
+                nbrs = indices[row][dists[row] < heur_thresh]
+                nbrs = nbrs[~reached[nbrs]]
+                reached[nbrs] = True
+                frontier.extend(nbrs.tolist())
+
+        return reached
+
+def pruned_laplacian(indptr: np.ndarray, indices: np.ndarray,
+                     dists: np.ndarray, reached: np.ndarray,
+                     heur_thresh: float, blocked: np.ndarray) -> 'sparse.csr_matrix':
+        from scipy import sparse
+        nodes = np.flatnonzero(reached)
+        local = np.full(len(reached), -1)
+        local[nodes] = np.arange(len(nodes))
+
+        rows = np.repeat(np.arange(len(reached)), np.diff(indptr))
+        keep = reached[rows] & reached[indices]
+        rows, cols = local[rows[keep]], local[indices[keep]]
+        cond = np.where(dists[keep] < heur_thresh, 1.0 / dists[keep], 0.0)
+
+        local_blocked = np.zeros(len(nodes), dtype=bool)
+        local_blocked[local[blocked[reached[blocked]]]] = True
+
+        cond[local_blocked[rows] & local_blocked[cols]] = 0.0
+        conductance = sparse.csr_matrix((cond, (rows, cols)),
+                                        shape=(len(nodes), len(nodes)))
+
+        degrees = np.asarray(conductance.sum(axis=1)).ravel()
+        return (sparse.diags(degrees) - conductance).tocsr()
+
+def grounded_res_dists(lap: 'sparse.csr_matrix', center: int,
+                       targets: np.ndarray) -> np.ndarray:
+        from scipy.sparse import linalg as splinalg
+        # ground the center and inject a unit current into every target at
+        # once: one factorization, one right-hand side column per target
+        keep = np.flatnonzero(np.arange(lap.shape[0]) != center)
+        pos = np.searchsorted(keep, targets)
+        cols = np.arange(len(targets))
+        rhs = np.zeros((len(keep), len(targets)))
+        rhs[pos, cols] = 1.0
+
+        reduced = lap[keep][:, keep]
+        if reduced.nnz > DENSE_SOLVE_FILL * len(keep) ** 2:
+                potentials = np.linalg.solve(reduced.toarray(), rhs)
+        else:
+                potentials = splinalg.splu(reduced.tocsc()).solve(rhs)
+        return potentials[pos, cols]
+
+def complete_res_dists(indptr: np.ndarray, indices: np.ndarray,
+                       dists: np.ndarray, default_dist: float,
+                       heur_thresh: float, center: int, targets: np.ndarray,
+                       blocked: np.ndarray,
+                       stages: 'SolverStages' = None) -> np.ndarray:
+        from scipy import sparse
+        stages = stages or PLAIN_STAGES
+        node_cnt = len(indptr) - 1
+        base = 1.0 / default_dist
+        is_blocked = np.zeros(node_cnt, dtype=bool)
+        is_blocked[blocked] = True
+        blocked = np.flatnonzero(is_blocked)
+
+        # conductance changes: a learned edge swaps c0 for its own (or for
+        # nothing when it is too heavy), a blocked pair loses c0
+        rows = np.repeat(np.arange(node_cnt), np.diff(indptr))
+        keep = ~(is_blocked[rows] & is_blocked[indices])
+        delta = np.where(dists[keep] < heur_thresh,
+                         1.0 / dists[keep], 0.0) - base
+        block_rows, block_cols = [pairs.ravel() for pairs
+                                  in np.meshgrid(blocked, blocked)]
+        off_diag = block_rows != block_cols
+        change = sparse.csr_matrix(
+                (np.concatenate([delta, np.full(off_diag.sum(), -base)]),
+                 (np.concatenate([rows[keep], block_rows[off_diag]]),
+                  np.concatenate([indices[keep], block_cols[off_diag]]))),
+                shape=(node_cnt, node_cnt))
+        degrees = np.asarray(change.sum(axis=1)).ravel()
+
+        # ground the center: A = M - c0 1 1^T with M = c0 n I + D reduced,
+        # then A^-1 b = M^-1 b + c0 M^-1 1 (1^T M^-1 b) / (1 - c0 1^T M^-1 1)
+        keep = np.flatnonzero(np.arange(node_cnt) != center)
+        pos = np.searchsorted(keep, targets)
+        cols = np.arange(len(targets))
+        rhs = np.zeros((len(keep), len(targets) + 1))
+        rhs[pos, cols] = 1.0
+        rhs[:, -1] = 1.0
+
+        # c0 n I dominates M, conjugate gradients converge in a few steps
+        # where a factorization would fill in
+        reduced = (sparse.diags(base * node_cnt + degrees) - change).tocsr()
+        sol = stages.block_cg(reduced[keep][:, keep], rhs)
+        ones_sol = sol[:, -1]
+        scale = base * sol[:, :-1].sum(axis=0) / (1.0 - base * ones_sol.sum())
+        return sol[pos, cols] + ones_sol[pos] * scale
+
+def block_cg(mat: 'sparse.csr_matrix', rhs: np.ndarray, tol: float = 1e-10,
+             max_iter: int = 1000) -> np.ndarray:
+        # Jacobi-preconditioned conjugate gradients, run on all the
+        # right-hand side columns at once
+        diag = mat.diagonal()[:, None]
+        sol = rhs / diag
+        resid = rhs - mat @ sol
+        stop = tol * max(np.linalg.norm(rhs, axis=0).max(), 1e-300)
+        direction = resid / diag
+        rz = (resid * direction).sum(axis=0)
+
+        for _ in range(max_iter):
+                if np.linalg.norm(resid, axis=0).max() <= stop:
+                        break
+                prod = mat @ direction
+                step = rz / np.maximum((direction * prod).sum(axis=0), 1e-300)
+                sol += direction * step
+                resid -= prod * step
+                precond = resid / diag
+                rz_next = (resid * precond).sum(axis=0)
+                direction = precond + direction * (rz_next /
+                                                   np.maximum(rz, 1e-300))
+                rz = rz_next
+
+        return sol
+
+class SolverStages:
+        # the solver steps, called through an instance: every engine owns
+        # one, so a model times the steps of its own engine by wrapping the
+        # instance attributes (see Metrics.instrument)
+        def __init__(self):
+                self.pruned_reach = pruned_reach
+                self.pruned_laplacian = pruned_laplacian
+                self.grounded_res_dists = grounded_res_dists
+                self.complete_res_dists = complete_res_dists
+                self.block_cg = block_cg
+
+PLAIN_STAGES = SolverStages() # never timed
+
+def subgraph_res_dists(indptr: np.ndarray, indices: np.ndarray,
+                       dists: np.ndarray, default_dist: float,
+                       heuristic_rate: float, center: int,
+                       targets: np.ndarray, blocked: np.ndarray,
+                       stages: SolverStages = None) -> np.ndarray:
+        stages = stages or PLAIN_STAGES
+        # every pair keeps its own threshold, HEURISTIC_RATE times the
+        # distance of its direct edge, so a distance never depends on the
+        # other targets: the targets are grouped by threshold and every
+        # distinct threshold is one pruned solve
+        thresholds = heuristic_rate * np.array([
+                csr_edge_dist(indptr, indices, dists, default_dist,
+                              center, target) for target in targets])
+        res = np.full(len(targets), np.inf) # pruned away = disconnected
+        for heur_thresh in np.unique(thresholds):
+                group = np.flatnonzero(thresholds == heur_thresh)
+                if default_dist < heur_thresh:
+                        res[group] = stages.complete_res_dists(
+                                indptr, indices, dists, default_dist,
+                                heur_thresh, center, targets[group], blocked,
+                                stages)
+                        continue
+                reached = stages.pruned_reach(indptr, indices, dists,
+                                              default_dist, center,
+                                              heur_thresh)
+                found = group[reached[targets[group]]]
+                if len(found) == 0:
+                        continue
+                lap = stages.pruned_laplacian(indptr, indices, dists, reached,
+                                              heur_thresh, blocked)
+                local = np.cumsum(reached) - 1
+                res[found] = stages.grounded_res_dists(lap, local[center],
+                                                       local[targets[found]])
+        return res
+
+
+#########################
+# Subgraph engine       #
+#########################
+
+class SubgraphEngine:
+        pairwise = True # the pruning only depends on the pair
+
+        def __init__(self, edge_dist: Callable, default_weight: float,
+                     heuristic_rate: float):
+                self.edge_dist = edge_dist
+                self.default_dist = float(edge_dist(default_weight))
+                self.heuristic_rate = heuristic_rate
+                self.stages = SolverStages()
+                self.graph = None
+                self.index = {}
+                self.indptr = self.indices = self.dists = None
+
+        def rebuild(self, graph: nx.Graph) -> None:
+                words = list(graph.nodes().keys())
+                self.index = {word: idx for idx, word in enumerate(words)}
+
+                edges = [(self.index[word_1], self.index[word_2], weight)
+                         for word_1, word_2, weight
+                         in graph.edges(data='weight')]
+                edges = np.array(edges, dtype=float).reshape(-1, 3)
+                rows = np.concatenate([edges[:, 0], edges[:, 1]]).astype(int)
+                cols = np.concatenate([edges[:, 1], edges[:, 0]]).astype(int)
+                weights = np.concatenate([edges[:, 2], edges[:, 2]])
+
+                order = np.lexsort((cols, rows))
+                self.indptr = np.concatenate([
+                        [0], np.cumsum(np.bincount(rows,
+                                                   minlength=len(words)))])
+                self.indices = cols[order]
+                self.dists = self.edge_dist(weights[order])
+                self.graph = graph
+
+        def invalidate(self) -> None:
+                self.indptr = None
+
+        def bind(self, graph: nx.Graph) -> None:
+                if self.indptr is None or self.graph is not graph:
+                        self.rebuild(graph)
+
+        def update_edges(self, updates: List) -> None:
+                self.invalidate() # the edges may enter or leave the CSR
+
+        def res_dists(self, graph: nx.Graph, center: str, word_set: List,
+                      restrictions: List = []) -> List:
+                self.bind(graph)
+                targets = np.array([self.index[word] for word in word_set])
+                blocked = np.array([self.index[word] for word in restrictions],
+                                   dtype=int)
+                return subgraph_res_dists(self.indptr, self.indices,
+                                          self.dists, self.default_dist,
+                                          self.heuristic_rate,
+                                          self.index[center], targets,
+                                          blocked, self.stages).tolist()
+
+        def batch_res_dists(self, graph: nx.Graph, queries: List) -> List:
+                # (center, word_set, restrictions) queries sharing a center
+                # and a restriction set are solved together, one pruned solve
+                # per distinct pair threshold and one right-hand side column
+                # per target; the thresholds are per pair, so pooling the
+                # word sets leaves every distance unchanged
+                self.bind(graph)
+                groups = {}
+                for pos, (center, word_set, restrictions) in enumerate(queries):
+                        groups.setdefault((center, tuple(sorted(restrictions))),
+                                          []).append(pos)
+
+                results = [None] * len(queries)
+                for (center, restrictions), members in groups.items():
+                        word_set = [word for pos in members
+                                    for word in queries[pos][1]]
+                        res = self.res_dists(graph, center, word_set,
+                                             list(restrictions))
+                        for pos in members:
+                                results[pos] = res[:len(queries[pos][1])]
+                                res = res[len(queries[pos][1]):]
+                return results
+
+        def res_dist(self, graph: nx.Graph, word_1: str, word_2: str,
+                     restrictions: List = []) -> float:
+                return self.res_dists(graph, word_1, [word_2], restrictions)[0]
+
+        def export(self) -> List:
+                return [] # the learned edges are exported anyway
+
+
+#####################################
+# Laplacian pseudo-inverse engine   #
+#####################################
+
+# The SL weight of an edge is treated as its resistance, so the Laplacian
+# is built over the conductances 1 / sigm_dist(raw_weight). Pairwise
+# resistance distances are then read out of the cached pseudo-inverse:
+#     R(i, j) = P[i, i] + P[j, j] - 2 * P[i, j]
+#
+# Blocking the m edges between the members of a bunch is a low-rank change
+# L' = L - B C B^T (B holds the e_a - e_b columns, C their conductances),
+# so by Woodbury, with U = P B and K = C^-1 - B^T P B:
+#     R'(i, j) = R(i, j) + u^T K^-1 u,    u = U[i] - U[j]
+# U and K^-1 are computed once per restriction set and cached.
+
+def blocked_pairs(key: Tuple) -> Tuple:
+        pairs = np.array(list(combinations(key, 2)))
+        return pairs[:, 0], pairs[:, 1]
+
+def woodbury_kernel_inv(low_rank: np.ndarray, cond: np.ndarray,
+                        idx_a: np.ndarray, idx_b: np.ndarray) -> np.ndarray:
+        return np.linalg.inv(np.diag(1.0 / cond) -
+                             (low_rank[idx_a] - low_rank[idx_b]))
+
+def woodbury_res_dists(low_rank: np.ndarray, kernel_inv: np.ndarray,
+                       center: int, targets: np.ndarray) -> np.ndarray:
+        diff = low_rank[center] - low_rank[targets]
+        return np.einsum('ij,jk,ik->i', diff, kernel_inv, diff)
+
+def pinv_res_dists(pinv: np.ndarray, center: int,
+                   targets: np.ndarray) -> np.ndarray:
+        return (pinv[center, center] + pinv[targets, targets] -
+                2.0 * pinv[center, targets])
+
+class PinvEngine:
+        pairwise = True
+
+        def __init__(self, edge_dist: Callable, default_weight: float,
+                     refactor_interval: int = 1000, blocked_cache_size: int = 64):
+                self.edge_dist = edge_dist
+                self.default_weight = default_weight
+                self.refactor_interval = refactor_interval
+                self.graph = None
+                self.index = {}
+                self.laplacian = None
+                self.pinv = None
+                self.updates = 0
+                self.blocked_cache_size = blocked_cache_size
+                self.blocked_cache = {}
+
+        def conductance(self, weight: float) -> float:
+                return 1.0 / self.edge_dist(weight)
+
+        def rebuild(self, graph: nx.Graph) -> None:
+                words = list(graph.nodes().keys())
+                self.index = {word: idx for idx, word in enumerate(words)}
+
+                lap = np.full((len(words), len(words)),
+                              -1.0 * self.conductance(self.default_weight))
+                for word_1, word_2, weight in graph.edges(data='weight'):
+                        idx_1, idx_2 = self.index[word_1], self.index[word_2]
+                        lap[idx_1, idx_2] = lap[idx_2, idx_1] = (
+                                -1.0 * self.conductance(weight))
+                np.fill_diagonal(lap, 0.0)
+                np.fill_diagonal(lap, -1.0 * lap.sum(axis=1))
+
+                self.graph = graph
+                self.laplacian = lap
+                # L^+ = (L + J / n)^-1 - J / n for a connected graph, exact
+                # where a cut-off pinv may keep the null space
+                shift = 1.0 / len(words)
+                self.pinv = np.linalg.inv(lap + shift) - shift
+                self.updates = 0
+                self.blocked_cache.clear()
+
+        def invalidate(self) -> None:
+                self.pinv = None
+
+        def bind(self, graph: nx.Graph) -> None:
+                if self.pinv is None or self.graph is not graph:
+                        self.rebuild(graph)
+
+        def update_edges(self, updates: List) -> None:
+                if self.pinv is None:
+                        return
+                if self.updates >= self.refactor_interval:
+                        self.invalidate() # bound the drift of low-rank updates
+                        return
+
+                # (word_1, word_2, old_weight, new_weight), distinct edges
+                updates = [(self.index[word_1], self.index[word_2],
+                            self.conductance(new_weight) -
+                            self.conductance(old_weight))
+                           for word_1, word_2, old_weight, new_weight
+                           in updates]
+                updates = np.array([update for update in updates
+                                    if update[2] != 0.0]).reshape(-1, 3)
+                if len(updates) == 0:
+                        return
+                idx_a = updates[:, 0].astype(int)
+                idx_b = updates[:, 1].astype(int)
+                delta = updates[:, 2]
+
+                np.add.at(self.laplacian, (idx_a, idx_a), delta)
+                np.add.at(self.laplacian, (idx_b, idx_b), delta)
+                np.add.at(self.laplacian, (idx_a, idx_b), -1.0 * delta)
+                np.add.at(self.laplacian, (idx_b, idx_a), -1.0 * delta)
+
+                # Woodbury: L' = L + B D B^T, B holds the e_a - e_b columns,
+                # D the conductance deltas (Sherman-Morrison for one edge)
+                low_rank = self.pinv[:, idx_a] - self.pinv[:, idx_b]
+                kernel = (np.diag(1.0 / delta) +
+                          (low_rank[idx_a] - low_rank[idx_b]))
+                self.pinv -= low_rank @ np.linalg.solve(kernel, low_rank.T)
+                self.updates += len(delta)
+                self.blocked_cache.clear()
+
+        def blocked_correction(self, blocked: List) -> Tuple:
+                key = tuple(sorted(blocked))
+                if key in self.blocked_cache:
+                        return self.blocked_cache[key]
+
+                idx_a, idx_b = blocked_pairs(key)
+                cond = -1.0 * self.laplacian[idx_a, idx_b]
+
+                low_rank = self.pinv[:, idx_a] - self.pinv[:, idx_b]
+                correction = (low_rank, woodbury_kernel_inv(low_rank, cond,
+                                                            idx_a, idx_b))
+
+                if len(self.blocked_cache) >= self.blocked_cache_size:
+                        del self.blocked_cache[next(iter(self.blocked_cache))]
+                self.blocked_cache[key] = correction
+                return correction
+
+        def blocked_res_dists(self, center: int, targets: np.ndarray,
+                              blocked: List) -> np.ndarray:
+                low_rank, kernel_inv = self.blocked_correction(blocked)
+                return (pinv_res_dists(self.pinv, center, targets) +
+                        woodbury_res_dists(low_rank, kernel_inv, center,
+                                           targets))
+
+        def res_dists(self, graph: nx.Graph, center: str, word_set: List,
+                      restrictions: List = []) -> List:
+                self.bind(graph)
+                idx_c = self.index[center]
+                targets = np.array([self.index[word] for word in word_set])
+
+                blocked = [self.index[word] for word in restrictions]
+                if len(blocked) > 1:
+                        return self.blocked_res_dists(idx_c, targets,
+                                                      blocked).tolist()
+
+                return pinv_res_dists(self.pinv, idx_c, targets).tolist()
+
+        def batch_res_dists(self, graph: nx.Graph, queries: List) -> List:
+                # lookups in the one pseudo-inverse, nothing to share
+                return [self.res_dists(graph, center, word_set, restrictions)
+                        for center, word_set, restrictions in queries]
+
+        def res_dist(self, graph: nx.Graph, word_1: str, word_2: str,
+                     restrictions: List = []) -> float:
+                return self.res_dists(graph, word_1, [word_2], restrictions)[0]
+
+        def export(self) -> List:
+                return [self.pinv]
+
+
+#########################
+# Sketch engine         #
+#########################
+
+# Approximate resistances for vocabularies too large for a dense
+# pseudo-inverse (Spielman-Srivastava). With c0 the default conductance and
+# D the learned corrections, L = c0 (n I - J) + D, and for every b orthogonal
+# to the ones vector L^+ b = M^-1 b where M = s I + D, s = c0 n, is sparse.
+# Expanding M^-1 = (I - D M^-1) / s twice, for b = e_i - e_j
+#     R(i, j) = 2 / s - b^T D b / s^2 + b^T D M^-1 D b / s^2
+# the complete graph's closed form and the learned edges' first order term
+# are exact lookups in M (as in spectral_index), only the second order term
+# is sketched: it is small next to the others, so is its error, and it is
+# zero for the words without learned edges. Writing M = F_pos^T F_pos -
+# F_neg^T F_neg (F rows: sqrt(s) e_i, and sqrt(|delta|) (e_a - e_b) per
+# learned edge, by the sign of its delta) and projecting both factors on
+# k random directions gives node coordinates
+#     Z = Q F M^-1 D / s,  b^T D M^-1 D b / s^2 ~ |Z_pos b|^2 - |Z_neg b|^2
+# with a (1 +- epsilon) error on each part for k ~ 4 ln(n) / epsilon^2,
+# never more than n. M is strongly diagonally dominant, so its solves are
+# a few CG sweeps. Whether the sketch keeps the verdicts of the exact
+# engines on a given graph is checked by support/sketch_agreement.py.
+# Blocked bunch edges are corrected exactly with the same Woodbury update
+# as the pinv engine, only with M^-1 solves in place of the pseudo-inverse.
+# A rebuild costs a projection of the whole graph, so the learning steps
+# leave the sketch (M, the embedding and the blocked corrections, all taken
+# from the same build) behind by at most `staleness` steps before the next
+# query rebuilds it; insertions and removals rebuild it right away.
+
+def sketch_res_dists(emb_pos: np.ndarray, emb_neg: np.ndarray,
+                     reduced: 'sparse.csr_matrix', base: float, center: int,
+                     targets: np.ndarray) -> np.ndarray:
+        # base is c0, so M = s I + D with s = c0 n
+        scale = base * reduced.shape[0]
+        first = (reduced[center, center] +
+                 np.asarray(reduced[targets, targets]).ravel() -
+                 2.0 * np.asarray(reduced[np.full(len(targets), center),
+                                          targets]).ravel() - 2.0 * scale)
+        diff_pos = emb_pos[center] - emb_pos[targets]
+        diff_neg = emb_neg[center] - emb_neg[targets]
+        second = np.maximum((diff_pos ** 2).sum(axis=1) -
+                            (diff_neg ** 2).sum(axis=1), 0.0)
+        res = 2.0 / scale - first / scale ** 2 + second
+        return np.where(targets == center, 0.0, res)
+
+def sketch_corrections(reduced: 'sparse.csr_matrix', base: float,
+                       keys: List, stages: SolverStages = None) -> List:
+        # the low-rank columns of all the restriction sets come out of a
+        # single block solve; base is c0, so M[a, b] = c0 - c(a, b)
+        stages = stages or PLAIN_STAGES
+        pairs = [blocked_pairs(key) for key in keys]
+        cols = np.zeros((reduced.shape[0],
+                         sum([len(idx_a) for idx_a, _ in pairs])))
+        start = 0
+        for idx_a, idx_b in pairs:
+                span = np.arange(start, start + len(idx_a))
+                cols[idx_a, span] = 1.0
+                cols[idx_b, span] = -1.0
+                start += len(idx_a)
+        low_ranks = stages.block_cg(reduced, cols)
+
+        corrections, start = [], 0
+        for idx_a, idx_b in pairs:
+                cond = base - np.asarray(reduced[idx_a, idx_b]).ravel()
+                low_rank = low_ranks[:, start:start + len(idx_a)]
+                start += len(idx_a)
+                corrections.append((low_rank, woodbury_kernel_inv(
+                        low_rank, cond, idx_a, idx_b)))
+        return corrections
+
+class SketchEngine:
+        pairwise = True
+
+        def __init__(self, edge_dist: Callable, default_weight: float,
+                     epsilon: float, staleness: int = 0, seed: int = None,
+                     blocked_cache_size: int = 64):
+                self.edge_dist = edge_dist
+                self.default_weight = default_weight
+                self.epsilon = epsilon
+                self.staleness = staleness
+                self.seed = seed
+                self.stages = SolverStages()
+                self.lag = 0 # learning steps since the build
+                self.graph = None
+                self.index = {}
+                self.reduced = None
+                self.emb_pos = self.emb_neg = None
+                self.blocked_cache_size = blocked_cache_size
+                self.blocked_cache = {}
+
+        def conductance(self, weight: float) -> float:
+                return 1.0 / self.edge_dist(weight)
+
+        def sketch_dim(self, node_cnt: int) -> int:
+                eps = self.epsilon
+                dim = int(np.ceil(4.0 * np.log(max(node_cnt, 2)) /
+                                  (eps ** 2 / 2.0 - eps ** 3 / 3.0)))
+                return max(min(dim, node_cnt), 1)
+
+        def rebuild(self, graph: nx.Graph) -> None:
+                from scipy import sparse
+                words = list(graph.nodes().keys())
+                node_cnt = len(words)
+                self.index = {word: idx for idx, word in enumerate(words)}
+                base = self.conductance(self.default_weight) * node_cnt
+
+                edges = [(self.index[word_1], self.index[word_2],
+                          self.conductance(weight) -
+                          self.conductance(self.default_weight))
+                         for word_1, word_2, weight
+                         in graph.edges(data='weight')]
+                edges = np.array(edges, dtype=float).reshape(-1, 3)
+                idx_a, idx_b = edges[:, 0].astype(int), edges[:, 1].astype(int)
+                delta = edges[:, 2]
+
+                incidence = sparse.csr_matrix(
+                        (np.concatenate([np.ones(len(delta)),
+                                         -1.0 * np.ones(len(delta))]),
+                         (np.tile(np.arange(len(delta)), 2),
+                          np.concatenate([idx_a, idx_b]))),
+                        shape=(len(delta), node_cnt))
+                reduced = (base * sparse.identity(node_cnt) +
+                           incidence.T @ sparse.diags(delta) @ incidence)
+                self.reduced = reduced.tocsr()
+
+                rng = np.random.default_rng(self.seed)
+                dim = self.sketch_dim(node_cnt)
+                proj_pos = (rng.choice([-1.0, 1.0], size=(dim, node_cnt)) *
+                            np.sqrt(base))
+                proj_neg = np.zeros((dim, node_cnt))
+                for proj, sign in ((proj_pos, delta > 0.0),
+                                   (proj_neg, delta < 0.0)):
+                        edge_proj = (rng.choice([-1.0, 1.0],
+                                                size=(dim, sign.sum())) *
+                                     np.sqrt(np.abs(delta[sign])))
+                        proj += (incidence[sign].T @ edge_proj.T).T
+                # D M^-1 F^T Q^T / s, zero on the rows of unlearned words
+                correction = self.reduced - base * sparse.identity(node_cnt)
+                self.emb_pos = correction @ self.stages.block_cg(
+                        self.reduced, proj_pos.T / np.sqrt(dim)) / base
+                self.emb_neg = correction @ self.stages.block_cg(
+                        self.reduced, proj_neg.T / np.sqrt(dim)) / base
+
+                self.graph = graph
+                self.lag = 0
+                self.blocked_cache.clear()
+
+        def invalidate(self) -> None:
+                self.reduced = None
+
+        def bind(self, graph: nx.Graph) -> None:
+                if self.reduced is None or self.graph is not graph:
+                        self.rebuild(graph)
+
+        def update_edges(self, updates: List) -> None:
+                self.lag += 1
+                if self.lag > self.staleness:
+                        self.invalidate() # a new projection on the next query
+
+        def blocked_correction(self, blocked: List) -> Tuple:
+                key = tuple(sorted(blocked))
+                if key not in self.blocked_cache:
+                        self.blocked_corrections([key])
+                return self.blocked_cache[key]
+
+        def blocked_corrections(self, keys: List) -> None:
+                corrections = sketch_corrections(
+                        self.reduced, self.conductance(self.default_weight),
+                        keys, self.stages)
+                for key, correction in zip(keys, corrections):
+                        if len(self.blocked_cache) >= self.blocked_cache_size:
+                                del self.blocked_cache[
+                                        next(iter(self.blocked_cache))]
+                        self.blocked_cache[key] = correction
+
+        def res_dists(self, graph: nx.Graph, center: str, word_set: List,
+                      restrictions: List = []) -> List:
+                self.bind(graph)
+                idx_c = self.index[center]
+                targets = np.array([self.index[word] for word in word_set])
+                res = sketch_res_dists(self.emb_pos, self.emb_neg,
+                                       self.reduced,
+                                       self.conductance(self.default_weight),
+                                       idx_c, targets)
+
+                blocked = [self.index[word] for word in restrictions]
+                if len(blocked) > 1:
+                        low_rank, kernel_inv = self.blocked_correction(blocked)
+                        res += woodbury_res_dists(low_rank, kernel_inv,
+                                                  idx_c, targets)
+
+                return res.tolist()
+
+        def batch_res_dists(self, graph: nx.Graph, queries: List) -> List:
+                # one block solve for every new restriction set, the rest
+                # are lookups in the embedding
+                self.bind(graph)
+                keys = [tuple(sorted([self.index[word]
+                                      for word in restrictions]))
+                        for _, _, restrictions in queries]
+                fresh = [key for key in dict.fromkeys(keys)
+                         if len(key) > 1 and key not in self.blocked_cache]
+                if fresh:
+                        self.blocked_corrections(fresh)
+                return [self.res_dists(graph, center, word_set, restrictions)
+                        for center, word_set, restrictions in queries]
+
+        def res_dist(self, graph: nx.Graph, word_1: str, word_2: str,
+                     restrictions: List = []) -> float:
+                return self.res_dists(graph, word_1, [word_2], restrictions)[0]
+
+        def export(self) -> List:
+                return [self.emb_pos, self.emb_neg, self.reduced.data,
+                        self.reduced.indices, self.reduced.indptr]
+
+
+#########################
+# Exported engines      #
+#########################
+
+# The arrays a bound engine exports (export()) answer its queries without
+# the graph or the engine object, e.g. in the snapshot workers. Every
+# export comes after the CSR of the learned edges (see SubgraphEngine), in
+# the word order of the engine's index:
+#     'subgraph'   nothing else, the pruned solves run on the CSR
+#     'pinv'       the pseudo-inverse, the CSR gives the blocked conductances
+#     'sketch'     the embedding and M (data, indices, indptr)
+
+def exported_res_dists(engine: str, arrays: List, default_dist: float,
+                       heuristic_rate: float, center: int,
+                       targets: np.ndarray, blocked: np.ndarray) -> np.ndarray:
+        indptr, indices, dists = arrays[:3]
+        key = tuple(sorted(blocked.tolist()))
+        if engine == 'subgraph':
+                return subgraph_res_dists(indptr, indices, dists,
+                                          default_dist, heuristic_rate,
+                                          center, targets, blocked)
+
+        if engine == 'pinv':
+                pinv, = arrays[3:]
+                res = pinv_res_dists(pinv, center, targets)
+                if len(key) > 1:
+                        idx_a, idx_b = blocked_pairs(key)
+                        cond = 1.0 / np.array([
+                                csr_edge_dist(indptr, indices, dists,
+                                              default_dist, node_a, node_b)
+                                for node_a, node_b in zip(idx_a, idx_b)])
+                        low_rank = pinv[:, idx_a] - pinv[:, idx_b]
+                        res += woodbury_res_dists(
+                                low_rank, woodbury_kernel_inv(low_rank, cond,
+                                                              idx_a, idx_b),
+                                center, targets)
+                return res
+
+        # engine == 'sketch'
+        from scipy import sparse
+        emb_pos, emb_neg, data, m_indices, m_indptr = arrays[3:]
+        reduced = sparse.csr_matrix((data, m_indices, m_indptr),
+                                    shape=(len(indptr) - 1,) * 2)
+        res = sketch_res_dists(emb_pos, emb_neg, reduced, 1.0 / default_dist,
+                               center, targets)
+        if len(key) > 1:
+                low_rank, kernel_inv = sketch_corrections(
+                        reduced, 1.0 / default_dist, [key])[0]
+                res += woodbury_res_dists(low_rank, kernel_inv, center,
+                                          targets)
+        return res
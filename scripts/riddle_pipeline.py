@@ -0,0 +1,58 @@
+from random import shuffle
+from typing import Dict, List, Tuple
+
+
+#########################
+# Riddle pipelines      #
+#########################
+
+# A pipeline is the sequence of riddles a user answers before a verdict,
+# declared as a list of (kind, judged) stages, e.g. the 2-random-1-dense
+#     [('rand', False), ('rand', False), ('dense', True)]
+# A kind names a bunch generator of the model and tells whether judging an
+# answer to its bunches blocks the edges inside the bunch. Only the judged
+# stages bear the verdict, the sequence passes if all of them pass; every
+# answer of the sequence learns from the final verdict. With shuffling on,
+# every sequence goes through the stages in a fresh random order, so the
+# user can not tell the judged riddles apart.
+#
+# A judged answer is not scored when it is posted: it leaves a (center,
+# bunch, restrictions) query on the challenge and the queries of the whole
+# sequence are resolved together after its last answer, in one batch of
+# the resistance engine (see batch_res_dists).
+
+class RiddlePipeline:
+        def __init__(self, stages: List, kinds: Dict, shuffled: bool):
+                # kinds: kind -> whether its verdicts block the bunch edges
+                self.stages = [(kind, bool(judged)) for kind, judged in stages]
+                self.kinds = kinds
+                self.shuffled = shuffled
+                assert self.stages, 'empty pipeline'
+                assert all([kind in kinds for kind, _ in self.stages]), \
+                       'riddle kind not supported'
+                assert any([judged for _, judged in self.stages]), \
+                       'no judged stage in the pipeline'
+
+        def new_order(self) -> List:
+                order = list(range(len(self.stages)))
+                if self.shuffled:
+                        shuffle(order)
+                return order
+
+        def stage(self, challenge) -> Tuple:
+                return self.stages[challenge.order[challenge.batch_iter]]
+
+        def restrictions(self, kind: str, word_set: List) -> List:
+                return list(word_set) if self.kinds[kind] else []
+
+        def is_last(self, challenge) -> bool:
+                return challenge.batch_iter == len(self.stages) - 1
+
+        def advance(self, challenge) -> None:
+                challenge.batch_iter += 1
+
+        def restart(self, challenge) -> None:
+                challenge.batch_iter = 0
+                challenge.order = self.new_order()
+                challenge.verdicts = []
+                challenge.queries = []
@@ -0,0 +1,91 @@
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+import networkx as nx
+
+
+#########################
+# Riddle prefetch pool  #
+#########################
+
+# A background worker keeps up to `size` pre-generated riddles of every
+# kind, so that a "get" only pops one. Each riddle remembers the graph
+# version it was generated at and is thrown away once the graph has moved
+# more than `staleness` versions past it (or lost one of its words).
+# `lock` is the lock guarding the graph, the worker holds it while
+# generating a riddle.
+
+class RiddlePool:
+        def __init__(self, generators: Dict[str, Callable], size: int,
+                     staleness: int, lock: threading.RLock,
+                     version: Callable):
+                self.generators = generators
+                self.size = size
+                self.staleness = staleness
+                self.lock = lock
+                self.version = version
+                self.graph = None
+                self.riddles = {kind: deque() for kind in generators}
+                self.cond = threading.Condition()
+                self.worker = None
+                self.stopped = False
+
+        def is_fresh(self, graph: nx.Graph, riddle: Tuple) -> bool:
+                word_set, version = riddle
+                return (self.version() - version <= self.staleness and
+                        all([graph.has_node(word) for word in word_set]))
+
+        def drop_stale(self) -> None:
+                for kind, riddles in self.riddles.items():
+                        self.riddles[kind] = deque([
+                                riddle for riddle in riddles
+                                if self.is_fresh(self.graph, riddle)])
+
+        def lacking_kind(self) -> str:
+                self.drop_stale()
+                kind = min(self.riddles, key=lambda kind:
+                           len(self.riddles[kind]))
+                return kind if len(self.riddles[kind]) < self.size else None
+
+        def generate(self, graph: nx.Graph, kind: str) -> Tuple:
+                with self.lock:
+                        return (self.generators[kind](graph), self.version())
+
+        def run(self) -> None:
+                while True:
+                        with self.cond:
+                                while (not self.stopped and
+                                       self.lacking_kind() is None):
+                                        self.cond.wait()
+                                if self.stopped:
+                                        return
+                                kind = self.lacking_kind()
+
+                        riddle = self.generate(self.graph, kind)
+                        with self.cond:
+                                self.riddles[kind].append(riddle)
+
+        def start(self, graph: nx.Graph) -> None:
+                self.graph = graph
+                if self.size > 0:
+                        self.worker = threading.Thread(target=self.run,
+                                                       daemon=True)
+                        self.worker.start()
+
+        def stop(self) -> None:
+                with self.cond:
+                        self.stopped = True
+                        self.cond.notify()
+
+        def pop(self, graph: nx.Graph, kind: str) -> List:
+                with self.cond:
+                        riddle = None
+                        if graph is self.graph:
+                                self.drop_stale()
+                                if self.riddles[kind]:
+                                        riddle = self.riddles[kind].popleft()
+                        self.cond.notify() # time to refill
+
+                if riddle is None: # pool drained or not started
+                        riddle = self.generate(graph, kind)
+                return riddle[0]
@@ -0,0 +1,413 @@
+import json
+import time
+import uuid
+import signal
+import asyncio
+import argparse
+import traceback
+from re import fullmatch
+from urllib.parse import urlsplit, parse_qs
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Tuple
+import captcha
+from snapshot import SnapshotPool
+from tenants import TenantRegistry
+
+
+#########################
+# HTTP front-end        #
+#########################
+
+# Serves one of the models (decadence or polydence, see captcha) over
+# HTTP/1.1:
+#     POST /session               -> {"session": <token>}
+#     GET  /get?session=<token>   -> {"riddle": [<word>, ...]}
+#     POST /post?session=<token>  <- {"answer": <word>[, "mode": "hum"|"mac"]}
+#                                 -> {"status": <code>, "message": <text>}
+#     GET  /stat                  -> {"nodes": <count>, "sessions": <count>,
+#                                     "res_cache": {<kind>: [<hits>, <misses>]},
+#                                     "snapshot": {...} with --workers}
+#     GET  /metrics               -> stage timers in the Prometheus text format
+# The event loop only parses and routes requests. Riddles are handed out
+# by a pool of reader threads (mostly just popped from the prefetch pool),
+# every answer is judged by one writer thread in arrival order, so the
+# graph keeps a single learner no matter how many sessions are open.
+# With --workers the riddles and the verdicts are computed by that many
+# processes on read-only snapshots of the graph (see snapshot), the writer
+# thread stays the only learner and publishes a new snapshot once the
+# graph is SNAPSHOT_STALENESS versions ahead of the current one.
+# With --record every judged answer is appended to a JSON lines log that
+# support/replay.py plays back:
+#     {"session": <token>, "riddle": [<word>, ...], "answer": <word>,
+#      "label": "hum"|"mac"|null, "status": <code>}
+# With --tenants one process serves every graph database under a directory
+# (see tenants), each with its own hyperparameters. The requests name
+# theirs with a graph=<name> query parameter (a session belongs to one
+# graph), /stat reports the loaded ones and /metrics needs a graph=<name>.
+
+REASONS = {
+        200: 'OK',
+        400: 'Bad Request',
+        403: 'Forbidden',
+        404: 'Not Found',
+        405: 'Method Not Allowed',
+        409: 'Conflict',
+        500: 'Internal Server Error'
+}
+
+async def read_request(reader: asyncio.StreamReader) -> Tuple:
+        request_line = await reader.readline()
+        if not request_line:
+                return None
+        method, target, _ = request_line.decode('latin-1').split(' ', 2)
+
+        headers = {}
+        while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                        break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        return method, target, headers, body
+
+def encode_response(code: int, payload, keep_alive: bool) -> bytes:
+        if isinstance(payload, str):
+                body, content_type = payload.encode('utf-8'), 'text/plain'
+        else:
+                body, content_type = (json.dumps(payload).encode('utf-8'),
+                                      'application/json')
+        head = ('HTTP/1.1 %d %s\r\n' % (code, REASONS[code]) +
+                'Content-Type: %s\r\n' % content_type +
+                'Content-Length: %d\r\n' % len(body) +
+                'Connection: %s\r\n\r\n' % ('keep-alive' if keep_alive
+                                            else 'close'))
+        return head.encode('latin-1') + body
+
+class Server:
+        def __init__(self, model, readers: int, learn: bool,
+                     record: str = None, workers: int = 0,
+                     tenants: TenantRegistry = None):
+                self.model = model
+                self.tenants = tenants
+                self.learn = learn
+                self.record = None if record is None else open(record, 'a')
+                self.graph = None
+                self.readers = ThreadPoolExecutor(readers)
+                self.writer = ThreadPoolExecutor(1)
+                self.snapshots = None
+                if workers > 0:
+                        self.snapshots = SnapshotPool(
+                                workers, model.RESISTANCE_ENGINE,
+                                model.sigm_dist, model.DEFUALT_EDGE_WEIGHT,
+                                model.HEURISTIC_RATE, model.SPECTRAL_DIM)
+                self.publisher = ThreadPoolExecutor(1)
+                self.publishing = False
+
+        def start(self) -> None:
+                if self.tenants is not None:
+                        return # loaded on their first request
+                if self.snapshots is not None:
+                        self.snapshots.start() # forks, so before the rest
+                self.graph = self.model.graph_db_import()
+                self.model.SCORER.start()
+                if self.snapshots is not None:
+                        self.publish() # the workers make the riddles
+                else:
+                        self.model.RIDDLE_POOL.start(self.graph)
+
+        def stop(self) -> None:
+                self.readers.shutdown()
+                self.writer.shutdown() # let the queued answers be judged
+                self.publisher.shutdown()
+                if self.tenants is not None:
+                        self.tenants.close()
+                        return
+                if self.snapshots is not None:
+                        self.snapshots.stop()
+                else:
+                        self.model.RIDDLE_POOL.stop()
+                self.model.SCORER.stop()
+                self.model.graph_db_save(self.graph)
+                if self.record is not None:
+                        self.record.close()
+
+        @contextmanager
+        def serving(self, name: str) -> Iterator:
+                # the model and the graph a request goes to
+                if self.tenants is None:
+                        yield self.model, self.graph
+                else:
+                        with self.tenants.use(name) as tenant:
+                                yield tenant.model, tenant.graph
+
+        def get(self, session: str, name: str = None) -> List:
+                with self.serving(name) as (model, graph):
+                        return model.process_get(graph, session)
+
+        def post(self, session: str, answer: str, mode: str,
+                 verdict: bool = None, name: str = None) -> int:
+                # a riddle is answered once, like in the CLI
+                with self.serving(name) as (model, graph):
+                        riddle = model.retrieve_word_set(session)
+                        if not riddle:
+                                return None
+                        sts = model.process_post(graph, answer, mode,
+                                                 session, verdict)
+                        model.remember_word_set(session, [])
+                self.schedule_publish()
+                if self.record is not None: # only the writer thread gets here
+                        self.record.write(json.dumps({
+                                'session': session, 'riddle': riddle,
+                                'answer': answer, 'label': mode,
+                                'status': sts}) + '\n')
+                        self.record.flush()
+                return sts
+
+        def publish(self) -> None:
+                try:
+                        self.snapshots.publish(self.graph,
+                                               self.model.GRAPH_LOCK,
+                                               self.model.graph_version,
+                                               self.model.RES_ENGINE)
+                finally:
+                        self.publishing = False
+
+        def schedule_publish(self) -> None:
+                # from the writer thread, one publication at a time
+                if (self.snapshots is not None and not self.publishing and
+                    self.model.graph_version() - self.snapshots.version >=
+                    self.model.SNAPSHOT_STALENESS):
+                        self.publishing = True
+                        self.publisher.submit(self.publish)
+
+        async def in_worker(self, submit: Callable, *args):
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+
+                def resolve(result) -> None:
+                        if not future.done():
+                                future.set_result(result)
+
+                def reject(exc: BaseException) -> None:
+                        if not future.done():
+                                future.set_exception(exc)
+
+                def settle(setter: Callable, value) -> None:
+                        # runs in the pool's result thread, which must
+                        # survive a loop closed by the shutdown
+                        try:
+                                loop.call_soon_threadsafe(setter, value)
+                        except RuntimeError:
+                                pass
+
+                submit(*args, lambda result: settle(resolve, result),
+                       lambda exc: settle(reject, exc))
+                return await future
+
+        async def snapshot_get(self, session: str) -> List:
+                # timed as the 'get' stage, like process_get on the learner
+                start = time.perf_counter()
+                riddle = await self.in_worker(
+                        self.snapshots.riddle,
+                        self.model.riddle_kind(session),
+                        self.model.WORD_SET_SIZE, self.model.DENSE_NEIGHBOURS)
+                if not all([self.graph.has_node(word) for word in riddle]):
+                        # a word was removed after the publication
+                        return await asyncio.get_running_loop() \
+                                .run_in_executor(self.readers, self.get,
+                                                 session)
+                self.model.remember_word_set(session, riddle)
+                if self.model.METRICS.enabled:
+                        self.model.METRICS.record('get',
+                                                  time.perf_counter() - start)
+                return riddle
+
+        def metrics(self, name: str) -> str:
+                with self.serving(name) as (model, _):
+                        return model.METRICS.exposition('decadence')
+
+        async def snapshot_verdict(self, session: str, answer: str) -> bool:
+                # None: left to the learner (or not needed at all)
+                riddle = self.model.retrieve_word_set(session)
+                if not riddle:
+                        return None
+                restrictions = self.model.verdict_restrictions(session,
+                                                               riddle)
+                if restrictions is None:
+                        return None
+                return await self.in_worker(self.snapshots.verdict,
+                                            self.model.THRESH, answer.lower(),
+                                            list(riddle), restrictions)
+
+        async def dispatch(self, method: str, target: str,
+                           body: bytes) -> Tuple:
+                url = urlsplit(target)
+                query = parse_qs(url.query)
+                session = query.get('session', [''])[0]
+                name = query.get('graph', [None])[0]
+                loop = asyncio.get_running_loop()
+
+                if url.path == '/session' and method == 'POST':
+                        return 200, {'session': uuid.uuid4().hex}
+                if self.tenants is not None:
+                        if url.path == '/stat' and method == 'GET':
+                                return 200, {'tenants': self.tenants.stats()}
+                        if name not in self.tenants.names():
+                                return 404, {'error': 'no such graph'}
+                        if url.path == '/metrics' and method == 'GET':
+                                return 200, await loop.run_in_executor(
+                                        self.readers, self.metrics, name)
+                if url.path == '/stat' and method == 'GET':
+                        return 200, {'nodes': self.graph.number_of_nodes(),
+                                     'sessions': len(self.model.CHALLENGES),
+                                     'res_cache':
+                                     self.model.RES_CACHE.stats(),
+                                     'snapshot':
+                                     None if self.snapshots is None
+                                     else self.snapshots.stats()}
+                if url.path == '/metrics' and method == 'GET':
+                        return 200, self.model.METRICS.exposition('decadence')
+                if url.path not in ('/get', '/post'):
+                        return 404, {'error': 'no such resource'}
+                if not fullmatch(r'[0-9a-f]{32}', session):
+                        return 400, {'error': 'a session token is required'}
+
+                if url.path == '/get' and method == 'GET':
+                        if self.snapshots is not None:
+                                riddle = await self.snapshot_get(session)
+                        else:
+                                riddle = await loop.run_in_executor(
+                                        self.readers, self.get, session, name)
+                        return 200, {'riddle': riddle}
+
+                if url.path == '/post' and method == 'POST':
+                        try:
+                                fields = json.loads(body)
+                                answer = fields['answer']
+                                mode = fields.get('mode')
+                        except (ValueError, KeyError, TypeError,
+                                AttributeError):
+                                return 400, {'error': 'malformed answer'}
+                        if not isinstance(answer, str):
+                                return 400, {'error': 'malformed answer'}
+                        if mode not in (None, 'hum', 'mac'):
+                                return 400, {'error': 'unknown mode'}
+                        if mode is not None and not self.learn:
+                                return 403, {'error': 'learning disabled'}
+
+                        verdict = None
+                        if self.snapshots is not None and mode is None:
+                                verdict = await self.snapshot_verdict(session,
+                                                                      answer)
+                        sts = await loop.run_in_executor(self.writer,
+                                                         self.post, session,
+                                                         answer, mode, verdict,
+                                                         name)
+                        if sts is None:
+                                return 409, {'error': 'request a riddle first'}
+                        return 200, {'status': sts,
+                                     'message': self.model.status_to_msg[sts]}
+
+                return 405, {'error': 'method not allowed'}
+
+        async def handle(self, reader: asyncio.StreamReader,
+                         writer: asyncio.StreamWriter) -> None:
+                try:
+                        while True:
+                                request = await read_request(reader)
+                                if request is None:
+                                        break
+                                method, target, headers, body = request
+
+                                try:
+                                        code, payload = await self.dispatch(
+                                                method, target, body)
+                                except Exception:
+                                        traceback.print_exc()
+                                        code, payload = 500, {'error':
+                                                              'internal error'}
+
+                                keep_alive = (headers.get('connection', '')
+                                              .lower() != 'close')
+                                writer.write(encode_response(code, payload,
+                                                             keep_alive))
+                                await writer.drain()
+                                if not keep_alive:
+                                        break
+                except (ConnectionError, ValueError,
+                        asyncio.IncompleteReadError):
+                        pass # malformed request or the client went away
+                finally:
+                        writer.close()
+
+        async def serve(self, host: str, port: int) -> None:
+                server = await asyncio.start_server(self.handle, host, port)
+                print('serving %s on http://%s:%d' %
+                      (self.model.__name__, host, port))
+
+                # both Ctrl+C and a service manager's SIGTERM end up saving
+                # the database
+                stopping = asyncio.Event()
+                loop = asyncio.get_running_loop()
+                for signum in (signal.SIGINT, signal.SIGTERM):
+                        loop.add_signal_handler(signum, stopping.set)
+                async with server:
+                        await stopping.wait()
+
+
+#########################
+# Entry point           #
+#########################
+
+# Run it from the repository root, the model's DATABASE_PATH is relative:
+#     python3 scripts/server.py --model polydence --port 8080
+#     python3 scripts/server.py --tenants database/tenants --budget 512
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--model', default='decadence',
+                            choices=captcha.MODEL_NAMES)
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8080)
+        parser.add_argument('--readers', type=int, default=4,
+                            help='threads handing out riddles')
+        parser.add_argument('--learn', action='store_true',
+                            help='accept answers labeled "hum" or "mac"')
+        parser.add_argument('--record', default=None,
+                            help='append the judged answers to this log')
+        parser.add_argument('--workers', type=int, default=0,
+                            help='processes serving riddles and verdicts '
+                                 'from graph snapshots (0: threads only)')
+        parser.add_argument('--tenants', default=None,
+                            help='serve every graph database under this '
+                                 'directory, named by a graph=<name> query')
+        parser.add_argument('--budget', type=int, default=1024,
+                            help='MB of loaded graph databases (--tenants)')
+        args = parser.parse_args()
+        if args.tenants is not None and args.workers > 0:
+                parser.error('--workers can not be used with --tenants')
+
+        tenants = None
+        if args.tenants is not None:
+                tenants = TenantRegistry(args.tenants, args.model,
+                                         args.budget * 2 ** 20)
+        model = captcha.use_model(args.model)
+        if args.workers > 0 and not model.DENSE_INDEX:
+                parser.error('--workers makes the dense riddles with the '
+                             'spectral index, DENSE_INDEX is off')
+        server = Server(model, args.readers,
+                        args.learn, args.record, args.workers, tenants)
+        server.start()
+        try:
+                asyncio.run(server.serve(args.host, args.port))
+        finally:
+                server.stop()
+                print('\ndatabase state commited to %s.' %
+                      (server.model.DATABASE_PATH if tenants is None
+                       else args.tenants))
+
+if __name__ == '__main__':
+        main()
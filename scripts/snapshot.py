@@ -0,0 +1,214 @@
+import os
+import threading
+import numpy as np
+import networkx as nx
+from random import seed, sample
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, Tuple
+from resistance import SubgraphEngine, exported_res_dists
+from spectral_index import SpectralIndex, nearest_bunch
+from parallel_scoring import attach
+
+
+#########################
+# Worker side           #
+#########################
+
+# A snapshot is everything a riddle and a verdict need, as flat arrays in
+# shared memory blocks, in this order:
+#     offsets, vocab            the words (utf-8, as in graph_store)
+#     indptr, indices, dists    the learned edges (see SubgraphEngine)
+#     emb_pos, emb_neg          the spectral embedding (see SpectralIndex)
+#     ...                       the export of the resistance engine
+# so a verdict is answered the way the learner's engine answers it (see
+# exported_res_dists): a pinv lookup, a sketch lookup or a pruned solve.
+# A worker maps a generation on its first task (parallel_scoring.attach)
+# and decodes its words once.
+
+SNAPSHOT_WORDS = {}
+
+def attach_snapshot(meta: Tuple) -> Tuple:
+        arrays = attach(meta)
+        generation = meta[0]
+        if generation not in SNAPSHOT_WORDS:
+                SNAPSHOT_WORDS.clear()
+                offsets, vocab = arrays[0], arrays[1].tobytes()
+                words = [vocab[offsets[idx]:offsets[idx + 1]].decode('utf-8')
+                         for idx in range(len(offsets) - 1)]
+                SNAPSHOT_WORDS[generation] = (
+                        words, {word: idx for idx, word in enumerate(words)})
+        return SNAPSHOT_WORDS[generation] + (arrays[2:],)
+
+def reseed() -> None:
+        # forked workers would all inherit the publisher's random state
+        seed(os.urandom(16))
+
+def snapshot_riddle(meta: Tuple, kind: str, size: int,
+                    neighbours: int) -> List:
+        words, _, arrays = attach_snapshot(meta)
+        emb_pos, emb_neg = arrays[3:5]
+        size = min(size, len(words))
+        if kind == 'dense':
+                bunch = nearest_bunch(emb_pos, emb_neg, size, neighbours)
+        else: # kind == 'rand'
+                bunch = sample(range(len(words)), size)
+        return [words[idx] for idx in bunch]
+
+def snapshot_verdict(meta: Tuple, engine: str, default_dist: float,
+                     heuristic_rate: float, thresh: float, center: str,
+                     word_set: List, restrictions: List) -> bool:
+        # None when the snapshot does not know all the words yet
+        _, index, arrays = attach_snapshot(meta)
+        if not all([word in index for word in [center] + word_set]):
+                return None
+        res_dists = exported_res_dists(
+                engine, arrays[:3] + arrays[5:], default_dist, heuristic_rate,
+                index[center], np.array([index[word] for word in word_set]),
+                np.array([index[word] for word in restrictions], dtype=int))
+        return bool(np.mean(res_dists) < thresh)
+
+
+#########################
+# Publisher side        #
+#########################
+
+# Read-copy-update over processes. The single learner owns the graph and
+# from time to time publishes it: the arrays are built from a copy taken
+# under the graph lock, together with a copy of the engine's export (the
+# engine updates its arrays in place), and written to fresh blocks that
+# are never touched again, then the current generation is switched with one assignment.
+# Every task is sent with the generation current at its submission, so a
+# worker never sees a half-applied update, and a superseded generation is
+# unlinked only once its last task is done.
+
+class SnapshotPool:
+        def __init__(self, processes: int, engine: str, edge_dist: Callable,
+                     default_weight: float, heuristic_rate: float,
+                     spectral_dim: int):
+                self.processes = processes
+                self.engine = engine # RESISTANCE_ENGINE
+                self.edge_dist = edge_dist
+                self.default_weight = default_weight
+                self.default_dist = float(edge_dist(default_weight))
+                self.heuristic_rate = heuristic_rate
+                self.spectral_dim = spectral_dim
+                self.pool = None
+                self.current = None  # (generation, meta)
+                self.version = None  # graph version of the current one
+                self.generation = 0
+                self.live = {}       # generation -> [blocks, tasks in flight]
+                self.lock = threading.Lock()
+
+        def start(self) -> None:
+                # fork before any thread is started, like SharedScorer
+                self.pool = get_context('fork').Pool(self.processes,
+                                                     initializer=reseed)
+
+        def snapshot_arrays(self, graph: nx.Graph, exported: List) -> List:
+                engine = SubgraphEngine(self.edge_dist, self.default_weight,
+                                        self.heuristic_rate)
+                engine.rebuild(graph)
+                index = SpectralIndex(self.edge_dist, self.default_weight,
+                                      self.spectral_dim, 0, lambda: 0)
+                index.rebuild(graph) # the same word order as the engine's
+
+                encoded = [word.encode('utf-8') for word in index.words]
+                offsets = np.zeros(len(encoded) + 1, dtype='<u8')
+                offsets[1:] = np.cumsum([len(word) for word in encoded])
+                vocab = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+                return [offsets, vocab, engine.indptr, engine.indices,
+                        engine.dists, index.emb_pos, index.emb_neg] + exported
+
+        def publish(self, graph: nx.Graph, lock: threading.RLock,
+                    version: Callable, res_engine) -> None:
+                with lock:
+                        res_engine.bind(graph)
+                        assert list(res_engine.index) == list(graph.nodes), \
+                               'engine and graph word orders differ'
+                        exported = [np.array(array)
+                                    for array in res_engine.export()]
+                        graph = graph.copy()
+                        version = version()
+
+                shms, blocks = [], []
+                for array in self.snapshot_arrays(graph, exported):
+                        array = np.ascontiguousarray(array)
+                        shm = SharedMemory(create=True,
+                                           size=max(array.nbytes, 1))
+                        np.ndarray(array.shape, array.dtype,
+                                   buffer=shm.buf)[:] = array
+                        shms.append(shm)
+                        blocks.append((shm.name, array.shape, array.dtype.str))
+
+                with self.lock:
+                        self.generation += 1
+                        self.live[self.generation] = [shms, 0]
+                        self.current = (self.generation,
+                                        (self.generation, blocks))
+                        self.version = version
+                        self.release_idle()
+
+        def release_idle(self) -> None:
+                # with self.lock held
+                for generation in list(self.live):
+                        shms, tasks = self.live[generation]
+                        if generation != self.current[0] and tasks == 0:
+                                for shm in shms:
+                                        shm.close()
+                                        shm.unlink()
+                                del self.live[generation]
+
+        def submit(self, func: Callable, args: Tuple, callback: Callable,
+                   error_callback: Callable) -> None:
+                with self.lock:
+                        generation, meta = self.current
+                        self.live[generation][1] += 1
+
+                def done(generation: int) -> None:
+                        with self.lock:
+                                self.live[generation][1] -= 1
+                                self.release_idle()
+
+                def on_result(result) -> None:
+                        done(generation)
+                        callback(result)
+
+                def on_error(exc: BaseException) -> None:
+                        done(generation)
+                        error_callback(exc)
+
+                self.pool.apply_async(func, (meta,) + args,
+                                      callback=on_result,
+                                      error_callback=on_error)
+
+        def riddle(self, kind: str, size: int, neighbours: int,
+                   callback: Callable, error_callback: Callable) -> None:
+                self.submit(snapshot_riddle, (kind, size, neighbours),
+                            callback, error_callback)
+
+        def verdict(self, thresh: float, center: str, word_set: List,
+                    restrictions: List, callback: Callable,
+                    error_callback: Callable) -> None:
+                self.submit(snapshot_verdict,
+                            (self.engine, self.default_dist,
+                             self.heuristic_rate, thresh, center, word_set,
+                             restrictions),
+                            callback, error_callback)
+
+        def stats(self) -> dict:
+                with self.lock:
+                        return {'generation': self.generation,
+                                'graph_version': self.version,
+                                'live_generations': len(self.live)}
+
+        def stop(self) -> None:
+                if self.pool is not None:
+                        self.pool.terminate()
+                        self.pool = None
+                with self.lock:
+                        for shms, _ in self.live.values():
+                                for shm in shms:
+                                        shm.close()
+                                        shm.unlink()
+                        self.live = {}
@@ -0,0 +1,114 @@
+import numpy as np
+import networkx as nx
+from random import randint, choice, getrandbits
+from typing import Callable, List
+
+
+#########################
+# Spectral word index   #
+#########################
+
+# Nearest words by resistance without computing a single resistance.
+# With c0 the default conductance and D the learned corrections, on the
+# vectors orthogonal to the ones vector L^+ = M^-1, M = c0 n I + D, and D
+# only touches the learned words. For the eigenpairs (lam_k, v_k) of D
+#     M^-1 = I / (c0 n) + sum_k g_k v_k v_k^T,  g_k = 1/(c0 n + lam_k) - 1/(c0 n)
+# so R(i, j) = 2 / (c0 n) + |P_i - P_j|^2 - |N_i - N_j|^2, where the words'
+# coordinates P (N) are the v_k scaled by sqrt(|g_k|) of the positive
+# (negative) g_k. The mean resistance from a word to a bunch is then, up
+# to a constant, |P_i - P_c|^2 - |N_i - N_c|^2 around the bunch centroid:
+# a dense bunch step is one vectorized pass over the vocabulary. Only the
+# `dim` strongest eigenpairs of D are kept, an unlearned word sits at the
+# origin. The index is rebuilt when the vocabulary changes and once the
+# graph has moved more than `staleness` versions since the last build.
+
+class SpectralIndex:
+        def __init__(self, edge_dist: Callable, default_weight: float,
+                     dim: int, staleness: int, version: Callable):
+                self.edge_dist = edge_dist
+                self.default_weight = default_weight
+                self.dim = dim
+                self.staleness = staleness
+                self.version = version
+                self.graph = None
+                self.words = None
+                self.built = None
+                self.emb_pos = self.emb_neg = None
+
+        def conductance(self, weight: float) -> float:
+                return 1.0 / self.edge_dist(weight)
+
+        def rebuild(self, graph: nx.Graph) -> None:
+                from scipy import sparse # only once a bunch is asked for
+                from scipy.sparse import linalg as splinalg
+                words = list(graph.nodes().keys())
+                index = {word: idx for idx, word in enumerate(words)}
+                base = self.conductance(self.default_weight) * len(words)
+
+                edges = [(index[word_1], index[word_2],
+                          self.conductance(weight) -
+                          self.conductance(self.default_weight))
+                         for word_1, word_2, weight
+                         in graph.edges(data='weight')]
+                edges = np.array(edges, dtype=float).reshape(-1, 3)
+                learned, local = np.unique(edges[:, :2].astype(int),
+                                           return_inverse=True)
+                local = local.reshape(-1, 2)
+
+                lam, vecs = np.zeros(0), np.zeros((len(learned), 0))
+                if len(learned) > 0:
+                        adj = sparse.csr_matrix(
+                                (np.concatenate([edges[:, 2], edges[:, 2]]),
+                                 (np.concatenate([local[:, 0], local[:, 1]]),
+                                  np.concatenate([local[:, 1], local[:, 0]]))),
+                                shape=(len(learned), len(learned)))
+                        corr = (sparse.diags(np.asarray(adj.sum(axis=1))
+                                             .ravel()) - adj)
+                        if len(learned) <= self.dim + 1:
+                                lam, vecs = np.linalg.eigh(corr.toarray())
+                        else:
+                                lam, vecs = splinalg.eigsh(corr, k=self.dim,
+                                                           which='LM')
+
+                gain = 1.0 / (base + lam) - 1.0 / base
+                coords = np.zeros((len(words), len(lam)))
+                coords[learned] = vecs
+                self.emb_pos = coords[:, gain > 0] * np.sqrt(gain[gain > 0])
+                self.emb_neg = coords[:, gain < 0] * np.sqrt(-gain[gain < 0])
+
+                self.graph = graph
+                self.words = words
+                self.built = self.version()
+
+        def invalidate(self) -> None:
+                self.words = None
+
+        def bind(self, graph: nx.Graph) -> None:
+                if (self.words is None or self.graph is not graph or
+                    self.version() - self.built > self.staleness):
+                        self.rebuild(graph)
+
+        def dense_bunch(self, graph: nx.Graph, size: int,
+                        neighbours: int) -> List:
+                self.bind(graph)
+                return [self.words[idx] for idx in nearest_bunch(
+                        self.emb_pos, self.emb_neg, size, neighbours)]
+
+def nearest_bunch(emb_pos: np.ndarray, emb_neg: np.ndarray, size: int,
+                  neighbours: int) -> List:
+        # every next member is a random one of the `neighbours` words
+        # nearest to the centroid of the bunch so far (word ids returned)
+        rng = np.random.default_rng(getrandbits(32))
+        order = rng.permutation(len(emb_pos)) # random tie breaks
+
+        bunch = [randint(0, len(emb_pos) - 1)]
+        for _ in range(size - 1):
+                score = (((emb_pos - emb_pos[bunch].mean(axis=0)) ** 2)
+                         .sum(axis=1) -
+                         ((emb_neg - emb_neg[bunch].mean(axis=0)) ** 2)
+                         .sum(axis=1))
+                score[bunch] = np.inf
+                near = min(neighbours, len(emb_pos) - len(bunch))
+                near = order[np.argpartition(score[order], near - 1)[:near]]
+                bunch.append(int(choice(near)))
+        return bunch
@@ -0,0 +1,211 @@
+import os
+import json
+import threading
+import importlib.util
+from collections import OrderedDict
+from contextlib import contextmanager
+import numpy as np
+import networkx as nx
+from graph_store import write_graph
+from typing import Dict, Iterator, List
+
+
+#########################
+# Graph tenants         #
+#########################
+
+# Many named graph databases served by one process. A tenant is a
+# directory under the registry root:
+#     <root>/<name>/graph.gml (or graph.bin)   the database
+#     <root>/<name>/params.json                its hyperparameters
+# so the hyperparameters travel with the graph, on top of the ones of the
+# registry's named model. Every tenant gets its own instance of the model
+# module, captcha (a fresh import, with its own globals: the graph lock,
+# journal, engines, caches and sessions), the interpreter and the
+# libraries are shared. A tenant is loaded on its first use and the
+# least recently used idle ones are flushed to disk and dropped whenever
+# the estimated footprint of the loaded ones exceeds the budget.
+#
+# The registry lock only guards the bookkeeping, never a load or a flush:
+# the first user of a cold tenant leaves a placeholder in its slot and
+# loads it outside the lock while the next users wait on the placeholder,
+# the evicted tenants leave their slots under the lock and are flushed
+# after it, and a tenant is only reloaded once its flush is over. Requests
+# to the other tenants go on in the meantime.
+
+# rough networkx costs, the engines' arrays are counted exactly
+NODE_BYTES = 600
+EDGE_BYTES = 400
+
+class Tenant:
+        def __init__(self, name: str):
+                self.name = name
+                self.model = None
+                self.graph = None
+                self.users = 0
+                self.footprint = 0
+                self.ready = threading.Event() # loaded, or failed to
+                self.error = None
+
+def array_bytes(obj) -> int:
+        return sum([value.nbytes for value in vars(obj).values()
+                    if isinstance(value, np.ndarray)])
+
+class TenantRegistry:
+        def __init__(self, root: str, model_name: str, budget: int):
+                self.root = root
+                self.model_name = model_name
+                self.budget = budget # bytes
+                self.loaded = OrderedDict() # LRU order
+                self.flushing = {} # name -> event set once flushed
+                self.lock = threading.Lock()
+                self.loads = self.evictions = 0
+
+        def tenant_dir(self, name: str) -> str:
+                assert name.isidentifier(), 'bad graph name %r' % name
+                return os.path.join(self.root, name)
+
+        def database_path(self, name: str) -> str:
+                for file_name in ('graph.bin', 'graph.gml'):
+                        path = os.path.join(self.tenant_dir(name), file_name)
+                        if os.path.exists(path):
+                                return path
+                raise KeyError(name)
+
+        def names(self) -> List:
+                if not os.path.isdir(self.root):
+                        return []
+                return sorted([name for name in os.listdir(self.root)
+                               if name.isidentifier() and
+                               os.path.isdir(os.path.join(self.root, name))])
+
+        def create(self, name: str, graph: nx.Graph, params: Dict = {},
+                   fmt: str = 'gml') -> None:
+                os.makedirs(self.tenant_dir(name), exist_ok=True)
+                write_graph(graph, os.path.join(self.tenant_dir(name),
+                                                'graph.' + fmt))
+                with open(os.path.join(self.tenant_dir(name), 'params.json'),
+                          'w') as params_file:
+                        json.dump(params, params_file, indent=1)
+
+        def params(self, name: str) -> Dict:
+                path = os.path.join(self.tenant_dir(name), 'params.json')
+                if not os.path.exists(path):
+                        return {}
+                with open(path, 'r') as params_file:
+                        return json.load(params_file)
+
+        def load(self, tenant: Tenant) -> None:
+                spec = importlib.util.find_spec('captcha')
+                model = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(model)
+                params = model.model_params(self.model_name)
+                params.update(self.params(tenant.name))
+                params['DATABASE_PATH'] = self.database_path(tenant.name)
+                model.configure(params)
+
+                tenant.graph = model.graph_db_import()
+                model.RIDDLE_POOL.start(tenant.graph)
+                tenant.model = model
+                with self.lock:
+                        self.loads += 1
+
+        def flush(self, tenant: Tenant) -> None:
+                tenant.model.RIDDLE_POOL.stop()
+                tenant.model.graph_db_save(tenant.graph)
+                tenant.model.JOURNAL.close()
+
+        def flush_evicted(self, evicted: List) -> None:
+                # without self.lock, the slots are already free
+                for tenant in evicted:
+                        try:
+                                self.flush(tenant)
+                        finally:
+                                with self.lock:
+                                        self.flushing.pop(tenant.name).set()
+
+        def measure(self, tenant: Tenant) -> None:
+                model = tenant.model
+                tenant.footprint = (
+                        tenant.graph.number_of_nodes() * NODE_BYTES +
+                        tenant.graph.number_of_edges() * EDGE_BYTES +
+                        array_bytes(model.RES_ENGINE) +
+                        array_bytes(model.SPECTRAL_INDEX))
+
+        def evict_idle(self, keep: str) -> List:
+                # with self.lock held, the evicted tenants are to be flushed
+                # by the caller once it is released
+                total = sum([tenant.footprint
+                             for tenant in self.loaded.values()])
+                evicted = []
+                for name in list(self.loaded):
+                        if total <= self.budget:
+                                break
+                        tenant = self.loaded[name]
+                        if name == keep or tenant.users > 0:
+                                continue
+                        del self.loaded[name]
+                        self.flushing[name] = threading.Event()
+                        evicted.append(tenant)
+                        total -= tenant.footprint
+                        self.evictions += 1
+                return evicted
+
+        def acquire(self, name: str) -> Tenant:
+                with self.lock:
+                        tenant = self.loaded.get(name)
+                        cold = tenant is None
+                        if cold:
+                                tenant = self.loaded[name] = Tenant(name)
+                                flushed = self.flushing.get(name)
+                        self.loaded.move_to_end(name)
+                        tenant.users += 1
+
+                if cold:
+                        try:
+                                if flushed is not None:
+                                        flushed.wait() # its last state
+                                self.load(tenant)
+                        except BaseException as exc:
+                                tenant.error = exc
+                                with self.lock:
+                                        del self.loaded[name]
+                        tenant.ready.set()
+                else:
+                        tenant.ready.wait()
+                if tenant.error is not None:
+                        raise tenant.error
+                return tenant
+
+        @contextmanager
+        def use(self, name: str) -> Iterator:
+                tenant = self.acquire(name)
+                try:
+                        yield tenant
+                finally:
+                        with self.lock:
+                                tenant.users -= 1
+                                self.measure(tenant)
+                                evicted = self.evict_idle(name)
+                        self.flush_evicted(evicted)
+
+        def stats(self) -> Dict:
+                with self.lock:
+                        return {'loaded': {name: tenant.footprint
+                                           for name, tenant
+                                           in self.loaded.items()},
+                                'budget': self.budget,
+                                'loads': self.loads,
+                                'evictions': self.evictions}
+
+        def close(self) -> None:
+                with self.lock:
+                        tenants = list(self.loaded.values())
+                        self.loaded.clear()
+                        flushing = list(self.flushing.values())
+                for tenant in tenants:
+                        tenant.ready.wait()
+                        if tenant.error is None:
+                                self.flush(tenant)
+                for flushed in flushing:
+                        flushed.wait()
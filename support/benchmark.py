@@ -0,0 +1,230 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from random import seed, sample, choice
+import numpy as np
+import networkx as nx
+from typing import Callable, Dict, List
+
+sys.path.append('../scripts')
+import captcha as model
+from graph_store import write_graph
+
+
+# Times the hot paths of the single-bunch model on synthetic vocabularies,
+# for every resistance engine, and writes the results as JSON. Run it from
+# the support dir:
+#     python3 benchmark.py --sizes 100 1000 10000 --out bench.json
+# Every (size, engine) run uses the same seeded graph and the same seeded
+# queries, so the engines (and two revisions of the code) are compared on
+# an identical workload. The model's database is never touched, all the
+# files go to a temporary directory.
+
+#########################
+# Synthetic vocabulary  #
+#########################
+
+# Learned edges gather around frequent words: both ends are drawn from a
+# Zipf-like distribution over the vocabulary. Every learned edge went
+# through a few WEIGHT_ELASTICITY steps, mostly in one direction, and its
+# raw weight is their clipped sum, the edges that summed back to the
+# default are not stored.
+
+def word_name(idx: int) -> str:
+        # answers have to pass the model's [a-z]+ check
+        name = ''
+        while True:
+                name = chr(ord('a') + idx % 26) + name
+                idx //= 26
+                if idx == 0:
+                        return 'w' + name
+
+def synthetic_graph(word_cnt: int, learned_cnt: int, zipf: float) -> nx.Graph:
+        graph = nx.Graph()
+        words = [word_name(idx) for idx in range(word_cnt)]
+        graph.add_nodes_from(words)
+        if word_cnt < 2:
+                return graph
+
+        rng = np.random.default_rng(word_cnt)
+        freq = 1.0 / np.arange(1, word_cnt + 1) ** zipf
+        freq /= freq.sum()
+        learned_cnt = min(learned_cnt, word_cnt * (word_cnt - 1) // 2)
+
+        while graph.number_of_edges() < learned_cnt:
+                idx_1, idx_2 = rng.choice(word_cnt, size=2, p=freq)
+                if idx_1 == idx_2 or graph.has_edge(words[idx_1],
+                                                    words[idx_2]):
+                        continue
+                steps = rng.geometric(0.3)
+                human = rng.random() < 0.5
+                ups = rng.binomial(steps, 0.2 if human else 0.8)
+                weight = np.clip(model.DEFUALT_EDGE_WEIGHT +
+                                 model.WEIGHT_ELASTICITY * (2 * ups - steps),
+                                 -1.0 * model.WEIGHT_LIMIT, model.WEIGHT_LIMIT)
+                if not model.is_default_weight(weight):
+                        graph.add_edge(words[idx_1], words[idx_2],
+                                       weight=round(float(weight), 6))
+        return graph
+
+
+#########################
+# Timing                #
+#########################
+
+def timed(call: Callable, repeat: int) -> List:
+        samples = []
+        for _ in range(repeat):
+                start = time.perf_counter()
+                call()
+                samples.append(time.perf_counter() - start)
+        return samples
+
+def summary(samples: List) -> Dict:
+        samples = np.array(samples)
+        return {'n': len(samples),
+                'mean_ms': float(samples.mean() * 1000),
+                'median_ms': float(np.median(samples) * 1000),
+                'p99_ms': float(np.percentile(samples, 99) * 1000),
+                'min_ms': float(samples.min() * 1000),
+                'total_s': float(samples.sum())}
+
+def use_engine(engine: str, bench_seed: int) -> None:
+        model.RESISTANCE_ENGINE = engine
+        model.RES_ENGINE = model.make_res_engine(engine)
+        model.RES_CACHE.clear() # the cache is keyed on the graph version only
+        if engine == 'sketch':
+                model.RES_ENGINE.seed = bench_seed
+
+def use_database(path: str) -> None:
+        model.DATABASE_PATH = path
+        model.JOURNAL.close()
+        model.JOURNAL = model.make_journal(path)
+        model.JOURNAL.reset()
+
+def run_cases(engine: str, graph: nx.Graph, args: argparse.Namespace,
+              db_path: str) -> Dict:
+        results = {}
+        session = 'benchmark'
+
+        def case(name: str, call: Callable, repeat: int) -> None:
+                seed(args.seed) # the same queries for every engine
+                results[name] = summary(timed(call, repeat))
+
+        write_graph(graph, db_path)
+        use_database(db_path)
+        use_engine(engine, args.seed)
+        case('graph_db_import', model.graph_db_import,
+             max(args.repeat // 10, 1))
+        graph = model.graph_db_import()
+        words = model.graph_db_get_all_words(graph)
+        riddle_size = min(model.WORD_SET_SIZE, len(words) - 1)
+
+        case('rebuild', lambda: model.RES_ENGINE.rebuild(graph), 1)
+        case('res_dist', lambda: model.res_dist(graph, *sample(words, 2)),
+             args.repeat)
+
+        def mean_res_dist() -> None:
+                riddle = sample(words, riddle_size + 1)
+                model.mean_res_dist_dense(graph, riddle[0], riddle[1:])
+        case('mean_res_dist', mean_res_dist, args.repeat)
+
+        case('generate_word_set_rand',
+             lambda: model.generate_word_set_rand(graph), args.repeat)
+        case('generate_word_set_dense',
+             lambda: model.generate_word_set_dense(graph),
+             max(args.repeat // 10, 1))
+
+        def process_post() -> None:
+                riddle = model.generate_word_set_rand(graph)
+                model.remember_word_set(session, riddle)
+                answer = choice(words)
+                while answer in riddle:
+                        answer = choice(words)
+                model.process_post(graph, answer, None, session)
+        case('process_post', process_post, args.repeat)
+
+        added = iter([word_name(len(words) + idx)
+                      for idx in range(args.repeat)])
+        case('graph_db_add', lambda: model.graph_db_add(graph, next(added)),
+             args.repeat)
+
+        case('graph_db_save', lambda: model.graph_db_save(graph),
+             max(args.repeat // 10, 1))
+        model.JOURNAL.file.close()
+        return results
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--sizes', type=int, nargs='+',
+                            default=[100, 1000])
+        parser.add_argument('--learned', type=float, default=5.0,
+                            help='learned edges per word')
+        parser.add_argument('--zipf', type=float, default=1.0)
+        parser.add_argument('--engines', nargs='+',
+                            default=['pinv', 'subgraph', 'sketch'],
+                            choices=['pinv', 'subgraph', 'sketch'])
+        parser.add_argument('--max-dense', type=int, default=5000,
+                            help='largest vocabulary for the pinv engine')
+        parser.add_argument('--format', default='bin', choices=['bin', 'gml'])
+        parser.add_argument('--repeat', type=int, default=50)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--out', default=None,
+                            help='JSON output file (stdout by default)')
+        args = parser.parse_args()
+
+        report = {'meta': {'args': vars(args),
+                           'python': platform.python_version(),
+                           'numpy': np.__version__,
+                           'networkx': nx.__version__,
+                           'machine': platform.machine(),
+                           'cpus': os.cpu_count(),
+                           'model': {'WORD_SET_SIZE': model.WORD_SET_SIZE,
+                                     'DENSE_SAMPLING_RATE':
+                                     model.DENSE_SAMPLING_RATE,
+                                     'DENSE_INDEX': model.DENSE_INDEX,
+                                     'HEURISTIC_RATE': model.HEURISTIC_RATE,
+                                     'SKETCH_EPSILON': model.SKETCH_EPSILON,
+                                     'SKETCH_STALENESS':
+                                     model.SKETCH_STALENESS,
+                                     'RES_CACHE_SIZE': model.RES_CACHE_SIZE,
+                                     'PIPELINE': model.PIPELINE}},
+                  'runs': []}
+
+        tmp_dir = tempfile.mkdtemp(prefix='decadence_bench_')
+        try:
+                for size in args.sizes:
+                        graph = synthetic_graph(size, int(size * args.learned),
+                                                args.zipf)
+                        for engine in args.engines:
+                                run = {'words': size,
+                                       'learned': graph.number_of_edges(),
+                                       'engine': engine}
+                                if engine == 'pinv' and size > args.max_dense:
+                                        run['skipped'] = 'above --max-dense'
+                                else:
+                                        run['cases'] = run_cases(
+                                                engine, graph.copy(), args,
+                                                os.path.join(tmp_dir,
+                                                             'graph.' +
+                                                             args.format))
+                                report['runs'].append(run)
+                                print('%6d words %-8s done' % (size, engine),
+                                      file=sys.stderr)
+        finally:
+                shutil.rmtree(tmp_dir)
+
+        if args.out is None:
+                json.dump(report, sys.stdout, indent=1)
+                print('')
+        else:
+                with open(args.out, 'w') as out_file:
+                        json.dump(report, out_file, indent=1)
+
+if __name__ == '__main__':
+        main()
@@ -0,0 +1,12 @@
+import sys
+
+sys.path.append('../scripts')
+from graph_store import read_graph, write_graph
+
+
+# Converts a graph database between the GML and the binary (.bin) formats,
+# the formats are picked by the file extensions:
+#     python3 convert_db.py ../database/graph.gml ../database/graph.bin
+
+assert len(sys.argv) == 3, 'usage: convert_db.py <source> <destination>'
+write_graph(read_graph(sys.argv[1]), sys.argv[2])
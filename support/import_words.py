@@ -0,0 +1,38 @@
+import os
+import sys
+import argparse
+
+sys.path.append('../scripts')
+import captcha
+
+
+# Bulk-imports a word list (any number of words per line) into the
+# database of a model, from a file or from stdin, and saves it:
+#     python3 import_words.py words.txt
+#     cat words.txt | python3 import_words.py -
+# The list is streamed, it is never held in memory as a whole.
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('words', help='word list file, "-" for stdin')
+        parser.add_argument('--model', default='decadence',
+                            choices=captcha.MODEL_NAMES)
+        args = parser.parse_args()
+
+        model = captcha.use_model(args.model)
+        path = args.words if args.words == '-' else os.path.abspath(args.words)
+        os.chdir('..') # the models' paths are relative to the repository root
+
+        graph = model.graph_db_import()
+        word_file = sys.stdin if path == '-' else open(path, 'r')
+        with word_file:
+                added, present, invalid = model.graph_db_add_many(
+                        graph, model.iter_word_list(word_file))
+        model.graph_db_save(graph)
+
+        print('%d words added, %d already present, ' % (added, present) +
+              '%d skipped due to an inappropriate format.' % invalid)
+        print('database state commited to %s.' % model.DATABASE_PATH)
+
+if __name__ == '__main__':
+        main()
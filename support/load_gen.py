@@ -0,0 +1,97 @@
+import json
+import time
+import asyncio
+import argparse
+from random import seed, choice
+import numpy as np
+from typing import Dict, List, Tuple
+
+
+# Drives a running server (scripts/server.py) with concurrent sessions, each
+# one answering riddles in a loop for a fixed time, and reports the p50/p99
+# latency of every request kind and the overall throughput:
+#     python3 load_gen.py --sessions 32 --duration 30
+# Answers are picked among the words of the riddles seen so far, so the
+# load never grows the vocabulary, but it does train the graph: point it at
+# a copy of the database.
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                  method: str, target: str, payload: dict = None) -> Tuple:
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        writer.write(('%s %s HTTP/1.1\r\n' % (method, target) +
+                      'Host: load_gen\r\n' +
+                      'Content-Length: %d\r\n\r\n' % len(body))
+                     .encode('latin-1') + body)
+        await writer.drain()
+
+        code = int((await reader.readline()).split(b' ')[1])
+        length = 0
+        while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                        break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                        length = int(value)
+        return code, json.loads(await reader.readexactly(length))
+
+async def run_session(args: argparse.Namespace, words: List,
+                      latencies: Dict, deadline: float) -> None:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+        _, reply = await request(reader, writer, 'POST', '/session')
+        query = '?session=' + reply['session']
+
+        while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                code, reply = await request(reader, writer, 'GET',
+                                            '/get' + query)
+                latencies['get'].append(time.perf_counter() - start)
+                assert code == 200, reply
+
+                riddle = reply['riddle']
+                words.extend([word for word in riddle if word not in words])
+                answers = [word for word in words if word not in riddle]
+                if not answers:
+                        continue
+
+                start = time.perf_counter()
+                code, reply = await request(reader, writer, 'POST',
+                                            '/post' + query,
+                                            {'answer': choice(answers)})
+                latencies['post'].append(time.perf_counter() - start)
+                assert code == 200, reply
+
+        writer.close()
+
+async def run(args: argparse.Namespace) -> Tuple:
+        latencies = {'get': [], 'post': []}
+        start = time.perf_counter()
+        await asyncio.gather(*[run_session(args, [], latencies,
+                                           start + args.duration)
+                               for _ in range(args.sessions)])
+        return latencies, time.perf_counter() - start
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8080)
+        parser.add_argument('--sessions', type=int, default=16)
+        parser.add_argument('--duration', type=float, default=10.0,
+                            help='seconds')
+        parser.add_argument('--seed', type=int, default=0)
+        args = parser.parse_args()
+
+        seed(args.seed)
+        latencies, elapsed = asyncio.run(run(args))
+
+        total = sum([len(samples) for samples in latencies.values()])
+        print('%d requests in %.1f s, %.1f req/s' %
+              (total, elapsed, total / elapsed))
+        for kind, samples in latencies.items():
+                if samples:
+                        p50, p99 = np.percentile(samples, [50, 99]) * 1000
+                        print('%-4s  n %6d  p50 %8.2f ms  p99 %8.2f ms' %
+                              (kind, len(samples), p50, p99))
+
+if __name__ == '__main__':
+        main()
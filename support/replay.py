@@ -0,0 +1,214 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+from random import seed
+import numpy as np
+import networkx as nx
+from typing import Dict, Iterator, List
+
+sys.path.append('../scripts')
+import captcha
+
+
+# Replays a recorded log of answers through a model's process_get and
+# process_post as fast as it can, against a copy of the database, and
+# writes the throughput, the latencies, the verdicts confusion versus the
+# labels and the drift of the graph as JSON. Run it from the support dir:
+#     python3 replay.py answers.jsonl --model polydence --seed 1
+# The log is the one written by `server.py --record`, one event a line:
+#     {"session": <id>, "riddle": [<word>, ...], "answer": <word>,
+#      "label": "hum"|"mac"|null}
+# Every event answers a riddle in its session (so polydence goes through
+# its 2-random-1-dense batches). With --riddles log (the default) the answer
+# is judged on the recorded riddle it was given to, no riddle is generated;
+# with --riddles model every event asks the model for a fresh riddle first
+# and the get latencies are reported too. The first --train events are posted with their
+# label as the mode (learning), the rest are judged by the model and make
+# up the confusion. Under a fixed --seed two runs make the same riddles,
+# verdicts and graph, so engines are compared on an identical workload.
+
+VERDICTS = {406: 'pass', 407: 'fail'}
+
+def read_log(path: str) -> Iterator:
+        with open(path, 'r') as log_file:
+                for line in log_file:
+                        if line.strip():
+                                yield json.loads(line)
+
+def copy_database(source: str, tmp_dir: str) -> str:
+        path = os.path.join(tmp_dir, os.path.basename(source))
+        shutil.copy(source, path)
+        for suffix in ('.journal', '.journal.old'):
+                if os.path.exists(source + suffix):
+                        shutil.copy(source + suffix, path + suffix)
+        return path
+
+def latency_summary(samples: List) -> Dict:
+        if not samples:
+                return {'n': 0}
+        samples = np.array(samples)
+        return {'n': len(samples),
+                'mean_ms': float(samples.mean() * 1000),
+                'p50_ms': float(np.percentile(samples, 50) * 1000),
+                'p99_ms': float(np.percentile(samples, 99) * 1000),
+                'max_ms': float(samples.max() * 1000)}
+
+def confusion_summary(confusion: Dict) -> Dict:
+        hum, mac = confusion['hum'], confusion['mac']
+        judged = sum(hum.values()) + sum(mac.values())
+        return {'confusion': confusion,
+                'accuracy': (hum['pass'] + mac['fail']) / max(judged, 1),
+                'humans_failed': hum['fail'] / max(sum(hum.values()), 1),
+                'bots_passed': mac['pass'] / max(sum(mac.values()), 1)}
+
+def graph_drift(model, before: nx.Graph, after: nx.Graph) -> Dict:
+        weights_before = {frozenset((word_1, word_2)): weight
+                          for word_1, word_2, weight
+                          in before.edges(data='weight')}
+        weights_after = {frozenset((word_1, word_2)): weight
+                         for word_1, word_2, weight
+                         in after.edges(data='weight')}
+        shifts = np.array([
+                weights_after.get(edge, model.DEFUALT_EDGE_WEIGHT) -
+                weights_before.get(edge, model.DEFUALT_EDGE_WEIGHT)
+                for edge in set(weights_before) | set(weights_after)])
+        shifts = shifts[np.abs(shifts) > 1e-9]
+        return {'words_before': before.number_of_nodes(),
+                'words_after': after.number_of_nodes(),
+                'words_added': len(set(after.nodes()) - set(before.nodes())),
+                'edges_before': before.number_of_edges(),
+                'edges_after': after.number_of_edges(),
+                'edges_shifted': len(shifts),
+                'mean_abs_shift': float(np.abs(shifts).mean())
+                                  if len(shifts) else 0.0,
+                'max_abs_shift': float(np.abs(shifts).max())
+                                 if len(shifts) else 0.0,
+                'net_shift': float(shifts.sum())}
+
+def replay(model, graph: nx.Graph, events: Iterator,
+           args: argparse.Namespace) -> Dict:
+        latencies = {'get': [], 'post': []}
+        statuses = {}
+        confusion = {label: {'pass': 0, 'fail': 0} for label in ('hum', 'mac')}
+        skipped = 0
+
+        start = time.perf_counter()
+        for pos, event in enumerate(events):
+                session = str(event.get('session', 'replay'))
+                label = event.get('label')
+                riddle = event.get('riddle')
+                if args.riddles == 'log':
+                        if not riddle:
+                                skipped += 1 # nothing to judge the answer on
+                                continue
+                        if not all([graph.has_node(word) for word in riddle]):
+                                skipped += 1 # recorded on another vocabulary
+                                continue
+                        model.remember_word_set(session, riddle)
+                else:
+                        call_start = time.perf_counter()
+                        model.process_get(graph, session)
+                        latencies['get'].append(time.perf_counter() - call_start)
+
+                mode = label if pos < args.train else None
+                call_start = time.perf_counter()
+                sts = model.process_post(graph, str(event['answer']), mode,
+                                         session)
+                latencies['post'].append(time.perf_counter() - call_start)
+
+                statuses[sts] = statuses.get(sts, 0) + 1
+                if mode is None and label in confusion and sts in VERDICTS:
+                        confusion[label][VERDICTS[sts]] += 1
+        elapsed = time.perf_counter() - start
+
+        replayed = len(latencies['post'])
+        return {'events': replayed,
+                'skipped': skipped,
+                'seconds': elapsed,
+                'events_per_s': replayed / elapsed if elapsed > 0 else 0.0,
+                'latency': {kind: latency_summary(samples)
+                            for kind, samples in latencies.items()},
+                'statuses': {str(sts): cnt
+                             for sts, cnt in sorted(statuses.items())},
+                'verdicts': confusion_summary(confusion)}
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('log', help='JSON lines answer log')
+        parser.add_argument('--model', default='decadence',
+                            choices=captcha.MODEL_NAMES)
+        parser.add_argument('--database', default=None,
+                            help="database to copy (the model's by default)")
+        parser.add_argument('--engine', default=None,
+                            choices=['pinv', 'subgraph', 'sketch'])
+        parser.add_argument('--riddles', default='log',
+                            choices=['log', 'model'],
+                            help='judge the answers on the recorded riddles '
+                                 'or on freshly generated ones')
+        parser.add_argument('--train', type=int, default=0,
+                            help='events posted with their label as the mode')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--out', default=None,
+                            help='JSON output file (stdout by default)')
+        args = parser.parse_args()
+
+        model = captcha.use_model(args.model)
+        log_path = os.path.abspath(args.log)
+        out_path = None if args.out is None else os.path.abspath(args.out)
+        if args.database is not None:
+                source = os.path.abspath(args.database)
+        else:
+                os.chdir('..') # the models' paths are relative to the root
+                source = os.path.abspath(model.DATABASE_PATH)
+
+        tmp_dir = tempfile.mkdtemp(prefix='decadence_replay_')
+        try:
+                params = {'DATABASE_PATH': copy_database(source, tmp_dir)}
+                if args.engine is not None:
+                        params['RESISTANCE_ENGINE'] = args.engine
+                model.configure(params)
+                if model.RESISTANCE_ENGINE == 'sketch':
+                        model.RES_ENGINE.seed = args.seed
+                seed(args.seed)
+                np.random.seed(args.seed)
+
+                graph = model.graph_db_import()
+                before = graph.copy()
+                result = replay(model, graph, read_log(log_path), args)
+                result['drift'] = graph_drift(model, before, graph)
+
+                if model.COMPACTION is not None:
+                        model.COMPACTION.join()
+                model.JOURNAL.file.close()
+        finally:
+                shutil.rmtree(tmp_dir)
+
+        report = {'meta': {'args': vars(args),
+                           'database': source,
+                           'python': platform.python_version(),
+                           'numpy': np.__version__,
+                           'networkx': nx.__version__,
+                           'machine': platform.machine(),
+                           'model': {'RESISTANCE_ENGINE':
+                                     model.RESISTANCE_ENGINE,
+                                     'WORD_SET_SIZE': model.WORD_SET_SIZE,
+                                     'THRESH': model.THRESH,
+                                     'DENSE_INDEX': model.DENSE_INDEX,
+                                     'WEIGHT_ELASTICITY':
+                                     model.WEIGHT_ELASTICITY,
+                                     'PIPELINE': model.PIPELINE}},
+                  'replay': result}
+        if out_path is None:
+                json.dump(report, sys.stdout, indent=1)
+                print('')
+        else:
+                with open(out_path, 'w') as out_file:
+                        json.dump(report, out_file, indent=1)
+
+if __name__ == '__main__':
+        main()
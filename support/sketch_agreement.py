@@ -0,0 +1,113 @@
+import sys
+import time
+import argparse
+from random import seed, sample, uniform
+from statistics import mean, pstdev, quantiles
+import numpy as np
+import networkx as nx
+
+sys.path.append('../scripts')
+from resistance import PinvEngine, SketchEngine
+
+
+# Compares the verdicts of the approximate sketch engine with the exact
+# pinv engine on random riddles and answers, and gates the sketch engine:
+# the exit status is 1 if, for any epsilon, more than --max-differ of the
+# verdicts flip at any of the thresholds checked (the quartiles of the
+# exact scores, plus --thresh if given). A fixed threshold alone would be
+# degenerate: all the scores of a graph sit close to 2 / (c0 n), on one
+# side of it. The errors are reported relative to the spread (standard
+# deviation) of the exact scores, which is what the verdicts depend on.
+# Run it from the support dir.
+
+def sigm_dist(edge_weight: float) -> float:
+        return 1.0 / (1 + np.exp(-1.0 * edge_weight))
+
+def synthetic_graph(word_cnt: int, learned_cnt: int) -> nx.Graph:
+        graph = nx.Graph()
+        graph.add_nodes_from(['w%d' % idx for idx in range(word_cnt)])
+        words = list(graph.nodes().keys())
+        while graph.number_of_edges() < learned_cnt:
+                word_1, word_2 = sample(words, 2)
+                graph.add_edge(word_1, word_2,
+                               weight=round(uniform(-2.0, 2.0), 1) or 0.1)
+        return graph
+
+def main() -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument('--db', default='../database/graph.gml')
+        parser.add_argument('--words', type=int, default=0,
+                            help='use a synthetic vocabulary of this size')
+        parser.add_argument('--learned', type=int, default=0,
+                            help='learned edges of the synthetic vocabulary')
+        parser.add_argument('--eps', type=float, nargs='+',
+                            default=[0.5, 0.3, 0.2])
+        parser.add_argument('--riddles', type=int, default=500)
+        parser.add_argument('--size', type=int, default=5)
+        parser.add_argument('--thresh', type=float, default=None,
+                            help="also check the model's THRESH")
+        parser.add_argument('--max-differ', type=float, default=0.01,
+                            help='share of flipped verdicts allowed')
+        parser.add_argument('--default-weight', type=float, default=0)
+        parser.add_argument('--seed', type=int, default=0)
+        args = parser.parse_args()
+
+        seed(args.seed)
+        if args.words > 0:
+                graph = synthetic_graph(args.words, args.learned)
+        else:
+                graph = nx.read_gml(args.db)
+        words = list(graph.nodes().keys())
+
+        queries = []
+        for _ in range(args.riddles):
+                riddle = sample(words, args.size + 1)
+                queries.append((riddle[0], riddle[1:]))
+
+        exact = PinvEngine(sigm_dist, args.default_weight)
+        start = time.perf_counter()
+        exact.bind(graph)
+        print('pinv   build %8.3f s' % (time.perf_counter() - start))
+
+        passed = True
+        for blocked in (False, True):
+                exact_scores = [mean(exact.res_dists(graph, answer, riddle,
+                                                     riddle if blocked
+                                                     else []))
+                                for answer, riddle in queries]
+                spread = max(pstdev(exact_scores), 1e-300)
+                threshs = quantiles(exact_scores, n=4)
+                if args.thresh is not None:
+                        threshs.append(args.thresh)
+
+                for eps in args.eps:
+                        approx = SketchEngine(sigm_dist, args.default_weight,
+                                              eps, seed=args.seed)
+                        start = time.perf_counter()
+                        approx.bind(graph)
+                        build = time.perf_counter() - start
+                        approx_scores = [
+                                mean(approx.res_dists(graph, answer, riddle,
+                                                      riddle if blocked
+                                                      else []))
+                                for answer, riddle in queries]
+
+                        err = [abs(app - exa) / spread for app, exa
+                               in zip(approx_scores, exact_scores)]
+                        differ = max([sum([(app < thresh) != (exa < thresh)
+                                           for app, exa in zip(approx_scores,
+                                                               exact_scores)]) /
+                                      len(queries) for thresh in threshs])
+                        passed = passed and differ <= args.max_differ
+                        print('%s eps %.2f dim %5d build %8.3f s | '
+                              'mean err %.4f max %.4f (of the spread) | '
+                              'verdicts differ %.3f %s' %
+                              ('dense' if blocked else 'rand ', eps,
+                               approx.sketch_dim(len(words)), build,
+                               mean(err), max(err), differ,
+                               'ok' if differ <= args.max_differ
+                               else 'FAIL'))
+
+        sys.exit(0 if passed else 1)
+
+main()